@@ -12,6 +12,8 @@ import {
   VectorCollectionDetails,
   PaginatedVectorDocuments,
   VectorSearchResponse,
+  VectorDocument,
+  LiveQueryHandlers,
   DatabaseStats,
   DashboardSummary,
 } from '@/types'
@@ -180,6 +182,62 @@ export async function searchVectors(
   })
 }
 
+// Follow a live query with Server-Sent Events, returns a function closing the stream
+function watchLiveQuery<Result, Row>(
+  endpoint: string,
+  params: URLSearchParams,
+  handlers: LiveQueryHandlers<Result, Row>
+): () => void {
+  // EventSource can't set headers, the database paths are passed as query parameters
+  const config = getDbConfig()
+  params.append('path', config.mainPath)
+  params.append('vector_path', config.vectorPath)
+
+  const source = new EventSource(`${API_BASE_URL}${endpoint}?${params.toString()}`)
+  source.addEventListener('snapshot', (event) => {
+    const data = JSON.parse((event as MessageEvent).data)
+    handlers.onSnapshot(data.result, data.version)
+  })
+  source.addEventListener('diff', (event) => {
+    handlers.onDiff(JSON.parse((event as MessageEvent).data))
+  })
+  source.addEventListener('error', (event) => {
+    const data = (event as MessageEvent).data
+    if (data && handlers.onError) {
+      handlers.onError(JSON.parse(data).error)
+    }
+  })
+  return () => source.close()
+}
+
+export function watchTableSearch(
+  tableName: string,
+  handlers: LiveQueryHandlers<SearchResult, Record<string, unknown>>,
+  query?: string,
+  limit: number = 100
+): () => void {
+  const params = new URLSearchParams()
+  if (query) params.append('query', query)
+  params.append('limit', limit.toString())
+
+  return watchLiveQuery(`/tables/${tableName}/search/live`, params, handlers)
+}
+
+export function watchCollectionDocuments(
+  collectionName: string,
+  handlers: LiveQueryHandlers<PaginatedVectorDocuments, VectorDocument>,
+  limit: number = 100,
+  offset: number = 0,
+  metadataFilter?: Record<string, unknown>
+): () => void {
+  const params = new URLSearchParams()
+  params.append('limit', limit.toString())
+  params.append('offset', offset.toString())
+  if (metadataFilter) params.append('metadata_filter', JSON.stringify(metadataFilter))
+
+  return watchLiveQuery(`/collections/${collectionName}/documents/live`, params, handlers)
+}
+
 export async function getStatistics(): Promise<DatabaseStats> {
   return fetchAPI<DatabaseStats>('/statistics')
 }
@@ -73,6 +73,28 @@ export interface PaginatedVectorDocuments {
   has_more: boolean
 }
 
+// Live Query Types
+export interface LiveQueryDiff<Row> {
+  version: number
+  added: Row[]
+  removed: string[]
+  updated: Row[]
+  ids: string[]
+  [field: string]: unknown
+}
+
+export interface LiveQueryHandlers<Result, Row> {
+  onSnapshot: (result: Result, version: number) => void
+  onDiff: (diff: LiveQueryDiff<Row>) => void
+  onError?: (error: string) => void
+}
+
+export interface VectorDocument {
+  id: string
+  document: string | null
+  metadata: Record<string, unknown> | null
+}
+
 export interface VectorSearchResult {
   id: string
   document: string | null
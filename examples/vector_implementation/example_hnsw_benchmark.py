@@ -0,0 +1,49 @@
+import os
+import time
+import tempfile
+import numpy as np
+from skypydb.database.vector_db import VectorDatabase
+
+# Benchmark settings
+N_ITEMS = 20000
+DIMENSION = 256
+N_QUERIES = 100
+N_RESULTS = 10
+
+# Clustered vectors behave like real embeddings, uniform noise is a worst case for HNSW
+rng = np.random.default_rng(0)
+centers = rng.standard_normal((200, DIMENSION))
+embeddings = (centers[rng.integers(0, 200, N_ITEMS)] + 0.5 * rng.standard_normal((N_ITEMS, DIMENSION))).astype(np.float32).tolist()
+queries = (centers[rng.integers(0, 200, N_QUERIES)] + 0.5 * rng.standard_normal((N_QUERIES, DIMENSION))).astype(np.float32).tolist()
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    db = VectorDatabase(os.path.join(tmp_dir, "benchmark.db"))
+
+    # Create a collection with an HNSW index
+    db.create_collection("bench", metadata={"index": "hnsw", "hnsw:M": 16, "hnsw:ef_construction": 200})
+
+    start = time.perf_counter()
+    db.add(
+        "bench",
+        ids=[f"id{i}" for i in range(N_ITEMS)],
+        embeddings=embeddings
+    )
+    print(f"Inserted {N_ITEMS} items in {time.perf_counter() - start:.2f}s")
+
+    # Exact search is the ground truth for recall
+    start = time.perf_counter()
+    exact = db.query("bench", query_embeddings=queries, n_results=N_RESULTS, include=["distances"], exact=True)
+    exact_latency = (time.perf_counter() - start) / N_QUERIES
+    print(f"exact          latency {exact_latency * 1000:.2f} ms/query")
+
+    for ef_search in (10, 50, 100, 200, 400):
+        start = time.perf_counter()
+        approx = db.query("bench", query_embeddings=queries, n_results=N_RESULTS, include=["distances"], ef_search=ef_search)
+        latency = (time.perf_counter() - start) / N_QUERIES
+        recall = np.mean([
+            len(set(found) & set(expected)) / N_RESULTS
+            for found, expected in zip(approx["ids"], exact["ids"])
+        ])
+        print(f"ef_search={ef_search:<4} latency {latency * 1000:.2f} ms/query, recall@{N_RESULTS} {recall:.3f}")
+
+    db.close()
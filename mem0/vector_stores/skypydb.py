@@ -97,7 +97,8 @@ class SkypyDB(VectorStoreBase):
             skypydb.Collection: The created or retrieved collection.
         """
         collection = self.client.get_or_create_collection(
-            name=name
+            name=name,
+            metadata_indexes=["user_id", "agent_id", "run_id"]
         )
         return collection
 
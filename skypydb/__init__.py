@@ -5,6 +5,8 @@ Skypydb - Open Source Reactive and Vector Embedding Database for Python.
 from skypydb.api.reactive_client import ReactiveClient
 from skypydb.api.vector_client import VectorClient
 from skypydb.api.collection import Collection
+from skypydb.api.async_vector_client import AsyncVectorClient
+from skypydb.api.async_collection import AsyncCollection
 from skypydb.errors import (
     DatabaseError,
     InvalidSearchError,
@@ -19,6 +21,7 @@ from skypydb.security import (
 )
 from skypydb.embeddings import (
     OllamaEmbedding,
+    AsyncOllamaEmbedding,
     get_embedding_function
 )
 
@@ -28,6 +31,8 @@ __all__ = [
     "ReactiveClient",
     "VectorClient",
     "Collection",
+    "AsyncVectorClient",
+    "AsyncCollection",
     "SkypydbError",
     "DatabaseError",
     "TableNotFoundError",
@@ -37,5 +42,6 @@ __all__ = [
     "EncryptionError",
     "create_encryption_manager",
     "OllamaEmbedding",
+    "AsyncOllamaEmbedding",
     "get_embedding_function"
 ]
@@ -0,0 +1,310 @@
+"""
+AsyncCollection class for managing vector collections from coroutines.
+"""
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    TYPE_CHECKING
+)
+from skypydb.database.mixins.vector.sysadd import DEFAULT_BATCH_SIZE
+
+if TYPE_CHECKING:
+    from skypydb.api.collection import Collection
+    from skypydb.api.mixins.vector.executor import DatabaseExecutor
+    from skypydb.embeddings.async_ollama import AsyncOllamaEmbedding
+
+class AsyncCollection:
+    """
+    Represents a vector collection in the database, with coroutine methods.
+
+    Documents and query texts are embedded without blocking the event loop,
+    the database calls run on the executor of the client.
+    """
+
+    def __init__(
+        self,
+        collection: "Collection",
+        executor: "DatabaseExecutor",
+        embedding_function: "AsyncOllamaEmbedding"
+    ):
+        """
+        Initialize collection.
+
+        Args:
+            collection: Synchronous collection the calls are delegated to
+            executor: Executor running the database calls
+            embedding_function: Asynchronous embedding function
+        """
+
+        self._collection = collection
+        self._executor = executor
+        self._embedding_function = embedding_function
+
+    @property
+    def name(self) -> str:
+        """
+        Get collection name.
+        """
+
+        return self._collection.name
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Get collection metadata.
+        """
+
+        return self._collection.metadata
+
+    async def add(
+        self,
+        ids: List[str],
+        embeddings: Optional[List[List[float]]] = None,
+        documents: Optional[List[str]] = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        """
+        Add items to the collection.
+
+        Args:
+            ids: Unique IDs for each item
+            embeddings: Optional pre-computed embeddings
+            documents: Optional documents (embedded if embeddings are not provided)
+            metadatas: Optional metadata for each item
+            batch_size: Number of rows written per statement batch
+
+        Example:
+            await collection.add(
+                ids=["doc1", "doc2"],
+                documents=["First document", "Second document"]
+            )
+        """
+
+        if embeddings is None and documents is not None:
+            embeddings = await self._embedding_function(documents)
+        await self._executor.write(
+            self._collection.add,
+            ids=ids,
+            embeddings=embeddings,
+            documents=documents,
+            metadatas=metadatas,
+            batch_size=batch_size
+        )
+
+    async def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None,
+        include: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after_id: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Get items from the collection by ID or filter.
+
+        Items are returned in ID order, with or without pagination, earlier
+        releases returned unpaginated items in insertion order.
+
+        Args:
+            ids: Optional list of IDs to retrieve
+            where: Optional metadata filter
+            where_document: Optional document content filter
+            include: Optional list of fields to include
+                    (embeddings, documents, metadatas)
+            limit: Optional maximum number of results, 0 returns no items
+            offset: Optional offset for pagination
+            after_id: Optional ID of the last item of the previous page, for
+                      pages that stay stable during writes
+
+        Returns:
+            Dictionary with lists of ids, embeddings, documents, metadatas
+        """
+
+        return await self._executor.read(
+            self._collection.get,
+            ids=ids,
+            where=where,
+            where_document=where_document,
+            include=include,
+            limit=limit,
+            offset=offset,
+            after_id=after_id
+        )
+
+    async def iter(
+        self,
+        batch_size: int = 1000,
+        include: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[Dict[str, List[Any]]]:
+        """
+        Iterate over the items of the collection in batches, in ID order.
+
+        Args:
+            batch_size: Maximum number of items per batch (default: 1000)
+            include: Optional list of fields to include
+                    (embeddings, documents, metadatas)
+            where: Optional metadata filter
+            where_document: Optional document content filter
+
+        Yields:
+            Dictionaries with lists of ids, embeddings, documents, metadatas
+
+        Example:
+            async for batch in collection.iter(include=["documents"]):
+                await export(batch["ids"], batch["documents"])
+        """
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        after_id = None
+        while True:
+            batch = await self.get(
+                where=where,
+                where_document=where_document,
+                include=include,
+                limit=batch_size,
+                after_id=after_id
+            )
+            if not batch["ids"]:
+                return
+            yield batch
+            if len(batch["ids"]) < batch_size:
+                return
+            after_id = batch["ids"][-1]
+
+    async def query(
+        self,
+        query_embeddings: Optional[List[List[float]]] = None,
+        query_texts: Optional[List[str]] = None,
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None,
+        include: Optional[List[str]] = None,
+        ef_search: Optional[int] = None,
+        exact: bool = False
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Query the collection for similar items.
+
+        Queries run concurrently with each other, so many of them can be
+        awaited together with asyncio.gather.
+
+        Args:
+            query_embeddings: Optional query embedding vectors
+            query_texts: Optional query texts (will be embedded)
+            n_results: Number of results to return per query (default: 10)
+            where: Optional metadata filter to apply before search
+            where_document: Optional document content filter
+            include: Optional list of fields to include in results
+                    (embeddings, documents, metadatas, distances)
+            ef_search: Optional HNSW candidate list size for this query
+            exact: If True, use brute-force search even if the collection
+                   was created with an HNSW index
+
+        Returns:
+            Dictionary with nested lists of results for each query
+
+        Example:
+            results = await asyncio.gather(*(
+                collection.query(query_texts=[text], n_results=5)
+                for text in texts
+            ))
+        """
+
+        if query_embeddings is None and query_texts is not None:
+            query_embeddings = await self._embedding_function(query_texts)
+        return await self._executor.read(
+            self._collection.query,
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+            where=where,
+            where_document=where_document,
+            include=include,
+            ef_search=ef_search,
+            exact=exact
+        )
+
+    async def update(
+        self,
+        ids: List[str],
+        embeddings: Optional[List[List[float]]] = None,
+        documents: Optional[List[str]] = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Update existing items in the collection.
+
+        Args:
+            ids: IDs of items to update
+            embeddings: Optional new embeddings
+            documents: Optional new documents (will be re-embedded)
+            metadatas: Optional new metadata
+        """
+
+        if embeddings is None and documents is not None:
+            embeddings = await self._embedding_function(documents)
+        await self._executor.write(
+            self._collection.update,
+            ids=ids,
+            embeddings=embeddings,
+            documents=documents,
+            metadatas=metadatas
+        )
+
+    async def delete(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Delete items from the collection.
+
+        Args:
+            ids: Optional list of IDs to delete
+            where: Optional metadata filter
+            where_document: Optional document content filter
+        """
+
+        await self._executor.write(
+            self._collection.delete,
+            ids=ids,
+            where=where,
+            where_document=where_document
+        )
+
+    async def count(self) -> int:
+        """
+        Count the number of items in the collection.
+
+        Returns:
+            Number of items in the collection
+        """
+
+        return await self._executor.read(self._collection.count)
+
+    async def peek(
+        self,
+        limit: int = 10
+    ) -> Dict[str, List[Any]]:
+        """
+        Get a sample of items from the collection.
+
+        Args:
+            limit: Maximum number of items to return (default: 10)
+
+        Returns:
+            Dictionary with sample items
+        """
+
+        return await self._executor.read(self._collection.peek, limit=limit)
@@ -0,0 +1,264 @@
+"""
+Asynchronous Vector Client API for Skypydb.
+"""
+
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Union
+)
+from skypydb.api.vector_client import VectorClient
+from skypydb.api.async_collection import AsyncCollection
+from skypydb.api.mixins.vector.executor import DatabaseExecutor
+from skypydb.embeddings.async_ollama import AsyncOllamaEmbedding
+from skypydb.embeddings.cache import (
+    DEFAULT_MEMORY_BUDGET,
+    DEFAULT_DISK_BUDGET
+)
+
+class AsyncVectorClient:
+    """
+    Vector client for interacting with Skypydb from asyncio code.
+
+    SQLite work runs on a dedicated thread pool and embeddings are requested
+    from Ollama over asyncio connections, so the event loop is never blocked.
+    """
+
+    def __init__(
+        self,
+        path: str = "./db/_generated/vector.db",
+        embedding_model: str = "mxbai-embed-large",
+        ollama_base_url: str = "http://localhost:11434",
+        cache_memory_budget: Optional[int] = None,
+        embedding_batch_size: int = 64,
+        embedding_max_workers: int = 4,
+        embedding_cache: bool = False,
+        embedding_cache_memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        embedding_cache_disk_budget: int = DEFAULT_DISK_BUDGET,
+        connection_profile: Union[str, Dict[str, Any], None] = None,
+        max_workers: int = 4
+    ):
+        """
+        Initialize Async Vector Client.
+
+        Args:
+            path: Path to the database file. Defaults to ./db/_generated/vector.db
+            embedding_model: Ollama model to use for embeddings (default: mxbai-embed-large)
+            ollama_base_url: Base URL for Ollama API (default: http://localhost:11434)
+            cache_memory_budget: Optional size in bytes of the in-memory cache that keeps
+                                 queried collections resident (default: disabled)
+            embedding_batch_size: Number of texts sent to Ollama per request (default: 64)
+            embedding_max_workers: Maximum number of concurrent Ollama requests (default: 4)
+            embedding_cache: Whether to cache computed embeddings in a SQLite file next to
+                             the database, named after it with an _embeddings suffix (default: False)
+            embedding_cache_memory_budget: Size in bytes of the in-memory tier of the embedding cache
+            embedding_cache_disk_budget: Size in bytes of the on-disk tier of the embedding cache
+            connection_profile: Optional SQLite profile (balanced, durable, low_memory,
+                                compat) or PRAGMA overrides (default: balanced)
+            max_workers: Number of threads running database calls (default: 4)
+
+        Example:
+            async with skypydb.AsyncVectorClient() as client:
+                collection = await client.get_or_create_collection("articles")
+                results = await collection.query(query_texts=["machine learning"])
+        """
+
+        self._executor = DatabaseExecutor(max_workers)
+        self._client = VectorClient(
+            path=path,
+            embedding_model=embedding_model,
+            ollama_base_url=ollama_base_url,
+            cache_memory_budget=cache_memory_budget,
+            embedding_batch_size=embedding_batch_size,
+            embedding_max_workers=embedding_max_workers,
+            embedding_cache=embedding_cache,
+            embedding_cache_memory_budget=embedding_cache_memory_budget,
+            embedding_cache_disk_budget=embedding_cache_disk_budget,
+            connection_profile=connection_profile
+        )
+        self.path = self._client.path
+
+        # share the embedding cache with the synchronous client
+        self._embedding_function = AsyncOllamaEmbedding(
+            model=embedding_model,
+            base_url=ollama_base_url,
+            batch_size=embedding_batch_size,
+            max_workers=embedding_max_workers,
+            cache=self._client._embedding_function.cache
+        )
+
+        # cache for collection instances
+        self._collections: Dict[str, AsyncCollection] = {}
+
+    async def __aenter__(self) -> "AsyncVectorClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def create_collection(
+        self,
+        name: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        get_or_create: bool = False,
+        metadata_indexes: Optional[List[str]] = None
+    ) -> AsyncCollection:
+        """
+        Create a new collection.
+
+        Args:
+            name: Unique name for the collection
+            metadata: Optional metadata to attach to the collection
+            get_or_create: If True, return existing collection if it exists
+            metadata_indexes: Optional metadata keys to index
+
+        Returns:
+            AsyncCollection instance
+
+        Raises:
+            ValueError: If collection already exists and get_or_create is False
+        """
+
+        collection = await self._executor.write(
+            self._client.create_collection,
+            name,
+            metadata,
+            get_or_create=get_or_create,
+            metadata_indexes=metadata_indexes
+        )
+        return self._wrap(collection)
+
+    async def get_collection(
+        self,
+        name: str
+    ) -> AsyncCollection:
+        """
+        Get an existing collection by name.
+
+        Args:
+            name: Name of the collection to retrieve
+
+        Returns:
+            AsyncCollection instance
+
+        Raises:
+            ValueError: If collection doesn't exist
+        """
+
+        collection = await self._executor.read(self._client.get_collection, name)
+        return self._wrap(collection)
+
+    async def get_or_create_collection(
+        self,
+        name: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_indexes: Optional[List[str]] = None
+    ) -> AsyncCollection:
+        """
+        Get an existing collection or create a new one.
+
+        Args:
+            name: Name of the collection
+            metadata: Optional metadata (used only when creating)
+            metadata_indexes: Optional metadata keys to index
+
+        Returns:
+            AsyncCollection instance
+        """
+
+        collection = await self._executor.write(
+            self._client.get_or_create_collection,
+            name,
+            metadata,
+            metadata_indexes=metadata_indexes
+        )
+        return self._wrap(collection)
+
+    async def list_collections(
+        self
+    ) -> List[AsyncCollection]:
+        """
+        List all collections in the database.
+
+        Returns:
+            List of AsyncCollection instances
+        """
+
+        collections = await self._executor.read(self._client.list_collections)
+        return [self._wrap(collection) for collection in collections]
+
+    async def delete_collection(
+        self,
+        name: str
+    ) -> None:
+        """
+        Delete a collection and all its data.
+
+        Args:
+            name: Name of the collection to delete
+
+        Raises:
+            ValueError: If collection doesn't exist
+        """
+
+        await self._executor.write(self._client.delete_collection, name)
+        self._collections.pop(name, None)
+
+    async def reset(
+        self
+    ) -> bool:
+        """
+        Reset the database by deleting all collections.
+
+        Returns:
+            True if reset was successful
+        """
+
+        result = await self._executor.write(self._client.reset)
+        self._collections.clear()
+        return result
+
+    async def heartbeat(
+        self
+    ) -> int:
+        """
+        Check if the database is alive.
+
+        Returns:
+            Current timestamp in nanoseconds
+        """
+
+        return int(time.time() * 1e9)
+
+    async def close(
+        self
+    ) -> None:
+        """
+        Close the database connection and the connections to Ollama.
+        """
+
+        await self._embedding_function.close()
+        await self._executor.write(self._client.close)
+        self._executor.shutdown()
+        self._collections.clear()
+
+    def _wrap(
+        self,
+        collection: Any
+    ) -> AsyncCollection:
+        """
+        Get the asynchronous instance of a collection, cached by name.
+        """
+
+        async_collection = self._collections.get(collection.name)
+        if async_collection is None or async_collection._collection is not collection:
+            async_collection = AsyncCollection(
+                collection=collection,
+                executor=self._executor,
+                embedding_function=self._embedding_function
+            )
+            self._collections[collection.name] = async_collection
+        return async_collection
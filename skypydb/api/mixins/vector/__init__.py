@@ -7,11 +7,13 @@ from skypydb.api.mixins.vector.sysget import SysGet
 from skypydb.api.mixins.vector.syslist import SysList
 from skypydb.api.mixins.vector.sysdelete import SysDelete
 from skypydb.api.mixins.vector.utils import Utils
+from skypydb.api.mixins.vector.executor import DatabaseExecutor
 
 __all__ = [
     "SysCreate",
     "SysGet",
     "SysList",
     "SysDelete",
-    "Utils"
+    "Utils",
+    "DatabaseExecutor"
 ]
\ No newline at end of file
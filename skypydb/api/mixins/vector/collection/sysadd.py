@@ -8,6 +8,7 @@ from typing import (
     Optional,
     List
 )
+from skypydb.database.mixins.vector.sysadd import DEFAULT_BATCH_SIZE
 
 class SysAdd:
     def add(
@@ -15,7 +16,8 @@ class SysAdd:
         ids: List[str],
         embeddings: Optional[List[List[float]]] = None,
         documents: Optional[List[str]] = None,
-        metadatas: Optional[List[Dict[str, Any]]] = None
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
     ) -> None:
         """
         Add items to the collection.
@@ -25,6 +27,8 @@ class SysAdd:
             embeddings: Optional pre-computed embedding vectors
             documents: Optional text documents to embed and store
             metadatas: Optional metadata dictionaries for each item
+            batch_size: Number of rows written per batch, the whole call is
+                        still applied in a single transaction
 
         Raises:
             ValueError: If neither embeddings nor documents provided,
@@ -51,5 +55,6 @@ class SysAdd:
             ids=ids,
             embeddings=embeddings,
             documents=documents,
-            metadatas=metadatas
+            metadatas=metadatas,
+            batch_size=batch_size
         )
\ No newline at end of file
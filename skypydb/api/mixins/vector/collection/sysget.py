@@ -5,6 +5,7 @@ Module containing the SysGet class, which is used to get items from a collection
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
     List
 )
@@ -17,19 +18,25 @@ class SysGet:
         where_document: Optional[Dict[str, str]] = None,
         include: Optional[List[str]] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        after_id: Optional[str] = None
     ) -> Dict[str, List[Any]]:
         """
         Get items from the collection by ID or filter.
 
+        Items are returned in ID order, with or without pagination, earlier
+        releases returned unpaginated items in insertion order.
+
         Args:
             ids: Optional list of IDs to retrieve
             where: Optional metadata filter
             where_document: Optional document content filter
             include: Optional list of fields to include
                     (embeddings, documents, metadatas)
-            limit: Optional maximum number of results
+            limit: Optional maximum number of results, 0 returns no items
             offset: Optional offset for pagination
+            after_id: Optional ID of the last item of the previous page, for
+                      pages that stay stable during writes
 
         Returns:
             Dictionary with lists of ids, embeddings, documents, metadatas
@@ -48,25 +55,71 @@ class SysGet:
             for i, doc_id in enumerate(results["ids"]):
                 print(f"ID: {doc_id}")
                 print(f"Document: {results['documents'][i]}")
+
+            # Page through a large collection
+            page = collection.get(limit=100, include=["documents"])
+            while page["ids"]:
+                page = collection.get(limit=100, after_id=page["ids"][-1], include=["documents"])
         """
 
-        results = self._db.get(
+        return self._db.get(
             collection_name=self._name,
             ids=ids,
             where=where,
             where_document=where_document,
-            include=include
+            include=include,
+            limit=limit,
+            offset=offset,
+            after_id=after_id
         )
-        # apply limit and offset
-        if offset is not None or limit is not None:
-            start = offset or 0
-            end = (start + limit) if limit else None
-
-            results["ids"] = results["ids"][start:end]
-            if results.get("embeddings") is not None:
-                results["embeddings"] = results["embeddings"][start:end]
-            if results.get("documents") is not None:
-                results["documents"] = results["documents"][start:end]
-            if results.get("metadatas") is not None:
-                results["metadatas"] = results["metadatas"][start:end]
-        return results
\ No newline at end of file
+
+    def iter(
+        self,
+        batch_size: int = 1000,
+        include: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None
+    ) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Iterate over the items of the collection in batches, in ID order.
+
+        Each batch is read with its own query continuing after the last ID
+        of the previous batch, so memory stays bounded by batch_size and no
+        database connection is held between batches.
+
+        Args:
+            batch_size: Maximum number of items per batch (default: 1000)
+            include: Optional list of fields to include
+                    (embeddings, documents, metadatas)
+            where: Optional metadata filter
+            where_document: Optional document content filter
+
+        Yields:
+            Dictionaries with lists of ids, embeddings, documents, metadatas
+
+        Raises:
+            ValueError: If batch_size is not positive
+
+        Example:
+            for batch in collection.iter(batch_size=500, include=["documents"]):
+                export(batch["ids"], batch["documents"])
+        """
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        after_id = None
+        while True:
+            batch = self.get(
+                where=where,
+                where_document=where_document,
+                include=include,
+                limit=batch_size,
+                after_id=after_id
+            )
+            if not batch["ids"]:
+                return
+            yield batch
+            if len(batch["ids"]) < batch_size:
+                return
+            after_id = batch["ids"][-1]
@@ -17,7 +17,9 @@ class SysQuery:
         n_results: int = 10,
         where: Optional[Dict[str, Any]] = None,
         where_document: Optional[Dict[str, str]] = None,
-        include: Optional[List[str]] = None
+        include: Optional[List[str]] = None,
+        ef_search: Optional[int] = None,
+        exact: bool = False
     ) -> Dict[str, List[List[Any]]]:
         """
         Query the collection for similar items.
@@ -30,6 +32,10 @@ class SysQuery:
             where_document: Optional document content filter
             include: Optional list of fields to include in results
                     (embeddings, documents, metadatas, distances)
+            ef_search: Optional HNSW candidate list size for this query,
+                       higher values trade latency for recall
+            exact: If True, use brute-force search even if the collection
+                   was created with an HNSW index
 
         Returns:
             Dictionary with nested lists of results for each query
@@ -48,6 +54,13 @@ class SysQuery:
                 where={"category": "technology"}
             )
 
+            # Query an HNSW indexed collection with a wider search
+            results = collection.query(
+                query_texts=["AI applications"],
+                n_results=10,
+                ef_search=200
+            )
+
             # Access results (first query's results)
             for i, doc_id in enumerate(results["ids"][0]):
                 print(f"ID: {doc_id}")
@@ -62,5 +75,7 @@ class SysQuery:
             n_results=n_results,
             where=where,
             where_document=where_document,
-            include=include
+            include=include,
+            ef_search=ef_search,
+            exact=exact
         )
\ No newline at end of file
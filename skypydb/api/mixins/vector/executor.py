@@ -0,0 +1,98 @@
+"""
+Module containing the DatabaseExecutor class, which is used to run database calls from coroutines.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Optional
+)
+
+class DatabaseExecutor:
+    """
+    Dedicated thread pool running the blocking database calls of the async API.
+
+    Reads run concurrently on the reader connections of the database, also
+    while a write is running. Writes share the writer connection, so they
+    run one at a time and a transaction never interleaves with another.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of threads running database calls
+
+        Raises:
+            ValueError: If max_workers is not positive
+        """
+
+        if max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="skypydb-db"
+        )
+        # created in the running loop
+        self._write_lock: Optional[asyncio.Lock] = None
+
+    async def read(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a call that doesn't modify the database.
+        """
+
+        return await self._run(function, *args, **kwargs)
+
+    async def write(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a call that modifies the database, after the running writes.
+        """
+
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        async with self._write_lock:
+            return await self._run(function, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        """
+        Stop the threads once the submitted calls are done.
+        """
+
+        self._executor.shutdown(wait=True)
+
+    async def _run(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a call on the pool.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # the call keeps running in its thread, a write keeps the lock until it's done
+            await asyncio.wait([future])
+            raise
@@ -5,6 +5,7 @@ Module containing the SysCreate class, which is used to create a collection.
 from typing import (
     Any,
     Dict,
+    List,
     Optional,
     TYPE_CHECKING
 )
@@ -17,7 +18,8 @@ class SysCreate:
         self,
         name: str,
         metadata: Optional[Dict[str, Any]] = None,
-        get_or_create: bool = False
+        get_or_create: bool = False,
+        metadata_indexes: Optional[List[str]] = None
     ) -> "Collection":
         """
         Create a new collection.
@@ -29,6 +31,8 @@ class SysCreate:
             name: Unique name for the collection
             metadata: Optional metadata to attach to the collection
             get_or_create: If True, return existing collection if it exists
+            metadata_indexes: Optional metadata keys to index, so filters
+                              on them don't scan the whole collection
 
         Returns:
             Collection instance
@@ -45,6 +49,12 @@ class SysCreate:
                 "articles",
                 get_or_create=True
             )
+
+            # Index metadata keys used in filters
+            collection = client.create_collection(
+                "memories",
+                metadata_indexes=["user_id", "agent_id"]
+            )
         """
 
         if get_or_create:
@@ -52,10 +62,10 @@ class SysCreate:
             # We intentionally discard the returned instance here so that
             # this method can apply a consistent caching strategy via
             # self._collections below.
-            self.get_or_create_collection(name, metadata)
+            self.get_or_create_collection(name, metadata, metadata_indexes=metadata_indexes)
         else:
             # Create collection in database
-            self._db.create_collection(name, metadata)
+            self._db.create_collection(name, metadata, metadata_indexes=metadata_indexes)
 
         # Create and cache collection instance (or return cached one)
         _collection = self._collections.get(name)
@@ -5,6 +5,7 @@ Module containing the SysGet class, which is used to get a collection.
 from typing import (
     Any,
     Dict,
+    List,
     Optional,
     TYPE_CHECKING
 )
@@ -55,7 +56,8 @@ class SysGet:
     def get_or_create_collection(
         self,
         name: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_indexes: Optional[List[str]] = None
     ) -> "Collection":
         """
         Get an existing collection or create a new one.
@@ -63,6 +65,8 @@ class SysGet:
         Args:
             name: Name of the collection
             metadata: Optional metadata (used only when creating)
+            metadata_indexes: Optional metadata keys to index, missing indexes
+                              are also added to an existing collection
 
         Returns:
             Collection instance
@@ -73,7 +77,11 @@ class SysGet:
         """
 
         # get or create in database
-        collection_info = self._db.get_or_create_collection(name, metadata)
+        collection_info = self._db.get_or_create_collection(
+            name,
+            metadata,
+            metadata_indexes=metadata_indexes
+        )
 
         # return cached instance if available
         if name in self._collections:
@@ -3,7 +3,12 @@ Client API for Skypydb.
 """
 
 import os
-from typing import Optional
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union
+)
 from skypydb.database.reactive_db import ReactiveDatabase
 from skypydb.api.mixins.reactive import (
     SysCreate,
@@ -25,7 +30,10 @@ class ReactiveClient(
         path: str = "./db/_generated/skypydb.db",
         encryption_key: Optional[str] = None,
         salt: Optional[bytes] = None,
-        encrypted_fields: Optional[list] = None
+        encrypted_fields: Optional[list] = None,
+        connection_profile: Union[str, Dict[str, Any], None] = None,
+        change_log: bool = False,
+        blind_indexed_fields: Optional[list] = None
     ):
         """
         Initialize Skypydb client.
@@ -40,6 +48,14 @@ class ReactiveClient(
             encrypted_fields: Optional list of field names to encrypt.
                              If None and encryption is enabled, all fields except
                              'id' and 'created_at' will be encrypted.
+            connection_profile: Optional SQLite profile (balanced, durable, low_memory,
+                                compat) or PRAGMA overrides (default: balanced)
+            change_log: Whether inserts and deletes are logged for Table.subscribe from the
+                        start; the first subscription enables it otherwise. The log is kept
+                        in the database file, every writer logs its changes once it exists
+                        (default: False)
+            blind_indexed_fields: Optional list of encrypted fields searchable by equality
+                                  and IN filters through an HMAC blind index.
 
         Example:
             # Without encryption
@@ -57,6 +73,13 @@ class ReactiveClient(
                 encryption_key=key,
                 encrypted_fields=["content", "email", "password"]
             )
+
+            # With encrypted fields searchable by equality
+            client = skypydb.Client(
+                encryption_key=key,
+                encrypted_fields=["content", "email"],
+                blind_indexed_fields=["email"]
+            )
         """
 
         # constant to define the path to the database file
@@ -71,7 +94,10 @@ class ReactiveClient(
             DB_PATH,
             encryption_key=encryption_key,
             salt=salt,
-            encrypted_fields=encrypted_fields
+            encrypted_fields=encrypted_fields,
+            connection_profile=connection_profile,
+            change_log=change_log,
+            blind_indexed_fields=blind_indexed_fields
         )
 
     def close(self) -> None:
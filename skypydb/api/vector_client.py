@@ -3,9 +3,19 @@ Vector Client API for Skypydb.
 """
 
 import os
-from typing import Dict
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union
+)
 from skypydb.database.vector_db import VectorDatabase
 from skypydb.embeddings.ollama import OllamaEmbedding
+from skypydb.embeddings.cache import (
+    EmbeddingCache,
+    DEFAULT_MEMORY_BUDGET,
+    DEFAULT_DISK_BUDGET
+)
 from skypydb.api.collection import Collection
 from skypydb.api.mixins.vector import (
     SysCreate,
@@ -30,7 +40,14 @@ class VectorClient(
         self,
         path: str = "./db/_generated/vector.db",
         embedding_model: str = "mxbai-embed-large",
-        ollama_base_url: str = "http://localhost:11434"
+        ollama_base_url: str = "http://localhost:11434",
+        cache_memory_budget: Optional[int] = None,
+        embedding_batch_size: int = 64,
+        embedding_max_workers: int = 4,
+        embedding_cache: bool = False,
+        embedding_cache_memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        embedding_cache_disk_budget: int = DEFAULT_DISK_BUDGET,
+        connection_profile: Union[str, Dict[str, Any], None] = None
     ):
         """
         Initialize Vector Client.
@@ -39,6 +56,16 @@ class VectorClient(
             path: Path to the database file. Defaults to ./db/_generated/vector.db
             embedding_model: Ollama model to use for embeddings (default: mxbai-embed-large)
             ollama_base_url: Base URL for Ollama API (default: http://localhost:11434)
+            cache_memory_budget: Optional size in bytes of the in-memory cache that keeps
+                                 queried collections resident (default: disabled)
+            embedding_batch_size: Number of texts sent to Ollama per request (default: 64)
+            embedding_max_workers: Maximum number of concurrent Ollama requests (default: 4)
+            embedding_cache: Whether to cache computed embeddings in a SQLite file next to
+                             the database, named after it with an _embeddings suffix (default: False)
+            embedding_cache_memory_budget: Size in bytes of the in-memory tier of the embedding cache
+            embedding_cache_disk_budget: Size in bytes of the on-disk tier of the embedding cache
+            connection_profile: Optional SQLite profile (balanced, durable, low_memory,
+                                compat) or PRAGMA overrides (default: balanced)
 
         Example:
             # Basic usage with defaults
@@ -46,6 +73,12 @@ class VectorClient(
 
             # With custom embedding model
             client = skypydb.VectorClient(embedding_model="mxbai-embed-large")
+
+            # Keep up to 512 MB of hot collections in memory
+            client = skypydb.VectorClient(cache_memory_budget=512 * 1024 * 1024)
+
+            # Never embed the same text twice, caching embeddings in vector_embeddings.db
+            client = skypydb.VectorClient(embedding_cache=True)
         """
 
         # constant to define the path to the database file
@@ -58,15 +91,27 @@ class VectorClient(
         self.path = DB_PATH
 
         # set up embedding function
+        cache = None
+        if embedding_cache:
+            cache = EmbeddingCache(
+                path=f"{os.path.splitext(DB_PATH)[0]}_embeddings.db",
+                memory_budget=embedding_cache_memory_budget,
+                disk_budget=embedding_cache_disk_budget
+            )
         self._embedding_function = OllamaEmbedding(
             model=embedding_model,
-            base_url=ollama_base_url
+            base_url=ollama_base_url,
+            batch_size=embedding_batch_size,
+            max_workers=embedding_max_workers,
+            cache=cache
         )
 
         # initialize vector database
         self._db = VectorDatabase(
             path=DB_PATH,
-            embedding_function=self._embedding_function
+            embedding_function=self._embedding_function,
+            cache_memory_budget=cache_memory_budget,
+            connection_profile=connection_profile
         )
 
         # cache for collection instances
@@ -80,4 +125,5 @@ class VectorClient(
         """
 
         self._db.close()
+        self._embedding_function.close()
         self._collections.clear()
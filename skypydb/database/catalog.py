@@ -0,0 +1,231 @@
+"""
+Module containing the SchemaCatalog class, which is used to cache the schema of a database.
+"""
+
+import sqlite3
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set
+)
+
+class SchemaCatalog:
+    """
+    Cache of the tables, their columns and the metadata rows describing them.
+
+    Every lookup compares PRAGMA schema_version with the version the cache
+    was filled at, which is a read of the database header, and drops the
+    cache when another connection or process changed the schema. Schema
+    changes made through this database update the cache instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._version: Optional[int] = None
+        self._tables: Optional[Set[str]] = None
+        self._columns: Dict[str, List[str]] = {}
+        self._entries: Dict[str, Any] = {}
+
+    def table_exists(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str
+    ) -> bool:
+        """
+        Check if a table exists.
+
+        Args:
+            conn: Connection used to read the schema
+            table_name: Name of the table
+
+        Returns:
+            True if the table exists
+        """
+
+        with self._lock:
+            self._validate(conn)
+            if self._tables is None:
+                cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                self._tables = {row[0] for row in cursor.fetchall()}
+            return table_name in self._tables
+
+    def get_columns(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str
+    ) -> List[str]:
+        """
+        Get the column names of an existing table.
+
+        Args:
+            conn: Connection used to read the schema
+            table_name: Name of the table
+
+        Returns:
+            List of column names, in table order
+        """
+
+        with self._lock:
+            self._validate(conn)
+            columns = self._columns.get(table_name)
+            if columns is None:
+                cursor = conn.execute(f"PRAGMA table_info([{table_name}])")
+                columns = [row[1] for row in cursor.fetchall()]
+                self._columns[table_name] = columns
+            return list(columns)
+
+    def get_entry(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        load: Callable[[], Any]
+    ) -> Any:
+        """
+        Get a cached metadata row, such as the metadata of a collection.
+
+        Only rows that change together with the schema may be cached here.
+
+        Args:
+            conn: Connection used to read the schema
+            key: Key of the row
+            load: Function reading the row when it isn't cached
+
+        Returns:
+            The cached or loaded row
+        """
+
+        with self._lock:
+            self._validate(conn)
+            if key not in self._entries:
+                self._entries[key] = load()
+            return self._entries[key]
+
+    def schema_changed(
+        self,
+        conn: sqlite3.Connection
+    ) -> None:
+        """
+        Record a schema change made through this database that doesn't
+        affect the cached tables, such as a new index.
+        """
+
+        with self._lock:
+            self._adopt(conn)
+
+    def table_created(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str
+    ) -> None:
+        """
+        Record a table created through this database.
+        """
+
+        with self._lock:
+            self._adopt(conn)
+            if self._tables is not None:
+                self._tables.add(table_name)
+            self._columns.pop(table_name, None)
+
+    def table_dropped(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str
+    ) -> None:
+        """
+        Record a table dropped through this database.
+        """
+
+        with self._lock:
+            self._adopt(conn)
+            if self._tables is not None:
+                self._tables.discard(table_name)
+            self._columns.pop(table_name, None)
+
+    def columns_added(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str,
+        columns: List[str]
+    ) -> None:
+        """
+        Record columns added to a table through this database.
+        """
+
+        with self._lock:
+            self._adopt(conn)
+            existing = self._columns.get(table_name)
+            if existing is not None:
+                existing.extend(column for column in columns if column not in existing)
+
+    def set_entry(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        value: Any
+    ) -> None:
+        """
+        Record a metadata row written through this database.
+        """
+
+        with self._lock:
+            self._adopt(conn)
+            self._entries[key] = value
+
+    def forget_entry(
+        self,
+        key: str
+    ) -> None:
+        """
+        Drop a cached metadata row, it is read again on the next lookup.
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self) -> None:
+        """
+        Drop the whole cache.
+        """
+
+        with self._lock:
+            self._version = None
+            self._clear()
+
+    def _validate(
+        self,
+        conn: sqlite3.Connection
+    ) -> None:
+        """
+        Drop the cache if the schema changed since it was filled.
+        """
+
+        version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        if version != self._version:
+            self._clear()
+            self._version = version
+
+    def _adopt(
+        self,
+        conn: sqlite3.Connection
+    ) -> None:
+        """
+        Accept the schema version of a change made through this database.
+        """
+
+        if self._version is None:
+            return
+        self._version = conn.execute("PRAGMA schema_version").fetchone()[0]
+
+    def _clear(self) -> None:
+        """
+        Drop every cached table, column list and metadata row.
+        """
+
+        self._tables = None
+        self._columns.clear()
+        self._entries.clear()
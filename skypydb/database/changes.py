@@ -0,0 +1,291 @@
+"""
+Module containing the ChangeFeed class, which is used to log the changes made to the tables of a database.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.errors import ChangesPrunedError
+
+# name of the system table holding the change log
+CHANGES_TABLE = "_skypy_changes"
+
+# name of the system table holding the last pruned sequence number of each table
+PRUNED_TABLE = "_skypy_changes_pruned"
+
+# key of the pruned sequence number shared by every table
+ALL_TABLES = "*"
+
+# number of most recent changes kept in the log, older ones are pruned on write
+DEFAULT_CHANGE_RETENTION = 100_000
+
+class ChangeFeed:
+    """
+    Sequence-numbered log of the rows inserted into and deleted from tables.
+
+    Changes are appended to the _skypy_changes table in the transaction that
+    makes them, so the log never disagrees with the tables. AUTOINCREMENT
+    keeps sequence numbers increasing even after old entries are pruned.
+    Rows are logged as stored, with encrypted fields still encrypted.
+    Waiters in this process are woken when a change is committed, changes
+    made by other processes are seen on their next poll.
+
+    Logging doubles the volume written by inserts, so it is off until
+    enabled, either when the database is opened or by the first
+    subscription. Enabling creates the log table, and every writer that
+    finds the table logs its changes, whichever process or instance it
+    runs in. Only the last retention changes are kept, reading past the
+    pruned entries raises ChangesPrunedError.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        retention: Optional[int] = DEFAULT_CHANGE_RETENTION,
+        catalog: Optional[SchemaCatalog] = None
+    ) -> None:
+        if retention is not None and retention <= 0:
+            raise ValueError("retention must be a positive integer or None")
+        # whether the log is created when the database is opened
+        self.enabled = enabled
+        self.retention = retention
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+        self._condition = threading.Condition()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Number of commits with changes made through this database, read before
+        polling the log and passed to wait so no commit is missed in between.
+        """
+
+        with self._condition:
+            return self._version
+
+    def active(
+        self,
+        conn: sqlite3.Connection
+    ) -> bool:
+        """
+        Check if the changes written to the database are logged.
+
+        The schema catalog notices the log table being created or dropped
+        by another connection, so this costs a read of the schema version.
+        """
+
+        return self.catalog.table_exists(conn, CHANGES_TABLE)
+
+    def create_table(
+        self,
+        conn: sqlite3.Connection
+    ) -> None:
+        """
+        Create the change log tables if they don't exist, which starts logging.
+        """
+
+        cursor = conn.cursor()
+
+        cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {CHANGES_TABLE} (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                table_name TEXT NOT NULL,
+                op TEXT NOT NULL,
+                row_id TEXT,
+                data TEXT,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx{CHANGES_TABLE}_table "
+            f"ON {CHANGES_TABLE} (table_name, seq)"
+        )
+        cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {PRUNED_TABLE} (
+                table_name TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL
+            )
+            """
+        )
+        conn.commit()
+
+    def drop_table(
+        self,
+        conn: sqlite3.Connection
+    ) -> None:
+        """
+        Drop the change log tables, which stops logging for every writer.
+        """
+
+        cursor = conn.cursor()
+
+        cursor.execute(f"DROP TABLE IF EXISTS {CHANGES_TABLE}")
+        cursor.execute(f"DROP TABLE IF EXISTS {PRUNED_TABLE}")
+        conn.commit()
+
+    def record(
+        self,
+        cursor: sqlite3.Cursor,
+        table_name: str,
+        op: str,
+        rows: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Append changes to the log, in the transaction of the cursor.
+
+        Args:
+            cursor: Cursor of the transaction making the changes
+            table_name: Name of the changed table
+            op: Kind of change, "insert" or "delete"
+            rows: Rows inserted or deleted, as stored
+        """
+
+        if not rows or not self.active(cursor.connection):
+            return
+        now = datetime.now().isoformat()
+        cursor.executemany(
+            f"INSERT INTO {CHANGES_TABLE} (table_name, op, row_id, data, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (table_name, op, row.get("id"), json.dumps(row, default=str), now)
+                for row in rows
+            ]
+        )
+        if self.retention is not None:
+            # a range of the primary key, only the entries past the retention are visited
+            cursor.execute(f"SELECT MAX(seq) FROM {CHANGES_TABLE}")
+            boundary = cursor.fetchone()[0] - self.retention
+            cursor.execute(f"DELETE FROM {CHANGES_TABLE} WHERE seq <= ?", (boundary,))
+            if cursor.rowcount > 0:
+                self.pruned(cursor, boundary)
+
+    def pruned(
+        self,
+        cursor: sqlite3.Cursor,
+        sequence: int,
+        table_name: Optional[str] = None
+    ) -> None:
+        """
+        Record that the changes up to a sequence number were deleted, in the
+        transaction of the cursor.
+
+        Args:
+            cursor: Cursor of the transaction deleting the changes
+            sequence: Sequence number of the last deleted change
+            table_name: Optional name of the table (default: all tables)
+        """
+
+        cursor.execute(
+            f"INSERT INTO {PRUNED_TABLE} (table_name, seq) VALUES (?, ?) "
+            "ON CONFLICT (table_name) DO UPDATE SET seq = MAX(seq, excluded.seq)",
+            (table_name or ALL_TABLES, sequence)
+        )
+
+    def committed(self) -> None:
+        """
+        Wake the waiters after changes were committed.
+        """
+
+        with self._condition:
+            self._version += 1
+            self._condition.notify_all()
+
+    def wait(
+        self,
+        version: int,
+        timeout: Optional[float]
+    ) -> bool:
+        """
+        Wait for a commit with changes made through this database.
+
+        Args:
+            version: Version read before the last poll of the log
+            timeout: Maximum number of seconds to wait, None waits forever
+
+        Returns:
+            True if changes were committed since version
+        """
+
+        with self._condition:
+            return self._condition.wait_for(lambda: self._version != version, timeout)
+
+    def read(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str,
+        since: Optional[int],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Read the changes of a table following a sequence number.
+
+        A since of None reads every change still in the log.
+
+        Returns:
+            Changes in sequence order, with the row decoded but not decrypted
+
+        Raises:
+            ChangesPrunedError: If changes following since were pruned
+        """
+
+        if not self.active(conn):
+            return []
+        if since is None:
+            since = 0
+        else:
+            row = conn.execute(
+                f"SELECT MAX(seq) FROM {PRUNED_TABLE} WHERE table_name IN (?, ?)",
+                (table_name, ALL_TABLES)
+            ).fetchone()
+            if row[0] is not None and since < row[0]:
+                raise ChangesPrunedError(
+                    f"Changes of table '{table_name}' after {since} were pruned up to {row[0]}",
+                    sequence=row[0]
+                )
+
+        cursor = conn.execute(
+            f"SELECT seq, op, row_id, data, created_at FROM {CHANGES_TABLE} "
+            "WHERE table_name = ? AND seq > ? ORDER BY seq LIMIT ?",
+            (table_name, since, limit)
+        )
+        return [
+            {
+                "seq": row[0],
+                "op": row[1],
+                "id": row[2],
+                "data": json.loads(row[3]) if row[3] is not None else None,
+                "created_at": row[4]
+            }
+            for row in cursor.fetchall()
+        ]
+
+    def latest(
+        self,
+        conn: sqlite3.Connection,
+        table_name: Optional[str] = None
+    ) -> int:
+        """
+        Get the sequence number of the last change, 0 if there is none.
+        """
+
+        if not self.active(conn):
+            return 0
+        if table_name is None:
+            row = conn.execute(f"SELECT MAX(seq) FROM {CHANGES_TABLE}").fetchone()
+        else:
+            row = conn.execute(
+                f"SELECT MAX(seq) FROM {CHANGES_TABLE} WHERE table_name = ?",
+                (table_name,)
+            ).fetchone()
+        return row[0] or 0
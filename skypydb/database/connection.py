@@ -0,0 +1,391 @@
+"""
+Module containing the ConnectionManager class, which is used to share one writer and a pool of reader connections.
+"""
+
+import queue
+import sqlite3
+import functools
+import threading
+from pathlib import Path
+from contextlib import (
+    contextmanager,
+    nullcontext
+)
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    Optional,
+    Union
+)
+
+# PRAGMA settings applied to every connection, by profile
+PROFILES: Dict[str, Dict[str, Union[int, str]]] = {
+    # WAL lets readers run during writes, NORMAL only syncs at checkpoints
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000
+    },
+    # every commit is synced, nothing is lost on power failure
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -16 * 1024,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000
+    },
+    "low_memory": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 0,
+        "cache_size": -2 * 1024,
+        "temp_store": "FILE",
+        "busy_timeout": 5000
+    },
+    # rollback journal, for file systems without shared memory such as network drives
+    "compat": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -2 * 1024,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000
+    }
+}
+
+DEFAULT_PROFILE = "balanced"
+
+# settings that only matter on the connection that writes
+WRITER_PRAGMAS = ("journal_mode", "synchronous")
+
+# default number of reader connections
+DEFAULT_READERS = 4
+
+def resolve_profile(
+    profile: Union[str, Dict[str, Union[int, str]], None] = None
+) -> Dict[str, Union[int, str]]:
+    """
+    Get the PRAGMA settings of a profile.
+
+    Args:
+        profile: Profile name, or a dictionary of settings overriding the default profile
+
+    Returns:
+        Dictionary of PRAGMA settings
+
+    Raises:
+        ValueError: If the profile or one of the settings is unknown
+    """
+
+    if profile is None:
+        profile = DEFAULT_PROFILE
+    if isinstance(profile, str):
+        if profile not in PROFILES:
+            raise ValueError(
+                f"Unknown connection profile '{profile}', expected one of: {', '.join(PROFILES)}"
+            )
+        return dict(PROFILES[profile])
+
+    pragmas = dict(PROFILES[DEFAULT_PROFILE])
+    for name, value in profile.items():
+        if name not in pragmas:
+            raise ValueError(f"Unknown PRAGMA '{name}' in connection profile")
+        # values are inlined in the PRAGMA statement
+        if not isinstance(value, int) and not (isinstance(value, str) and value.isalnum()):
+            raise ValueError(f"Invalid value for PRAGMA '{name}': {value!r}")
+        pragmas[name] = value
+    return pragmas
+
+def reads(
+    method: Callable[..., Any]
+) -> Callable[..., Any]:
+    """
+    Run a database method on a reader connection of the calling thread.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        reading = getattr(self.conn, "reading", None)
+        if reading is None:
+            # plain connection, passed to a mixin directly
+            return method(self, *args, **kwargs)
+        with reading():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def writing(
+    conn: Any
+) -> ContextManager[None]:
+    """
+    Hold the writer lock of a managed connection for a whole write transaction.
+    """
+
+    section = getattr(conn, "writing", None)
+    if section is None:
+        # plain connection, passed to a mixin directly
+        return nullcontext()
+    return section()
+
+def writes(
+    method: Callable[..., Any]
+) -> Callable[..., Any]:
+    """
+    Run a database method holding the writer lock, from its first statement to its commit or rollback.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        with writing(self.conn):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class ConnectionManager:
+    """
+    One writer connection and a pool of read-only connections to a database.
+
+    Methods decorated with reads run on a reader connection, which in WAL
+    mode sees the last committed state and never waits for the writer.
+    Everything else runs on the writer. A thread with an open write
+    transaction keeps reading from the writer, so it sees its own changes.
+
+    Methods decorated with writes hold the writer lock for their whole
+    transaction, so the statements of two threads never end up in the same
+    transaction and one thread can't commit or roll back the other's work.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        profile: Union[str, Dict[str, Union[int, str]], None] = None,
+        readers: int = DEFAULT_READERS
+    ):
+        """
+        Open the writer connection and configure the database.
+
+        Args:
+            path: Path to SQLite database file
+            profile: Connection profile name or PRAGMA overrides (default: balanced)
+            readers: Maximum number of reader connections, 0 reads from the writer
+
+        Raises:
+            ValueError: If the profile is unknown or readers is negative
+        """
+
+        if readers < 0:
+            raise ValueError("readers must be a non-negative integer")
+
+        self.path = path
+        self.pragmas = resolve_profile(profile)
+
+        # in-memory databases are private to their connection
+        self.in_memory = path in ("", ":memory:") or path.startswith("file::memory:") or "mode=memory" in path
+        self.max_readers = 0 if self.in_memory else readers
+
+        self.writer = sqlite3.connect(path, check_same_thread=False)
+        self.writer.row_factory = sqlite3.Row
+        self._configure(self.writer, writer=True)
+
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        self._local = threading.local()
+        self._writer_thread: Optional[int] = None
+        self._write_lock = threading.RLock()
+        self._closed = False
+
+        self.proxy = ConnectionProxy(self)
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get the connection the calling thread should use.
+        """
+
+        reader = getattr(self._local, "reader", None)
+        if reader is not None:
+            return reader
+        if not self.writer.in_transaction:
+            # the next transaction is opened by the thread using the writer now
+            self._writer_thread = threading.get_ident()
+        return self.writer
+
+    @contextmanager
+    def reading(self) -> Iterator[None]:
+        """
+        Route the calls of the current thread to a reader connection.
+        """
+
+        if (
+            getattr(self._local, "reader", None) is not None
+            or not self.max_readers
+            or self._closed
+            or (self.writer.in_transaction and self._writer_thread == threading.get_ident())
+        ):
+            yield
+            return
+
+        reader = self._acquire()
+        self._local.reader = reader
+        try:
+            yield
+        finally:
+            self._local.reader = None
+            self._release(reader)
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """
+        Hold the writer lock, other threads wait to start their write transactions.
+
+        A transaction left open when the outermost section ends is rolled
+        back, so the next thread never commits half-finished work.
+        """
+
+        with self._write_lock:
+            depth = getattr(self._local, "write_depth", 0)
+            self._local.write_depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.write_depth = depth
+                if not depth and not self._closed and self.writer.in_transaction:
+                    self.rollback()
+
+    def commit(self) -> None:
+        """
+        Commit the transaction of the writer.
+        """
+
+        self.writer.commit()
+        self._writer_thread = None
+
+    def rollback(self) -> None:
+        """
+        Roll back the transaction of the writer.
+        """
+
+        self.writer.rollback()
+        self._writer_thread = None
+
+    def close(self) -> None:
+        """
+        Close every connection, readers in use are closed when released.
+        """
+
+        # wait for the write transaction in progress
+        with self._write_lock:
+            self._closed = True
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+        self.writer.close()
+
+    def _acquire(self) -> sqlite3.Connection:
+        """
+        Take an idle reader, opening one if the pool isn't full.
+        """
+
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._readers_lock:
+            if len(self._readers) < self.max_readers:
+                reader = sqlite3.connect(
+                    f"{Path(self.path).resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=False
+                )
+                reader.row_factory = sqlite3.Row
+                self._configure(reader, writer=False)
+                self._readers.append(reader)
+                return reader
+        return self._pool.get()
+
+    def _release(
+        self,
+        reader: sqlite3.Connection
+    ) -> None:
+        """
+        Give a reader back to the pool.
+        """
+
+        if reader.in_transaction:
+            reader.rollback()
+        if self._closed:
+            reader.close()
+            return
+        self._pool.put(reader)
+
+    def _configure(
+        self,
+        conn: sqlite3.Connection,
+        writer: bool
+    ) -> None:
+        """
+        Apply the PRAGMA settings of the profile to a connection.
+        """
+
+        for name, value in self.pragmas.items():
+            if name in WRITER_PRAGMAS and not writer:
+                continue
+            if name == "journal_mode" and self.in_memory:
+                continue
+            conn.execute(f"PRAGMA {name} = {value}")
+
+class ConnectionProxy:
+    """
+    Stand-in for a sqlite3 connection that forwards every call to the
+    connection of the calling thread, so the mixins keep using self.conn.
+    """
+
+    def __init__(
+        self,
+        manager: ConnectionManager
+    ):
+        self._manager = manager
+
+    def __getattr__(
+        self,
+        name: str
+    ) -> Any:
+        return getattr(self._manager.connection(), name)
+
+    def reading(self) -> Any:
+        """
+        Route the calls of the current thread to a reader connection.
+        """
+
+        return self._manager.reading()
+
+    def writing(self) -> Any:
+        """
+        Hold the writer lock for a whole write transaction.
+        """
+
+        return self._manager.writing()
+
+    def commit(self) -> None:
+        connection = self._manager.connection()
+        if connection is self._manager.writer:
+            self._manager.commit()
+        else:
+            connection.commit()
+
+    def rollback(self) -> None:
+        connection = self._manager.connection()
+        if connection is self._manager.writer:
+            self._manager.rollback()
+        else:
+            connection.rollback()
+
+    def close(self) -> None:
+        self._manager.close()
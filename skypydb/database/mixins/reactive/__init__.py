@@ -13,6 +13,9 @@ from .encryption import Encryption
 from .rsysadd import RSysAdd
 from .rsyssearch import RSysSearch
 from .rsysdelete import RSysDelete
+from .rsysstats import RSysStats
+from .rsysmigrate import RSysMigrate
+from .rsyschanges import RSysChanges
 
 __all__ = [
     "SysCreate",
@@ -23,5 +26,8 @@ __all__ = [
     "Encryption",
     "RSysAdd",
     "RSysDelete",
-    "RSysSearch"
+    "RSysSearch",
+    "RSysStats",
+    "RSysMigrate",
+    "RSysChanges"
 ]
@@ -0,0 +1,129 @@
+"""
+Module containing the blind index helpers, which are used to keep the blind-index columns of a table.
+"""
+
+import sqlite3
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.mixins.reactive.tables.audit import AuditTable
+from skypydb.database.mixins.reactive.encryption import (
+    Encryption,
+    blind_index_column
+)
+
+def ensure_blind_index_columns(
+    conn: sqlite3.Connection,
+    catalog: SchemaCatalog,
+    audit: AuditTable,
+    encryption: Optional[Encryption],
+    table_name: str,
+    rebuild: bool = False
+) -> int:
+    """
+    Create the blind-index columns of a table and fill them for its existing rows.
+
+    Each blind-indexed field gets a shadow column with an SQLite index. The
+    column is filled once, when it is created, by decrypting the stored
+    values; afterwards inserts write it.
+
+    Args:
+        conn: Writer connection
+        catalog: Schema catalog of the database
+        audit: Table checks of the database
+        encryption: Encryption of the database
+        table_name: Name of the validated table
+        rebuild: Whether to fill columns that already exist again (default: False)
+
+    Returns:
+        Number of blind indexes written
+    """
+
+    fields = encryption.blind_indexed_fields if encryption is not None else []
+    if not fields:
+        return 0
+
+    columns = catalog.get_columns(conn, table_name)
+    pending = [
+        field for field in fields
+        if rebuild or blind_index_column(field) not in columns
+    ]
+    if not pending:
+        return 0
+
+    audit.add_columns_if_needed(table_name, [blind_index_column(field) for field in pending])
+
+    cursor = conn.cursor()
+
+    written = 0
+    try:
+        for field in pending:
+            shadow = blind_index_column(field)
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS [idx_{table_name}_{shadow}] ON [{table_name}] ([{shadow}])"
+            )
+            if field not in columns:
+                continue
+            rows = cursor.execute(
+                f"SELECT rowid, [{field}] FROM [{table_name}] WHERE [{field}] IS NOT NULL"
+            ).fetchall()
+            if not rows:
+                continue
+            # the stored values are decrypted a column at a time
+            decrypted = encryption.decrypt_rows([{field: row[1]} for row in rows])
+            cursor.executemany(
+                f"UPDATE [{table_name}] SET [{shadow}] = ? WHERE rowid = ?",
+                [
+                    (encryption.blind_index(table_name, field, plain[field]), row[0])
+                    for row, plain in zip(rows, decrypted)
+                ]
+            )
+            written += len(rows)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    catalog.schema_changed(conn)
+    return written
+
+def translate_filters(
+    conn: sqlite3.Connection,
+    catalog: SchemaCatalog,
+    encryption: Optional[Encryption],
+    table_name: str,
+    filters: Dict[str, Any]
+) -> List[Tuple[str, Any]]:
+    """
+    Replace the filters on blind-indexed fields by filters on their blind indexes.
+
+    Filters on tables whose blind-index columns don't exist yet are kept,
+    they compare against the encrypted values as before.
+
+    Args:
+        conn: Connection used to read the columns of the table
+        catalog: Schema catalog of the database
+        encryption: Encryption of the database
+        table_name: Name of the validated table
+        filters: Validated column-value pairs, values may be lists
+
+    Returns:
+        List of the column and value pairs to compare
+    """
+
+    if encryption is None or not encryption.blind_indexed_fields:
+        return list(filters.items())
+
+    columns = catalog.get_columns(conn, table_name)
+    translated = []
+    for column, value in filters.items():
+        blind_filter = encryption.blind_index_filter(table_name, column, value)
+        if blind_filter is not None and blind_filter[0] in columns:
+            translated.append(blind_filter)
+        else:
+            translated.append((column, value))
+    return translated
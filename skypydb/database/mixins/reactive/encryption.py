@@ -5,17 +5,52 @@ Module containing the Encryption class, which is used to encrypt and decrypt dat
 from typing import (
     Dict,
     Any,
-    Optional
+    List,
+    Optional,
+    Tuple
 )
 from skypydb.security.encryption import EncryptionManager
 
+# prefix of the shadow columns holding the blind indexes of encrypted fields
+BLIND_INDEX_PREFIX = "_skypy_bidx_"
+
+def blind_index_column(
+    field: str
+) -> str:
+    """
+    Get the name of the column holding the blind indexes of a field.
+    """
+
+    return f"{BLIND_INDEX_PREFIX}{field}"
+
+def is_blind_index_column(
+    column: str
+) -> bool:
+    """
+    Check if a column holds blind indexes, such columns are never returned to callers.
+    """
+
+    return column.startswith(BLIND_INDEX_PREFIX)
+
+def without_blind_indexes(
+    row: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Get a row without its blind-index columns.
+    """
+
+    return {column: value for column, value in row.items() if not is_blind_index_column(column)}
+
 class Encryption:
     def __init__(
         self,
         path: str,
         encryption_key: Optional[str] = None,
         salt: Optional[bytes] = None,
-        encrypted_fields: Optional[list] = None
+        encrypted_fields: Optional[list] = None,
+        workers: Optional[int] = None,
+        encryption_manager: Optional[EncryptionManager] = None,
+        blind_indexed_fields: Optional[list] = None
     ):
         """
         Initialize the encryption module.
@@ -24,6 +59,9 @@ class Encryption:
             encryption_key: Optional encryption key for data encryption
             salt: Optional salt for encryption key derivation
             encrypted_fields: Optional list of fields to encrypt
+            workers: Optional number of threads encrypting and decrypting large result sets
+            encryption_manager: Optional manager already created for the key, to derive the key once
+            blind_indexed_fields: Optional list of encrypted fields searchable by equality through a blind index
         """
 
         self.encryption_key = encryption_key
@@ -34,9 +72,21 @@ class Encryption:
                 "use [] to disable encryption."
             )
         self.encrypted_fields = encrypted_fields if encrypted_fields is not None else []
+        self.encryption_workers = workers
 
-        # initialize encryption manager
-        self._encryption_manager = EncryptionManager(encryption_key=encryption_key, salt=salt)
+        # initialize encryption manager, unless the caller already derived the key
+        if encryption_manager is None:
+            encryption_manager = EncryptionManager(encryption_key=encryption_key, salt=salt)
+        self._encryption_manager = encryption_manager
+
+        blind_indexed_fields = blind_indexed_fields or []
+        unencrypted = [field for field in blind_indexed_fields if field not in self.encrypted_fields]
+        if unencrypted:
+            raise ValueError(
+                f"blind_indexed_fields must be encrypted fields, not in encrypted_fields: {unencrypted}"
+            )
+        # without a key the fields are stored in clear and searched directly
+        self.blind_indexed_fields = blind_indexed_fields if encryption_manager.enabled else []
 
     def encrypt_data(
         self,
@@ -85,3 +135,151 @@ class Encryption:
             if key in self.encrypted_fields
         ]
         return self._encryption_manager.decrypt_dict(data, fields_to_decrypt)
+
+    def encrypt_rows(
+        self,
+        rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Encrypt sensitive fields in many rows, one column at a time.
+
+        Args:
+            rows: Dictionaries containing data to encrypt
+
+        Returns:
+            New dictionaries with encrypted fields
+        """
+
+        if not self._encryption_manager.enabled or not rows:
+            return rows
+        return self._transform_columns(rows, self._encryption_manager.encrypt_many)
+
+    def decrypt_rows(
+        self,
+        rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Decrypt sensitive fields in many rows, one column at a time.
+
+        Args:
+            rows: Dictionaries containing encrypted data
+
+        Returns:
+            New dictionaries with decrypted fields
+        """
+
+        if rows and any(is_blind_index_column(column) for column in rows[0]):
+            # rows of a table share their columns, the blind indexes stay in the database
+            rows = [without_blind_indexes(row) for row in rows]
+        if not self._encryption_manager.enabled or not rows:
+            return rows
+        return self._transform_columns(rows, self._encryption_manager.decrypt_many)
+
+    def stored_encrypted_fields(self) -> List[str]:
+        """
+        Get the fields stored as ciphertext, none without an encryption key.
+        """
+
+        return list(self.encrypted_fields) if self._encryption_manager.enabled else []
+
+    def blind_index(
+        self,
+        table_name: str,
+        field: str,
+        value: Any
+    ) -> Optional[str]:
+        """
+        Compute the blind index of a plaintext value of a field.
+
+        Values are indexed in the text form they are encrypted in, so a
+        filter matches the rows whose decrypted value equals it.
+
+        Args:
+            table_name: Name of the table
+            field: Name of the blind-indexed field
+            value: Plaintext value
+
+        Returns:
+            Hex-encoded blind index, None for None
+        """
+
+        if value is None:
+            return None
+        return self._encryption_manager.blind_index(str(value), f"{table_name}.{field}")
+
+    def add_blind_indexes(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]],
+        stored_rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Add the blind indexes of the plaintext rows to the rows about to be stored.
+
+        Args:
+            table_name: Name of the table
+            rows: Rows before encryption
+            stored_rows: The same rows after encryption
+
+        Returns:
+            The stored rows, with a shadow column for each blind-indexed field they contain
+        """
+
+        if not self.blind_indexed_fields:
+            return stored_rows
+
+        indexed = []
+        for row, stored_row in zip(rows, stored_rows):
+            stored_row = dict(stored_row)
+            for field in self.blind_indexed_fields:
+                if field in row:
+                    stored_row[blind_index_column(field)] = self.blind_index(table_name, field, row[field])
+            indexed.append(stored_row)
+        return indexed
+
+    def blind_index_filter(
+        self,
+        table_name: str,
+        column: str,
+        value: Any
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        Translate an equality or IN filter on a blind-indexed field.
+
+        Args:
+            table_name: Name of the table
+            column: Filtered column
+            value: Plaintext value, or list of values
+
+        Returns:
+            Tuple of the shadow column and the blind index (or list of blind
+            indexes) to compare it with, None if the column isn't blind-indexed
+        """
+
+        if column not in self.blind_indexed_fields:
+            return None
+        if isinstance(value, list):
+            return blind_index_column(column), [self.blind_index(table_name, column, item) for item in value]
+        return blind_index_column(column), self.blind_index(table_name, column, value)
+
+    def _transform_columns(
+        self,
+        rows: List[Dict[str, Any]],
+        transform: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply encrypt_many or decrypt_many to every sensitive column of rows.
+        """
+
+        transformed = [dict(row) for row in rows]
+        for field in self.encrypted_fields:
+            positions = [position for position, row in enumerate(transformed) if field in row]
+            if not positions:
+                continue
+            values = transform(
+                [transformed[position][field] for position in positions],
+                workers=self.encryption_workers
+            )
+            for position, value in zip(positions, values):
+                transformed[position][field] = value
+        return transformed
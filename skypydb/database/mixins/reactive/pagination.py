@@ -0,0 +1,130 @@
+"""
+Module containing the pagination helpers, which are used to read pages of rows from a table.
+"""
+
+import sqlite3
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple
+)
+from skypydb.errors import ValidationError
+from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.reactive.encryption import is_blind_index_column
+
+def parse_order_by(
+    order_by: Optional[str],
+    columns: List[str],
+    encrypted_columns: Iterable[str] = ()
+) -> Tuple[Optional[str], bool]:
+    """
+    Parse an order_by argument such as "name" or "-created_at".
+
+    Args:
+        order_by: Column to order by, prefixed with "-" for descending order
+        columns: Columns of the table
+        encrypted_columns: Columns stored encrypted, whose stored order is meaningless
+
+    Returns:
+        Tuple of the column (None for insertion order) and whether the order is descending
+
+    Raises:
+        ValidationError: If the column is invalid or not in the table
+        ValueError: If the column is encrypted or holds blind indexes
+    """
+
+    if order_by is None:
+        return None, False
+    descending = order_by.startswith("-")
+    column = InputValidator.validate_column_name(order_by[1:] if descending else order_by)
+    if column in encrypted_columns or is_blind_index_column(column):
+        # the rows would be sorted by ciphertext or HMAC, and cursors built on that order
+        raise ValueError(f"Cannot order by encrypted column '{column}'")
+    if column not in columns:
+        raise ValidationError(f"Cannot order by unknown column '{column}'")
+    return column, descending
+
+def build_page(
+    conn: sqlite3.Connection,
+    table_name: str,
+    columns: List[str],
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    order_by: Optional[str] = None,
+    after_id: Optional[str] = None,
+    encrypted_columns: Iterable[str] = ()
+) -> Tuple[Optional[str], List[Any], str, List[Any]]:
+    """
+    Build the SQL selecting a page of rows.
+
+    Rows are ordered by order_by, then by rowid, which is insertion order.
+    A keyset cursor continues after the row with the ID after_id, it reads
+    the page through the order instead of skipping offset rows.
+
+    Args:
+        conn: Connection used to read the position of the cursor row
+        table_name: Name of the validated table
+        columns: Columns of the table
+        limit: Optional maximum number of rows
+        offset: Optional number of rows to skip
+        order_by: Optional column to order by, prefixed with "-" for descending order
+        after_id: Optional ID of the last row of the previous page
+        encrypted_columns: Columns stored encrypted, which can't be ordered by
+
+    Returns:
+        Tuple of the cursor condition (None without cursor) and its
+        parameters, and the ORDER BY/LIMIT clause and its parameters
+
+    Raises:
+        ValidationError: If an argument is invalid or the cursor row doesn't exist
+        ValueError: If order_by is an encrypted column
+    """
+
+    if limit is not None and limit < 0:
+        raise ValidationError("limit must be a non-negative integer")
+    if offset is not None and offset < 0:
+        raise ValidationError("offset must be a non-negative integer")
+
+    column, descending = parse_order_by(order_by, columns, encrypted_columns)
+
+    condition = None
+    condition_params: List[Any] = []
+    if after_id is not None:
+        select = f"rowid, [{column}]" if column else "rowid, NULL"
+        row = conn.execute(
+            f"SELECT {select} FROM [{table_name}] WHERE id = ?",
+            (after_id,)
+        ).fetchone()
+        if row is None:
+            raise ValidationError(f"Cursor row '{after_id}' not found")
+        cursor_rowid, cursor_value = row[0], row[1]
+        if column is None:
+            condition = "rowid > ?"
+            condition_params = [cursor_rowid]
+        elif cursor_value is None:
+            # NULLs sort first in ascending order and last in descending order
+            if descending:
+                condition = f"([{column}] IS NULL AND rowid > ?)"
+                condition_params = [cursor_rowid]
+            else:
+                condition = f"(([{column}] IS NULL AND rowid > ?) OR [{column}] IS NOT NULL)"
+                condition_params = [cursor_rowid]
+        else:
+            operator = "<" if descending else ">"
+            condition = f"([{column}] {operator} ? OR ([{column}] = ? AND rowid > ?)"
+            condition_params = [cursor_value, cursor_value, cursor_rowid]
+            if descending:
+                condition += f" OR [{column}] IS NULL"
+            condition += ")"
+
+    if column is None:
+        clause = " ORDER BY rowid"
+    else:
+        clause = f" ORDER BY [{column}] {'DESC' if descending else 'ASC'}, rowid"
+    clause_params: List[Any] = []
+    if limit is not None or offset:
+        clause += " LIMIT ? OFFSET ?"
+        clause_params = [limit if limit is not None else -1, offset or 0]
+    return condition, condition_params, clause, clause_params
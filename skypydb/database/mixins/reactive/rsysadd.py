@@ -3,20 +3,30 @@ Module containing the RSysAdd class, which is used to add data to a table.
 """
 
 import sqlite3
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import uuid
 from datetime import datetime
 from skypydb.security.validation import InputValidator
 from skypydb.errors import TableNotFoundError
 from skypydb.database.mixins.reactive.tables.audit import AuditTable
-from skypydb.database.mixins.reactive.encryption import Encryption
+from skypydb.database.mixins.reactive.encryption import (
+    Encryption,
+    without_blind_indexes
+)
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.mixins.reactive.types import to_sql_value
+from skypydb.database.changes import ChangeFeed
+from skypydb.database.mixins.reactive.blindindex import ensure_blind_index_columns
+from skypydb.database.connection import writes
 
 class RSysAdd:
     def __init__(
         self,
         path: Optional[str] = None,
         conn: Optional[sqlite3.Connection] = None,
-        encryption: Optional[Encryption] = None
+        encryption: Optional[Encryption] = None,
+        catalog: Optional[SchemaCatalog] = None,
+        changes: Optional[ChangeFeed] = None
     ):
         if conn is not None:
             self.conn = conn
@@ -26,9 +36,14 @@ class RSysAdd:
         else:
             raise ValueError("Either path or conn must be provided")
 
-        self.audit = AuditTable(conn=self.conn)
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+
+        self.audit = AuditTable(conn=self.conn, catalog=self.catalog)
         self.encryption = encryption
+        self.changes = changes
 
+    @writes
     def add_data(
         self,
         table_name: str,
@@ -72,6 +87,9 @@ class RSysAdd:
         # encrypt sensitive data before storing if encryption is available
         if self.encryption:
             encrypted_data = self.encryption.encrypt_data(data)
+            # blind indexes let searches match encrypted fields by equality
+            ensure_blind_index_columns(self.conn, self.catalog, self.audit, self.encryption, table_name)
+            encrypted_data = self.encryption.add_blind_indexes(table_name, [data], [encrypted_data])[0]
         else:
             encrypted_data = data
 
@@ -80,11 +98,125 @@ class RSysAdd:
         placeholders = ", ".join(["?" for _ in columns])
         column_names = ", ".join([f"[{col}]" for col in columns])
 
+        values = [to_sql_value(encrypted_data[col]) for col in columns]
+
         cursor = self.conn.cursor()
 
-        cursor.execute(
-            f"INSERT INTO [{table_name}] ({column_names}) VALUES ({placeholders})",
-            [str(encrypted_data[col]) for col in columns],
-        )
-        self.conn.commit()
+        try:
+            cursor.execute(
+                f"INSERT INTO [{table_name}] ({column_names}) VALUES ({placeholders})",
+                values,
+            )
+            if self.changes is not None:
+                # blind indexes aren't logged
+                self.changes.record(
+                    cursor,
+                    table_name,
+                    "insert",
+                    [without_blind_indexes(dict(zip(columns, values)))]
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        if self.changes is not None:
+            self.changes.committed()
         return data["id"]
+
+
+    @writes
+    def add_data_batch(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]],
+        generate_id: bool = True
+    ) -> List[str]:
+        """
+        Insert many rows into a table in a single transaction.
+
+        Columns are added once for the union of the row keys, and every row is
+        written with one executemany call. Either all rows are inserted or none.
+
+        Args:
+            table_name: Name of the table
+            rows: List of dictionaries of column names and values
+            generate_id: Whether to generate UUIDs automatically
+
+        Returns:
+            The IDs of the inserted rows, in order
+
+        Raises:
+            ValidationError: If input data is invalid
+        """
+
+        # validate table name
+        table_name = InputValidator.validate_table_name(table_name)
+
+        if not self.audit.table_exists(table_name):
+            raise TableNotFoundError(f"Table '{table_name}' not found")
+        if not rows:
+            return []
+
+        prepared_rows = []
+        columns: Dict[str, None] = {}
+        for data in rows:
+            # validate data dictionary
+            data = InputValidator.validate_data_dict(data)
+            # generate ID if needed
+            if generate_id:
+                data["id"] = str(uuid.uuid4())
+            # add created_at timestamp, taken per row as add_data does
+            if "created_at" not in data:
+                data["created_at"] = datetime.now().isoformat()
+            prepared_rows.append(data)
+            # keep the columns in first-seen order
+            columns.update(dict.fromkeys(data))
+
+        # ensure columns exist for the union of the row keys
+        columns_to_add = [col for col in columns if col not in ("id", "created_at")]
+        if columns_to_add:
+            self.audit.add_columns_if_needed(table_name, columns_to_add)
+
+        # encrypt sensitive data before storing if encryption is available, a column at a time
+        encrypted_rows = prepared_rows
+        if self.encryption:
+            encrypted_rows = self.encryption.encrypt_rows(prepared_rows)
+            # blind indexes let searches match encrypted fields by equality
+            ensure_blind_index_columns(self.conn, self.catalog, self.audit, self.encryption, table_name)
+            encrypted_rows = self.encryption.add_blind_indexes(table_name, prepared_rows, encrypted_rows)
+            for encrypted_data in encrypted_rows:
+                columns.update(dict.fromkeys(encrypted_data))
+
+        # build INSERT query, columns missing from a row are stored as NULL
+        column_list = list(columns)
+        placeholders = ", ".join(["?" for _ in column_list])
+        column_names = ", ".join([f"[{col}]" for col in column_list])
+        values = [
+            [
+                to_sql_value(encrypted_data[col]) if col in encrypted_data else None
+                for col in column_list
+            ]
+            for encrypted_data in encrypted_rows
+        ]
+
+        cursor = self.conn.cursor()
+
+        try:
+            cursor.executemany(
+                f"INSERT INTO [{table_name}] ({column_names}) VALUES ({placeholders})",
+                values
+            )
+            if self.changes is not None:
+                self.changes.record(
+                    cursor,
+                    table_name,
+                    "insert",
+                    [without_blind_indexes(dict(zip(column_list, row_values))) for row_values in values]
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        if self.changes is not None:
+            self.changes.committed()
+        return [data["id"] for data in prepared_rows]
@@ -0,0 +1,214 @@
+"""
+Module containing the RSysChanges class, which is used to read the change log of the tables.
+"""
+
+import sqlite3
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+from skypydb.security.validation import InputValidator
+from skypydb.errors import TableNotFoundError
+from skypydb.database.mixins.reactive.tables.audit import AuditTable
+from skypydb.database.mixins.reactive.encryption import Encryption
+from skypydb.database.connection import (
+    reads,
+    writes
+)
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.changes import (
+    CHANGES_TABLE,
+    ChangeFeed
+)
+
+class RSysChanges:
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
+        encryption: Optional[Encryption] = None,
+        catalog: Optional[SchemaCatalog] = None,
+        changes: Optional[ChangeFeed] = None
+    ):
+        if conn is not None:
+            self.conn = conn
+        elif path is not None:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
+        else:
+            raise ValueError("Either path or conn must be provided")
+
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+
+        self.audit = AuditTable(conn=self.conn, catalog=self.catalog)
+        self.encryption = encryption
+        self.changes = changes if changes is not None else ChangeFeed(catalog=self.catalog)
+
+    @writes
+    def check_changes_table(self) -> None:
+        """
+        Create the system tables for storing the change log if the database
+        was opened with change_log=True and they don't exist.
+        """
+
+        if self.changes.enabled and not self.changes.active(self.conn):
+            self.enable_change_log()
+
+    @writes
+    def enable_change_log(self) -> None:
+        """
+        Start logging the inserts and deletes of every table.
+
+        The setting is stored in the database file, so every writer logs its
+        changes from its next write on, in this process or any other, whether
+        or not it was opened with change_log=True.
+        """
+
+        self.changes.create_table(self.conn)
+        self.catalog.invalidate()
+
+    @writes
+    def disable_change_log(self) -> None:
+        """
+        Stop logging for every writer and delete the change log.
+
+        Subscriptions stop receiving changes.
+        """
+
+        self.changes.drop_table(self.conn)
+        self.catalog.invalidate()
+
+    @reads
+    def get_changes(
+        self,
+        table_name: str,
+        since: Optional[int] = None,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the rows inserted into and deleted from a table after a sequence number.
+
+        Only the log is read, never the table itself, so following a table
+        costs one indexed query per poll whatever its size. Without since
+        every change still in the log is returned, otherwise
+        ChangesPrunedError is raised if changes following since were
+        pruned, in which case the table has to be read again.
+
+        Args:
+            table_name: Name of the table
+            since: Optional sequence number of the last change already seen
+                   (default: every change still in the log)
+            limit: Maximum number of changes to return (default: 1000)
+
+        Returns:
+            List of changes in sequence order, each a dictionary with the
+            sequence number "seq", the kind of change "op" ("insert" or
+            "delete"), the row "id", the row "data" and "created_at"
+
+        Raises:
+            TableNotFoundError: If table doesn't exist
+            ValueError: If limit is not positive
+            ChangesPrunedError: If changes following since were pruned
+
+        Example:
+            changes = database.get_changes("users", since=last_seq)
+            for change in changes:
+                last_seq = change["seq"]
+        """
+
+        # validate table name
+        table_name = InputValidator.validate_table_name(table_name)
+        if not self.audit.table_exists(table_name):
+            raise TableNotFoundError(f"Table '{table_name}' not found")
+        if limit <= 0:
+            raise ValueError("limit must be a positive integer")
+
+        changes = self.changes.read(self.conn, table_name, since, limit)
+
+        # rows are logged as stored, decrypt them and restore their types
+        logged = [change for change in changes if change["data"] is not None]
+        rows = [change["data"] for change in logged]
+        if self.encryption:
+            rows = self.encryption.decrypt_rows(rows)
+        for change, row in zip(logged, self.audit.restore_rows_with_config(table_name, rows)):
+            change["data"] = row
+        return changes
+
+    @reads
+    def get_last_change_sequence(
+        self,
+        table_name: Optional[str] = None
+    ) -> int:
+        """
+        Get the sequence number of the last change, 0 if there is none.
+
+        Args:
+            table_name: Optional name of the table (default: all tables)
+        """
+
+        if table_name is not None:
+            table_name = InputValidator.validate_table_name(table_name)
+        return self.changes.latest(self.conn, table_name)
+
+    def wait_for_changes(
+        self,
+        version: int,
+        timeout: Optional[float]
+    ) -> bool:
+        """
+        Wait for changes committed through this database.
+
+        Args:
+            version: Value of changes.version read before the last get_changes call
+            timeout: Maximum number of seconds to wait, None waits forever
+
+        Returns:
+            True if changes were committed, False on timeout
+        """
+
+        return self.changes.wait(version, timeout)
+
+    @writes
+    def prune_changes(
+        self,
+        before: int,
+        table_name: Optional[str] = None
+    ) -> int:
+        """
+        Delete the changes up to a sequence number from the log.
+
+        Subscribers that didn't read these changes yet get a
+        ChangesPrunedError on their next read.
+
+        Args:
+            before: Sequence number of the last change to delete
+            table_name: Optional name of the table (default: all tables)
+
+        Returns:
+            Number of changes deleted
+        """
+
+        if not self.changes.active(self.conn):
+            return 0
+
+        cursor = self.conn.cursor()
+
+        try:
+            if table_name is None:
+                cursor.execute(f"DELETE FROM {CHANGES_TABLE} WHERE seq <= ?", (before,))
+            else:
+                table_name = InputValidator.validate_table_name(table_name)
+                cursor.execute(
+                    f"DELETE FROM {CHANGES_TABLE} WHERE table_name = ? AND seq <= ?",
+                    (table_name, before)
+                )
+            deleted = cursor.rowcount
+            self.changes.pruned(cursor, before, table_name)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return deleted
@@ -7,12 +7,24 @@ from typing import Optional
 from skypydb.security.validation import InputValidator
 from skypydb.errors import TableNotFoundError
 from skypydb.database.mixins.reactive.tables.audit import AuditTable
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.mixins.reactive.types import to_sql_value
+from skypydb.database.changes import ChangeFeed
+from skypydb.database.mixins.reactive.encryption import (
+    Encryption,
+    without_blind_indexes
+)
+from skypydb.database.mixins.reactive.blindindex import translate_filters
+from skypydb.database.connection import writes
 
 class RSysDelete:
     def __init__(
         self,
         path: Optional[str] = None,
-        conn: Optional[sqlite3.Connection] = None
+        conn: Optional[sqlite3.Connection] = None,
+        catalog: Optional[SchemaCatalog] = None,
+        changes: Optional[ChangeFeed] = None,
+        encryption: Optional[Encryption] = None
     ):
         if conn is not None:
             self.conn = conn
@@ -22,8 +34,14 @@ class RSysDelete:
         else:
             raise ValueError("Either path or conn must be provided")
 
-        self.audit = AuditTable(conn=self.conn)
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
 
+        self.audit = AuditTable(conn=self.conn, catalog=self.catalog)
+        self.changes = changes
+        self.encryption = encryption
+
+    @writes
     def delete(
         self,
         table_name: str,
@@ -69,16 +87,16 @@ class RSysDelete:
         conditions = []
         params = []
 
-        # build WHERE clause from filters
-        for column, value in filters.items():
+        # build WHERE clause from filters, encrypted fields are compared through their blind index
+        for column, value in translate_filters(self.conn, self.catalog, self.encryption, table_name, filters):
             # handle list values, use IN clause
             if isinstance(value, list) and len(value) > 0:
                 placeholders = ", ".join(["?" for _ in value])
                 conditions.append(f"[{column}] IN ({placeholders})")
-                params.extend([str(v) for v in value])
+                params.extend([to_sql_value(v) for v in value])
             else:
                 conditions.append(f"[{column}] = ?")
-                params.append(str(value))
+                params.append(to_sql_value(value))
 
         # build DELETE query
         where_clause = " AND ".join(conditions)
@@ -86,6 +104,25 @@ class RSysDelete:
 
         cursor = self.conn.cursor()
 
-        cursor.execute(query, params)
-        self.conn.commit()
-        return cursor.rowcount
+        if self.changes is None or not self.changes.active(self.conn):
+            cursor.execute(query, params)
+            self.conn.commit()
+            return cursor.rowcount
+
+        # the deleted rows are logged in the same transaction
+        try:
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                cursor.execute(f"{query} RETURNING *", params)
+                deleted = [dict(row) for row in cursor.fetchall()]
+            else:
+                # no RETURNING clause, read the rows to delete first
+                cursor.execute(f"SELECT * FROM [{table_name}] WHERE {where_clause}", params)
+                deleted = [dict(row) for row in cursor.fetchall()]
+                cursor.execute(query, params)
+            self.changes.record(cursor, table_name, "delete", [without_blind_indexes(row) for row in deleted])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.changes.committed()
+        return len(deleted)
@@ -0,0 +1,239 @@
+"""
+Module containing the RSysMigrate class, which is used to migrate tables to typed column storage and blind indexes.
+"""
+
+import sqlite3
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+from skypydb.security.validation import InputValidator
+from skypydb.errors import TableNotFoundError
+from skypydb.database.mixins.reactive.tables.audit import AuditTable
+from skypydb.database.mixins.reactive.tables.sysget import SysGet
+from skypydb.database.mixins.reactive.encryption import Encryption
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.mixins.reactive.types import (
+    SQL_AFFINITIES,
+    column_affinity,
+    column_type
+)
+from skypydb.database.mixins.reactive.blindindex import ensure_blind_index_columns
+from skypydb.database.connection import writes
+
+class RSysMigrate:
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
+        encryption: Optional[Encryption] = None,
+        catalog: Optional[SchemaCatalog] = None
+    ):
+        if conn is not None:
+            self.conn = conn
+        elif path is not None:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
+        else:
+            raise ValueError("Either path or conn must be provided")
+
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+
+        self.audit = AuditTable(conn=self.conn, catalog=self.catalog)
+        self.sysget = SysGet(conn=self.conn, encryption=encryption, catalog=self.catalog)
+        self.encryption = encryption
+
+    @writes
+    def migrate_column_types(
+        self,
+        table_name: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Migrate tables written by older versions to typed column storage.
+
+        Columns declared as int, float or bool in the table configuration
+        get the INTEGER or REAL affinity, rebuilding the table if a column
+        was created as TEXT, and values stored as text ("True", "False",
+        "None", numbers) are rewritten as numbers or NULL. Encrypted columns
+        are left unchanged. Each table is migrated in one transaction.
+
+        Args:
+            table_name: Optional name of the table to migrate (default: all tables)
+
+        Returns:
+            Dictionary mapping each migrated table to the number of values rewritten
+
+        Raises:
+            TableNotFoundError: If the table doesn't exist
+        """
+
+        if table_name is not None:
+            table_name = InputValidator.validate_table_name(table_name)
+            if not self.audit.table_exists(table_name):
+                raise TableNotFoundError(f"Table '{table_name}' not found")
+            table_names = [table_name]
+        else:
+            table_names = self.sysget.get_all_tables_names()
+
+        encrypted_fields = set(getattr(self.encryption, "encrypted_fields", None) or [])
+
+        migrated = {}
+        for name in table_names:
+            config = self.audit.utils.get_table_config(name)
+            if not config:
+                continue
+            typed_columns = {
+                column: column_type(spec)
+                for column, spec in config.items()
+                if column_type(spec) in SQL_AFFINITIES and column not in encrypted_fields
+            }
+            if not typed_columns:
+                continue
+            try:
+                migrated[name] = self._migrate_table(name, config, typed_columns)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            finally:
+                # the table may have been rebuilt
+                self.catalog.invalidate()
+        return migrated
+
+    @writes
+    def build_blind_indexes(
+        self,
+        table_name: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Create and fill the blind-index columns of tables written before their fields were blind-indexed.
+
+        Inserts create the columns of their table on their own, this fills
+        them for every row at once, such as right after enabling a blind
+        index, so searches on the field match existing rows before the next
+        insert. The columns are filled again from the decrypted values.
+
+        Args:
+            table_name: Optional name of the table (default: all tables)
+
+        Returns:
+            Dictionary mapping each table to the number of blind indexes written
+
+        Raises:
+            TableNotFoundError: If the table doesn't exist
+        """
+
+        if table_name is not None:
+            table_name = InputValidator.validate_table_name(table_name)
+            if not self.audit.table_exists(table_name):
+                raise TableNotFoundError(f"Table '{table_name}' not found")
+            table_names = [table_name]
+        else:
+            table_names = self.sysget.get_all_tables_names()
+
+        return {
+            name: ensure_blind_index_columns(
+                self.conn,
+                self.catalog,
+                self.audit,
+                self.encryption,
+                name,
+                rebuild=True
+            )
+            for name in table_names
+        }
+
+    def _migrate_table(
+        self,
+        table_name: str,
+        config: Dict[str, Any],
+        typed_columns: Dict[str, str]
+    ) -> int:
+        """
+        Migrate the typed columns of a table, without committing.
+
+        Returns:
+            Number of values rewritten
+        """
+
+        cursor = self.conn.cursor()
+
+        columns = cursor.execute(f"PRAGMA table_info([{table_name}])").fetchall()
+        if any(
+            column[1] in typed_columns and column[2].upper() != column_affinity(config[column[1]])
+            for column in columns
+        ):
+            self._rebuild_table(table_name, columns, config, typed_columns)
+
+        rewritten = 0
+        for column, type_name in typed_columns.items():
+            if column not in {info[1] for info in columns}:
+                continue
+            cursor.execute(
+                f"UPDATE [{table_name}] SET [{column}] = NULL "
+                f"WHERE typeof([{column}]) = 'text' AND [{column}] = 'None'"
+            )
+            rewritten += cursor.rowcount
+            if type_name == "bool":
+                cursor.execute(
+                    f"UPDATE [{table_name}] SET [{column}] = "
+                    f"lower([{column}]) IN ('true', '1', 'yes') "
+                    f"WHERE typeof([{column}]) = 'text'"
+                )
+            else:
+                # numeric text was already converted by the column affinity when rebuilding
+                cursor.execute(
+                    f"UPDATE [{table_name}] SET [{column}] = CAST([{column}] AS {SQL_AFFINITIES[type_name]}) "
+                    f"WHERE typeof([{column}]) = 'text' AND trim([{column}]) != '' "
+                    f"AND CAST([{column}] AS {SQL_AFFINITIES[type_name]}) = [{column}] + 0"
+                )
+            rewritten += cursor.rowcount
+        return rewritten
+
+    def _rebuild_table(
+        self,
+        table_name: str,
+        columns: List[Any],
+        config: Dict[str, Any],
+        typed_columns: Dict[str, str]
+    ) -> None:
+        """
+        Copy a table into a new table with the declared column affinities.
+        """
+
+        cursor = self.conn.cursor()
+
+        definitions = []
+        for column in columns:
+            name, declared_type, not_null, primary_key = column[1], column[2], column[3], column[5]
+            affinity = column_affinity(config[name]) if name in typed_columns else declared_type
+            definition = f"[{name}] {affinity}".rstrip()
+            if primary_key:
+                definition += " PRIMARY KEY"
+            if not_null:
+                definition += " NOT NULL"
+            definitions.append(definition)
+
+        # indexes are dropped with the table, they are created again on the new one
+        indexes = [
+            row[0]
+            for row in cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                (table_name,)
+            ).fetchall()
+        ]
+
+        column_names = ", ".join(f"[{column[1]}]" for column in columns)
+        temporary_name = f"_skypy_migrate_{table_name}"
+        cursor.execute(f"CREATE TABLE [{temporary_name}] ({', '.join(definitions)})")
+        cursor.execute(
+            f"INSERT INTO [{temporary_name}] (rowid, {column_names}) "
+            f"SELECT rowid, {column_names} FROM [{table_name}] ORDER BY rowid"
+        )
+        cursor.execute(f"DROP TABLE [{table_name}]")
+        cursor.execute(f"ALTER TABLE [{temporary_name}] RENAME TO [{table_name}]")
+        for index_sql in indexes:
+            cursor.execute(index_sql)
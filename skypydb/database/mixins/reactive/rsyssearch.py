@@ -7,7 +7,8 @@ from typing import (
     Any,
     Dict,
     List,
-    Optional
+    Optional,
+    Tuple
 )
 from skypydb.errors import TableNotFoundError
 from skypydb.security.validation import InputValidator
@@ -15,13 +16,19 @@ from skypydb.errors import ValidationError
 from skypydb.database.mixins.reactive.tables.audit import AuditTable
 from skypydb.database.mixins.reactive.tables.sysget import SysGet
 from skypydb.database.mixins.reactive.encryption import Encryption
+from skypydb.database.connection import reads
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.mixins.reactive.pagination import build_page
+from skypydb.database.mixins.reactive.types import to_sql_value
+from skypydb.database.mixins.reactive.blindindex import translate_filters
 
 class RSysSearch:
     def __init__(
         self,
         path: Optional[str] = None,
         conn: Optional[sqlite3.Connection] = None,
-        encryption: Optional[Encryption] = None
+        encryption: Optional[Encryption] = None,
+        catalog: Optional[SchemaCatalog] = None
     ):
         if conn is not None:
             self.conn = conn
@@ -31,14 +38,22 @@ class RSysSearch:
         else:
             raise ValueError("Either path or conn must be provided")
 
-        self.audit = AuditTable(conn=self.conn)
-        self.sysget = SysGet(conn=self.conn, encryption=encryption)
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+
+        self.audit = AuditTable(conn=self.conn, catalog=self.catalog)
+        self.sysget = SysGet(conn=self.conn, encryption=encryption, catalog=self.catalog)
         self.encryption = encryption
 
+    @reads
     def search(
         self,
         table_name: str,
         index: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        after_id: Optional[str] = None,
         **filters
     ) -> List[Dict[str, Any]]:
         """
@@ -47,6 +62,10 @@ class RSysSearch:
         Parameters:
             table_name (str): Name of the target table.
             index (Optional[str]): Value to search across all non-standard columns; ignored if None.
+            limit (Optional[int]): Maximum number of rows to return; the page is selected by SQLite so only its rows are decrypted.
+            offset (Optional[int]): Number of matching rows to skip.
+            order_by (Optional[str]): Column to order by, prefixed with "-" for descending order; insertion order if None.
+            after_id (Optional[str]): ID of the last row of the previous page, to continue after it without skipping rows.
             **filters: Column-value pairs to filter results. If a value is a list, it is used with an IN clause (empty lists are invalid).
 
         Returns:
@@ -55,6 +74,7 @@ class RSysSearch:
         Raises:
             ValidationError: If table name, index, or filters fail validation, or an empty list is provided for a filter.
             TableNotFoundError: If the specified table does not exist.
+            ValueError: If order_by is an encrypted column.
         """
 
         # validate table name
@@ -69,8 +89,95 @@ class RSysSearch:
         if not self.audit.table_exists(table_name):
             raise TableNotFoundError(f"Table '{table_name}' not found")
 
+        where_clause, params = self._build_search_conditions(table_name, index, filters)
+        query = f"SELECT * FROM [{table_name}] WHERE {where_clause}"
+        if limit is not None or offset is not None or order_by is not None or after_id is not None:
+            condition, condition_params, clause, clause_params = build_page(
+                self.conn,
+                table_name,
+                self.catalog.get_columns(self.conn, table_name),
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+                after_id=after_id,
+                encrypted_columns=self.encryption.stored_encrypted_fields() if self.encryption else ()
+            )
+            if condition is not None:
+                query += f" AND {condition}"
+                params.extend(condition_params)
+            query += clause
+            params.extend(clause_params)
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(query, params)
+
+        # convert rows to dictionaries and decrypt sensitive data
+        results = [dict(row) for row in cursor]
+        if self.encryption:
+            # sensitive columns are decrypted a whole column at a time
+            results = self.encryption.decrypt_rows(results)
+        return self.audit.restore_rows_with_config(table_name, results)
+
+    @reads
+    def count(
+        self,
+        table_name: str,
+        index: Optional[str] = None,
+        **filters
+    ) -> int:
+        """
+        Count the rows of a table that match an optional index value and/or column filters.
+
+        The rows are counted by SQLite, nothing is read or decrypted.
+
+        Args:
+            table_name: Name of the table
+            index: Value to search across all non-standard columns, as in search
+            **filters: Column-value pairs the rows must match, as in search
+
+        Returns:
+            Number of matching rows
+
+        Raises:
+            ValidationError: If table name, index, or filters fail validation
+            TableNotFoundError: If the table does not exist
+        """
+
+        # validate table name
+        table_name = InputValidator.validate_table_name(table_name)
+
+        # validate filters
+        if filters:
+            filters = InputValidator.validate_filter_dict(filters)
+        # sanitize index value
+        if index is not None:
+            index = InputValidator.sanitize_string(str(index))
+        if not self.audit.table_exists(table_name):
+            raise TableNotFoundError(f"Table '{table_name}' not found")
+
+        where_clause, params = self._build_search_conditions(table_name, index, filters)
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(f"SELECT COUNT(*) FROM [{table_name}] WHERE {where_clause}", params)
+        return cursor.fetchone()[0]
+
+    def _build_search_conditions(
+        self,
+        table_name: str,
+        index: Optional[str],
+        filters: Dict[str, Any]
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the WHERE clause of a search from validated inputs.
+
+        Returns:
+            Tuple of the clause and its parameters
+        """
+
         conditions = []
-        params = []
+        params: List[Any] = []
 
         # add index condition if provided
         # index searches across all non-standard columns (OR condition)
@@ -80,40 +187,31 @@ class RSysSearch:
                 col for col in columns if col not in ("id", "created_at")
             ]
             if non_standard_columns:
-                # search index value in any of the non-standard columns
+                # search index value in any of the non-standard columns,
+                # encrypted fields through their blind index
                 index_conditions = []
-                for col in non_standard_columns:
+                for col, value in translate_filters(
+                    self.conn,
+                    self.catalog,
+                    self.encryption,
+                    table_name,
+                    dict.fromkeys(non_standard_columns, str(index))
+                ):
                     index_conditions.append(f"[{col}] = ?")
-                    params.append(str(index))
+                    params.append(value)
                 conditions.append(f"({' OR '.join(index_conditions)})")
-        # add additional filters (AND conditions)
-        for column, value in filters.items():
+        # add additional filters (AND conditions), encrypted fields through their blind index
+        for column, value in translate_filters(self.conn, self.catalog, self.encryption, table_name, filters):
             # handle list values, use IN clause
             if isinstance(value, list):
                 if not value:
                     raise ValidationError(f"Empty list provided for filter '{column}'")
                 placeholders = ", ".join(["?" for _ in value])
                 conditions.append(f"[{column}] IN ({placeholders})")
-                params.extend([str(v) for v in value])
+                params.extend([to_sql_value(v) for v in value])
             else:
                 conditions.append(f"[{column}] = ?")
-                params.append(str(value))
+                params.append(to_sql_value(value))
 
-        # build query
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        query = f"SELECT * FROM [{table_name}] WHERE {where_clause}"
-
-        cursor = self.conn.cursor()
-
-        cursor.execute(query, params)
-
-        # convert rows to dictionaries and decrypt sensitive data
-        results = []
-        for row in cursor.fetchall():
-            row_dict = dict(row)
-            if self.encryption:
-                decrypted_row = self.encryption.decrypt_data(row_dict)
-                results.append(decrypted_row)
-            else:
-                results.append(row_dict)
-        return results
+        return where_clause, params
@@ -0,0 +1,62 @@
+"""
+Module containing the RSysStats class, which is used to collect statistics of the tables in the database.
+"""
+
+import sqlite3
+from typing import (
+    Any,
+    Dict,
+    Optional
+)
+from skypydb.database.mixins.reactive.tables.sysget import SysGet
+from skypydb.database.mixins.reactive.encryption import Encryption
+from skypydb.database.connection import reads
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.statistics import DatabaseStatistics
+
+class RSysStats:
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
+        encryption: Optional[Encryption] = None,
+        catalog: Optional[SchemaCatalog] = None
+    ):
+        if conn is not None:
+            self.conn = conn
+        elif path is not None:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
+        else:
+            raise ValueError("Either path or conn must be provided")
+
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+
+        self.sysget = SysGet(conn=self.conn, encryption=encryption, catalog=self.catalog)
+        self.statistics = DatabaseStatistics()
+
+    @reads
+    def get_statistics(
+        self,
+        max_age: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Get row counts, sizes in bytes and indexes of all tables.
+
+        Args:
+            max_age: Age in seconds of previously collected statistics that
+                     may be returned instead of collecting them again (default: 0)
+
+        Returns:
+            Dictionary with the page size, page count, database and free bytes,
+            and per table its row count, size in bytes and indexes. Sizes are
+            None if SQLite was compiled without the dbstat table.
+
+        Example:
+            stats = database.get_statistics(max_age=5)
+            print(stats["tables"]["users"]["row_count"])
+        """
+
+        tables = self.sysget.get_all_tables_names()
+        return self.statistics.collect(self.conn, tables, max_age=max_age)
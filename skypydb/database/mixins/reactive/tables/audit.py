@@ -12,12 +12,22 @@ from typing import (
 from skypydb.security.validation import InputValidator
 from skypydb.errors import TableNotFoundError, ValidationError
 from skypydb.database.mixins.reactive.utils import Utils
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.mixins.reactive.encryption import is_blind_index_column
+from skypydb.database.mixins.reactive.types import (
+    SQL_AFFINITIES,
+    column_affinity,
+    column_type,
+    from_sql_value
+)
+from skypydb.database.connection import writes
 
 class AuditTable:
     def __init__(
         self,
         path: Optional[str] = None,
-        conn: Optional[sqlite3.Connection] = None
+        conn: Optional[sqlite3.Connection] = None,
+        catalog: Optional[SchemaCatalog] = None
     ):
         if conn is not None:
             self.conn = conn
@@ -27,7 +37,10 @@ class AuditTable:
         else:
             raise ValueError("Either path or conn must be provided")
 
-        self.utils = Utils(conn=self.conn)
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+
+        self.utils = Utils(conn=self.conn, catalog=self.catalog)
 
     def table_exists(
         self,
@@ -43,14 +56,9 @@ class AuditTable:
         except ValidationError:
             return False
 
-        cursor = self.conn.cursor()
-
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (table_name,),
-        )
-        return cursor.fetchone() is not None
+        return self.catalog.table_exists(self.conn, table_name)
 
+    @writes
     def add_columns_if_needed(
         self,
         table_name: str,
@@ -67,17 +75,32 @@ class AuditTable:
         # validate table name
         table_name = InputValidator.validate_table_name(table_name)
 
-        existing_columns = set(self.get_table_columns(table_name))
+        if not self.table_exists(table_name):
+            raise TableNotFoundError(f"Table '{table_name}' not found")
+
+        # blind-index columns included
+        existing_columns = set(self.catalog.get_columns(self.conn, table_name))
+        config = self.utils.get_table_config(table_name) or {}
 
         cursor = self.conn.cursor()
 
+        added_columns = []
         for column in columns:
             # validate column name
             validated_column = InputValidator.validate_column_name(column)
-            if validated_column not in existing_columns and validated_column not in ("id", "created_at"):
-                cursor.execute(f"ALTER TABLE [{table_name}] ADD COLUMN [{validated_column}] TEXT")
+            if (
+                validated_column not in existing_columns
+                and validated_column not in ("id", "created_at")
+                and validated_column not in added_columns
+            ):
+                # declared columns get the affinity of their type, others store text
+                affinity = column_affinity(config[validated_column]) if validated_column in config else "TEXT"
+                cursor.execute(f"ALTER TABLE [{table_name}] ADD COLUMN [{validated_column}] {affinity}")
+                added_columns.append(validated_column)
 
         self.conn.commit()
+        if added_columns:
+            self.catalog.columns_added(self.conn, table_name, added_columns)
 
     def get_table_columns(
         self,
@@ -93,11 +116,14 @@ class AuditTable:
         if not self.table_exists(table_name):
             raise TableNotFoundError(f"Table '{table_name}' not found")
 
-        cursor = self.conn.cursor()
-
-        cursor.execute(f"PRAGMA table_info([{table_name}])")
-        return [row[1] for row in cursor.fetchall()]
+        # blind-index columns are internal to the database
+        return [
+            column
+            for column in self.catalog.get_columns(self.conn, table_name)
+            if not is_blind_index_column(column)
+        ]
 
+    @writes
     def check_config_table(self) -> None:
         """
         Create the system table for storing table configurations if it doesn't exist.
@@ -139,6 +165,81 @@ class AuditTable:
         if not config:
             # no configuration, return data as-is
             return data
+        return self._convert_with_config(config, data)
+
+    def validate_rows_with_config(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate many rows against the table's configuration, which is read only once.
+
+        Args:
+            table_name: Name of the table
+            rows: Data dictionaries to validate
+
+        Returns:
+            Validated data dictionaries with converted values
+
+        Raises:
+            ValueError: If data validation fails
+        """
+
+        config = self.utils.get_table_config(table_name)
+        if not config:
+            # no configuration, return data as-is
+            return rows
+        return [self._convert_with_config(config, data) for data in rows]
+
+    def restore_rows_with_config(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert stored values back to the types of the table's configuration.
+
+        Integers, floats and booleans are stored as numbers, this turns the
+        0/1 of booleans back into bool and converts values stored as text by
+        older versions. Rows are converted in place.
+
+        Args:
+            table_name: Name of the table
+            rows: Rows read from the table, decrypted
+
+        Returns:
+            The converted rows
+        """
+
+        config = self.utils.get_table_config(table_name)
+        if not config:
+            return rows
+
+        typed_columns = {
+            column: type_name
+            for column, type_name in (
+                (column, column_type(spec)) for column, spec in config.items()
+            )
+            if type_name in SQL_AFFINITIES
+        }
+        if not typed_columns:
+            return rows
+
+        for row in rows:
+            for column, type_name in typed_columns.items():
+                if column in row:
+                    row[column] = from_sql_value(row[column], type_name)
+        return rows
+
+    def _convert_with_config(
+        self,
+        config: Dict[str, Any],
+        data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Convert the values of a data dictionary to the types of a table configuration.
+        """
 
         validated_data = {}
 
@@ -9,12 +9,15 @@ from skypydb.security.validation import InputValidator
 from skypydb.schema.schema import TableDefinition
 from skypydb.database.mixins.reactive.tables.audit import AuditTable
 from skypydb.database.mixins.reactive.utils import Utils
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.connection import writes
 
 class SysCreate:
     def __init__(
         self,
         path: Optional[str] = None,
-        conn: Optional[sqlite3.Connection] = None
+        conn: Optional[sqlite3.Connection] = None,
+        catalog: Optional[SchemaCatalog] = None
     ):
         if conn is not None:
             self.conn = conn
@@ -24,9 +27,13 @@ class SysCreate:
         else:
             raise ValueError("Either path or conn must be provided")
 
-        self.audit = AuditTable(conn=self.conn)
-        self.utils = Utils(conn=self.conn)
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
 
+        self.audit = AuditTable(conn=self.conn, catalog=self.catalog)
+        self.utils = Utils(conn=self.conn, catalog=self.catalog)
+
+    @writes
     def create_table(
         self,
         table_name: str,
@@ -84,3 +91,4 @@ class SysCreate:
         config = self.utils.table_def_to_config(table_def)
         self.utils.save_table_config(table_name, config)
         self.conn.commit()
+        self.catalog.table_created(self.conn, table_name)
@@ -8,12 +8,19 @@ from skypydb.security.validation import InputValidator
 from skypydb.errors import TableNotFoundError
 from skypydb.database.mixins.reactive.tables.audit import AuditTable
 from skypydb.database.mixins.reactive.utils import Utils
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.changes import (
+    CHANGES_TABLE,
+    PRUNED_TABLE
+)
+from skypydb.database.connection import writes
 
 class SysDelete:
     def __init__(
         self,
         path: Optional[str] = None,
-        conn: Optional[sqlite3.Connection] = None
+        conn: Optional[sqlite3.Connection] = None,
+        catalog: Optional[SchemaCatalog] = None
     ):
         if conn is not None:
             self.conn = conn
@@ -23,9 +30,13 @@ class SysDelete:
         else:
             raise ValueError("Either path or conn must be provided")
 
-        self.audit = AuditTable(conn=self.conn)
-        self.utils = Utils(conn=self.conn)
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
 
+        self.audit = AuditTable(conn=self.conn, catalog=self.catalog)
+        self.utils = Utils(conn=self.conn, catalog=self.catalog)
+
+    @writes
     def delete_table(
         self,
         table_name: str
@@ -52,4 +63,10 @@ class SysDelete:
 
         self.utils.delete_table_config(table_name)
 
+        # the change log of a dropped table can't be followed anymore
+        if self.audit.table_exists(CHANGES_TABLE):
+            cursor.execute(f"DELETE FROM {CHANGES_TABLE} WHERE table_name = ?", (table_name,))
+            cursor.execute(f"DELETE FROM {PRUNED_TABLE} WHERE table_name = ?", (table_name,))
+
         self.conn.commit()
+        self.catalog.table_dropped(self.conn, table_name)
@@ -7,19 +7,32 @@ from typing import (
     List,
     Dict,
     Any,
-    Optional
+    Iterator,
+    Optional,
+    Tuple
 )
 from skypydb.errors import TableNotFoundError
 from skypydb.security.validation import InputValidator
 from skypydb.database.mixins.reactive.tables.audit import AuditTable
-from skypydb.database.mixins.reactive.encryption import Encryption
+from skypydb.database.mixins.reactive.encryption import (
+    Encryption,
+    is_blind_index_column
+)
+from skypydb.database.connection import reads
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.mixins.reactive.pagination import build_page
+from skypydb.database.changes import (
+    CHANGES_TABLE,
+    PRUNED_TABLE
+)
 
 class SysGet:
     def __init__(
         self,
         path: Optional[str] = None,
         conn: Optional[sqlite3.Connection] = None,
-        encryption: Optional[Encryption] = None
+        encryption: Optional[Encryption] = None,
+        catalog: Optional[SchemaCatalog] = None
     ):
         if conn is not None:
             self.conn = conn
@@ -29,9 +42,13 @@ class SysGet:
         else:
             raise ValueError("Either path or conn must be provided")
 
-        self.audit = AuditTable(conn=self.conn)
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+
+        self.audit = AuditTable(conn=self.conn, catalog=self.catalog)
         self.encryption = encryption
 
+    @reads
     def get_all_tables_names(self) -> List[str]:
         """
         Get list of all table names.
@@ -41,10 +58,12 @@ class SysGet:
 
         cursor.execute(
             "SELECT name FROM sqlite_master "
-            "WHERE type='table' AND name NOT LIKE 'sqlite_%' AND name != '_skypy_config'"
+            "WHERE type='table' AND name NOT LIKE 'sqlite_%' AND name NOT IN (?, ?, ?)",
+            ("_skypy_config", CHANGES_TABLE, PRUNED_TABLE)
         )
         return [row[0] for row in cursor.fetchall()]
 
+    @reads
     def get_table_columns_names(
         self,
         table_name: str
@@ -58,17 +77,43 @@ class SysGet:
         if not self.audit.table_exists(table_name):
             raise TableNotFoundError(f"Table '{table_name}' not found")
 
-        cursor = self.conn.cursor()
-
-        cursor.execute(f"PRAGMA table_info([{table_name}])")
-        return [row[1] for row in cursor.fetchall()]
+        # blind-index columns are internal to the database
+        return [
+            column
+            for column in self.catalog.get_columns(self.conn, table_name)
+            if not is_blind_index_column(column)
+        ]
 
+    @reads
     def get_all_data(
         self,
-        table_name: str
+        table_name: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        after_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get all data from a table.
+        Get all data from a table, or a page of it.
+
+        Pages are selected by SQLite, so only the returned rows are decrypted.
+
+        Args:
+            table_name: Name of the table
+            limit: Optional maximum number of rows
+            offset: Optional number of rows to skip
+            order_by: Optional column to order by, prefixed with "-" for
+                      descending order (default: insertion order)
+            after_id: Optional ID of the last row of the previous page, to
+                      continue after it without skipping rows
+
+        Returns:
+            List of row dictionaries
+
+        Raises:
+            TableNotFoundError: If table doesn't exist
+            ValidationError: If a pagination argument is invalid
+            ValueError: If order_by is an encrypted column
         """
 
         # validate table name
@@ -76,16 +121,106 @@ class SysGet:
         if not self.audit.table_exists(table_name):
             raise TableNotFoundError(f"Table '{table_name}' not found")
 
+        query = f"SELECT * FROM [{table_name}]"
+        params: List[Any] = []
+        if limit is not None or offset is not None or order_by is not None or after_id is not None:
+            condition, condition_params, clause, clause_params = build_page(
+                self.conn,
+                table_name,
+                self.catalog.get_columns(self.conn, table_name),
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+                after_id=after_id,
+                encrypted_columns=self.encryption.stored_encrypted_fields() if self.encryption else ()
+            )
+            if condition is not None:
+                query += f" WHERE {condition}"
+                params.extend(condition_params)
+            query += clause
+            params.extend(clause_params)
+
         cursor = self.conn.cursor()
 
-        cursor.execute(f"SELECT * FROM [{table_name}]")
+        cursor.execute(query, params)
 
-        results = []
-        for row in cursor.fetchall():
-            row_dict = dict(row)
+        results = [dict(row) for row in cursor]
+        if self.encryption:
+            # sensitive columns are decrypted a whole column at a time
+            results = self.encryption.decrypt_rows(results)
+        return self.audit.restore_rows_with_config(table_name, results)
+
+    def iter_data(
+        self,
+        table_name: str,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the data of a table in batches, in insertion order.
+
+        Each batch is read with its own query continuing after the last rowid
+        of the previous batch and decrypted when it is reached, so memory
+        stays bounded by batch_size and no connection is held between batches.
+
+        Args:
+            table_name: Name of the table
+            batch_size: Maximum number of rows per batch (default: 1000)
+
+        Yields:
+            Lists of row dictionaries
+
+        Raises:
+            TableNotFoundError: If table doesn't exist
+            ValueError: If batch_size is not positive
+        """
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        after_rowid = None
+        while True:
+            rows, after_rowid = self._get_data_page(table_name, after_rowid, batch_size)
+            if not rows:
+                return
             if self.encryption:
-                decrypted_row = self.encryption.decrypt_data(row_dict)
-                results.append(decrypted_row)
-            else:
-                results.append(row_dict)
-        return results
+                rows = self.encryption.decrypt_rows(rows)
+            yield self.audit.restore_rows_with_config(table_name, rows)
+            if len(rows) < batch_size:
+                return
+
+    @reads
+    def _get_data_page(
+        self,
+        table_name: str,
+        after_rowid: Optional[int],
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Read the rows of a table following a rowid.
+
+        Returns:
+            Tuple of the rows and the rowid of the last row
+        """
+
+        # validate table name
+        table_name = InputValidator.validate_table_name(table_name)
+        if not self.audit.table_exists(table_name):
+            raise TableNotFoundError(f"Table '{table_name}' not found")
+
+        cursor = self.conn.cursor()
+
+        query = f"SELECT rowid AS _skypy_rowid, * FROM [{table_name}]"
+        params: List[Any] = []
+        if after_rowid is not None:
+            query += " WHERE rowid > ?"
+            params.append(after_rowid)
+        query += " ORDER BY rowid LIMIT ?"
+        params.append(limit)
+        cursor.execute(query, params)
+
+        rows = []
+        for row in cursor:
+            row_dict = dict(row)
+            after_rowid = row_dict.pop("_skypy_rowid")
+            rows.append(row_dict)
+        return rows, after_rowid
@@ -0,0 +1,93 @@
+"""
+Module containing the column type helpers, which are used to store values with the SQLite affinity of their declared type.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Optional
+)
+
+# SQLite affinity of the column types of a table configuration
+SQL_AFFINITIES: Dict[str, str] = {
+    "int": "INTEGER",
+    "bool": "INTEGER",
+    "float": "REAL"
+}
+
+def column_type(
+    spec: Any
+) -> Optional[str]:
+    """
+    Get the type name of a column from its table configuration entry.
+
+    Args:
+        spec: Configuration entry, a type name or a dictionary with a "type" key
+
+    Returns:
+        The type name ("str", "int", "float", "bool", ...), or None if the
+        entry doesn't describe a column
+    """
+
+    if isinstance(spec, dict):
+        spec = spec.get("type", "str")
+    if isinstance(spec, str):
+        return spec
+    return None
+
+def column_affinity(
+    spec: Any
+) -> str:
+    """
+    Get the SQLite affinity of a column from its table configuration entry.
+    """
+
+    return SQL_AFFINITIES.get(column_type(spec) or "str", "TEXT")
+
+def to_sql_value(
+    value: Any
+) -> Any:
+    """
+    Convert a validated value to the value stored by SQLite.
+
+    Numbers are kept as numbers and booleans stored as 0/1 so the column
+    affinity applies, None is stored as NULL.
+    """
+
+    if isinstance(value, bool):
+        return int(value)
+    if value is None or isinstance(value, (int, float, str, bytes)):
+        return value
+    return str(value)
+
+def from_sql_value(
+    value: Any,
+    type_name: Optional[str]
+) -> Any:
+    """
+    Convert a stored value back to the declared type of its column.
+
+    Values stored as text by older versions are converted too; values that
+    can't be converted are returned unchanged.
+    """
+
+    if value is None or type_name is None:
+        return value
+    try:
+        if type_name == "bool":
+            if isinstance(value, str):
+                if value == "None":
+                    return None
+                return value.lower() in ("true", "1", "yes")
+            return bool(value)
+        if type_name == "int" and not isinstance(value, int):
+            if value == "None":
+                return None
+            return int(value)
+        if type_name == "float" and not isinstance(value, float):
+            if value == "None":
+                return None
+            return float(value)
+    except (ValueError, TypeError):
+        return value
+    return value
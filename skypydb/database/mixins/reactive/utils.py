@@ -12,12 +12,15 @@ from typing import (
 )
 from skypydb.security.validation import InputValidator
 from skypydb.schema.schema import TableDefinition
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.connection import writes
 
 class Utils:
     def __init__(
         self,
         path: Optional[str] = None,
-        conn: Optional[sqlite3.Connection] = None
+        conn: Optional[sqlite3.Connection] = None,
+        catalog: Optional[SchemaCatalog] = None
     ):
         if conn is not None:
             self.conn = conn
@@ -27,6 +30,9 @@ class Utils:
         else:
             raise ValueError("Either path or conn must be provided")
 
+        # schema lookups shared by every component of the database
+        self.catalog = catalog if catalog is not None else SchemaCatalog()
+
     def get_table_config(
         self,
         table_name: str
@@ -44,6 +50,8 @@ class Utils:
         # validate table name
         table_name = InputValidator.validate_table_name(table_name)
 
+        # not cached with the schema, a configuration rewritten by another
+        # connection doesn't change the schema version
         cursor = self.conn.cursor()
 
         cursor.execute(
@@ -54,6 +62,7 @@ class Utils:
             return json.loads(row[0])
         return None
 
+    @writes
     def save_table_config(
         self,
         table_name: str,
@@ -189,6 +198,7 @@ class Utils:
             ]
         return config
 
+    @writes
     def delete_table_config(
         self,
         table_name: str
@@ -4,6 +4,9 @@ Vector database operations module.
 
 from skypydb.database.mixins.vector.utils import cosine_similarity, euclidean_distance
 from skypydb.database.mixins.vector.sysembeddings import SysEmbeddings
+from skypydb.database.mixins.vector.syscache import SysCache
+from skypydb.database.mixins.vector.syshnsw import SysHnsw
+from skypydb.database.mixins.vector.sysplanner import SysPlanner
 from skypydb.database.mixins.vector.sysadd import SysAdd
 from skypydb.database.mixins.vector.sysupdate import SysUpdate
 from skypydb.database.mixins.vector.sysquery import SysQuery
@@ -14,13 +17,18 @@ from skypydb.database.mixins.vector.collections import (
     SysCreate,
     SysGet,
     SysCount,
-    SysDelete
+    SysDelete,
+    SysMigrate,
+    SysIndex
 )
 
 __all__ = [
     cosine_similarity,
     euclidean_distance,
     SysEmbeddings,
+    SysCache,
+    SysHnsw,
+    SysPlanner,
     SysAdd,
     SysUpdate,
     SysQuery,
@@ -30,5 +38,7 @@ __all__ = [
     SysCreate,
     SysGet,
     SysCount,
-    SysDelete
+    SysDelete,
+    SysMigrate,
+    SysIndex
 ]
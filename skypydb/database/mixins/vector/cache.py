@@ -0,0 +1,410 @@
+"""
+Module containing the CollectionSnapshot and VectorCache classes, which are used to keep collections resident in memory.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union
+)
+import numpy as np
+from skypydb.database.mixins.vector.utils import embeddings_to_matrix
+
+class CollectionSnapshot:
+    """
+    Immutable in-memory copy of a collection used by the search path.
+
+    Writes never modify a snapshot in place, they return a new one so readers
+    holding a reference keep a consistent view.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        matrix: np.ndarray,
+        documents: List[Optional[str]],
+        metadatas: List[Optional[Dict[str, Any]]]
+    ):
+        """
+        Initialize a snapshot.
+
+        Args:
+            ids: Item IDs in row order
+            matrix: Float32 embedding matrix, one row per item
+            documents: Documents in row order
+            metadatas: Metadata dictionaries in row order
+        """
+
+        self.ids = ids
+        self.positions = {item_id: position for position, item_id in enumerate(ids)}
+        self.matrix = matrix
+        self.documents = documents
+        self.metadatas = metadatas
+
+        # norms are computed once so scoring is a single product plus a scale
+        norms = np.linalg.norm(matrix, axis=1) if len(ids) else np.empty(0, dtype=np.float32)
+        self.inverse_norms = np.divide(
+            1.0,
+            norms,
+            out=np.zeros_like(norms, dtype=np.float32),
+            where=norms > 0
+        ).astype(np.float32, copy=False)
+
+    @classmethod
+    def from_items(
+        cls,
+        items: List[Dict[str, Any]]
+    ) -> "CollectionSnapshot":
+        """
+        Build a snapshot from rows returned by _get_all_items.
+
+        Args:
+            items: Items with id, embedding, document and metadata keys
+
+        Returns:
+            CollectionSnapshot instance
+        """
+
+        return cls(
+            ids=[item["id"] for item in items],
+            matrix=embeddings_to_matrix([item["embedding"] for item in items]),
+            documents=[item["document"] for item in items],
+            metadatas=[item["metadata"] for item in items]
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """
+        Get the embedding dimension, None for an empty snapshot.
+        """
+
+        return self.matrix.shape[1] if len(self.ids) else None
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimate the memory held by the snapshot.
+        """
+
+        size = self.matrix.nbytes + self.inverse_norms.nbytes
+        for item_id, document, metadata in zip(self.ids, self.documents, self.metadatas):
+            size += sys.getsizeof(item_id) + sys.getsizeof(document) + sys.getsizeof(metadata)
+        return size
+
+    def filter(
+        self,
+        matches: Callable[[Dict[str, Any]], bool]
+    ) -> np.ndarray:
+        """
+        Get the positions of the items accepted by a predicate.
+
+        Args:
+            matches: Predicate receiving an item with document and metadata keys
+
+        Returns:
+            Array of row positions
+        """
+
+        positions = [
+            position
+            for position in range(len(self.ids))
+            if matches({"document": self.documents[position], "metadata": self.metadatas[position]})
+        ]
+        return np.asarray(positions, dtype=np.intp)
+
+    def similarities(
+        self,
+        queries: np.ndarray,
+        positions: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Compute cosine similarities between normalized queries and the items.
+
+        Args:
+            queries: Row-normalized query matrix
+            positions: Optional subset of row positions to score
+
+        Returns:
+            Matrix of shape (n_queries, n_scored_items)
+        """
+
+        if positions is None:
+            return (queries @ self.matrix.T) * self.inverse_norms
+        return (queries @ self.matrix[positions].T) * self.inverse_norms[positions]
+
+    def embedding(
+        self,
+        position: int
+    ) -> List[float]:
+        """
+        Get the embedding of an item as a list.
+        """
+
+        return self.matrix[position].tolist()
+
+    def upsert(
+        self,
+        ids: List[str],
+        embeddings: List[Union[bytes, str, List[float]]],
+        documents: List[Optional[str]],
+        metadatas: List[Optional[Dict[str, Any]]]
+    ) -> "CollectionSnapshot":
+        """
+        Return a new snapshot with rows inserted or fully replaced.
+
+        Raises:
+            ValueError: If the new embeddings don't match the snapshot dimension
+        """
+
+        rows = embeddings_to_matrix(embeddings)
+        if len(self.ids) and rows.shape[1] != self.matrix.shape[1]:
+            raise ValueError(
+                f"Vector dimensions don't match: {rows.shape[1]} vs {self.matrix.shape[1]}"
+            )
+
+        new_ids = list(self.ids)
+        new_documents = list(self.documents)
+        new_metadatas = list(self.metadatas)
+        positions = dict(self.positions)
+        replaced: Dict[int, int] = {}
+        appended: List[int] = []
+
+        for index, item_id in enumerate(ids):
+            position = positions.get(item_id)
+            if position is None:
+                position = len(new_ids)
+                positions[item_id] = position
+                new_ids.append(item_id)
+                new_documents.append(documents[index])
+                new_metadatas.append(metadatas[index])
+                appended.append(index)
+            else:
+                new_documents[position] = documents[index]
+                new_metadatas[position] = metadatas[index]
+                if position < len(self.ids):
+                    replaced[position] = index
+                else:
+                    # same id repeated in one batch, the last row wins
+                    appended[position - len(self.ids)] = index
+
+        matrix = self.matrix.copy() if len(self.ids) else np.empty((0, rows.shape[1]), dtype=np.float32)
+        for position, index in replaced.items():
+            matrix[position] = rows[index]
+        if appended:
+            matrix = np.vstack([matrix, rows[appended]])
+        return CollectionSnapshot(new_ids, matrix, new_documents, new_metadatas)
+
+    def update(
+        self,
+        ids: List[str],
+        embeddings: Optional[List[Union[bytes, str, List[float]]]] = None,
+        documents: Optional[List[Optional[str]]] = None,
+        metadatas: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> "CollectionSnapshot":
+        """
+        Return a new snapshot with some fields of existing rows replaced.
+
+        IDs that are not part of the snapshot are ignored, like UPDATE does.
+
+        Raises:
+            ValueError: If the new embeddings don't match the snapshot dimension
+        """
+
+        matrix = self.matrix
+        if embeddings is not None:
+            rows = embeddings_to_matrix(embeddings)
+            if len(self.ids) and rows.shape[1] != self.matrix.shape[1]:
+                raise ValueError(
+                    f"Vector dimensions don't match: {rows.shape[1]} vs {self.matrix.shape[1]}"
+                )
+            matrix = self.matrix.copy()
+
+        new_documents = list(self.documents)
+        new_metadatas = list(self.metadatas)
+
+        for index, item_id in enumerate(ids):
+            position = self.positions.get(item_id)
+            if position is None:
+                continue
+            if embeddings is not None:
+                matrix[position] = rows[index]
+            if documents is not None:
+                new_documents[position] = documents[index]
+            if metadatas is not None:
+                new_metadatas[position] = metadatas[index]
+        return CollectionSnapshot(list(self.ids), matrix, new_documents, new_metadatas)
+
+    def remove(
+        self,
+        ids: List[str]
+    ) -> "CollectionSnapshot":
+        """
+        Return a new snapshot without the given rows.
+        """
+
+        removed = {self.positions[item_id] for item_id in ids if item_id in self.positions}
+        if not removed:
+            return self
+
+        keep = [position for position in range(len(self.ids)) if position not in removed]
+        return CollectionSnapshot(
+            [self.ids[position] for position in keep],
+            self.matrix[keep] if keep else np.empty((0, self.matrix.shape[1]), dtype=np.float32),
+            [self.documents[position] for position in keep],
+            [self.metadatas[position] for position in keep]
+        )
+
+class VectorCache:
+    """
+    LRU cache of collection snapshots bounded by a memory budget.
+
+    Every write to a collection bumps its version, a snapshot loaded from
+    SQLite is only stored if no write happened while it was being loaded.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            memory_budget: Maximum estimated size of all snapshots in bytes
+        """
+
+        self.memory_budget = memory_budget
+        self._snapshots: "OrderedDict[str, CollectionSnapshot]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._versions: Dict[str, int] = {}
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the estimated size of all cached snapshots.
+        """
+
+        return self._nbytes
+
+    def version(
+        self,
+        name: str
+    ) -> int:
+        """
+        Get the write version of a collection.
+        """
+
+        with self._lock:
+            return self._versions.get(name, 0)
+
+    def get(
+        self,
+        name: str
+    ) -> Optional[CollectionSnapshot]:
+        """
+        Get a cached snapshot and mark it as most recently used.
+        """
+
+        with self._lock:
+            snapshot = self._snapshots.get(name)
+            if snapshot is not None:
+                self._snapshots.move_to_end(name)
+            return snapshot
+
+    def put(
+        self,
+        name: str,
+        snapshot: CollectionSnapshot,
+        version: Optional[int] = None
+    ) -> None:
+        """
+        Store a snapshot, evicting least recently used collections if needed.
+
+        Args:
+            name: Collection name
+            snapshot: Snapshot to store
+            version: Version the snapshot was loaded at, stale snapshots are dropped
+        """
+
+        with self._lock:
+            if version is not None and version != self._versions.get(name, 0):
+                return
+            self._discard(name)
+
+            size = snapshot.nbytes
+            if size > self.memory_budget:
+                return
+            while self._snapshots and self._nbytes + size > self.memory_budget:
+                self._discard(next(iter(self._snapshots)))
+
+            self._snapshots[name] = snapshot
+            self._sizes[name] = size
+            self._nbytes += size
+
+    def apply(
+        self,
+        name: str,
+        change: Callable[[CollectionSnapshot], CollectionSnapshot]
+    ) -> None:
+        """
+        Record a write to a collection and apply it to the cached snapshot.
+
+        If the change can't be applied the snapshot is dropped and will be
+        reloaded from SQLite on the next query.
+        """
+
+        with self._lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
+            snapshot = self._snapshots.get(name)
+            if snapshot is None:
+                return
+            try:
+                updated = change(snapshot)
+            except ValueError:
+                self._discard(name)
+                return
+            self.put(name, updated)
+
+    def invalidate(
+        self,
+        name: str
+    ) -> None:
+        """
+        Drop the snapshot of a collection.
+        """
+
+        with self._lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
+            self._discard(name)
+
+    def clear(self) -> None:
+        """
+        Drop every snapshot.
+        """
+
+        with self._lock:
+            for name in list(self._snapshots):
+                self.invalidate(name)
+
+    def _discard(
+        self,
+        name: str
+    ) -> None:
+        """
+        Remove a snapshot without touching its version.
+        """
+
+        if name in self._snapshots:
+            del self._snapshots[name]
+            self._nbytes -= self._sizes.pop(name)
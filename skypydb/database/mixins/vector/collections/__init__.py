@@ -7,11 +7,15 @@ from skypydb.database.mixins.vector.collections.syscreate import SysCreate
 from skypydb.database.mixins.vector.collections.sysget import SysGet
 from skypydb.database.mixins.vector.collections.syscount import SysCount
 from skypydb.database.mixins.vector.collections.sysdelete import SysDelete
+from skypydb.database.mixins.vector.collections.sysmigrate import SysMigrate
+from skypydb.database.mixins.vector.collections.sysindex import SysIndex
 
 __all__ = [
     AuditCollections,
     SysCreate,
     SysGet,
     SysCount,
-    SysDelete
+    SysDelete,
+    SysMigrate,
+    SysIndex
 ]
@@ -2,12 +2,21 @@
 Module containing the AuditCollections class, which is used to check the integrity of a collection.
 """
 
+import sqlite3
 from typing import (
     Optional,
     Dict,
-    Any
+    Any,
+    List,
+    Tuple
 )
 from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.vector.utils import (
+    EMBEDDING_FORMAT_JSON,
+    EMBEDDING_FORMAT_FLOAT32
+)
+from skypydb.database.mixins.vector.filters import compile_filters
+from skypydb.database.connection import writes
 
 class AuditCollections:
     def collection_exists(
@@ -25,15 +34,9 @@ class AuditCollections:
         """
 
         name = InputValidator.validate_table_name(name)
+        return self._catalog.table_exists(self.conn, f"vec_{name}")
 
-        cursor = self.conn.cursor()
-
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (f"vec_{name}",)
-        )
-        return cursor.fetchone() is not None
-
+    @writes
     def _ensure_collections_table(self) -> None:
         """
         Ensure the collections metadata table exists.
@@ -45,11 +48,106 @@ class AuditCollections:
             CREATE TABLE IF NOT EXISTS _vector_collections (
                 name TEXT PRIMARY KEY,
                 metadata TEXT,
-                created_at TEXT NOT NULL
+                created_at TEXT NOT NULL,
+                embedding_format TEXT NOT NULL DEFAULT 'json'
+            )
+        """)
+
+        # databases created before binary storage have no format marker,
+        # their collections all store embeddings as JSON text
+        cursor.execute("PRAGMA table_info(_vector_collections)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "embedding_format" not in columns:
+            cursor.execute(
+                "ALTER TABLE _vector_collections "
+                "ADD COLUMN embedding_format TEXT NOT NULL DEFAULT 'json'"
+            )
+
+        # approximate nearest-neighbour indexes, generation counts the writes
+        # so a persisted index file can be checked against the collection
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS _vector_indexes (
+                collection TEXT PRIMARY KEY,
+                type TEXT NOT NULL,
+                params TEXT NOT NULL,
+                generation INTEGER NOT NULL DEFAULT 0
             )
         """)
         self.conn.commit()
 
+    def _get_embedding_format(
+        self,
+        name: str
+    ) -> str:
+        """
+        Get the storage format of the embeddings of a collection.
+
+        Args:
+            name: Collection name
+
+        Returns:
+            Embedding format (float32 or json)
+        """
+
+        # migrations only ever move a collection to float32, so that format
+        # can't go stale, json collections are read again every time
+        key = f"embedding_format:{name}"
+        embedding_format = self._catalog.get_entry(self.conn, key, lambda: self._read_embedding_format(name))
+        if embedding_format != EMBEDDING_FORMAT_FLOAT32:
+            self._catalog.forget_entry(key)
+        return embedding_format
+
+    def _read_embedding_format(
+        self,
+        name: str
+    ) -> str:
+        """
+        Read the storage format of the embeddings of a collection.
+        """
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            "SELECT embedding_format FROM _vector_collections WHERE name = ?",
+            (name,)
+        )
+        row = cursor.fetchone()
+        if row and row[0]:
+            return row[0]
+        return EMBEDDING_FORMAT_JSON
+
+    def _compile_filters(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[str], List[Any], bool]:
+        """
+        Compile filters into a SQL predicate so rows are filtered by SQLite.
+
+        Args:
+            where: Metadata filter
+            where_document: Document filter
+
+        Returns:
+            Tuple of the predicate (None to select every row), its parameters,
+            and whether the predicate is exact. Rows selected by a predicate
+            that isn't exact must still be checked with _matches_filters.
+        """
+
+        if where is None and where_document is None:
+            return None, [], True
+
+        # metadata filters need the JSON1 functions of SQLite
+        if getattr(self, "_json1_available", None) is None:
+            try:
+                self.conn.execute("SELECT json_extract('{}', '$.a')")
+                self._json1_available = True
+            except sqlite3.OperationalError:
+                self._json1_available = False
+        if not self._json1_available:
+            return None, [], False
+        return compile_filters(where, where_document)
+
     def _matches_filters(
         self,
         item: Dict[str, Any],
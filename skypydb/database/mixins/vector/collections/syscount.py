@@ -2,21 +2,32 @@
 Module containing the SysCount class, which is used to count items in a collection.
 """
 
+from typing import (
+    Any,
+    Dict,
+    Optional
+)
 from skypydb.security.validation import InputValidator
+from skypydb.database.connection import reads
 
 class SysCount:
+    @reads
     def count(
         self,
-        collection_name: str
+        collection_name: str,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None
     ) -> int:
         """
         Count items in a collection.
 
         Args:
             collection_name: Name of the collection
+            where: Optional metadata filter
+            where_document: Optional document filter
 
         Returns:
-            Number of items in the collection
+            Number of items in the collection matching the filters
         """
 
         collection_name = InputValidator.validate_table_name(collection_name)
@@ -24,7 +35,15 @@ class SysCount:
         if not self.collection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' not found")
 
+        clause, params, exact = self._compile_filters(where, where_document)
+        if not exact:
+            # filters without a SQL equivalent are checked row by row
+            return len(self._get_matching_rowids(collection_name, where, where_document))
+
         cursor = self.conn.cursor()
 
-        cursor.execute(f"SELECT COUNT(*) FROM [vec_{collection_name}]")
-        return cursor.fetchone()[0]
\ No newline at end of file
+        query = f"SELECT COUNT(*) FROM [vec_{collection_name}]"
+        if clause is not None:
+            query += f" WHERE {clause}"
+        cursor.execute(query, params)
+        return cursor.fetchone()[0]
@@ -7,31 +7,49 @@ from datetime import datetime
 from typing import (
     Optional,
     Dict,
-    Any
+    Any,
+    List
 )
 from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.vector.utils import EMBEDDING_FORMAT_FLOAT32
+from skypydb.database.mixins.vector.hnsw import (
+    _import_hnswlib,
+    get_index_params
+)
+from skypydb.database.connection import writes
 
 class SysCreate:
+    @writes
     def create_collection(
         self,
         name: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_indexes: Optional[List[str]] = None
     ) -> None:
         """
         Create a new vector collection.
 
         Args:
             name: Collection name
-            metadata: Optional collection metadata
+            metadata: Optional collection metadata. Set "index" to "hnsw" to search the
+                      collection with an approximate nearest-neighbour index, tuned with
+                      "hnsw:M", "hnsw:ef_construction" and "hnsw:ef_search".
+            metadata_indexes: Optional metadata keys to index, filters on these
+                              keys don't scan the collection
 
         Raises:
-            ValueError: If collection already exists
+            ValueError: If collection already exists or the index metadata is invalid
+            ImportError: If an HNSW index is requested and hnswlib is not installed
         """
 
         name = InputValidator.validate_table_name(name)
         table_name = f"vec_{name}"
         if self.collection_exists(name):
             raise ValueError(f"Collection '{name}' already exists")
+        index_params = get_index_params(metadata)
+        if index_params is not None:
+            # fail before creating anything if the optional dependency is missing
+            _import_hnswlib()
 
         cursor = self.conn.cursor()
 
@@ -40,15 +58,23 @@ class SysCreate:
             CREATE TABLE [{table_name}] (
                 id TEXT PRIMARY KEY,
                 document TEXT,
-                embedding TEXT NOT NULL,
+                embedding BLOB NOT NULL,
                 metadata TEXT,
                 created_at TEXT NOT NULL
             )
         """)
 
-        # store collection metadata
+        # store collection metadata, new collections store packed float32 embeddings
         cursor.execute(
-            "INSERT INTO _vector_collections (name, metadata, created_at) VALUES (?, ?, ?)",
-            (name, json.dumps(metadata or {}), datetime.now().isoformat())
+            """
+            INSERT INTO _vector_collections (name, metadata, created_at, embedding_format)
+            VALUES (?, ?, ?, ?)
+            """,
+            (name, json.dumps(metadata or {}), datetime.now().isoformat(), EMBEDDING_FORMAT_FLOAT32)
         )
-        self.conn.commit()
\ No newline at end of file
+        if index_params is not None:
+            self._register_index(name, index_params)
+        if metadata_indexes:
+            self._create_metadata_indexes(name, metadata_indexes)
+        self.conn.commit()
+        self._catalog.table_created(self.conn, table_name)
\ No newline at end of file
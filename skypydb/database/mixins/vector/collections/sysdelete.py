@@ -3,8 +3,10 @@ Module containing the SysDelete class, which is used to delete a collection.
 """
 
 from skypydb.security.validation import InputValidator
+from skypydb.database.connection import writes
 
 class SysDelete:
+    @writes
     def delete_collection(
         self,
         name: str
@@ -34,4 +36,11 @@ class SysDelete:
             "DELETE FROM _vector_collections WHERE name = ?",
             (name,)
         )
-        self.conn.commit()
\ No newline at end of file
+        self._drop_index(name)
+        self.conn.commit()
+        self._catalog.table_dropped(self.conn, table_name)
+        self._catalog.forget_entry(f"collection:{name}")
+        self._catalog.forget_entry(f"embedding_format:{name}")
+
+        # drop the resident copy of the collection
+        self.clear_cache(name)
\ No newline at end of file
@@ -10,8 +10,10 @@ from typing import (
     Any
 )
 from skypydb.security.validation import InputValidator
+from skypydb.database.connection import reads
 
 class SysGet:
+    @reads
     def get_collection(
         self,
         name: str
@@ -30,13 +32,11 @@ class SysGet:
         if not self.collection_exists(name):
             return None
 
-        cursor = self.conn.cursor()
-        
-        cursor.execute(
-            "SELECT * FROM _vector_collections WHERE name = ?",
-            (name,)
+        row = self._catalog.get_entry(
+            self.conn,
+            f"collection:{name}",
+            lambda: self._read_collection_row(name)
         )
-        row = cursor.fetchone()
         if row:
             return {
                 "name": row["name"],
@@ -45,10 +45,28 @@ class SysGet:
             }
         return None
 
+    def _read_collection_row(
+        self,
+        name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the row of a collection in the collections metadata table.
+        """
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            "SELECT name, metadata, created_at FROM _vector_collections WHERE name = ?",
+            (name,)
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
     def get_or_create_collection(
         self,
         name: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_indexes: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Get an existing collection or create a new one.
@@ -56,6 +74,8 @@ class SysGet:
         Args:
             name: Collection name
             metadata: Optional collection metadata (used only if creating)
+            metadata_indexes: Optional metadata keys to index, missing indexes
+                              are also added to an existing collection
 
         Returns:
             Collection metadata
@@ -63,13 +83,17 @@ class SysGet:
 
         name = InputValidator.validate_table_name(name)
         if not self.collection_exists(name):
-            self.create_collection(name, metadata)
+            self.create_collection(name, metadata, metadata_indexes=metadata_indexes)
+        elif metadata_indexes and not set(metadata_indexes) <= set(self.get_metadata_indexes(name)):
+            # only take the writer when a key isn't indexed yet
+            self.create_metadata_indexes(name, metadata_indexes)
 
         result = self.get_collection(name)
         # at this point collection must exist since we just created it if needed
         assert result is not None
         return result
 
+    @reads
     def list_collections(self) -> List[Dict[str, Any]]:
         """
         List all collections.
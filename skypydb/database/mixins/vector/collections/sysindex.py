@@ -0,0 +1,112 @@
+"""
+Module containing the SysIndex class, which is used to index metadata keys of a collection.
+"""
+
+import json
+from typing import List
+from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.vector.filters import metadata_expression
+from skypydb.database.connection import writes
+
+# collection metadata key listing the indexed metadata keys
+METADATA_INDEXES_KEY = "metadata_indexes"
+
+class SysIndex:
+    @writes
+    def create_metadata_indexes(
+        self,
+        name: str,
+        keys: List[str]
+    ) -> None:
+        """
+        Index metadata keys of a collection.
+
+        Filters on indexed keys ($eq, $in, $gt, ...) are answered with an
+        index lookup instead of a scan of the collection. Keys that are
+        already indexed are skipped, and nothing is written if all of them are.
+
+        Args:
+            name: Collection name
+            keys: Metadata keys to index
+
+        Raises:
+            ValueError: If collection doesn't exist
+            ValidationError: If a key is not a valid identifier
+        """
+
+        name = InputValidator.validate_table_name(name)
+        if not self.collection_exists(name):
+            raise ValueError(f"Collection '{name}' not found")
+
+        try:
+            created = self._create_metadata_indexes(name, keys)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        if created:
+            self._catalog.schema_changed(self.conn)
+            self._catalog.forget_entry(f"collection:{name}")
+
+    def get_metadata_indexes(
+        self,
+        name: str
+    ) -> List[str]:
+        """
+        Get the indexed metadata keys of a collection.
+
+        Args:
+            name: Collection name
+
+        Returns:
+            List of indexed metadata keys
+        """
+
+        collection = self.get_collection(name)
+        if collection is None:
+            return []
+        return list(collection["metadata"].get(METADATA_INDEXES_KEY, []))
+
+    def _create_metadata_indexes(
+        self,
+        name: str,
+        keys: List[str]
+    ) -> bool:
+        """
+        Create the expression indexes of metadata keys and record them in the
+        collection metadata, inside the caller's transaction.
+
+        Returns:
+            True if an index was created, False if every key was already indexed
+        """
+
+        # keys end up in index names, so they must be plain identifiers
+        keys = [InputValidator.validate_column_name(key) for key in keys]
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            "SELECT metadata FROM _vector_collections WHERE name = ?",
+            (name,)
+        )
+        row = cursor.fetchone()
+        metadata = json.loads(row["metadata"]) if row and row["metadata"] else {}
+        indexed = list(metadata.get(METADATA_INDEXES_KEY, []))
+        missing = [key for key in dict.fromkeys(keys) if key not in indexed]
+        if not missing:
+            return False
+
+        for key in missing:
+            # same expression as the compiled filters, so the planner can match it
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS [idx_vec_{name}_meta_{key}] "
+                f"ON [vec_{name}] ({metadata_expression(key)})"
+            )
+            indexed.append(key)
+
+        metadata[METADATA_INDEXES_KEY] = indexed
+        cursor.execute(
+            "UPDATE _vector_collections SET metadata = ? WHERE name = ?",
+            (json.dumps(metadata), name)
+        )
+        return True
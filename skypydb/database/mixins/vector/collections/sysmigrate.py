@@ -0,0 +1,63 @@
+"""
+Module containing the SysMigrate class, which is used to migrate a collection to binary embedding storage.
+"""
+
+from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.vector.utils import (
+    EMBEDDING_FORMAT_FLOAT32,
+    decode_embedding,
+    encode_embedding
+)
+from skypydb.database.connection import writes
+
+class SysMigrate:
+    @writes
+    def migrate_collection(
+        self,
+        name: str
+    ) -> int:
+        """
+        Convert the embeddings of a collection from JSON text to packed float32 blobs.
+
+        Collections created before binary storage keep working without migration,
+        but every read has to parse the JSON text of each embedding.
+
+        Args:
+            name: Collection name
+
+        Returns:
+            Number of rows converted
+
+        Raises:
+            ValueError: If collection doesn't exist
+        """
+
+        name = InputValidator.validate_table_name(name)
+        if not self.collection_exists(name):
+            raise ValueError(f"Collection '{name}' not found")
+
+        cursor = self.conn.cursor()
+
+        # only text values still need to be converted
+        cursor.execute(
+            f"SELECT id, embedding FROM [vec_{name}] WHERE typeof(embedding) = 'text'"
+        )
+        updates = [
+            (encode_embedding(decode_embedding(row["embedding"]), EMBEDDING_FORMAT_FLOAT32), row["id"])
+            for row in cursor.fetchall()
+        ]
+
+        try:
+            cursor.executemany(
+                f"UPDATE [vec_{name}] SET embedding = ? WHERE id = ?",
+                updates
+            )
+            cursor.execute(
+                "UPDATE _vector_collections SET embedding_format = ? WHERE name = ?",
+                (EMBEDDING_FORMAT_FLOAT32, name)
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return len(updates)
@@ -0,0 +1,251 @@
+"""
+Module containing the functions used to compile collection filters into SQLite JSON1 predicates.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+# range of the integers SQLite can bind
+MIN_INTEGER = -2 ** 63
+MAX_INTEGER = 2 ** 63 - 1
+
+# JSON types that json_extract returns as numbers
+NUMERIC_JSON_TYPES = "('integer', 'real', 'true', 'false')"
+
+COMPARISON_OPERATORS = {
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<="
+}
+
+class UnsupportedFilter(Exception):
+    """
+    Raised when part of a filter has no SQL equivalent, the filter is then evaluated in Python.
+    """
+
+def metadata_expression(
+    key: str,
+    function: str = "json_extract"
+) -> str:
+    """
+    Get the SQL expression reading a top-level metadata key.
+
+    The JSON path is inlined rather than bound, so the expression matches
+    the metadata indexes declared on the collection and SQLite can use them.
+
+    Args:
+        key: Metadata key
+        function: JSON1 function applied to the metadata column
+
+    Returns:
+        SQL expression
+    """
+
+    # quoted labels can't contain a double quote, such keys are filtered in Python
+    if '"' in key or "\\" in key or "\x00" in key:
+        raise UnsupportedFilter(key)
+    path = f'$."{key}"'.replace("'", "''")
+    return f"{function}(metadata, '{path}')"
+
+def _is_number(
+    value: Any
+) -> bool:
+    """
+    Check if a value can be bound as a SQLite number.
+    """
+
+    if isinstance(value, int):
+        return MIN_INTEGER <= value <= MAX_INTEGER
+    return isinstance(value, float)
+
+def _equals(
+    key: str,
+    value: Any,
+    params: List[Any]
+) -> str:
+    """
+    Compile a NULL-safe equality between a metadata value and a Python value.
+    """
+
+    expression = metadata_expression(key)
+    if value is None:
+        # a missing key and a JSON null both read as None
+        return f"({expression} IS NULL)"
+    if isinstance(value, str):
+        # strings must not match the JSON text of nested objects or arrays
+        params.append(value)
+        return f"({metadata_expression(key, 'json_type')} IS 'text' AND {expression} IS ?)"
+    if _is_number(value):
+        # JSON booleans read as 0 and 1, which Python also treats as equal to numbers
+        params.append(value)
+        return f"({expression} IS ?)"
+    raise UnsupportedFilter(value)
+
+def _compare(
+    key: str,
+    operator: str,
+    value: Any,
+    params: List[Any]
+) -> str:
+    """
+    Compile an ordering comparison, values of another type never match.
+    """
+
+    expression = metadata_expression(key)
+    json_type = metadata_expression(key, "json_type")
+    if isinstance(value, str):
+        params.append(value)
+        return f"({json_type} IS 'text' AND {expression} {operator} ?)"
+    if _is_number(value):
+        params.append(value)
+        return f"({json_type} IN {NUMERIC_JSON_TYPES} AND {expression} {operator} ?)"
+    raise UnsupportedFilter(value)
+
+def _membership(
+    key: str,
+    values: Any,
+    params: List[Any]
+) -> str:
+    """
+    Compile a membership test against a list of values.
+    """
+
+    if not isinstance(values, (list, tuple)):
+        raise UnsupportedFilter(values)
+    if not values:
+        return "0"
+    return "(" + " OR ".join(_equals(key, value, params) for value in values) + ")"
+
+def _compile_condition(
+    key: str,
+    value: Any,
+    params: List[Any]
+) -> Tuple[str, bool]:
+    """
+    Compile one entry of a metadata filter.
+    """
+
+    if key in ("$and", "$or"):
+        compiled = [_compile_where(condition, params) for condition in value]
+        exact = all(condition_exact for _, condition_exact in compiled)
+        if not compiled:
+            # all() of nothing is true, any() of nothing is false
+            return ("1" if key == "$and" else "0"), exact
+        joiner = " AND " if key == "$and" else " OR "
+        return "(" + joiner.join(sql for sql, _ in compiled) + ")", exact
+    if key.startswith("$"):
+        # other top-level operators are ignored
+        return "1", True
+
+    if not isinstance(value, dict):
+        return _equals(key, value, params), True
+
+    clauses = []
+    for operator, operand in value.items():
+        if operator == "$eq":
+            clauses.append(_equals(key, operand, params))
+        elif operator == "$ne":
+            clauses.append(f"NOT {_equals(key, operand, params)}")
+        elif operator in COMPARISON_OPERATORS:
+            clauses.append(_compare(key, COMPARISON_OPERATORS[operator], operand, params))
+        elif operator == "$in":
+            clauses.append(_membership(key, operand, params))
+        elif operator == "$nin":
+            clauses.append(f"NOT {_membership(key, operand, params)}")
+        # unknown operators are ignored
+    return " AND ".join(clauses) if clauses else "1", True
+
+def _compile_where(
+    where: Dict[str, Any],
+    params: List[Any]
+) -> Tuple[str, bool]:
+    """
+    Compile a metadata filter, following the semantics of _matches_filters.
+
+    Entries without a SQL equivalent are left out, which only widens the
+    selection since no compiled expression negates a group of entries.
+
+    Returns:
+        Tuple of the predicate and whether every entry was compiled
+    """
+
+    clauses = []
+    exact = True
+    for key, value in where.items():
+        condition_params: List[Any] = []
+        try:
+            sql, condition_exact = _compile_condition(key, value, condition_params)
+        except (UnsupportedFilter, AttributeError, TypeError):
+            exact = False
+            continue
+        clauses.append(sql)
+        params.extend(condition_params)
+        exact = exact and condition_exact
+    return ("(" + " AND ".join(clauses) + ")" if clauses else "1"), exact
+
+def _compile_where_document(
+    where_document: Dict[str, str],
+    params: List[Any]
+) -> str:
+    """
+    Compile a document filter, matching is case sensitive like the Python check.
+    """
+
+    clauses = []
+    for operator, value in where_document.items():
+        if operator not in ("$contains", "$not_contains"):
+            continue
+        if not isinstance(value, str):
+            raise UnsupportedFilter(value)
+        params.append(value)
+        if operator == "$contains":
+            clauses.append("instr(COALESCE(document, ''), ?) > 0")
+        else:
+            clauses.append("instr(COALESCE(document, ''), ?) = 0")
+    return "(" + " AND ".join(clauses) + ")" if clauses else "1"
+
+def compile_filters(
+    where: Optional[Dict[str, Any]] = None,
+    where_document: Optional[Dict[str, str]] = None
+) -> Tuple[Optional[str], List[Any], bool]:
+    """
+    Compile collection filters into a SQL predicate over the vec_* columns.
+
+    Args:
+        where: Optional metadata filter
+        where_document: Optional document filter
+
+    Returns:
+        Tuple of the predicate (None if nothing could be compiled), its
+        parameters, and whether the predicate is exact. When it isn't, the
+        matching rows must still be checked with _matches_filters.
+    """
+
+    clauses = []
+    params: List[Any] = []
+    exact = True
+
+    if where is not None:
+        try:
+            sql, exact = _compile_where(where, params)
+            clauses.append(sql)
+        except AttributeError:
+            # not a dictionary, left to the Python check
+            exact = False
+    if where_document is not None:
+        document_params: List[Any] = []
+        try:
+            clauses.append(_compile_where_document(where_document, document_params))
+            params.extend(document_params)
+        except (UnsupportedFilter, AttributeError):
+            exact = False
+
+    if not clauses:
+        return None, [], exact
+    return " AND ".join(clauses), params, exact
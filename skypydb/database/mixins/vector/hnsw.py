@@ -0,0 +1,360 @@
+"""
+Module containing the HnswIndex class, which is used to search a collection with an approximate nearest-neighbour index.
+"""
+
+import os
+import json
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+import numpy as np
+
+# collection metadata keys used to select and tune the index
+INDEX_KEY = "index"
+INDEX_TYPE_HNSW = "hnsw"
+HNSW_PARAMS = {
+    "hnsw:M": 16,
+    "hnsw:ef_construction": 200,
+    "hnsw:ef_search": 50
+}
+
+# minimum capacity allocated when the index is created or grown
+MIN_CAPACITY = 1024
+
+def _import_hnswlib():
+    """
+    Import hnswlib, which is an optional dependency.
+    """
+
+    try:
+        import hnswlib
+    except ImportError:
+        raise ImportError(
+            "The 'hnswlib' library is required for HNSW indexes. "
+            "Please install it using 'pip install skypydb[hnsw]'."
+        )
+    return hnswlib
+
+def get_index_params(
+    metadata: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, int]]:
+    """
+    Get the HNSW parameters declared in collection metadata.
+
+    Args:
+        metadata: Collection metadata
+
+    Returns:
+        Dictionary with M, ef_construction and ef_search, or None if the
+        collection doesn't use an HNSW index
+
+    Raises:
+        ValueError: If the index type or a parameter is invalid
+    """
+
+    if not metadata or metadata.get(INDEX_KEY) is None:
+        return None
+    if metadata[INDEX_KEY] != INDEX_TYPE_HNSW:
+        raise ValueError(
+            f"Unsupported index type '{metadata[INDEX_KEY]}'. Supported types: '{INDEX_TYPE_HNSW}'"
+        )
+
+    params = {}
+    for key, default in HNSW_PARAMS.items():
+        value = metadata.get(key, default)
+        if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+            raise ValueError(f"Collection metadata '{key}' must be a positive integer")
+        params[key.split(":", 1)[1]] = value
+    return params
+
+class HnswIndex:
+    """
+    HNSW index over the embeddings of one collection.
+
+    Items are labelled with the rowid of their row in the vec_* table, the
+    index is persisted next to the SQLite file and tagged with the write
+    generation of the collection it reflects.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        params: Dict[str, int]
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            path: Path of the index file, None to keep the index in memory only
+            params: HNSW parameters (M, ef_construction, ef_search)
+        """
+
+        self.path = path
+        self.params = params
+        self.generation = -1
+        self.lock = threading.RLock()
+        self._index = None
+        self._dimension: Optional[int] = None
+        # labels marked deleted, they stay in the graph until it is rebuilt
+        self._deleted: Set[int] = set()
+
+    @property
+    def meta_path(self) -> Optional[str]:
+        """
+        Get the path of the file describing the persisted index.
+        """
+
+        return f"{self.path}.json" if self.path else None
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """
+        Get the embedding dimension, None while the index is empty.
+        """
+
+        return self._dimension
+
+    @property
+    def live_count(self) -> int:
+        """
+        Get the number of items a search can return.
+        """
+
+        with self.lock:
+            if self._index is None:
+                return 0
+            return self._index.get_current_count() - len(self._deleted)
+
+    def _init_index(
+        self,
+        dimension: int,
+        capacity: int
+    ) -> None:
+        """
+        Allocate a new empty hnswlib index.
+        """
+
+        hnswlib = _import_hnswlib()
+        index = hnswlib.Index(space="cosine", dim=dimension)
+        index.init_index(
+            max_elements=max(capacity, MIN_CAPACITY),
+            M=self.params["M"],
+            ef_construction=self.params["ef_construction"]
+        )
+        index.set_ef(self.params["ef_search"])
+        self._index = index
+        self._dimension = dimension
+
+    def rebuild(
+        self,
+        labels: List[int],
+        matrix: np.ndarray,
+        generation: int
+    ) -> None:
+        """
+        Replace the index with one built from every row of the collection.
+
+        Args:
+            labels: Rowids of the rows
+            matrix: Embedding matrix in the same order
+            generation: Write generation of the collection
+        """
+
+        with self.lock:
+            self._index = None
+            self._dimension = None
+            self._deleted = set()
+            if len(labels):
+                self._init_index(matrix.shape[1], int(len(labels) * 1.25))
+                self._index.add_items(matrix, np.asarray(labels, dtype=np.int64))
+            self.generation = generation
+
+    def load(self) -> Optional[int]:
+        """
+        Load the persisted index.
+
+        Returns:
+            Generation of the persisted index, None if there is no usable file
+        """
+
+        if not self.path or not os.path.exists(self.path) or not os.path.exists(self.meta_path):
+            return None
+
+        with self.lock:
+            try:
+                with open(self.meta_path, "r", encoding="utf-8") as meta_file:
+                    meta = json.load(meta_file)
+                hnswlib = _import_hnswlib()
+                index = hnswlib.Index(space="cosine", dim=meta["dimension"])
+                index.load_index(self.path, max_elements=meta["capacity"])
+                index.set_ef(self.params["ef_search"])
+            except (OSError, ValueError, KeyError, RuntimeError):
+                return None
+            self._index = index
+            self._dimension = meta["dimension"]
+            # files written before deleted labels were recorded count them as live
+            self._deleted = set(meta.get("deleted", []))
+            self.generation = meta["generation"]
+            return self.generation
+
+    def invalidate(self) -> None:
+        """
+        Mark the index as not reflecting any generation, it is loaded or rebuilt on next use.
+        """
+
+        with self.lock:
+            self.generation = -1
+
+    def save(self) -> None:
+        """
+        Persist the index and the generation it reflects.
+        """
+
+        if not self.path:
+            return
+
+        with self.lock:
+            if self._index is None:
+                for path in (self.path, self.meta_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                return
+            if self.generation < 0:
+                # a stale graph is never persisted, the file of the last good one is kept
+                return
+            self._index.save_index(self.path)
+            with open(self.meta_path, "w", encoding="utf-8") as meta_file:
+                json.dump({
+                    "generation": self.generation,
+                    "dimension": self._dimension,
+                    "capacity": self._index.get_max_elements(),
+                    "deleted": sorted(self._deleted)
+                }, meta_file)
+
+    def add(
+        self,
+        labels: List[int],
+        matrix: np.ndarray
+    ) -> None:
+        """
+        Insert items or replace the vectors of existing labels.
+
+        Raises:
+            ValueError: If the vectors don't match the index dimension
+        """
+
+        if not len(labels):
+            return
+
+        with self.lock:
+            if self._index is None:
+                self._init_index(matrix.shape[1], int(len(labels) * 1.25))
+            elif matrix.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Vector dimensions don't match: {matrix.shape[1]} vs {self._dimension}"
+                )
+
+            # grow geometrically so bulk loads don't resize on every batch
+            needed = self._index.element_count + len(labels)
+            capacity = self._index.get_max_elements()
+            if needed > capacity:
+                self._index.resize_index(max(needed, capacity * 2))
+            self._index.add_items(matrix, np.asarray(labels, dtype=np.int64))
+            # adding a deleted label brings it back
+            self._deleted.difference_update(labels)
+
+    def remove(
+        self,
+        labels: List[int]
+    ) -> None:
+        """
+        Mark items as deleted.
+        """
+
+        with self.lock:
+            if self._index is None:
+                return
+            for label in labels:
+                try:
+                    self._index.mark_deleted(label)
+                    self._deleted.add(label)
+                except RuntimeError:
+                    # label was never indexed or is already deleted
+                    pass
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        ef_search: Optional[int] = None,
+        allowed: Optional[Callable[[int], bool]] = None
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Find the approximate nearest neighbours of each query.
+
+        Args:
+            queries: Query matrix
+            k: Number of neighbours per query, at most the number of live items
+            ef_search: Optional size of the dynamic candidate list for this search
+            allowed: Optional predicate on labels, rejected labels are skipped
+
+        Returns:
+            One (labels, cosine distances) pair per query
+        """
+
+        with self.lock:
+            # hnswlib raises rather than return fewer than k neighbours
+            k = min(k, self.live_count)
+            if self._index is None or k <= 0:
+                empty = np.empty(0)
+                return [(empty.astype(np.int64), empty.astype(np.float32)) for _ in queries]
+            if queries.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Vector dimensions don't match: {queries.shape[1]} vs {self._dimension}"
+                )
+
+            # ef must be at least k for the search to return k neighbours
+            self._index.set_ef(max(ef_search or self.params["ef_search"], k))
+            try:
+                labels, distances = self._index.knn_query(queries, k=k, filter=allowed)
+                return list(zip(labels, distances))
+            except RuntimeError:
+                # some query reached fewer than k live items, search them one by one
+                return [self._search_one(query, k, allowed) for query in queries]
+            finally:
+                self._index.set_ef(self.params["ef_search"])
+
+    def _search_one(
+        self,
+        query: np.ndarray,
+        k: int,
+        allowed: Optional[Callable[[int], bool]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search a single query with the largest k hnswlib can fill.
+
+        The filter may leave fewer than k reachable items, the largest k that
+        succeeds is found by bisection, so a query costs O(log k) searches.
+        """
+
+        empty = np.empty(0)
+        result = (empty.astype(np.int64), empty.astype(np.float32))
+        # low always succeeds, high always fails
+        low, high = 0, k + 1
+        candidate = k
+        while low + 1 < high:
+            try:
+                labels, distances = self._index.knn_query(query, k=candidate, filter=allowed)
+                result = (labels[0], distances[0])
+                low = candidate
+            except RuntimeError:
+                high = candidate
+            candidate = (low + high) // 2
+        return result
@@ -2,6 +2,7 @@
 Module containing the SysAdd class, which is used to add items in the collection.
 """
 
+import copy
 import json
 from datetime import datetime
 from typing import (
@@ -11,6 +12,11 @@ from typing import (
     Optional
 )
 from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.vector.utils import encode_embedding
+from skypydb.database.connection import writing
+
+# number of rows serialized and sent to SQLite per executemany call
+DEFAULT_BATCH_SIZE = 5000
 
 class SysAdd:
     def add(
@@ -19,7 +25,8 @@ class SysAdd:
         ids: List[str],
         embeddings: Optional[List[List[float]]] = None,
         documents: Optional[List[str]] = None,
-        metadatas: Optional[List[Dict[str, Any]]] = None
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
     ) -> List[str]:
         """
         Add items to a collection.
@@ -30,6 +37,9 @@ class SysAdd:
             embeddings: Optional list of embedding vectors
             documents: Optional list of documents (will be embedded if embedding_function is set)
             metadatas: Optional list of metadata dictionaries
+            batch_size: Number of rows written per executemany call. All batches
+                        are written in a single transaction, so either every item
+                        is added or none is.
             
         Returns:
             List of IDs of added items
@@ -43,6 +53,8 @@ class SysAdd:
             raise ValueError(f"Collection '{collection_name}' not found")
         if embeddings is None and documents is None:
             raise ValueError("Either embeddings or documents must be provided")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
         if embeddings is None:
             if self.embedding_function is None:
                 raise ValueError(
@@ -71,28 +83,55 @@ class SysAdd:
                 f"number of IDs ({n_items})"
             )
 
+        embedding_format = self._get_embedding_format(collection_name)
+
         cursor = self.conn.cursor()
         
         now = datetime.now().isoformat()
 
-        for i, item_id in enumerate(ids):
-            embedding = embeddings[i]
-            document = documents[i] if documents else None
-            metadata = metadatas[i] if metadatas else None
+        # upsert keeps the rowid of replaced rows, which labels them in the HNSW index
+        statement = f"""
+            INSERT INTO [vec_{collection_name}] 
+            (id, document, embedding, metadata, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                document = excluded.document,
+                embedding = excluded.embedding,
+                metadata = excluded.metadata,
+                created_at = excluded.created_at
+        """
 
-            cursor.execute(
-                f"""
-                INSERT OR REPLACE INTO [vec_{collection_name}] 
-                (id, document, embedding, metadata, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    item_id,
-                    document,
-                    json.dumps(embedding),
-                    json.dumps(metadata) if metadata else None,
-                    now
-                )
+        # embeddings are computed first, the writer lock is held for the transaction
+        # and the cache update, so the cache follows the commit order
+        with writing(self.conn):
+            try:
+                for start in range(0, n_items, batch_size):
+                    stop = min(start + batch_size, n_items)
+                    # serialize the whole batch before handing it to SQLite
+                    rows = [
+                        (
+                            ids[i],
+                            documents[i] if documents else None,
+                            encode_embedding(embeddings[i], embedding_format),
+                            json.dumps(metadatas[i]) if metadatas and metadatas[i] else None,
+                            now
+                        )
+                        for i in range(start, stop)
+                    ]
+                    cursor.executemany(statement, rows)
+                self._index_add(collection_name, ids, embeddings)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                self._discard_index_changes(collection_name)
+                raise
+
+            # keep the resident copy of the collection in sync
+            self._cache_upsert(
+                collection_name,
+                ids,
+                embeddings,
+                [documents[i] if documents else None for i in range(n_items)],
+                [copy.deepcopy(metadatas[i]) if metadatas and metadatas[i] else None for i in range(n_items)]
             )
-        self.conn.commit()
         return ids
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Module containing the SysCache class, which is used to keep collections resident in memory for queries.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+from skypydb.database.mixins.vector.cache import CollectionSnapshot
+
+class SysCache:
+    def _get_snapshot(
+        self,
+        collection_name: str
+    ) -> CollectionSnapshot:
+        """
+        Get the snapshot of a collection, loading it from SQLite on a cache miss.
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            CollectionSnapshot of the whole collection
+        """
+
+        if self._cache is not None:
+            snapshot = self._cache.get(collection_name)
+            if snapshot is not None:
+                return snapshot
+            version = self._cache.version(collection_name)
+
+        snapshot = CollectionSnapshot.from_items(
+            self._get_all_items(collection_name, decode_embeddings=False)
+        )
+        if self._cache is not None:
+            self._cache.put(collection_name, snapshot, version=version)
+        return snapshot
+
+    def _cache_upsert(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[Optional[str]],
+        metadatas: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """
+        Apply inserted or replaced rows to the cached snapshot.
+        """
+
+        if self._cache is not None:
+            self._cache.apply(
+                collection_name,
+                lambda snapshot: snapshot.upsert(ids, embeddings, documents, metadatas)
+            )
+
+    def _cache_update(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: Optional[List[List[float]]] = None,
+        documents: Optional[List[Optional[str]]] = None,
+        metadatas: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> None:
+        """
+        Apply updated fields to the cached snapshot.
+        """
+
+        if self._cache is not None:
+            self._cache.apply(
+                collection_name,
+                lambda snapshot: snapshot.update(ids, embeddings, documents, metadatas)
+            )
+
+    def _cache_remove(
+        self,
+        collection_name: str,
+        ids: List[str]
+    ) -> None:
+        """
+        Remove deleted rows from the cached snapshot.
+        """
+
+        if self._cache is not None:
+            self._cache.apply(
+                collection_name,
+                lambda snapshot: snapshot.remove(ids)
+            )
+
+    def clear_cache(
+        self,
+        collection_name: Optional[str] = None
+    ) -> None:
+        """
+        Drop cached collections so the next query reloads them from SQLite.
+
+        Use this after the database file was modified by another process.
+
+        Args:
+            collection_name: Optional collection to drop, drops every collection if None
+        """
+
+        if self._cache is None:
+            return
+        if collection_name is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate(collection_name)
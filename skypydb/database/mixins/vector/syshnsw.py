@@ -0,0 +1,292 @@
+"""
+Module containing the SysHnsw class, which is used to maintain the HNSW indexes of the collections.
+"""
+
+import json
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.vector.hnsw import HnswIndex
+from skypydb.database.mixins.vector.utils import embeddings_to_matrix
+
+class SysHnsw:
+    def _index_path(
+        self,
+        collection_name: str
+    ) -> Optional[str]:
+        """
+        Get the path of the index file of a collection, None for in-memory databases.
+        """
+
+        if self.path == ":memory:" or self.path.startswith("file::memory:"):
+            return None
+        return f"{self.path}.{collection_name}.hnsw"
+
+    def _register_index(
+        self,
+        collection_name: str,
+        params: Dict[str, int]
+    ) -> None:
+        """
+        Declare the HNSW index of a new collection, inside the creating transaction.
+        """
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            "INSERT OR REPLACE INTO _vector_indexes (collection, type, params, generation) VALUES (?, ?, ?, 0)",
+            (collection_name, "hnsw", json.dumps(params))
+        )
+
+    def _get_index(
+        self,
+        collection_name: str
+    ) -> Optional[HnswIndex]:
+        """
+        Get the up to date HNSW index of a collection.
+
+        The index is loaded from its file, or rebuilt from the collection rows
+        when the file is missing or older than the last write.
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            HnswIndex, or None if the collection has no index
+        """
+
+        return self._sync_index(collection_name)[0]
+
+    def _sync_index(
+        self,
+        collection_name: str
+    ) -> Tuple[Optional[HnswIndex], bool]:
+        """
+        Bring the index of a collection up to date.
+
+        Returns:
+            Tuple of the index, or None if the collection has no index, and
+            whether it had to be rebuilt from the collection rows
+        """
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            "SELECT params, generation FROM _vector_indexes WHERE collection = ?",
+            (collection_name,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None, False
+
+        generation = row["generation"]
+        index = self._indexes.get(collection_name)
+        if index is None:
+            index = HnswIndex(self._index_path(collection_name), json.loads(row["params"]))
+            self._indexes[collection_name] = index
+
+        with index.lock:
+            # a reader on a snapshot older than the last write keeps the newer index
+            if index.generation < generation and index.load() != generation:
+                self._rebuild(collection_name, index, generation)
+                return index, True
+        return index, False
+
+    def _rebuild(
+        self,
+        collection_name: str,
+        index: HnswIndex,
+        generation: int
+    ) -> None:
+        """
+        Build an index from every row of a collection.
+        """
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(f"SELECT rowid, embedding FROM [vec_{collection_name}]")
+        rows = cursor.fetchall()
+        index.rebuild(
+            [row[0] for row in rows],
+            embeddings_to_matrix([row[1] for row in rows]),
+            generation
+        )
+
+    def _get_rowids(
+        self,
+        collection_name: str,
+        ids: List[str]
+    ) -> Dict[str, int]:
+        """
+        Get the rowids of items, which are used as index labels.
+        """
+
+        cursor = self.conn.cursor()
+
+        rowids = {}
+        unique_ids = list(dict.fromkeys(ids))
+        # stay below the SQLite limit on bound parameters
+        for start in range(0, len(unique_ids), 900):
+            chunk = unique_ids[start:start + 900]
+            placeholders = ", ".join(["?" for _ in chunk])
+            cursor.execute(
+                f"SELECT rowid, id FROM [vec_{collection_name}] WHERE id IN ({placeholders})",
+                chunk
+            )
+            rowids.update({row[1]: row[0] for row in cursor.fetchall()})
+        return rowids
+
+    def _bump_index_generation(
+        self,
+        collection_name: str
+    ) -> int:
+        """
+        Record a write to an indexed collection, inside the writing transaction.
+        """
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            "UPDATE _vector_indexes SET generation = generation + 1 WHERE collection = ?",
+            (collection_name,)
+        )
+        cursor.execute(
+            "SELECT generation FROM _vector_indexes WHERE collection = ?",
+            (collection_name,)
+        )
+        return cursor.fetchone()[0]
+
+    def _index_add(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: List[Union[bytes, str, List[float]]]
+    ) -> None:
+        """
+        Add written rows to the index of a collection.
+
+        Must be called after the rows were written and before the transaction
+        is committed, rows that don't exist are skipped.
+        """
+
+        index, rebuilt = self._sync_index(collection_name)
+        if index is None:
+            return
+
+        with index.lock:
+            generation = self._bump_index_generation(collection_name)
+            if rebuilt:
+                # the rebuild already read the rows written by this transaction
+                index.generation = generation
+                return
+            rowids = self._get_rowids(collection_name, ids)
+            # the last embedding of a repeated id is the one stored
+            latest = {item_id: position for position, item_id in enumerate(ids) if item_id in rowids}
+            if latest:
+                matrix = embeddings_to_matrix([embeddings[position] for position in latest.values()])
+                try:
+                    index.add([rowids[item_id] for item_id in latest], matrix)
+                except ValueError:
+                    # mixed dimensions can't be indexed, searches fall back to the rebuilt index
+                    index.generation = -1
+                    return
+            index.generation = generation
+
+    def _index_remove(
+        self,
+        collection_name: str,
+        ids: List[str]
+    ) -> None:
+        """
+        Remove rows from the index of a collection.
+
+        Must be called before the rows are deleted, inside the deleting transaction.
+        """
+
+        index = self._get_index(collection_name)
+        if index is None:
+            return
+
+        with index.lock:
+            rowids = self._get_rowids(collection_name, ids)
+            generation = self._bump_index_generation(collection_name)
+            index.remove(list(rowids.values()))
+            index.generation = generation
+
+    def _discard_index_changes(
+        self,
+        collection_name: str
+    ) -> None:
+        """
+        Mark the index of a collection stale after its writing transaction was rolled back.
+
+        _index_add and _index_remove change the graph before the commit, the
+        index is rebuilt from the collection rows on its next use.
+        """
+
+        index = self._indexes.get(collection_name)
+        if index is not None:
+            index.invalidate()
+
+    def _drop_index(
+        self,
+        collection_name: str
+    ) -> None:
+        """
+        Remove the index of a deleted collection and its files.
+        """
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            "DELETE FROM _vector_indexes WHERE collection = ?",
+            (collection_name,)
+        )
+        index = self._indexes.pop(collection_name, None)
+        if index is None:
+            index = HnswIndex(self._index_path(collection_name), {})
+        with index.lock:
+            index.rebuild([], None, -1)
+            index.save()
+
+    def rebuild_index(
+        self,
+        name: str
+    ) -> None:
+        """
+        Rebuild the HNSW index of a collection from its rows.
+
+        Deleted items stay in the graph until the index is rebuilt, rebuilding
+        after large deletions keeps the index compact.
+
+        Args:
+            name: Collection name
+
+        Raises:
+            ValueError: If collection doesn't exist or has no HNSW index
+        """
+
+        name = InputValidator.validate_table_name(name)
+        if not self.collection_exists(name):
+            raise ValueError(f"Collection '{name}' not found")
+
+        index = self._get_index(name)
+        if index is None:
+            raise ValueError(f"Collection '{name}' has no HNSW index")
+
+        with index.lock:
+            self._rebuild(name, index, index.generation)
+            index.save()
+
+    def save_indexes(self) -> None:
+        """
+        Persist the loaded HNSW indexes next to the database file.
+        """
+
+        for index in list(self._indexes.values()):
+            index.save()
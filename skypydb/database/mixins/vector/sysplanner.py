@@ -0,0 +1,193 @@
+"""
+Module containing the SysPlanner class, which is used to choose how a filtered query is executed.
+"""
+
+import json
+import random
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Set
+)
+import numpy as np
+from skypydb.database.mixins.vector.cache import CollectionSnapshot
+
+# strategies chosen by the planner
+STRATEGY_SCAN = "scan"
+STRATEGY_PREFILTER = "pre-filter"
+STRATEGY_POSTFILTER = "post-filter"
+
+# fraction of matching rows above which filtering the best scored rows is cheaper
+POSTFILTER_SELECTIVITY = 0.3
+
+# number of rows sampled to estimate the selectivity of a filter
+SELECTIVITY_SAMPLE_SIZE = 256
+
+# indexed collections score the candidates exactly below this many, graph
+# search gets slow when most of the neighbours it visits are filtered out
+EXACT_CANDIDATES_LIMIT = 4096
+
+class SysPlanner:
+    def _plan_query(
+        self,
+        collection_name: str,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None,
+        snapshot: Optional[CollectionSnapshot] = None,
+        indexed: bool = False
+    ) -> str:
+        """
+        Choose how the filters of a query are applied.
+
+        Pre-filtering evaluates the filters once and scores only the
+        candidates, post-filtering scores every row and evaluates the filters
+        on the best rows only, which is cheaper when most rows match.
+
+        Args:
+            collection_name: Name of the collection
+            where: Optional metadata filter
+            where_document: Optional document filter
+            snapshot: Optional resident snapshot of the collection
+            indexed: Whether the collection is searched through an HNSW index
+
+        Returns:
+            One of STRATEGY_SCAN, STRATEGY_PREFILTER or STRATEGY_POSTFILTER
+        """
+
+        if where is None and where_document is None:
+            return STRATEGY_SCAN
+        if snapshot is None and not indexed:
+            # rows have to be read from SQLite, which filters them on the way
+            return STRATEGY_PREFILTER
+
+        selectivity = self._estimate_selectivity(collection_name, where, where_document, snapshot)
+        if selectivity >= POSTFILTER_SELECTIVITY:
+            return STRATEGY_POSTFILTER
+        return STRATEGY_PREFILTER
+
+    def _estimate_selectivity(
+        self,
+        collection_name: str,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None,
+        snapshot: Optional[CollectionSnapshot] = None
+    ) -> float:
+        """
+        Estimate the fraction of rows matching the filters from a sample.
+        """
+
+        if snapshot is not None:
+            if not len(snapshot):
+                return 1.0
+            positions = np.unique(
+                np.linspace(0, len(snapshot) - 1, min(SELECTIVITY_SAMPLE_SIZE, len(snapshot))).astype(np.intp)
+            )
+            matches = sum(
+                self._matches_filters(
+                    {"document": snapshot.documents[position], "metadata": snapshot.metadatas[position]},
+                    where,
+                    where_document
+                )
+                for position in positions
+            )
+            return matches / len(positions)
+
+        cursor = self.conn.cursor()
+
+        # sample random rowids, which avoids reading the whole table
+        cursor.execute(f"SELECT MAX(rowid) FROM [vec_{collection_name}]")
+        max_rowid = cursor.fetchone()[0]
+        if not max_rowid:
+            return 1.0
+        sample = random.sample(range(1, max_rowid + 1), min(SELECTIVITY_SAMPLE_SIZE, max_rowid))
+        placeholders = ", ".join(["?" for _ in sample])
+        cursor.execute(
+            f"SELECT document, metadata FROM [vec_{collection_name}] WHERE rowid IN ({placeholders})",
+            sample
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return 1.0
+        matches = sum(
+            self._matches_filters(
+                {
+                    "document": row["document"],
+                    "metadata": json.loads(row["metadata"]) if row["metadata"] else None
+                },
+                where,
+                where_document
+            )
+            for row in rows
+        )
+        return matches / len(rows)
+
+    def _filter_positions(
+        self,
+        collection_name: str,
+        snapshot: CollectionSnapshot,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None
+    ) -> np.ndarray:
+        """
+        Get the positions of the snapshot rows matching the filters.
+
+        Filters on indexed metadata keys are answered by SQLite, other filters
+        are evaluated on the resident rows.
+        """
+
+        clause, params, exact = self._compile_filters(where, where_document)
+        if clause is None or not exact or not self.get_metadata_indexes(collection_name):
+            return snapshot.filter(
+                lambda item: self._matches_filters(item, where, where_document)
+            )
+
+        cursor = self.conn.cursor()
+
+        cursor.execute(f"SELECT id FROM [vec_{collection_name}] WHERE {clause}", params)
+        positions = [
+            snapshot.positions[row[0]]
+            for row in cursor
+            if row[0] in snapshot.positions
+        ]
+        return np.asarray(sorted(positions), dtype=np.intp)
+
+    def _filter_rowids(
+        self,
+        collection_name: str,
+        rowids: Set[int],
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None
+    ) -> Set[int]:
+        """
+        Get the rowids among the given ones whose rows match the filters.
+        """
+
+        cursor = self.conn.cursor()
+
+        clause, clause_params, exact = self._compile_filters(where, where_document)
+        matching = set()
+        rowid_list = list(rowids)
+        # stay below the SQLite limit on bound parameters
+        for start in range(0, len(rowid_list), 900):
+            chunk = rowid_list[start:start + 900]
+            query = (
+                f"SELECT rowid, document, metadata FROM [vec_{collection_name}] "
+                f"WHERE rowid IN ({', '.join(['?' for _ in chunk])})"
+            )
+            params = list(chunk)
+            if clause is not None:
+                query += f" AND {clause}"
+                params.extend(clause_params)
+            cursor.execute(query, params)
+            for row in cursor:
+                if exact or self._matches_filters(
+                    {
+                        "document": row["document"],
+                        "metadata": json.loads(row["metadata"]) if row["metadata"] else None
+                    },
+                    where,
+                    where_document
+                ):
+                    matching.add(row["rowid"])
+        return matching
@@ -2,16 +2,33 @@
 Module containing the SysQuery class, which is used to query a collection to get similar items.
 """
 
+import copy
 from typing import (
     Dict,
     List,
     Optional,
+    Set,
+    Tuple,
     Any
 )
+import numpy as np
 from skypydb.security.validation import InputValidator
-from skypydb.database.mixins.vector.utils import cosine_similarity
+from skypydb.database.mixins.vector.cache import CollectionSnapshot
+from skypydb.database.mixins.vector.hnsw import HnswIndex
+from skypydb.database.mixins.vector.sysplanner import (
+    EXACT_CANDIDATES_LIMIT,
+    STRATEGY_POSTFILTER,
+    STRATEGY_PREFILTER
+)
+from skypydb.database.mixins.vector.utils import (
+    embeddings_to_matrix,
+    normalize_rows,
+    top_k
+)
+from skypydb.database.connection import reads
 
 class SysQuery:
+    @reads
     def query(
         self,
         collection_name: str,
@@ -20,7 +37,9 @@ class SysQuery:
         n_results: int = 10,
         where: Optional[Dict[str, Any]] = None,
         where_document: Optional[Dict[str, str]] = None,
-        include: Optional[List[str]] = None
+        include: Optional[List[str]] = None,
+        ef_search: Optional[int] = None,
+        exact: bool = False
     ) -> Dict[str, List[List[Any]]]:
         """
         Query a collection for similar items.
@@ -33,6 +52,9 @@ class SysQuery:
             where: Optional metadata filter
             where_document: Optional document filter
             include: Optional list of fields to include
+            ef_search: Optional HNSW candidate list size for this query,
+                       higher values trade latency for recall
+            exact: If True, use brute-force search even if the collection has an HNSW index
             
         Returns:
             Dictionary with nested lists of results for each query
@@ -54,9 +76,6 @@ class SysQuery:
 
         include = include or ["embeddings", "documents", "metadatas", "distances"]
 
-        # get all items from collection
-        all_items = self._get_all_items(collection_name)
-
         results = {
             "ids": [],
             "embeddings": [] if "embeddings" in include else None,
@@ -65,47 +84,286 @@ class SysQuery:
             "distances": [] if "distances" in include else None,
         }
 
-        for query_embedding in query_embeddings:
-            # calculate similarities and filter
-            scored_items = []
+        if not query_embeddings:
+            return results
+
+        queries = normalize_rows(embeddings_to_matrix(query_embeddings))
 
-            for item in all_items:
-                # apply filters
-                if not self._matches_filters(item, where, where_document):
-                    continue
+        # collections created with an HNSW index are searched through it
+        index = None if exact else self._get_index(collection_name)
+        snapshot = self._get_snapshot(collection_name) if index is None and self._cache is not None else None
+        strategy = self._plan_query(
+            collection_name,
+            where,
+            where_document,
+            snapshot=snapshot,
+            indexed=index is not None
+        )
+
+        if index is not None:
+            self._query_index(
+                collection_name,
+                index,
+                queries,
+                n_results,
+                where,
+                where_document,
+                ef_search,
+                strategy,
+                results
+            )
+            return results
+
+        positions = None
+        if snapshot is None:
+            # without a cache only the rows that pass the filters are decoded
+            snapshot = CollectionSnapshot.from_items(
+                self._get_all_items(
+                    collection_name,
+                    decode_embeddings=False,
+                    where=where,
+                    where_document=where_document
+                )
+            )
+        elif strategy == STRATEGY_PREFILTER:
+            # the filters are evaluated once, only the candidates are scored
+            positions = self._filter_positions(collection_name, snapshot, where, where_document)
 
-                # calculate cosine similarity
-                similarity = cosine_similarity(query_embedding, item["embedding"])
+        self._check_dimension(queries, snapshot.dimension)
+        if strategy == STRATEGY_POSTFILTER:
+            ranked = self._rank_postfiltered(snapshot, queries, n_results, where, where_document)
+        else:
+            ranked = self._rank_snapshot(snapshot, queries, n_results, positions)
+
+        for rows, similarities in ranked:
+            self._append_query_result(
+                results,
+                [
+                    {
+                        "id": snapshot.ids[row],
+                        "embedding": snapshot.embedding(row) if results["embeddings"] is not None else None,
+                        "document": snapshot.documents[row],
+                        "metadata": copy.deepcopy(snapshot.metadatas[row])
+                    }
+                    for row in rows
+                ],
                 # convert to distance (1 - similarity, so lower is better)
-                distance = 1.0 - similarity
-
-                scored_items.append((item, distance))
-
-            # sort by distance (ascending) and take top n
-            scored_items.sort(key=lambda x: x[1])
-            top_items = scored_items[:n_results]
-
-            # extract results for this query
-            query_ids = []
-            query_embeddings_result = []
-            query_documents = []
-            query_metadatas = []
-            query_distances = []
-
-            for item, distance in top_items:
-                query_ids.append(item["id"])
-                query_embeddings_result.append(item["embedding"])
-                query_documents.append(item["document"])
-                query_metadatas.append(item["metadata"])
-                query_distances.append(distance)
-
-            results["ids"].append(query_ids)
-            if results["embeddings"] is not None:
-                results["embeddings"].append(query_embeddings_result)
-            if results["documents"] is not None:
-                results["documents"].append(query_documents)
-            if results["metadatas"] is not None:
-                results["metadatas"].append(query_metadatas)
-            if results["distances"] is not None:
-                results["distances"].append(query_distances)
-        return results
\ No newline at end of file
+                [1.0 - float(similarity) for similarity in similarities]
+            )
+        return results
+
+    def _check_dimension(
+        self,
+        queries: np.ndarray,
+        dimension: Optional[int]
+    ) -> None:
+        """
+        Check that the queries have the dimension of the searched embeddings.
+        """
+
+        if dimension is not None and queries.shape[1] != dimension:
+            raise ValueError(
+                f"Vector dimensions don't match: {queries.shape[1]} vs {dimension}"
+            )
+
+    def _rank_snapshot(
+        self,
+        snapshot: CollectionSnapshot,
+        queries: np.ndarray,
+        n_results: int,
+        positions: Optional[np.ndarray] = None
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Rank the rows of a snapshot, or a subset of them, for every query.
+
+        Returns:
+            One (row positions, similarities) pair per query, best first
+        """
+
+        n_candidates = len(snapshot) if positions is None else len(positions)
+        if not n_candidates:
+            empty = np.empty(0)
+            return [(empty.astype(np.intp), empty.astype(np.float32)) for _ in queries]
+
+        # cosine similarity of every query against every candidate in one product
+        similarities = snapshot.similarities(queries, positions)
+        top_indices = top_k(similarities, n_results)
+        return [
+            (
+                indices if positions is None else positions[indices],
+                similarities[query_index, indices]
+            )
+            for query_index, indices in enumerate(top_indices)
+        ]
+
+    def _rank_postfiltered(
+        self,
+        snapshot: CollectionSnapshot,
+        queries: np.ndarray,
+        n_results: int,
+        where: Optional[Dict[str, Any]],
+        where_document: Optional[Dict[str, str]]
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Rank every row of a snapshot, then keep the best rows matching the filters.
+
+        The filters are evaluated on the best rows only, widening the window
+        until enough rows match, and at most once per row for all queries.
+        """
+
+        if not len(snapshot):
+            return self._rank_snapshot(snapshot, queries, n_results)
+
+        similarities = snapshot.similarities(queries)
+        matches: Dict[int, bool] = {}
+
+        def row_matches(row: int) -> bool:
+            if row not in matches:
+                matches[row] = self._matches_filters(
+                    {"document": snapshot.documents[row], "metadata": snapshot.metadatas[row]},
+                    where,
+                    where_document
+                )
+            return matches[row]
+
+        ranked = []
+        for scores in similarities:
+            window = min(len(snapshot), max(n_results * 2, 16))
+            while True:
+                order = top_k(scores[np.newaxis, :], window)[0]
+                rows = [row for row in order if row_matches(int(row))][:n_results]
+                if len(rows) >= n_results or window == len(snapshot):
+                    break
+                window = min(len(snapshot), window * 4)
+            rows = np.asarray(rows, dtype=np.intp)
+            ranked.append((rows, scores[rows]))
+        return ranked
+
+    def _query_index(
+        self,
+        collection_name: str,
+        index: HnswIndex,
+        queries: np.ndarray,
+        n_results: int,
+        where: Optional[Dict[str, Any]],
+        where_document: Optional[Dict[str, str]],
+        ef_search: Optional[int],
+        strategy: str,
+        results: Dict[str, List[List[Any]]]
+    ) -> None:
+        """
+        Answer a query with the HNSW index of a collection.
+
+        Pre-filtered queries search the graph restricted to the candidates,
+        or score the candidates exactly when there are few of them.
+        Post-filtered queries search the whole graph and widen the search
+        until enough neighbours match the filters.
+        """
+
+        if strategy == STRATEGY_PREFILTER:
+            allowed = self._get_matching_rowids(collection_name, where, where_document)
+            if len(allowed) <= EXACT_CANDIDATES_LIMIT:
+                # a small candidate set is cheaper to score exactly than to search
+                candidates = list(self._get_items_by_rowid(collection_name, list(allowed)).values())
+                snapshot = CollectionSnapshot.from_items(candidates)
+                self._check_dimension(queries, snapshot.dimension)
+                for rows, similarities in self._rank_snapshot(snapshot, queries, n_results):
+                    self._append_query_result(
+                        results,
+                        [candidates[row] for row in rows],
+                        [1.0 - float(similarity) for similarity in similarities]
+                    )
+                return
+            neighbours = index.search(
+                queries,
+                min(n_results, len(allowed)),
+                ef_search=ef_search,
+                allowed=allowed.__contains__
+            )
+        elif strategy == STRATEGY_POSTFILTER:
+            neighbours = self._postfilter_neighbours(
+                collection_name,
+                index,
+                queries,
+                n_results,
+                where,
+                where_document,
+                ef_search
+            )
+        else:
+            neighbours = index.search(
+                queries,
+                min(n_results, self.count(collection_name)),
+                ef_search=ef_search
+            )
+
+        items = self._get_items_by_rowid(
+            collection_name,
+            [int(label) for labels, _ in neighbours for label in labels]
+        )
+
+        for labels, distances in neighbours:
+            found = [
+                (items[int(label)], float(distance))
+                for label, distance in zip(labels, distances)
+                if int(label) in items
+            ]
+            self._append_query_result(
+                results,
+                [item for item, _ in found],
+                [distance for _, distance in found]
+            )
+
+    def _postfilter_neighbours(
+        self,
+        collection_name: str,
+        index: HnswIndex,
+        queries: np.ndarray,
+        n_results: int,
+        where: Optional[Dict[str, Any]],
+        where_document: Optional[Dict[str, str]],
+        ef_search: Optional[int]
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Search the whole graph and keep the neighbours matching the filters.
+        """
+
+        n_items = self.count(collection_name)
+        checked: Set[int] = set()
+        matching: Set[int] = set()
+        window = min(n_items, max(n_results * 2, 16))
+        while True:
+            neighbours = index.search(queries, window, ef_search=ef_search)
+            # each neighbour is checked once whichever query found it
+            labels = {int(label) for found, _ in neighbours for label in found} - checked
+            matching |= self._filter_rowids(collection_name, labels, where, where_document)
+            checked |= labels
+
+            filtered = []
+            for found, distances in neighbours:
+                keep = [position for position, label in enumerate(found) if int(label) in matching]
+                keep = keep[:n_results]
+                filtered.append((found[keep], distances[keep]))
+            if window >= n_items or all(len(found) >= n_results for found, _ in filtered):
+                return filtered
+            window = min(n_items, window * 4)
+
+    def _append_query_result(
+        self,
+        results: Dict[str, List[List[Any]]],
+        items: List[Dict[str, Any]],
+        distances: List[float]
+    ) -> None:
+        """
+        Append the ranked items of one query to the results.
+        """
+
+        results["ids"].append([item["id"] for item in items])
+        if results["embeddings"] is not None:
+            results["embeddings"].append([item["embedding"] for item in items])
+        if results["documents"] is not None:
+            results["documents"].append([item["document"] for item in items])
+        if results["metadatas"] is not None:
+            results["metadatas"].append([item["metadata"] for item in items])
+        if results["distances"] is not None:
+            results["distances"].append(distances)
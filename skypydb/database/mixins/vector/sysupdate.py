@@ -2,6 +2,7 @@
 Module containing the SysUpdate class, which is used to update items in the collection.
 """
 
+import copy
 import json
 from typing import (
     Dict,
@@ -10,6 +11,8 @@ from typing import (
     Any
 )
 from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.vector.utils import encode_embedding
+from skypydb.database.connection import writing
 
 class SysUpdate:
     def update(
@@ -41,24 +44,47 @@ class SysUpdate:
                 )
             embeddings = self.embedding_function(documents)
 
-        cursor = self.conn.cursor()
+        embedding_format = self._get_embedding_format(collection_name)
 
-        for i, item_id in enumerate(ids):
-            updates = []
-            params = []
-            if embeddings is not None:
-                updates.append("embedding = ?")
-                params.append(json.dumps(embeddings[i]))
-            if documents is not None:
-                updates.append("document = ?")
-                params.append(documents[i])
-            if metadatas is not None:
-                updates.append("metadata = ?")
-                params.append(json.dumps(metadatas[i]) if metadatas[i] else None)
-            if updates:
-                params.append(item_id)
-                cursor.execute(
-                    f"UPDATE [vec_{collection_name}] SET {', '.join(updates)} WHERE id = ?",
-                    params
-                )
-        self.conn.commit()
\ No newline at end of file
+        # embeddings are computed first, the writer lock is held for the transaction
+        # and the cache update, so the cache follows the commit order
+        with writing(self.conn):
+            cursor = self.conn.cursor()
+
+            try:
+                for i, item_id in enumerate(ids):
+                    updates = []
+                    params = []
+                    if embeddings is not None:
+                        updates.append("embedding = ?")
+                        params.append(encode_embedding(embeddings[i], embedding_format))
+                    if documents is not None:
+                        updates.append("document = ?")
+                        params.append(documents[i])
+                    if metadatas is not None:
+                        updates.append("metadata = ?")
+                        params.append(json.dumps(metadatas[i]) if metadatas[i] else None)
+                    if updates:
+                        params.append(item_id)
+                        cursor.execute(
+                            f"UPDATE [vec_{collection_name}] SET {', '.join(updates)} WHERE id = ?",
+                            params
+                        )
+                if embeddings is not None:
+                    self._index_add(collection_name, ids, embeddings)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                self._discard_index_changes(collection_name)
+                raise
+
+            # keep the resident copy of the collection in sync
+            self._cache_update(
+                collection_name,
+                ids,
+                embeddings=embeddings,
+                documents=documents,
+                metadatas=[
+                    copy.deepcopy(metadata) if metadata else None for metadata in metadatas
+                ] if metadatas is not None else None
+            )
\ No newline at end of file
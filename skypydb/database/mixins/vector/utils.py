@@ -1,9 +1,22 @@
 """
-Module containing the base definition, which are used to calculate cosine and euclidean vectors.
+Module containing the base definition, which are used to calculate cosine and euclidean vectors,
+to encode embeddings for storage and to score whole collections at once.
 """
 
+import sys
+import json
 import math
-from typing import List
+from array import array
+from typing import (
+    List,
+    Sequence,
+    Union
+)
+import numpy as np
+
+# storage formats of the embedding column in vec_* tables
+EMBEDDING_FORMAT_JSON = "json"
+EMBEDDING_FORMAT_FLOAT32 = "float32"
 
 def cosine_similarity(
     vec1: List[float],
@@ -47,4 +60,135 @@ def euclidean_distance(
 
     if len(vec1) != len(vec2):
         raise ValueError(f"Vector dimensions don't match: {len(vec1)} vs {len(vec2)}")
-    return math.sqrt(sum((a - b) ** 2 for a, b in zip(vec1, vec2)))
\ No newline at end of file
+    return math.sqrt(sum((a - b) ** 2 for a, b in zip(vec1, vec2)))
+
+def encode_embedding(
+    embedding: List[float],
+    embedding_format: str = EMBEDDING_FORMAT_FLOAT32
+) -> Union[bytes, str]:
+    """
+    Encode an embedding for storage in a vec_* table.
+
+    Args:
+        embedding: Embedding vector
+        embedding_format: Storage format of the collection (float32 or json)
+
+    Returns:
+        Packed little-endian float32 bytes, or JSON text for legacy collections
+    """
+
+    if embedding_format == EMBEDDING_FORMAT_JSON:
+        return json.dumps(embedding)
+
+    values = array("f", embedding)
+    # stored blobs are always little-endian
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+def decode_embedding(
+    value: Union[bytes, str]
+) -> List[float]:
+    """
+    Decode an embedding read from a vec_* table.
+
+    Blobs are decoded as packed little-endian float32 values, text is decoded as JSON
+    so collections that have not been migrated yet keep working.
+
+    Args:
+        value: Raw value of the embedding column
+
+    Returns:
+        Embedding vector
+    """
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        values = array("f")
+        values.frombytes(memoryview(value))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+    return json.loads(value)
+
+def embeddings_to_matrix(
+    embeddings: Sequence[Union[bytes, str, List[float]]]
+) -> np.ndarray:
+    """
+    Stack embeddings into a contiguous float32 matrix.
+
+    Args:
+        embeddings: Raw embedding column values (blobs or JSON text) or decoded vectors
+
+    Returns:
+        Matrix of shape (len(embeddings), dimension)
+
+    Raises:
+        ValueError: If the embeddings don't all have the same dimension
+    """
+
+    if not embeddings:
+        return np.empty((0, 0), dtype=np.float32)
+
+    # fast path, a collection stored as float32 blobs is decoded with a single copy
+    if all(isinstance(value, bytes) for value in embeddings):
+        sizes = {len(value) for value in embeddings}
+        if len(sizes) == 1:
+            buffer = np.frombuffer(b"".join(embeddings), dtype="<f4")
+            return buffer.reshape(len(embeddings), -1).astype(np.float32, copy=False)
+
+    rows = [
+        decode_embedding(value) if isinstance(value, (bytes, str)) else value
+        for value in embeddings
+    ]
+    dimensions = {len(row) for row in rows}
+    if len(dimensions) != 1:
+        raise ValueError(f"Vector dimensions don't match: {sorted(dimensions)}")
+    return np.asarray(rows, dtype=np.float32)
+
+def normalize_rows(
+    matrix: np.ndarray
+) -> np.ndarray:
+    """
+    Scale every row of a matrix to unit length.
+
+    Rows with a zero norm are left as zeros so their cosine similarity is 0.
+
+    Args:
+        matrix: Matrix of shape (n, dimension)
+
+    Returns:
+        Row-normalized float32 matrix
+    """
+
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+def top_k(
+    scores: np.ndarray,
+    k: int
+) -> np.ndarray:
+    """
+    Select the indices of the k highest scores of every row.
+
+    Args:
+        scores: Matrix of shape (n_queries, n_items)
+        k: Number of indices to keep per row
+
+    Returns:
+        Matrix of shape (n_queries, min(k, n_items)) sorted by descending score
+    """
+
+    n_queries, n_items = scores.shape
+    k = min(k, n_items)
+    if k <= 0:
+        return np.empty((n_queries, 0), dtype=np.intp)
+
+    # partial selection is O(n) per row, only the k survivors are sorted
+    if k < n_items:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(n_items), (n_queries, n_items))
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1)
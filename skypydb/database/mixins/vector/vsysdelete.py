@@ -9,8 +9,10 @@ from typing import (
     Optional
 )
 from skypydb.security.validation import InputValidator
+from skypydb.database.connection import writes
 
 class VSysDelete:
+    @writes
     def delete(
         self,
         collection_name: str,
@@ -36,26 +38,38 @@ class VSysDelete:
             raise ValueError(f"Collection '{collection_name}' not found")
 
         cursor = self.conn.cursor()
-        if ids is not None:
-            placeholders = ", ".join(["?" for _ in ids])
-            cursor.execute(
-                f"DELETE FROM [vec_{collection_name}] WHERE id IN ({placeholders})",
-                list(ids)
-            )
-        else:
-            # get all items and filter
-            items = self._get_all_items(collection_name)
-            ids_to_delete = []
-
-            for item in items:
-                if self._matches_filters(item, where, where_document):
-                    ids_to_delete.append(item["id"])
-            if ids_to_delete:
-                placeholders = ", ".join(["?" for _ in ids_to_delete])
+        try:
+            if ids is not None:
+                ids_to_delete = list(ids)
+                self._index_remove(collection_name, ids_to_delete)
+                placeholders = ", ".join(["?" for _ in ids])
                 cursor.execute(
                     f"DELETE FROM [vec_{collection_name}] WHERE id IN ({placeholders})",
                     ids_to_delete
                 )
-        deleted_count = cursor.rowcount
-        self.conn.commit()
+            else:
+                # get the items matching the filters
+                items = self._get_all_items(
+                    collection_name,
+                    decode_embeddings=False,
+                    where=where,
+                    where_document=where_document
+                )
+                ids_to_delete = [item["id"] for item in items]
+                if ids_to_delete:
+                    self._index_remove(collection_name, ids_to_delete)
+                    placeholders = ", ".join(["?" for _ in ids_to_delete])
+                    cursor.execute(
+                        f"DELETE FROM [vec_{collection_name}] WHERE id IN ({placeholders})",
+                        ids_to_delete
+                    )
+            deleted_count = cursor.rowcount
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            self._discard_index_changes(collection_name)
+            raise
+
+        # keep the resident copy of the collection in sync
+        self._cache_remove(collection_name, ids_to_delete)
         return deleted_count
\ No newline at end of file
@@ -7,21 +7,36 @@ from typing import (
     Any,
     Dict,
     List,
-    Optional
+    Optional,
+    Set
 )
 from skypydb.security.validation import InputValidator
+from skypydb.database.mixins.vector.utils import decode_embedding
+from skypydb.database.connection import reads
 
 class VSysGet:
+    @reads
     def get(
         self,
         collection_name: str,
         ids: Optional[List[str]] = None,
         where: Optional[Dict[str, Any]] = None,
         where_document: Optional[Dict[str, str]] = None,
-        include: Optional[List[str]] = None
+        include: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after_id: Optional[str] = None
     ) -> Dict[str, List[Any]]:
         """
         Get items from a collection by ID or filter.
+
+        Items are returned in ID order, with or without pagination, so a
+        whole collection lists the same items as the concatenation of its
+        pages. Earlier releases returned unpaginated items in insertion
+        order. Pages are read by SQLite in ID order, so only the rows of the
+        requested page are decoded. Continuing from the last ID of a page
+        with after_id stays stable while items are added or deleted, unlike
+        offset.
         
         Args:
             collection_name: Name of the collection
@@ -29,45 +44,47 @@ class VSysGet:
             where: Optional metadata filter
             where_document: Optional document filter
             include: Optional list of fields to include (embeddings, documents, metadatas)
+            limit: Optional maximum number of items to return, 0 returns no items
+            offset: Optional number of matching items to skip
+            after_id: Optional ID of the last item of the previous page, only
+                      items with a greater ID are returned
             
         Returns:
             Dictionary with lists of ids, embeddings, documents, and metadatas
+
+        Raises:
+            ValueError: If the collection doesn't exist or limit or offset is negative
         """
 
         collection_name = InputValidator.validate_table_name(collection_name)
         if not self.collection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' not found")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be a non-negative integer")
+        if offset is not None and offset < 0:
+            raise ValueError("offset must be a non-negative integer")
 
         include = include or ["embeddings", "documents", "metadatas"]
 
-        cursor = self.conn.cursor()
-
-        if ids is not None:
-            placeholders = ", ".join(["?" for _ in ids])
-            cursor.execute(
-                f"SELECT * FROM [vec_{collection_name}] WHERE id IN ({placeholders})",
-                list(ids)
-            )
-        else:
-            cursor.execute(f"SELECT * FROM [vec_{collection_name}]")
-
         results = {
             "ids": [],
             "embeddings": [] if "embeddings" in include else None,
             "documents": [] if "documents" in include else None,
             "metadatas": [] if "metadatas" in include else None,
         }
-        for row in cursor.fetchall():
-            item = {
-                "id": row["id"],
-                "document": row["document"],
-                "embedding": json.loads(row["embedding"]),
-                "metadata": json.loads(row["metadata"]) if row["metadata"] else None,
-            }
-            # apply filters
-            if not self._matches_filters(item, where, where_document):
-                continue
-
+        items = self._get_all_items(
+            collection_name,
+            decode_embeddings=results["embeddings"] is not None,
+            where=where,
+            where_document=where_document,
+            ids=ids,
+            limit=limit,
+            offset=offset,
+            after_id=after_id,
+            read_embeddings=results["embeddings"] is not None,
+            ordered=True
+        )
+        for item in items:
             results["ids"].append(item["id"])
             if results["embeddings"] is not None:
                 results["embeddings"].append(item["embedding"])
@@ -79,23 +96,167 @@ class VSysGet:
 
     def _get_all_items(
         self,
-        collection_name: str
+        collection_name: str,
+        decode_embeddings: bool = True,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None,
+        ids: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after_id: Optional[str] = None,
+        read_embeddings: bool = True,
+        ordered: bool = False
     ) -> List[Dict[str, Any]]:
         """
-        Get all items from a collection.
+        Get all items from a collection, optionally filtered.
+
+        Filters are evaluated by SQLite when they can be compiled, so rows
+        that don't match are never decoded. The page is then selected by
+        SQLite too, in ID order, otherwise rows are read until the page is
+        complete. Unpaginated reads follow the rowid unless ordered is set,
+        a plain table scan being faster than walking the ID index.
+
+        Args:
+            collection_name: Name of the collection
+            decode_embeddings: If False, embeddings are left as raw column values
+                               so callers can decode them in bulk
+            where: Optional metadata filter
+            where_document: Optional document filter
+            ids: Optional list of IDs to restrict the items to
+            limit: Optional maximum number of items
+            offset: Optional number of matching items to skip
+            after_id: Optional ID the items must be greater than
+            read_embeddings: If False, the embedding column isn't read and
+                             the items have no embedding
+            ordered: Whether to return the items in ID order without pagination,
+                     as paginated reads always are (default: False)
         """
 
         cursor = self.conn.cursor()
-        
-        cursor.execute(f"SELECT * FROM [vec_{collection_name}]")
+
+        conditions = []
+        params: List[Any] = []
+        if ids is not None:
+            conditions.append(f"id IN ({', '.join(['?' for _ in ids])})")
+            params.extend(ids)
+        if after_id is not None:
+            conditions.append("id > ?")
+            params.append(after_id)
+        clause, clause_params, exact = self._compile_filters(where, where_document)
+        if clause is not None:
+            conditions.append(clause)
+            params.extend(clause_params)
+
+        columns = "rowid, *" if read_embeddings else "rowid, id, document, NULL AS embedding, metadata, created_at"
+        query = f"SELECT {columns} FROM [vec_{collection_name}]"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        paginated = limit is not None or offset is not None or after_id is not None
+        if paginated or ordered:
+            # pages follow the primary key index, so after_id continues any page
+            query += " ORDER BY id"
+        skip = offset or 0
+        if paginated and exact:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit if limit is not None else -1, skip])
+            skip = 0
 
         items = []
-        for row in cursor.fetchall():
-            items.append({
+        if limit == 0:
+            return items
+
+        cursor.execute(query, params)
+        for row in cursor:
+            item = {
+                "rowid": row["rowid"],
                 "id": row["id"],
                 "document": row["document"],
-                "embedding": json.loads(row["embedding"]),
+                "embedding": row["embedding"],
                 "metadata": json.loads(row["metadata"]) if row["metadata"] else None,
                 "created_at": row["created_at"]
-            })
-        return items
\ No newline at end of file
+            }
+            # filters without a SQL equivalent are checked here
+            if not exact and not self._matches_filters(item, where, where_document):
+                continue
+            if skip:
+                skip -= 1
+                continue
+            if decode_embeddings and item["embedding"] is not None:
+                item["embedding"] = decode_embedding(item["embedding"])
+            items.append(item)
+            if limit is not None and len(items) >= limit:
+                # the rest of the rows is never read
+                cursor.close()
+                break
+        return items
+
+    def _get_matching_rowids(
+        self,
+        collection_name: str,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None
+    ) -> Set[int]:
+        """
+        Get the rowids of the items matching filters, without reading embeddings.
+        """
+
+        cursor = self.conn.cursor()
+
+        clause, params, exact = self._compile_filters(where, where_document)
+        query = f"SELECT rowid, document, metadata FROM [vec_{collection_name}]"
+        if clause is not None:
+            query += f" WHERE {clause}"
+        cursor.execute(query, params)
+
+        if exact:
+            return {row["rowid"] for row in cursor}
+        return {
+            row["rowid"]
+            for row in cursor
+            if self._matches_filters(
+                {
+                    "document": row["document"],
+                    "metadata": json.loads(row["metadata"]) if row["metadata"] else None
+                },
+                where,
+                where_document
+            )
+        }
+
+    def _get_items_by_rowid(
+        self,
+        collection_name: str,
+        rowids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get items of a collection by rowid.
+
+        Args:
+            collection_name: Name of the collection
+            rowids: Rowids of the items, as used by the HNSW index
+
+        Returns:
+            Dictionary mapping rowids to items
+        """
+
+        cursor = self.conn.cursor()
+
+        items = {}
+        unique_rowids = list(dict.fromkeys(rowids))
+        # stay below the SQLite limit on bound parameters
+        for start in range(0, len(unique_rowids), 900):
+            chunk = unique_rowids[start:start + 900]
+            placeholders = ", ".join(["?" for _ in chunk])
+            cursor.execute(
+                f"SELECT rowid, * FROM [vec_{collection_name}] WHERE rowid IN ({placeholders})",
+                chunk
+            )
+            for row in cursor.fetchall():
+                items[row["rowid"]] = {
+                    "id": row["id"],
+                    "document": row["document"],
+                    "embedding": decode_embedding(row["embedding"]),
+                    "metadata": json.loads(row["metadata"]) if row["metadata"] else None,
+                }
+        return items
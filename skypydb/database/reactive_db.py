@@ -2,11 +2,22 @@
 Reactive Database module for Skypydb.
 """
 
-import sqlite3
 from pathlib import Path
 from typing import (
+    Any,
+    Dict,
     List,
-    Optional
+    Optional,
+    Union
+)
+from skypydb.database.connection import (
+    ConnectionManager,
+    DEFAULT_READERS
+)
+from skypydb.database.catalog import SchemaCatalog
+from skypydb.database.changes import (
+    ChangeFeed,
+    DEFAULT_CHANGE_RETENTION
 )
 from skypydb.security.encryption import EncryptionManager
 from skypydb.database.mixins.reactive import (
@@ -18,7 +29,10 @@ from skypydb.database.mixins.reactive import (
     Encryption,
     RSysAdd,
     RSysSearch,
-    RSysDelete
+    RSysDelete,
+    RSysStats,
+    RSysMigrate,
+    RSysChanges
 )
 
 class ReactiveDatabase(
@@ -30,6 +44,9 @@ class ReactiveDatabase(
     RSysAdd,
     RSysSearch,
     RSysDelete,
+    RSysStats,
+    RSysMigrate,
+    RSysChanges,
     Encryption
 ):
     def __init__(
@@ -37,16 +54,36 @@ class ReactiveDatabase(
         path: str,
         encryption_key: Optional[str] = None,
         salt: Optional[bytes] = None,
-        encrypted_fields: Optional[List[str]] = None
+        encrypted_fields: Optional[List[str]] = None,
+        connection_profile: Union[str, Dict[str, Any], None] = None,
+        readers: int = DEFAULT_READERS,
+        change_log: bool = False,
+        change_log_retention: Optional[int] = DEFAULT_CHANGE_RETENTION,
+        encryption_workers: Optional[int] = None,
+        blind_indexed_fields: Optional[List[str]] = None
     ):
         """
-        Initialize reactive database with a single shared SQLite connection.
+        Initialize reactive database with a shared writer connection and a pool of reader connections.
 
         Args:
             path: Path to SQLite database file
             encryption_key: Optional key for field-level encryption
             salt: Optional salt for encryption key derivation
             encrypted_fields: Optional List of field names to encrypt
+            connection_profile: Optional PRAGMA profile name (balanced, durable,
+                                low_memory, compat) or PRAGMA overrides (default: balanced)
+            readers: Maximum number of reader connections used by searches (default: 4)
+            change_log: Whether to start writing inserts and deletes to the change log
+                        followed by subscriptions; the first subscription enables it
+                        otherwise. The log is kept in the database file, every writer
+                        logs its changes once it exists (default: False)
+            change_log_retention: Number of most recent changes kept in the log,
+                                  None keeps every change (default: 100000)
+            encryption_workers: Optional number of threads encrypting and decrypting
+                                large result sets (default: calling thread only)
+            blind_indexed_fields: Optional list of encrypted fields that search, count and
+                                  delete match by equality through an HMAC blind index;
+                                  equal values get equal indexes, which the database reveals
         """
 
         self.path = path
@@ -54,25 +91,35 @@ class ReactiveDatabase(
         # create directory if needed
         Path(path).parent.mkdir(parents=True, exist_ok=True)
 
-        # create sqlite connection
-        self.conn = sqlite3.connect(path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # create sqlite connections, reads run on a pool of reader connections
+        self._connections = ConnectionManager(path, profile=connection_profile, readers=readers)
+        self.conn = self._connections.proxy
 
         # initialize encryption
-        self._init_encryption(path, encryption_key, salt, encrypted_fields)
+        self._init_encryption(
+            path,
+            encryption_key,
+            salt,
+            encrypted_fields,
+            encryption_workers,
+            blind_indexed_fields
+        )
 
         # initialize all components
-        self._init_components()
+        self._init_components(change_log, change_log_retention)
 
         # ensure system tables exist
         self.check_config_table()
+        self.check_changes_table()
 
     def _init_encryption(
         self,
         path,
         encryption_key,
         salt,
-        encrypted_fields
+        encrypted_fields,
+        encryption_workers=None,
+        blind_indexed_fields=None
     ):
         """
         Initialize encryption components.
@@ -95,24 +142,36 @@ class ReactiveDatabase(
             path=path,
             encryption_key=encryption_key,
             salt=salt,
-            encrypted_fields=encrypted_fields
+            encrypted_fields=encrypted_fields,
+            workers=encryption_workers,
+            encryption_manager=self._encryption_manager,
+            blind_indexed_fields=blind_indexed_fields
         )
 
-    def _init_components(self):
+    def _init_components(
+        self,
+        change_log: bool = False,
+        change_log_retention: Optional[int] = DEFAULT_CHANGE_RETENTION
+    ):
         """
         Initialize all database components with the shared connection.
         """
 
-        # initialize all parent classes with the shared connection
+        # initialize all parent classes with the shared connection and schema catalog
         # we pass conn=self.conn so all classes share the same connection
-        AuditTable.__init__(self, conn=self.conn)
-        Utils.__init__(self, conn=self.conn)
-        SysCreate.__init__(self, conn=self.conn)
-        SysDelete.__init__(self, conn=self.conn)
-        SysGet.__init__(self, conn=self.conn, encryption=self)
-        RSysAdd.__init__(self, conn=self.conn, encryption=self)
-        RSysSearch.__init__(self, conn=self.conn, encryption=self)
-        RSysDelete.__init__(self, conn=self.conn)
+        self.catalog = SchemaCatalog()
+        self.changes = ChangeFeed(enabled=change_log, retention=change_log_retention, catalog=self.catalog)
+        AuditTable.__init__(self, conn=self.conn, catalog=self.catalog)
+        Utils.__init__(self, conn=self.conn, catalog=self.catalog)
+        SysCreate.__init__(self, conn=self.conn, catalog=self.catalog)
+        SysDelete.__init__(self, conn=self.conn, catalog=self.catalog)
+        SysGet.__init__(self, conn=self.conn, encryption=self, catalog=self.catalog)
+        RSysAdd.__init__(self, conn=self.conn, encryption=self, catalog=self.catalog, changes=self.changes)
+        RSysSearch.__init__(self, conn=self.conn, encryption=self, catalog=self.catalog)
+        RSysDelete.__init__(self, conn=self.conn, catalog=self.catalog, changes=self.changes, encryption=self)
+        RSysStats.__init__(self, conn=self.conn, encryption=self, catalog=self.catalog)
+        RSysMigrate.__init__(self, conn=self.conn, encryption=self, catalog=self.catalog)
+        RSysChanges.__init__(self, conn=self.conn, encryption=self, catalog=self.catalog, changes=self.changes)
 
     def close(self) -> None:
         """
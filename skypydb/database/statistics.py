@@ -0,0 +1,139 @@
+"""
+Module containing the DatabaseStatistics class, which is used to collect row counts and storage statistics of a database.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+class DatabaseStatistics:
+    """
+    Row counts, storage sizes and indexes of the tables of a database.
+
+    Everything is read with SQL: COUNT(*) for row counts, the dbstat virtual
+    table for sizes and the index PRAGMAs for indexes, so no row is decoded.
+    Sizes need SQLite compiled with dbstat, they are None otherwise. The last
+    result is kept so callers accepting slightly stale numbers can reuse it,
+    writes don't drop it, it only expires after the max_age of the caller.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cached: Optional[Tuple[float, Tuple[str, ...], Dict[str, Any]]] = None
+        self._dbstat_available: Optional[bool] = None
+
+    def collect(
+        self,
+        conn: sqlite3.Connection,
+        tables: List[str],
+        max_age: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Collect the statistics of tables.
+
+        Args:
+            conn: Connection used to read the statistics
+            tables: Names of the tables
+            max_age: Age in seconds of a previous result that may be returned
+                     instead of reading the statistics again (default: 0)
+
+        Returns:
+            Dictionary with the page size, page count, database and free bytes,
+            and per table its row count, size in bytes and indexes
+        """
+
+        key = tuple(tables)
+        with self._lock:
+            if self._cached is not None and max_age > 0:
+                collected_at, cached_key, cached = self._cached
+                if cached_key == key and time.monotonic() - collected_at <= max_age:
+                    return cached
+
+        sizes = self._read_sizes(conn)
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        statistics: Dict[str, Any] = {
+            "page_size": page_size,
+            "page_count": page_count,
+            "database_bytes": page_size * page_count,
+            "free_bytes": page_size * freelist_count,
+            "tables": {}
+        }
+        for table_name in tables:
+            row_count = conn.execute(f"SELECT COUNT(*) FROM [{table_name}]").fetchone()[0]
+            indexes = self._read_indexes(conn, table_name, sizes)
+            statistics["tables"][table_name] = {
+                "row_count": row_count,
+                "bytes": sizes.get(table_name) if sizes is not None else None,
+                "index_bytes": (
+                    sum(index["bytes"] or 0 for index in indexes)
+                    if sizes is not None else None
+                ),
+                "indexes": indexes
+            }
+
+        with self._lock:
+            self._cached = (time.monotonic(), key, statistics)
+        return statistics
+
+    def _read_sizes(
+        self,
+        conn: sqlite3.Connection
+    ) -> Optional[Dict[str, int]]:
+        """
+        Read the size in bytes of every table and index, None without dbstat.
+        """
+
+        with self._lock:
+            available = self._dbstat_available
+        if available is False:
+            return None
+        try:
+            cursor = conn.execute(
+                "SELECT name, SUM(pgsize) FROM dbstat WHERE aggregate = 1 GROUP BY name"
+            )
+        except sqlite3.OperationalError:
+            try:
+                # dbstat without the aggregate column, before SQLite 3.31
+                cursor = conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+            except sqlite3.OperationalError:
+                with self._lock:
+                    self._dbstat_available = False
+                return None
+        with self._lock:
+            self._dbstat_available = True
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def _read_indexes(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str,
+        sizes: Optional[Dict[str, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Read the indexes of a table with their columns and sizes.
+        """
+
+        indexes = []
+        for row in conn.execute(f"PRAGMA index_list([{table_name}])").fetchall():
+            index_name = row[1]
+            columns = [
+                info[2]
+                for info in conn.execute(f"PRAGMA index_info([{index_name}])").fetchall()
+            ]
+            indexes.append({
+                "name": index_name,
+                "columns": columns,
+                "unique": bool(row[2]),
+                "bytes": sizes.get(index_name) if sizes is not None else None
+            })
+        return indexes
@@ -2,15 +2,24 @@
 Vector database backend using SQLite for storing and querying embeddings.
 """
 
-import sqlite3
 from pathlib import Path
 from typing import (
+    Any,
+    Dict,
     List,
     Optional,
-    Callable
+    Callable,
+    Union
+)
+from skypydb.database.connection import (
+    ConnectionManager,
+    DEFAULT_READERS
 )
 from skypydb.database.mixins.vector import (
     SysEmbeddings,
+    SysCache,
+    SysHnsw,
+    SysPlanner,
     SysAdd,
     SysUpdate,
     SysQuery,
@@ -20,11 +29,18 @@ from skypydb.database.mixins.vector import (
     SysCreate,
     SysGet,
     SysCount,
-    SysDelete
+    SysDelete,
+    SysMigrate,
+    SysIndex
 )
+from skypydb.database.mixins.vector.cache import VectorCache
+from skypydb.database.catalog import SchemaCatalog
 
 class VectorDatabase(
     SysEmbeddings,
+    SysCache,
+    SysHnsw,
+    SysPlanner,
     SysAdd,
     SysUpdate,
     SysQuery,
@@ -34,7 +50,9 @@ class VectorDatabase(
     SysCreate,
     SysGet,
     SysCount,
-    SysDelete
+    SysDelete,
+    SysMigrate,
+    SysIndex
 ):
     """
     Manages SQLite database for vector storage and similarity search.
@@ -43,7 +61,10 @@ class VectorDatabase(
     def __init__(
         self,
         path: str,
-        embedding_function: Optional[Callable[[List[str]], List[List[float]]]] = None
+        embedding_function: Optional[Callable[[List[str]], List[List[float]]]] = None,
+        cache_memory_budget: Optional[int] = None,
+        connection_profile: Union[str, Dict[str, Any], None] = None,
+        readers: int = DEFAULT_READERS
     ):
         """
         Initialize vector database.
@@ -51,17 +72,31 @@ class VectorDatabase(
         Args:
             path: Path to SQLite database file
             embedding_function: Optional function to generate embeddings from text
+            cache_memory_budget: Optional size in bytes of the in-memory collection cache
+                                 used by queries. The cache is disabled if None.
+            connection_profile: Optional PRAGMA profile name (balanced, durable,
+                                low_memory, compat) or PRAGMA overrides (default: balanced)
+            readers: Maximum number of reader connections used by queries (default: 4)
         """
 
         self.path = path
         self.embedding_function = embedding_function
 
+        # resident collections for queries, kept in sync by add, update and delete
+        self._cache = VectorCache(cache_memory_budget) if cache_memory_budget else None
+
+        # loaded HNSW indexes of the collections that declare one
+        self._indexes = {}
+
+        # tables and collection rows, read once instead of on every call
+        self._catalog = SchemaCatalog()
+
         # create directory if it doesn't exist
         Path(path).parent.mkdir(parents=True, exist_ok=True)
 
-        # connect to SQLite database
-        self.conn = sqlite3.connect(path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # connect to SQLite database, reads run on a pool of reader connections
+        self._connections = ConnectionManager(path, profile=connection_profile, readers=readers)
+        self.conn = self._connections.proxy
 
         # create collections metadata table
         self._ensure_collections_table()
@@ -72,4 +107,5 @@ class VectorDatabase(
         """
 
         if self.conn:
+            self.save_indexes()
             self.conn.close()
@@ -2,7 +2,9 @@
 Embeddings module.
 """
 
+from skypydb.embeddings.cache import EmbeddingCache
 from skypydb.embeddings.ollama import OllamaEmbedding
+from skypydb.embeddings.async_ollama import AsyncOllamaEmbedding
 from skypydb.embeddings.mixins import (
     EmbeddingsFn,
     SysGet,
@@ -12,6 +14,8 @@ from skypydb.embeddings.mixins import (
 
 __all__ = [
     "OllamaEmbedding",
+    "AsyncOllamaEmbedding",
+    "EmbeddingCache",
     "EmbeddingsFn",
     "SysGet",
     "Utils",
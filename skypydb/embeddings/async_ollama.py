@@ -0,0 +1,60 @@
+"""
+Asynchronous Ollama embedding functions for vector operations.
+"""
+
+from typing import Optional
+from skypydb.embeddings.cache import EmbeddingCache
+from skypydb.embeddings.mixins import (
+    AsyncEmbeddingsFn,
+    AsyncSysGet
+)
+
+class AsyncOllamaEmbedding(
+    AsyncEmbeddingsFn,
+    AsyncSysGet
+):
+    def __init__(
+        self,
+        model: str = "mxbai-embed-large",
+        base_url: str = "http://localhost:11434",
+        dimension: Optional[int] = None,
+        batch_size: int = 64,
+        max_workers: int = 4,
+        timeout: float = 60,
+        cache: Optional[EmbeddingCache] = None
+    ):
+        """
+        Initialize asynchronous Ollama embedding function.
+
+        Args:
+            model: Name of the Ollama embedding model to use
+            base_url: Base URL for Ollama API (default: http://localhost:11434)
+            dimension: Embedding dimension, if already known
+            batch_size: Number of texts sent to Ollama per request (default: 64)
+            max_workers: Maximum number of concurrent requests (default: 4)
+            timeout: Timeout of a request in seconds (default: 60)
+            cache: Optional cache of computed embeddings
+
+        Raises:
+            ValueError: If batch_size or max_workers is not positive
+        """
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self._dimension: Optional[int] = dimension
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = cache
+
+        # idle keep-alive connections, at most max_workers are open at once,
+        # both belong to the event loop they were created in
+        self._idle = []
+        self._semaphore = None
+        self._loop = None
+        self._legacy_api = False
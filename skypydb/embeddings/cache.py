@@ -0,0 +1,329 @@
+"""
+Module containing the EmbeddingCache class, which is used to avoid embedding the same text twice.
+"""
+
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+# default size of the in-memory tier in bytes
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# default size of the on-disk tier in bytes
+DEFAULT_DISK_BUDGET = 1024 * 1024 * 1024
+
+# rows deleted at once when the on-disk tier is over budget
+EVICTION_BATCH_SIZE = 1024
+
+# format of the on-disk tier, stored as its user_version
+# 1: float32 embeddings, files without a version stored float64 and are emptied
+CACHE_FORMAT_VERSION = 1
+
+class EmbeddingCache:
+    """
+    Two-tier cache of embeddings keyed by model and text hash.
+
+    Lookups go through an in-memory LRU first and then through a SQLite
+    file, hits on disk are promoted to memory. Both tiers are bounded by a
+    size in bytes and evict least recently used embeddings first.
+
+    Embeddings are kept as float32, the precision collections store them
+    with, so cached embeddings take half the space of Python floats.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        disk_budget: int = DEFAULT_DISK_BUDGET
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path to the SQLite file of the on-disk tier, None keeps the cache in memory only
+            memory_budget: Maximum size of the in-memory tier in bytes
+            disk_budget: Maximum size of the on-disk tier in bytes
+        """
+
+        self.path = path
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.conn: Optional[sqlite3.Connection] = None
+        self._disk_nbytes = 0
+        if path is not None:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_FORMAT_VERSION:
+                # embeddings of another format can't be read back, the cache is rebuilt
+                self.conn.execute("DROP TABLE IF EXISTS embedding_cache")
+                self.conn.execute(f"PRAGMA user_version = {CACHE_FORMAT_VERSION}")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                )
+                """
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache (last_used)"
+            )
+            self.conn.commit()
+            row = self.conn.execute("SELECT COALESCE(SUM(length(embedding)), 0) FROM embedding_cache").fetchone()
+            self._disk_nbytes = row[0]
+
+    @staticmethod
+    def text_hash(
+        text: str
+    ) -> str:
+        """
+        Get the hash identifying a text, texts equal after NFC normalization share it.
+        """
+
+        return hashlib.sha256(unicodedata.normalize("NFC", text).encode("utf-8")).hexdigest()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the size of the in-memory tier.
+        """
+
+        return self._nbytes
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the hit and miss counters and the size of both tiers.
+
+        Returns:
+            Dictionary with memory_hits, disk_hits, misses, memory_bytes and disk_bytes
+        """
+
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_bytes": self._nbytes,
+                "disk_bytes": self._disk_nbytes
+            }
+
+    def get_many(
+        self,
+        model: str,
+        texts: Sequence[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        Look up the embeddings of texts.
+
+        Args:
+            model: Name of the embedding model
+            texts: Texts to look up
+
+        Returns:
+            Embeddings in the order of the texts, None for the texts that aren't cached
+        """
+
+        keys = [(model, self.text_hash(text)) for text in texts]
+        found: Dict[Tuple[str, str], bytes] = {}
+
+        with self._lock:
+            for key in keys:
+                data = self._entries.get(key)
+                if data is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = data
+
+            missing = {key for key in keys if key not in found}
+            if missing and self.conn is not None:
+                from_disk = self._read_disk(model, [text_hash for _, text_hash in missing])
+                for text_hash, data in from_disk.items():
+                    found[(model, text_hash)] = data
+                    self._remember((model, text_hash), data)
+
+            results = []
+            for key in keys:
+                data = found.get(key)
+                if data is None:
+                    self.misses += 1
+                    results.append(None)
+                    continue
+                if self.conn is not None and key in missing:
+                    self.disk_hits += 1
+                else:
+                    self.memory_hits += 1
+                embedding = array("f")
+                embedding.frombytes(data)
+                results.append(embedding.tolist())
+            return results
+
+    def put_many(
+        self,
+        model: str,
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]]
+    ) -> None:
+        """
+        Store the embeddings of texts in both tiers.
+
+        Args:
+            model: Name of the embedding model
+            texts: Embedded texts
+            embeddings: Embeddings in the order of the texts
+        """
+
+        entries = {
+            (model, self.text_hash(text)): array("f", embedding).tobytes()
+            for text, embedding in zip(texts, embeddings)
+        }
+
+        with self._lock:
+            for key, data in entries.items():
+                self._remember(key, data)
+
+            if self.conn is None:
+                return
+            now = time.time()
+            try:
+                for (_, text_hash), data in entries.items():
+                    # replaced rows no longer count towards the size of the tier
+                    row = self.conn.execute(
+                        "SELECT length(embedding) FROM embedding_cache WHERE model = ? AND text_hash = ?",
+                        (model, text_hash)
+                    ).fetchone()
+                    if row is not None:
+                        self._disk_nbytes -= row[0]
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO embedding_cache (model, text_hash, embedding, last_used) "
+                        "VALUES (?, ?, ?, ?)",
+                        (model, text_hash, data, now)
+                    )
+                    self._disk_nbytes += len(data)
+                self._evict_disk()
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                self._disk_nbytes = self.conn.execute(
+                    "SELECT COALESCE(SUM(length(embedding)), 0) FROM embedding_cache"
+                ).fetchone()[0]
+                raise
+
+    def clear(self) -> None:
+        """
+        Remove every embedding from both tiers and reset the counters.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.memory_hits = self.disk_hits = self.misses = 0
+            if self.conn is not None:
+                self.conn.execute("DELETE FROM embedding_cache")
+                self.conn.commit()
+                self._disk_nbytes = 0
+
+    def close(self) -> None:
+        """
+        Close the on-disk tier.
+        """
+
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    def _remember(
+        self,
+        key: Tuple[str, str],
+        data: bytes
+    ) -> None:
+        """
+        Store an embedding in memory, evicting least recently used ones if needed.
+        """
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._nbytes -= len(previous)
+        if len(data) > self.memory_budget:
+            return
+        while self._entries and self._nbytes + len(data) > self.memory_budget:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= len(evicted)
+        self._entries[key] = data
+        self._nbytes += len(data)
+
+    def _read_disk(
+        self,
+        model: str,
+        text_hashes: List[str]
+    ) -> Dict[str, bytes]:
+        """
+        Read embeddings from disk and mark them as recently used.
+        """
+
+        found = {}
+        # stay below the SQLite limit on bound parameters
+        for start in range(0, len(text_hashes), 900):
+            chunk = text_hashes[start:start + 900]
+            cursor = self.conn.execute(
+                f"SELECT text_hash, embedding FROM embedding_cache "
+                f"WHERE model = ? AND text_hash IN ({', '.join(['?' for _ in chunk])})",
+                [model, *chunk]
+            )
+            found.update(cursor.fetchall())
+
+        if found:
+            now = time.time()
+            self.conn.executemany(
+                "UPDATE embedding_cache SET last_used = ? WHERE model = ? AND text_hash = ?",
+                [(now, model, text_hash) for text_hash in found]
+            )
+            self.conn.commit()
+        return found
+
+    def _evict_disk(self) -> None:
+        """
+        Delete least recently used embeddings until the on-disk tier fits its budget.
+        """
+
+        while self._disk_nbytes > self.disk_budget:
+            rows = self.conn.execute(
+                "SELECT model, text_hash, length(embedding) FROM embedding_cache "
+                "ORDER BY last_used LIMIT ?",
+                (EVICTION_BATCH_SIZE,)
+            ).fetchall()
+            if not rows:
+                self._disk_nbytes = 0
+                return
+            evicted = []
+            for model, text_hash, size in rows:
+                evicted.append((model, text_hash))
+                self._disk_nbytes -= size
+                if self._disk_nbytes <= self.disk_budget:
+                    break
+            self.conn.executemany(
+                "DELETE FROM embedding_cache WHERE model = ? AND text_hash = ?",
+                evicted
+            )
@@ -8,10 +8,14 @@ from skypydb.embeddings.mixins.sysget import (
     get_embedding_function
 )
 from skypydb.embeddings.mixins.utils import Utils
+from skypydb.embeddings.mixins.async_embeddings_fn import AsyncEmbeddingsFn
+from skypydb.embeddings.mixins.async_sysget import AsyncSysGet
 
 __all__ = [
     "EmbeddingsFn",
     "SysGet",
     "Utils",
+    "AsyncEmbeddingsFn",
+    "AsyncSysGet",
     "get_embedding_function"
 ]
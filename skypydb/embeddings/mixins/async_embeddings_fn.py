@@ -0,0 +1,118 @@
+"""
+Module containing the AsyncEmbeddingsFn class, which is used to generate embeddings for a list of texts from a coroutine.
+"""
+
+import asyncio
+from typing import (
+    List,
+    Optional
+)
+
+class AsyncEmbeddingsFn:
+    async def embed(
+        self,
+        texts: List[str]
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for a list of texts.
+
+        Texts are sent to Ollama in batches of batch_size, and up to
+        max_workers batches are embedded concurrently. With a cache, only
+        the texts that aren't cached yet are sent.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors, in the order of the texts
+        """
+
+        texts = list(texts)
+        if not texts:
+            return []
+
+        if self.cache is None:
+            embeddings = await self._embed_batches(texts)
+        else:
+            loop = asyncio.get_running_loop()
+            # lookups may read the on-disk tier
+            embeddings = await loop.run_in_executor(None, self.cache.get_many, self.model, texts)
+            # repeated texts are only sent once
+            missing = list(dict.fromkeys(
+                text for text, embedding in zip(texts, embeddings) if embedding is None
+            ))
+            if missing:
+                computed = dict(zip(missing, await self._embed_batches(missing)))
+                await loop.run_in_executor(
+                    None,
+                    self.cache.put_many,
+                    self.model,
+                    missing,
+                    [computed[text] for text in missing]
+                )
+                embeddings = [
+                    computed[text] if embedding is None else embedding
+                    for text, embedding in zip(texts, embeddings)
+                ]
+
+        # cache the dimension from the first embedding
+        if self._dimension is None:
+            self._dimension = len(embeddings[0])
+        return embeddings
+
+    async def __call__(
+        self,
+        texts: List[str]
+    ) -> List[List[float]]:
+        """
+        Make the class callable, like the synchronous embedding functions.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors
+        """
+
+        return await self.embed(texts)
+
+    async def _embed_batches(
+        self,
+        texts: List[str]
+    ) -> List[List[float]]:
+        """
+        Embed texts with Ollama, batches are sent concurrently.
+        """
+
+        batches = [
+            texts[start:start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        embeddings = []
+        # gather keeps the batches in order
+        for batch_embeddings in await asyncio.gather(*(self._get_embeddings(batch) for batch in batches)):
+            embeddings.extend(batch_embeddings)
+        return embeddings
+
+    def dimension(
+        self
+    ) -> Optional[int]:
+        """
+        Get the embedding dimension.
+
+        Returns:
+            None if no embedding has been generated yet.
+        """
+
+        return self._dimension
+
+    async def close(
+        self
+    ) -> None:
+        """
+        Close the idle connections to Ollama.
+
+        The cache isn't closed, it may be shared with a synchronous embedding function.
+        """
+
+        self._close_idle()
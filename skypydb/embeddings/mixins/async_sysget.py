@@ -0,0 +1,285 @@
+"""
+Module containing the AsyncSysGet class, which is used to get embedding in ollama without blocking the event loop.
+"""
+
+import ssl
+import json
+import asyncio
+from urllib.parse import urlparse
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+class AsyncSysGet:
+    async def _open_connection(
+        self
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Get an idle keep-alive connection to Ollama, or open a new one.
+
+        Returns:
+            Reader and writer of the connection
+        """
+
+        self._bind_loop()
+        if self._idle:
+            return self._idle.pop()
+
+        url = urlparse(self.base_url)
+        if url.scheme == "https":
+            return await asyncio.wait_for(
+                asyncio.open_connection(url.hostname, url.port or 443, ssl=ssl.create_default_context()),
+                self.timeout
+            )
+        return await asyncio.wait_for(
+            asyncio.open_connection(url.hostname, url.port or 80),
+            self.timeout
+        )
+
+    async def _exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        path: str,
+        body: bytes
+    ) -> Tuple[int, bytes, bool]:
+        """
+        Send a POST request and read the response on a connection.
+
+        Returns:
+            Tuple of the status, the body, and whether the connection can be reused
+        """
+
+        url = urlparse(self.base_url)
+        writer.write(
+            (
+                f"POST {path} HTTP/1.1\r\n"
+                f"Host: {url.netloc}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: keep-alive\r\n"
+                f"\r\n"
+            ).encode("latin-1") + body
+        )
+        await writer.drain()
+
+        while True:
+            status = await self._read_status(reader)
+            headers = await self._read_headers(reader)
+            # interim responses such as 100 Continue precede the final one
+            if not 100 <= status < 200:
+                break
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    # skip the trailers
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        else:
+            # the body ends with the connection
+            data = await reader.read()
+            return status, data, False
+
+        return status, data, headers.get("connection", "").lower() != "close"
+
+    async def _read_status(
+        self,
+        reader: asyncio.StreamReader
+    ) -> int:
+        """
+        Read the status line of a response.
+
+        Raises:
+            ConnectionResetError: If the connection was closed
+            ValueError: If the status line is malformed
+        """
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by Ollama")
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[0].startswith(b"HTTP/") or not parts[1].isdigit():
+            raise ValueError(f"Malformed status line from Ollama: {status_line!r}")
+        return int(parts[1])
+
+    async def _read_headers(
+        self,
+        reader: asyncio.StreamReader
+    ) -> Dict[str, str]:
+        """
+        Read the headers of a response, with lowercase names.
+        """
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return headers
+
+    async def _post(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Send a JSON request to the Ollama API.
+
+        Args:
+            endpoint: API endpoint, such as /api/embed
+            payload: JSON body
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            ConnectionError: If Ollama server is not reachable
+            ValueError: If the response is not valid JSON
+            LookupError: If the endpoint doesn't exist on this Ollama version
+        """
+
+        path = urlparse(self.base_url).path.rstrip("/") + endpoint
+        body = json.dumps(payload).encode("utf-8")
+
+        # a kept-alive connection may have been closed by the server, retry once on a new one
+        for attempt in range(2):
+            writer: Optional[asyncio.StreamWriter] = None
+            try:
+                reader, writer = await self._open_connection()
+                status, data, reusable = await asyncio.wait_for(
+                    self._exchange(reader, writer, path, body),
+                    self.timeout
+                )
+            except (OSError, EOFError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                if writer is not None:
+                    writer.close()
+                if attempt:
+                    raise ConnectionError(
+                        f"Cannot connect to Ollama at {self.base_url}. "
+                        f"Make sure Ollama is running. If you haven't installed it go to https://ollama.com/download and install it. Error: {e}"
+                    )
+                continue
+            if reusable:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            break
+
+        if status == 404 and b"model" not in data.lower():
+            raise LookupError(f"Ollama endpoint {endpoint} not found")
+        if status >= 400:
+            raise ValueError(
+                f"Ollama request failed with status {status}: {data.decode('utf-8', 'replace')}"
+            )
+        try:
+            return json.loads(data.decode("utf-8"))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid response from Ollama: {e}")
+
+    async def _get_embeddings(
+        self,
+        texts: List[str]
+    ) -> List[List[float]]:
+        """
+        Get embeddings for a batch of texts with a single Ollama request.
+
+        Ollama versions without the /api/embed endpoint are sent one
+        /api/embeddings request per text instead.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embedding vectors, in the order of the texts
+
+        Raises:
+            ConnectionError: If Ollama server is not reachable
+            ValueError: If embedding generation fails
+        """
+
+        async with self._get_semaphore():
+            if not self._legacy_api:
+                try:
+                    result = await self._post("/api/embed", {"model": self.model, "input": texts})
+                except LookupError:
+                    self._legacy_api = True
+                else:
+                    embeddings = result.get("embeddings")
+                    if not embeddings or len(embeddings) != len(texts):
+                        raise ValueError(
+                            f"No embedding returned from Ollama. "
+                            f"Make sure model '{self.model}' is an embedding model."
+                        )
+                    return embeddings
+
+            embeddings = []
+            for text in texts:
+                result = await self._post("/api/embeddings", {"model": self.model, "prompt": text})
+                embedding = result.get("embedding")
+                if embedding is None:
+                    raise ValueError(
+                        f"No embedding returned from Ollama. "
+                        f"Make sure model '{self.model}' is an embedding model."
+                    )
+                embeddings.append(embedding)
+            return embeddings
+
+    def _get_semaphore(
+        self
+    ) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding the concurrent requests, created in the running loop.
+        """
+
+        self._bind_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return self._semaphore
+
+    def _bind_loop(
+        self
+    ) -> None:
+        """
+        Drop the connections and the semaphore of a previous event loop.
+
+        Streams and semaphores can only be used in the loop they were
+        created in, so a client reused across asyncio.run calls starts
+        over in each new loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._close_idle()
+        self._semaphore = None
+        self._loop = loop
+
+    def _close_idle(
+        self
+    ) -> None:
+        """
+        Close the idle connections, those of a closed loop are only dropped.
+        """
+
+        while self._idle:
+            _, writer = self._idle.pop()
+            try:
+                writer.close()
+            except RuntimeError:
+                # the loop of the connection is closed, and the socket with it
+                pass
@@ -2,11 +2,11 @@
 Module containing the EmbeddingsFn class, which is used to generate embeddings for a list of texts.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     List,
     Optional
 )
-from skypydb.embeddings.mixins.sysget import SysGet
 
 class EmbeddingsFn:
     def __init__(self) -> None:
@@ -19,25 +19,77 @@ class EmbeddingsFn:
         """
         Generate embeddings for a list of texts.
 
+        Texts are sent to Ollama in batches of batch_size, and up to
+        max_workers batches are embedded concurrently. With a cache, only
+        the texts that aren't cached yet are sent.
+
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in the order of the texts
         """
 
-        self.sysget = SysGet()
+        texts = list(texts)
+        if not texts:
+            return []
 
-        embeddings = []
+        if self.cache is None:
+            embeddings = self._embed_batches(texts)
+        else:
+            embeddings = self.cache.get_many(self.model, texts)
+            # repeated texts are only sent once
+            missing = list(dict.fromkeys(
+                text for text, embedding in zip(texts, embeddings) if embedding is None
+            ))
+            if missing:
+                computed = dict(zip(missing, self._embed_batches(missing)))
+                self.cache.put_many(self.model, missing, [computed[text] for text in missing])
+                embeddings = [
+                    computed[text] if embedding is None else embedding
+                    for text, embedding in zip(texts, embeddings)
+                ]
 
-        for text in texts:
-            embedding = self.sysget._get_embedding(text)
-            embeddings.append(embedding)
-            # cache the dimension from the first embedding
-            if self._dimension is None:
-                self._dimension = len(embedding)
+        # cache the dimension from the first embedding
+        if self._dimension is None:
+            self._dimension = len(embeddings[0])
         return embeddings
 
+    def _embed_batches(
+        self,
+        texts: List[str]
+    ) -> List[List[float]]:
+        """
+        Embed texts with Ollama, batches are sent concurrently.
+        """
+
+        batches = [
+            texts[start:start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        if len(batches) == 1:
+            embeddings = self._get_embeddings(batches[0])
+        else:
+            # map keeps the batches in order
+            embeddings = []
+            for batch_embeddings in self._get_executor().map(self._get_embeddings, batches):
+                embeddings.extend(batch_embeddings)
+        return embeddings
+
+    def _get_executor(
+        self
+    ) -> ThreadPoolExecutor:
+        """
+        Get the thread pool sending concurrent requests, created on first use.
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="skypydb-embed"
+            )
+        return self._executor
+
     def dimension(
         self
     ) -> Optional[int]:
@@ -49,3 +101,22 @@ class EmbeddingsFn:
         """
 
         return self._dimension
+
+    def close(
+        self
+    ) -> None:
+        """
+        Stop the request threads, close the connections to Ollama and the cache.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+        if self.cache is not None:
+            self.cache.close()
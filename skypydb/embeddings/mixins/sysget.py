@@ -3,14 +3,101 @@ Module containing the SysGet class, which is used to get embedding in ollama.
 """
 
 import json
-import urllib.request
-import urllib.error
+import http.client
+from urllib.parse import urlparse
 from typing import (
+    Any,
+    Dict,
     List,
+    Optional,
     Callable
 )
 
 class SysGet:
+    def _get_connection(
+        self,
+        fresh: bool = False
+    ) -> http.client.HTTPConnection:
+        """
+        Get the keep-alive connection to Ollama of the current thread.
+
+        Args:
+            fresh: If True, replace the connection, used after the server closed it
+
+        Returns:
+            HTTP connection reused across requests
+        """
+
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and not fresh:
+            return connection
+        if connection is not None:
+            connection.close()
+
+        url = urlparse(self.base_url)
+        if url.scheme == "https":
+            connection = http.client.HTTPSConnection(url.hostname, url.port, timeout=self.timeout)
+        else:
+            connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=self.timeout)
+        self._local.connection = connection
+
+        # keep track of every connection so close() can release them
+        with self._connections_lock:
+            self._connections.append(connection)
+        return connection
+
+    def _post(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Send a JSON request to the Ollama API.
+
+        Args:
+            endpoint: API endpoint, such as /api/embed
+            payload: JSON body
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            ConnectionError: If Ollama server is not reachable
+            ValueError: If the response is not valid JSON
+            LookupError: If the endpoint doesn't exist on this Ollama version
+        """
+
+        path = urlparse(self.base_url).path.rstrip("/") + endpoint
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+        # a kept-alive connection may have been closed by the server, retry once on a new one
+        for attempt in range(2):
+            connection = self._get_connection(fresh=attempt > 0)
+            try:
+                connection.request("POST", path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                connection.close()
+                if attempt:
+                    raise ConnectionError(
+                        f"Cannot connect to Ollama at {self.base_url}. "
+                        f"Make sure Ollama is running. If you haven't installed it go to https://ollama.com/download and install it. Error: {e}"
+                    )
+
+        if response.status == 404 and b"model" not in data.lower():
+            raise LookupError(f"Ollama endpoint {endpoint} not found")
+        if response.status >= 400:
+            raise ValueError(
+                f"Ollama request failed with status {response.status}: {data.decode('utf-8', 'replace')}"
+            )
+        try:
+            return json.loads(data.decode("utf-8"))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid response from Ollama: {e}")
+
     def _get_embedding(
         self,
         text: str
@@ -29,41 +116,54 @@ class SysGet:
             ValueError: If embedding generation fails
         """
 
-        from skypydb.embeddings.ollama import OllamaEmbedding
-        self.embedder = OllamaEmbedding()
+        return self._get_embeddings([text])[0]
 
-        url = f"{self.embedder.base_url}/api/embeddings"
+    def _get_embeddings(
+        self,
+        texts: List[str]
+    ) -> List[List[float]]:
+        """
+        Get embeddings for a batch of texts with a single Ollama request.
 
-        data = json.dumps({
-            "model": self.embedder.model,
-            "prompt": text
-        }).encode("utf-8")
+        Ollama versions without the /api/embed endpoint are sent one
+        /api/embeddings request per text instead.
 
-        request = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        Args:
+            texts: Texts to embed
 
-        try:
-            with urllib.request.urlopen(request, timeout=60) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                embedding = result.get("embedding")
+        Returns:
+            List of embedding vectors, in the order of the texts
 
-                if embedding is None:
+        Raises:
+            ConnectionError: If Ollama server is not reachable
+            ValueError: If embedding generation fails
+        """
+
+        if not self._legacy_api:
+            try:
+                result = self._post("/api/embed", {"model": self.model, "input": texts})
+            except LookupError:
+                self._legacy_api = True
+            else:
+                embeddings = result.get("embeddings")
+                if not embeddings or len(embeddings) != len(texts):
                     raise ValueError(
                         f"No embedding returned from Ollama. "
-                        f"Make sure model '{self.embedder.model}' is an embedding model."
+                        f"Make sure model '{self.model}' is an embedding model."
                     )
-                return embedding
-        except urllib.error.URLError as e:
-            raise ConnectionError(
-                f"Cannot connect to Ollama at {self.embedder.base_url}. "
-                f"Make sure Ollama is running. If you haven't installed it go to https://ollama.com/download and install it. Error: {e}"
-            )
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid response from Ollama: {e}")
+                return embeddings
+
+        embeddings = []
+        for text in texts:
+            result = self._post("/api/embeddings", {"model": self.model, "prompt": text})
+            embedding = result.get("embedding")
+            if embedding is None:
+                raise ValueError(
+                    f"No embedding returned from Ollama. "
+                    f"Make sure model '{self.model}' is an embedding model."
+                )
+            embeddings.append(embedding)
+        return embeddings
 
     def get_dimension(
         self
@@ -84,7 +184,10 @@ class SysGet:
 
 def get_embedding_function(
     model: str = "mxbai-embed-large",
-    base_url: str = "http://localhost:11434"
+    base_url: str = "http://localhost:11434",
+    batch_size: int = 64,
+    max_workers: int = 4,
+    cache_path: Optional[str] = None
 ) -> Callable[[List[str]], List[List[float]]]:
     """
     Get an embedding function using Ollama.
@@ -95,6 +198,9 @@ def get_embedding_function(
     Args:
         model: Name of the Ollama embedding model
         base_url: Base URL for Ollama API
+        batch_size: Number of texts sent to Ollama per request
+        max_workers: Maximum number of concurrent requests
+        cache_path: Optional path of a SQLite file caching computed embeddings
 
     Returns:
         Callable that takes a list of texts and returns embeddings
@@ -104,5 +210,12 @@ def get_embedding_function(
         embeddings = embed_fn(["Hello world", "How are you?"])
     """
 
+    from skypydb.embeddings.cache import EmbeddingCache
     from skypydb.embeddings.ollama import OllamaEmbedding
-    return OllamaEmbedding(model=model, base_url=base_url)
+    return OllamaEmbedding(
+        model=model,
+        base_url=base_url,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        cache=EmbeddingCache(cache_path) if cache_path is not None else None
+    )
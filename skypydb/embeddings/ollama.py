@@ -2,7 +2,9 @@
 Ollama embedding functions for vector operations.
 """
 
+import threading
 from typing import Optional
+from skypydb.embeddings.cache import EmbeddingCache
 from skypydb.embeddings.mixins import (
     Utils,
     EmbeddingsFn,
@@ -18,7 +20,11 @@ class OllamaEmbedding(
         self,
         model: str = "mxbai-embed-large",
         base_url: str = "http://localhost:11434",
-        dimension: Optional[int] = None
+        dimension: Optional[int] = None,
+        batch_size: int = 64,
+        max_workers: int = 4,
+        timeout: float = 60,
+        cache: Optional[EmbeddingCache] = None
     ):
         """
         Initialize Ollama embedding function.
@@ -26,8 +32,32 @@ class OllamaEmbedding(
         Args:
             model: Name of the Ollama embedding model to use
             base_url: Base URL for Ollama API (default: http://localhost:11434)
+            dimension: Embedding dimension, if already known
+            batch_size: Number of texts sent to Ollama per request (default: 64)
+            max_workers: Maximum number of concurrent requests (default: 4)
+            timeout: Timeout of a request in seconds (default: 60)
+            cache: Optional cache of computed embeddings, closed with this function
+
+        Raises:
+            ValueError: If batch_size or max_workers is not positive
         """
 
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+
         self.model = model
         self.base_url = base_url.rstrip("/")
-        self._dimension: Optional[int] = None
+        self._dimension: Optional[int] = dimension
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = cache
+
+        # one keep-alive connection per thread, created on first use
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._executor = None
+        self._legacy_api = False
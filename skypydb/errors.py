@@ -65,6 +65,33 @@ class DatabaseError(SkypydbError):
         "invalid query, or transaction problem. Check database logs and configuration."
     )
 
+class ChangesPrunedError(SkypydbError):
+    """
+    Raised when changes following a sequence number were pruned from the change log.
+    """
+
+    CODE = "SKY104"
+    default_message = (
+        "Changes after this sequence number were pruned from the change log. "
+        "Read the table again, then follow it from the sequence number of the error."
+    )
+
+    def __init__(
+        self,
+        message=None,
+        sequence=0
+    ):
+        """
+        Initialize the ChangesPrunedError instance.
+
+        Args:
+            message (str, optional): The error message. Defaults to None.
+            sequence (int, optional): Sequence number of the last pruned change. Defaults to 0.
+        """
+
+        self.sequence = sequence
+        super().__init__(message)
+
 class InvalidSearchError(SkypydbError):
     """
     Raised when search parameters are invalid.
@@ -3,6 +3,10 @@ Security module for Skypydb.
 """
 
 from skypydb.security.encryption import EncryptionManager, EncryptionError
+from skypydb.security.keycache import (
+    DerivedKeyCache,
+    derived_key_cache
+)
 from skypydb.security.mixins.encryption import create_encryption_manager
 from skypydb.security.mixins.validation import (
     validate_table_name,
@@ -13,6 +17,8 @@ from skypydb.security.validation import InputValidator
 
 __all__ = [
     "create_encryption_manager",
+    "DerivedKeyCache",
+    "derived_key_cache",
     "EncryptionError",
     "EncryptionManager",
     "InputValidator",
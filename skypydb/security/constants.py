@@ -30,3 +30,14 @@ SQL_INJECTION_PATTERNS = [
     r'INTO\s+OUTFILE',
     r'LOAD_FILE'
 ]
+
+# prefix of encrypted values, followed by the base64 of nonce|ciphertext
+# values without it were written before the envelope was versioned
+ENCRYPTION_ENVELOPE_PREFIX = "skv1:"
+
+# sizes of the AES-GCM nonce and authentication tag in bytes
+NONCE_SIZE = 12
+TAG_SIZE = 16
+
+# values handled per task when encrypting or decrypting on a thread pool
+ENCRYPTION_CHUNK_SIZE = 2048
@@ -10,7 +10,8 @@ from skypydb.security.mixins.encryption import (
     SysGenerator,
     SysPassword,
     SysEncrypt,
-    SysDecrypt
+    SysDecrypt,
+    SysBlindIndex
 )
 
 class EncryptionManager(
@@ -18,7 +19,8 @@ class EncryptionManager(
     SysGenerator,
     SysPassword,
     SysEncrypt,
-    SysDecrypt
+    SysDecrypt,
+    SysBlindIndex
 ):
     """
     Manages encryption and decryption of sensitive data using AES-256-GCM.
@@ -28,6 +30,7 @@ class EncryptionManager(
     - PBKDF2HMAC key derivation from passwords
     - Secure random nonce generation
     - Base64 encoding for storage compatibility
+    - HMAC-SHA256 blind indexes for equality search on encrypted values
     """
 
     def __init__(
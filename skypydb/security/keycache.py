@@ -0,0 +1,142 @@
+"""
+Key cache module, which keeps the keys derived from passwords for the life of the process.
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Dict,
+    Optional,
+    Tuple
+)
+
+# maximum number of derived keys kept by the process
+MAX_CACHED_KEYS = 32
+
+class DerivedKeyCache:
+    """
+    Process-wide cache of the keys derived with PBKDF2HMAC.
+
+    Entries are keyed by an HMAC of the password under a secret drawn when
+    the process starts, the salt and the iteration count, so the password
+    itself is never kept. The cached keys are overwritten with zeros when
+    evicted or cleared; the copies held by the encryption managers using
+    them live as long as those managers.
+
+    Keys are derived outside the cache lock, so databases opened with
+    different passwords or salts derive their keys concurrently, while
+    concurrent opens with the same password derive it once.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = MAX_CACHED_KEYS
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_keys: Maximum number of keys kept, least recently used first evicted (default: 32)
+        """
+
+        self.max_keys = max_keys
+        self._secret = secrets.token_bytes(32)
+        self._keys: "OrderedDict[Tuple[bytes, bytes, int], bytearray]" = OrderedDict()
+        # one lock per key being derived, held for the derivation
+        self._pending: Dict[Tuple[bytes, bytes, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        password: str,
+        salt: bytes,
+        iterations: int,
+        derive: Callable[[], bytes]
+    ) -> bytes:
+        """
+        Get the key derived from a password, deriving it on first use.
+
+        Args:
+            password: Password the key is derived from
+            salt: Salt of the derivation
+            iterations: Number of PBKDF2HMAC iterations
+            derive: Function deriving the key when it isn't cached
+
+        Returns:
+            The derived key
+        """
+
+        fingerprint = hmac.new(self._secret, password.encode('utf-8'), hashlib.sha256).digest()
+        cache_key = (fingerprint, bytes(salt), iterations)
+        with self._lock:
+            key = self._cached(cache_key)
+            if key is not None:
+                return key
+            pending = self._pending.setdefault(cache_key, threading.Lock())
+
+        with pending:
+            # another thread may have derived the key while this one waited
+            with self._lock:
+                key = self._cached(cache_key)
+                if key is not None:
+                    return key
+            derived = None
+            try:
+                derived = bytearray(derive())
+            finally:
+                # the key is stored before the next thread can start deriving it
+                with self._lock:
+                    if self._pending.get(cache_key) is pending:
+                        del self._pending[cache_key]
+                    if derived is not None:
+                        key = bytes(derived)
+                        self._keys[cache_key] = derived
+                        while len(self._keys) > self.max_keys:
+                            _, evicted = self._keys.popitem(last=False)
+                            self._wipe(evicted)
+            return key
+
+    def clear(self) -> None:
+        """
+        Forget every key, overwriting them in memory.
+        """
+
+        with self._lock:
+            while self._keys:
+                _, key = self._keys.popitem()
+                self._wipe(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+    def _cached(
+        self,
+        cache_key: Tuple[bytes, bytes, int]
+    ) -> Optional[bytes]:
+        """
+        Get a cached key and mark it as most recently used, with the lock held.
+        """
+
+        key = self._keys.get(cache_key)
+        if key is None:
+            return None
+        self._keys.move_to_end(cache_key)
+        return bytes(key)
+
+    @staticmethod
+    def _wipe(
+        key: bytearray
+    ) -> None:
+        """
+        Overwrite a key with zeros.
+        """
+
+        key[:] = bytes(len(key))
+
+# cache shared by every encryption manager of the process
+derived_key_cache = DerivedKeyCache()
@@ -7,6 +7,7 @@ from skypydb.security.mixins.encryption.sysgenerator import SysGenerator
 from skypydb.security.mixins.encryption.syspassword import SysPassword
 from skypydb.security.mixins.encryption.sysencrypt import SysEncrypt
 from skypydb.security.mixins.encryption.sysdecrypt import SysDecrypt
+from skypydb.security.mixins.encryption.sysblindindex import SysBlindIndex
 
 __all__ = [
     "SysManager",
@@ -14,5 +15,6 @@ __all__ = [
     "SysGenerator",
     "SysPassword",
     "SysEncrypt",
-    "SysDecrypt"
+    "SysDecrypt",
+    "SysBlindIndex"
 ]
@@ -0,0 +1,49 @@
+"""
+Module containing the SysBlindIndex class, which is used to compute blind indexes of encrypted values.
+"""
+
+import hashlib
+import hmac
+from typing import Optional
+from skypydb.errors import EncryptionError
+
+# context of the key derived from the encryption key for blind indexes
+BLIND_INDEX_KEY_CONTEXT = b"skypydb blind index v1"
+
+class SysBlindIndex:
+    _key: Optional[bytes]
+    _blind_index_key: Optional[bytes] = None
+
+    def blind_index(
+        self,
+        value: str,
+        context: str
+    ) -> str:
+        """
+        Compute the blind index of a value, an HMAC-SHA256 comparable by equality.
+
+        Encrypted values use random nonces and never compare equal, their
+        blind indexes do. The HMAC key is derived from the encryption key
+        and the context (such as the table and column) is part of the
+        message, so equal values in different columns get different indexes.
+
+        Args:
+            value: Plaintext value
+            context: Name of the place the value is stored in
+
+        Returns:
+            Hex-encoded blind index
+
+        Raises:
+            EncryptionError: If encryption is disabled
+        """
+
+        if not self.enabled or self._key is None:
+            raise EncryptionError("Blind indexes need an encryption key.")
+
+        if self._blind_index_key is None:
+            # never use the encryption key itself as HMAC key
+            self._blind_index_key = hmac.new(self._key, BLIND_INDEX_KEY_CONTEXT, hashlib.sha256).digest()
+
+        message = context.encode('utf-8') + b"\x00" + value.encode('utf-8')
+        return hmac.new(self._blind_index_key, message, hashlib.sha256).hexdigest()
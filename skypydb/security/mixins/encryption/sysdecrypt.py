@@ -2,11 +2,26 @@
 Module containing the SysDecrypt class, which is used to decrypt data.
 """
 
-import base64
-from typing import Optional
+import binascii
+from typing import (
+    Any,
+    List,
+    Optional,
+    Sequence
+)
 from skypydb.errors import EncryptionError
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from skypydb.security.mixins.encryption import SysPassword
+from skypydb.security.mixins.encryption.utils import map_in_chunks
+from skypydb.security.constants import (
+    ENCRYPTION_ENVELOPE_PREFIX,
+    NONCE_SIZE,
+    TAG_SIZE
+)
+
+# shortest base64 text of a nonce and an authentication tag, values written
+# before the envelope prefix that are shorter can't be encrypted
+MIN_LEGACY_LENGTH = 4 * -(-(NONCE_SIZE + TAG_SIZE) // 3)
 
 class SysDecrypt:
     def __init__(
@@ -37,7 +52,8 @@ class SysDecrypt:
         Decrypt encrypted data.
 
         Args:
-            encrypted_data: Base64-encoded encrypted data with format: nonce|ciphertext
+            encrypted_data: Encrypted data with format: skv1:base64(nonce|ciphertext),
+                            or base64(nonce|ciphertext) for data written by older versions
 
         Returns:
             Decrypted plaintext
@@ -50,23 +66,108 @@ class SysDecrypt:
             return encrypted_data
 
         try:
-            # decode from base64
-            encrypted_bytes = base64.b64decode(encrypted_data.encode('utf-8'))
-
-            # extract nonce and ciphertext
-            nonce = encrypted_bytes[:12]
-            ciphertext = encrypted_bytes[12:]
-
-            # decrypt the data
-            plaintext = self._aesgcm.decrypt(
-                nonce,
-                ciphertext,
-                None
-            )
-            return plaintext.decode('utf-8')
+            return self._decrypt_value(encrypted_data)
         except Exception as e:
             raise EncryptionError(f"Decryption failed: {str(e)}")
 
+    def decrypt_many(
+        self,
+        values: Sequence[Any],
+        workers: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Decrypt a column of values at once.
+
+        Values are recognized by the envelope prefix, so plaintext values are
+        returned without attempting to decrypt them. Values written before
+        the prefix existed are only attempted if they are long enough to hold
+        a nonce and a tag. Like decrypt_dict, values that fail to decrypt are
+        returned unchanged.
+
+        Args:
+            values: Values to decrypt
+            workers: Optional number of threads for large columns (default: calling thread only)
+
+        Returns:
+            Decrypted values, in order
+        """
+
+        if not self.enabled:
+            return list(values)
+        return map_in_chunks(self._decrypt_column, values, workers)
+
+    def _decrypt_value(
+        self,
+        encrypted_data: str
+    ) -> str:
+        """
+        Decrypt a value with or without the envelope prefix, raising on failure.
+        """
+
+        if encrypted_data.startswith(ENCRYPTION_ENVELOPE_PREFIX):
+            encrypted_data = encrypted_data[len(ENCRYPTION_ENVELOPE_PREFIX):]
+
+        # decode from base64, then extract nonce and ciphertext
+        encrypted_bytes = binascii.a2b_base64(encrypted_data)
+        plaintext = self._aesgcm.decrypt(
+            encrypted_bytes[:NONCE_SIZE],
+            encrypted_bytes[NONCE_SIZE:],
+            None
+        )
+        return plaintext.decode('utf-8')
+
+    def _decrypt_field(
+        self,
+        value: Any
+    ) -> Any:
+        """
+        Decrypt a stored value, returning it unchanged if it isn't encrypted.
+        """
+
+        if not isinstance(value, str) or not value:
+            return value
+        if not value.startswith(ENCRYPTION_ENVELOPE_PREFIX) and (
+            len(value) < MIN_LEGACY_LENGTH or len(value) % 4
+        ):
+            # neither enveloped nor shaped like a value written by older versions
+            return value
+        try:
+            return self._decrypt_value(value)
+        except Exception:
+            # if decryption fails, keep original value but they might be unencrypted data
+            return value
+
+    def _decrypt_column(
+        self,
+        values: Sequence[Any]
+    ) -> List[Any]:
+        """
+        Decrypt values on the calling thread.
+        """
+
+        decrypt = self._aesgcm.decrypt
+        a2b_base64 = binascii.a2b_base64
+        prefix_length = len(ENCRYPTION_ENVELOPE_PREFIX)
+
+        decrypted = []
+        for value in values:
+            if isinstance(value, str) and value.startswith(ENCRYPTION_ENVELOPE_PREFIX):
+                # enveloped values are decrypted inline, the common case of a column
+                try:
+                    encrypted_bytes = a2b_base64(value[prefix_length:])
+                    value = decrypt(
+                        encrypted_bytes[:NONCE_SIZE],
+                        encrypted_bytes[NONCE_SIZE:],
+                        None
+                    ).decode('utf-8')
+                except Exception:
+                    # if decryption fails, keep original value
+                    pass
+                decrypted.append(value)
+            else:
+                decrypted.append(self._decrypt_field(value))
+        return decrypted
+
     def decrypt_dict(
         self,
         data: dict,
@@ -91,14 +192,7 @@ class SysDecrypt:
         for key, value in data.items():
             if fields_to_decrypt is None or key in fields_to_decrypt:
                 # decrypt this field
-                if isinstance(value, str) and value:
-                    try:
-                        decrypted_data[key] = self.decrypt(value)
-                    except EncryptionError:
-                        # if decryption fails, keep original value but they might be unencrypted data
-                        decrypted_data[key] = value
-                else:
-                    decrypted_data[key] = value
+                decrypted_data[key] = self._decrypt_field(value)
             else:
                 # don't decrypt this field
                 decrypted_data[key] = value
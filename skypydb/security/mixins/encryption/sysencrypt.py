@@ -3,11 +3,21 @@ Module containing the SysEncrypt class, which is used to encrypt data.
 """
 
 import os
-import base64
-from typing import Optional
+import binascii
+from typing import (
+    Any,
+    List,
+    Optional,
+    Sequence
+)
 from skypydb.errors import EncryptionError
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from skypydb.security.mixins.encryption import SysPassword
+from skypydb.security.mixins.encryption.utils import map_in_chunks
+from skypydb.security.constants import (
+    ENCRYPTION_ENVELOPE_PREFIX,
+    NONCE_SIZE
+)
 
 class SysEncrypt:
     def __init__(
@@ -42,7 +52,7 @@ class SysEncrypt:
             plaintext: Data to encrypt
 
         Returns:
-            Base64-encoded encrypted data with format: nonce|ciphertext
+            Encrypted data with format: skv1:base64(nonce|ciphertext)
 
         Raises:
             EncryptionError: If encryption fails
@@ -52,24 +62,68 @@ class SysEncrypt:
             return plaintext
 
         try:
-            # generate a random 96-bit nonce
-            nonce = os.urandom(12)
+            return self._encrypt_column([plaintext])[0]
+        except Exception as e:
+            raise EncryptionError(f"Encryption failed: {str(e)}")
+
+    def encrypt_many(
+        self,
+        values: Sequence[Any],
+        workers: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Encrypt a column of values at once.
+
+        The nonces of the whole column are drawn with one call to the random
+        generator. None is kept as is and other non-string values are
+        converted to strings first, like encrypt_dict does.
+
+        Args:
+            values: Values to encrypt
+            workers: Optional number of threads for large columns (default: calling thread only)
+
+        Returns:
+            Encrypted values, in order
 
-            # encrypt the data
-            ciphertext = self._aesgcm.encrypt(
-                nonce,
-                plaintext.encode('utf-8'),
-                None
-            )
+        Raises:
+            EncryptionError: If encryption fails
+        """
 
-            # combine nonce and ciphertext
-            encrypted_data = nonce + ciphertext
+        if not self.enabled:
+            return list(values)
 
-            # encode to base64 for storage
-            return base64.b64encode(encrypted_data).decode('utf-8')
+        try:
+            return map_in_chunks(self._encrypt_column, values, workers)
         except Exception as e:
             raise EncryptionError(f"Encryption failed: {str(e)}")
 
+    def _encrypt_column(
+        self,
+        values: Sequence[Any]
+    ) -> List[Any]:
+        """
+        Encrypt values on the calling thread.
+        """
+
+        encrypt = self._aesgcm.encrypt
+        b2a_base64 = binascii.b2a_base64
+        nonces = memoryview(os.urandom(NONCE_SIZE * len(values)))
+
+        encrypted = []
+        for position, value in enumerate(values):
+            if value is None:
+                encrypted.append(None)
+                continue
+            if not isinstance(value, str):
+                value = str(value)
+            # generate a random 96-bit nonce, taken from the column's buffer
+            nonce = bytes(nonces[position * NONCE_SIZE:(position + 1) * NONCE_SIZE])
+            ciphertext = encrypt(nonce, value.encode('utf-8'), None)
+            # combine nonce and ciphertext, encode to base64 for storage
+            encoded = b2a_base64(nonce + ciphertext, newline=False).decode('ascii')
+            encrypted.append(ENCRYPTION_ENVELOPE_PREFIX + encoded)
+        return encrypted
+
     def encrypt_dict(
         self,
         data: dict,
@@ -21,7 +21,7 @@ class SysManager:
         self.iterations = iterations
         self._salt = salt
         self._key: Optional[bytes] = None
-        self._password = SysPassword()
+        self._password = SysPassword(iterations)
         if self.enabled:
             if encryption_key == "":
                 raise EncryptionError("Encryption key must not be empty.")
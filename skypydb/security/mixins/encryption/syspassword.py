@@ -9,6 +9,7 @@ from skypydb.errors import EncryptionError
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
+from skypydb.security.keycache import derived_key_cache
 
 class SysPassword:
     def __init__(
@@ -25,6 +26,9 @@ class SysPassword:
         """
         Derive a 256-bit encryption key from a password using PBKDF2HMAC.
 
+        Keys are cached for the life of the process, so opening the same
+        encrypted database again doesn't run the derivation again.
+
         Args:
             password: Master password/key
             salt: Required, non-empty salt for PBKDF2HMAC
@@ -36,14 +40,17 @@ class SysPassword:
         if not salt:
             raise EncryptionError("Encryption salt must be provided and non-empty.")
 
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,  # 256 bits
-            salt=salt,
-            iterations=self.iterations,
-            backend=default_backend()
-        )
-        return kdf.derive(password.encode('utf-8'))
+        def derive() -> bytes:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,  # 256 bits
+                salt=salt,
+                iterations=self.iterations,
+                backend=default_backend()
+            )
+            return kdf.derive(password.encode('utf-8'))
+
+        return derived_key_cache.get(password, salt, self.iterations, derive)
 
     def hash_password(
         self,
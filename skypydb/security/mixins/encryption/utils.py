@@ -0,0 +1,49 @@
+"""
+Module containing the helpers used to encrypt and decrypt columns of values.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence
+)
+from skypydb.security.constants import ENCRYPTION_CHUNK_SIZE
+
+def map_in_chunks(
+    function: Callable[[Sequence[Any]], List[Any]],
+    values: Sequence[Any],
+    workers: Optional[int] = None
+) -> List[Any]:
+    """
+    Apply a function transforming a list of values to chunks of values.
+
+    AES-GCM releases the GIL while it runs, so large columns are split into
+    chunks handled by a thread pool when workers is set. Small columns and
+    workers=None run on the calling thread.
+
+    Args:
+        function: Function returning one result per value, in order
+        values: Values to transform
+        workers: Optional number of threads (default: calling thread only)
+
+    Returns:
+        Results in the order of the values
+    """
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if not workers or workers == 1 or len(values) <= ENCRYPTION_CHUNK_SIZE:
+        return function(values)
+
+    chunks = [
+        values[start:start + ENCRYPTION_CHUNK_SIZE]
+        for start in range(0, len(values), ENCRYPTION_CHUNK_SIZE)
+    ]
+    results: List[Any] = []
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for chunk_results in executor.map(function, chunks):
+            results.extend(chunk_results)
+    return results
@@ -2,18 +2,41 @@
 Dashboard API for monitoring Skypydb databases.
 """
 
+import json
 import os
+import threading
 from pathlib import Path
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import (
+    AsyncContextManager,
+    Callable,
+    ContextManager,
     Dict,
+    Iterator,
     List,
     Optional,
+    Tuple,
     Any
 )
 from dataclasses import dataclass
 from skypydb.database.reactive_db import ReactiveDatabase
 from skypydb.database.vector_db import VectorDatabase
+from skypydb.server.live_queries import (
+    LiveQueryHub,
+    file_fingerprint
+)
+
+# age in seconds of table statistics that may be served again
+STATISTICS_MAX_AGE = 5.0
+
+# seconds an unused database stays open in the registry
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+# database paths of the request being served
+_main_path: ContextVar[Optional[str]] = ContextVar("skypydb_main_path", default=None)
+_vector_path: ContextVar[Optional[str]] = ContextVar("skypydb_vector_path", default=None)
 
 @dataclass
 class TableInfo:
@@ -48,22 +71,191 @@ class PaginatedResult:
     offset: int
     has_more: bool
 
+@dataclass
+class DatabaseHandle:
+    """
+    Open database shared by the requests using it.
+    """
+
+    database: Any
+    references: int = 0
+    last_used: float = 0.0
+
+class DatabaseRegistry:
+    """
+    Keeps databases open between requests, one per kind and path.
+
+    A database is opened by the first request using it and shared by the
+    following ones. Once no request uses it, it stays open until it has been
+    idle for idle_timeout seconds, then it is closed by the next acquire or
+    release, or by close_idle, which the server calls periodically.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            idle_timeout: Seconds an unused database stays open (default: 300)
+        """
+
+        self.idle_timeout = idle_timeout
+        self._handles: Dict[Tuple[str, str], DatabaseHandle] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(
+        self,
+        kind: str,
+        path: str,
+        open_database: Callable[[str], Any]
+    ) -> Iterator[Any]:
+        """
+        Use the open database of a path, opening it if needed.
+
+        Args:
+            kind: Kind of database, databases of different kinds never share a handle
+            path: Absolute path of the database file
+            open_database: Function opening the database of a path
+
+        Yields:
+            The shared database instance
+        """
+
+        key = (kind, path)
+        with self._lock:
+            idle = self._evict_idle()
+            handle = self._handles.get(key)
+            if handle is None:
+                handle = DatabaseHandle(database=open_database(path))
+                self._handles[key] = handle
+            handle.references += 1
+        self._close_all(idle)
+
+        try:
+            yield handle.database
+        finally:
+            with self._lock:
+                handle.references -= 1
+                handle.last_used = time.monotonic()
+                idle = self._evict_idle()
+            self._close_all(idle)
+
+    def close_idle(self) -> None:
+        """
+        Close the databases unused for longer than the idle timeout.
+        """
+
+        with self._lock:
+            idle = self._evict_idle()
+        self._close_all(idle)
+
+    def close_all(self) -> None:
+        """
+        Close every database, including the ones in use.
+        """
+
+        with self._lock:
+            handles = list(self._handles.values())
+            self._handles.clear()
+        self._close_all(handles)
+
+    def _evict_idle(self) -> List[DatabaseHandle]:
+        """
+        Remove the databases unused for longer than the idle timeout, under the lock.
+
+        Returns:
+            The removed handles, closed by the caller once the lock is released
+        """
+
+        now = time.monotonic()
+        idle = []
+        for key, handle in list(self._handles.items()):
+            if handle.references == 0 and now - handle.last_used > self.idle_timeout:
+                del self._handles[key]
+                idle.append(handle)
+        return idle
+
+    @staticmethod
+    def _close_all(
+        handles: List[DatabaseHandle]
+    ) -> None:
+        """
+        Close removed databases, outside the lock so other requests aren't held up.
+        """
+
+        for handle in handles:
+            DatabaseRegistry._close(handle)
+
+    @staticmethod
+    def _close(
+        handle: DatabaseHandle
+    ) -> None:
+        """
+        Close a database, ignoring errors.
+        """
+
+        try:
+            handle.database.close()
+        except Exception:
+            # a database failing to close must not fail the request that evicted it
+            pass
+
 class DatabaseConnection:
     """
     Manages database connections.
+
+    Paths come from the request being served, set with paths(), then from the
+    SKYPYDB_PATH and SKYPYDB_VECTOR_PATH environment variables, then from the
+    default locations. main() and vector() share open databases through the
+    registry; get_main() and get_vector() open a new instance for the caller.
     """
 
+    registry = DatabaseRegistry()
+
+    @staticmethod
+    @contextmanager
+    def paths(
+        main_path: Optional[str] = None,
+        vector_path: Optional[str] = None
+    ) -> Iterator[None]:
+        """
+        Set the database paths of the current request.
+
+        The paths are context variables, so concurrent requests never see
+        each other's paths.
+
+        Args:
+            main_path: Optional path of the main database
+            vector_path: Optional path of the vector database
+        """
+
+        tokens = []
+        if main_path:
+            tokens.append((_main_path, _main_path.set(main_path)))
+        if vector_path:
+            tokens.append((_vector_path, _vector_path.set(vector_path)))
+        try:
+            yield
+        finally:
+            for variable, token in reversed(tokens):
+                variable.reset(token)
+
     @staticmethod
     def _resolve_db_path(
         env_key: str,
-        default_relative: str
+        default_relative: str,
+        override: Optional[str] = None
     ) -> str:
         """
-        Resolve a database path from env, normalizing to an absolute path.
+        Resolve a database path from the request or env, normalizing to an absolute path.
         """
 
         base = Path.cwd()
-        raw = os.environ.get(env_key)
+        raw = override or os.environ.get(env_key)
         if raw:
             path = Path(raw)
             return str(path if path.is_absolute() else (base / path).resolve())
@@ -91,30 +283,72 @@ class DatabaseConnection:
             )
 
     @staticmethod
-    def get_main() -> ReactiveDatabase:
+    def main_db_path() -> str:
         """
-        Get main database instance from environment.
+        Resolve the path of the main database and check that it exists.
         """
 
         path = DatabaseConnection._resolve_db_path(
             "SKYPYDB_PATH",
-            "db/_generated/skypydb.db"
+            "db/_generated/skypydb.db",
+            _main_path.get()
         )
         DatabaseConnection._require_existing(path, "Main")
-        return ReactiveDatabase(path)
+        return path
 
     @staticmethod
-    def get_vector() -> VectorDatabase:
+    def vector_db_path() -> str:
         """
-        Get vector database instance from environment.
+        Resolve the path of the vector database and check that it exists.
         """
 
         path = DatabaseConnection._resolve_db_path(
             "SKYPYDB_VECTOR_PATH",
-            "db/_generated/vector.db"
+            "db/_generated/vector.db",
+            _vector_path.get()
         )
         DatabaseConnection._require_existing(path, "Vector")
-        return VectorDatabase(path)
+        return path
+
+    @staticmethod
+    def main() -> ContextManager[ReactiveDatabase]:
+        """
+        Use the shared main database of the current request.
+        """
+
+        return DatabaseConnection.registry.acquire(
+            "main",
+            DatabaseConnection.main_db_path(),
+            ReactiveDatabase
+        )
+
+    @staticmethod
+    def vector() -> ContextManager[VectorDatabase]:
+        """
+        Use the shared vector database of the current request.
+        """
+
+        return DatabaseConnection.registry.acquire(
+            "vector",
+            DatabaseConnection.vector_db_path(),
+            VectorDatabase
+        )
+
+    @staticmethod
+    def get_main() -> ReactiveDatabase:
+        """
+        Get a new main database instance, closed by the caller.
+        """
+
+        return ReactiveDatabase(DatabaseConnection.main_db_path())
+
+    @staticmethod
+    def get_vector() -> VectorDatabase:
+        """
+        Get a new vector database instance, closed by the caller.
+        """
+
+        return VectorDatabase(DatabaseConnection.vector_db_path())
 
 class HealthAPI:
     """
@@ -148,9 +382,8 @@ class HealthAPI:
         """
 
         try:
-            db = DatabaseConnection.get_main()
-            table_count = len(db.get_all_tables_names())
-            db.close()
+            with DatabaseConnection.main() as db:
+                table_count = len(db.get_all_tables_names())
 
             status["databases"]["main"] = {
                 "status": "connected",
@@ -171,10 +404,9 @@ class HealthAPI:
         Check vector database health.
         """
 
-        vdb = None
         try:
-            vdb = DatabaseConnection.get_vector()
-            collection_count = len(vdb.list_collections())
+            with DatabaseConnection.vector() as vdb:
+                collection_count = len(vdb.list_collections())
 
             status["databases"]["vector"] = {
                 "status": "connected",
@@ -186,13 +418,6 @@ class HealthAPI:
                 "error": str(error)
             }
             status["status"] = "degraded"
-        finally:
-            if vdb is not None:
-                try:
-                    vdb.close()
-                except Exception:
-                    # suppress close errors in health check to avoid masking original issues
-                    pass
 
 class TableAPI:
     """
@@ -204,13 +429,9 @@ class TableAPI:
         Get all tables with metadata and row counts.
         """
 
-        db = DatabaseConnection.get_main()
-        
-        try:
+        with DatabaseConnection.main() as db:
             table_names = db.get_all_tables_names()
             return [self._get_info(db, name) for name in table_names]
-        finally:
-            db.close()
 
     def _get_info(
         self,
@@ -224,7 +445,7 @@ class TableAPI:
         try:
             return {
                 "name": table_name,
-                "row_count": len(db.get_all_data(table_name)),
+                "row_count": db.count(table_name),
                 "columns": db.get_table_columns(table_name),
                 "config": db.get_table_config(table_name)
             }
@@ -244,16 +465,12 @@ class TableAPI:
         Get schema information for a table.
         """
 
-        db = DatabaseConnection.get_main()
-
-        try:
+        with DatabaseConnection.main() as db:
             return {
                 "name": table_name,
                 "columns": db.get_table_columns(table_name),
                 "config": db.get_table_config(table_name)
             }
-        finally:
-            db.close()
 
     def get_data(
         self,
@@ -265,13 +482,11 @@ class TableAPI:
         Get paginated data from a table.
         """
 
-        db = DatabaseConnection.get_main()
-
-        try:
-            all_data = db.get_all_data(table_name)
-            return self._paginate(all_data, limit, offset)
-        finally:
-            db.close()
+        with DatabaseConnection.main() as db:
+            # only the requested page is read and decrypted
+            data = db.get_all_data(table_name, limit=limit or None, offset=offset)
+            total = db.count(table_name)
+            return self._page(data, total, limit, offset)
 
     def search(
         self,
@@ -284,39 +499,31 @@ class TableAPI:
         Search table data with filters.
         """
 
-        db = DatabaseConnection.get_main()
-
-        try:
-            results = db.search(table_name, index=query, **filters)
-            if limit and len(results) > limit:
-                results = results[:limit]
+        with DatabaseConnection.main() as db:
+            results = db.search(table_name, index=query, limit=limit or None, **filters)
             return {
                 "data": results,
-                "total": len(results),
+                "total": db.count(table_name, index=query, **filters),
                 "limit": limit
             }
-        finally:
-            db.close()
 
-    def _paginate(
+    def _page(
         self,
         data: List[Dict],
+        total: int,
         limit: int,
         offset: int
     ) -> Dict[str, Any]:
         """
-        Apply pagination to data.
+        Build the response of a page of data.
         """
 
-        total = len(data)
-        start = offset
-        end = offset + limit if limit else total
         return {
-            "data": data[start:end],
+            "data": data,
             "total": total,
             "limit": limit,
             "offset": offset,
-            "has_more": end < total
+            "has_more": offset + len(data) < total
         }
 
 class VectorAPI:
@@ -329,15 +536,12 @@ class VectorAPI:
         Get all vector collections with document counts.
         """
 
-        vdb = DatabaseConnection.get_vector()
-
-        try:
-            collections = vdb.list_collections()
-            return [self._get_info(vdb, coll) for coll in collections]
-        except Exception:
-            return []
-        finally:
-            vdb.close()
+        with DatabaseConnection.vector() as vdb:
+            try:
+                collections = vdb.list_collections()
+                return [self._get_info(vdb, coll) for coll in collections]
+            except Exception:
+                return []
 
     def _get_info(
         self,
@@ -371,30 +575,27 @@ class VectorAPI:
         Get detailed information about a vector collection.
         """
 
-        vdb = DatabaseConnection.get_vector()
-
-        try:
-            collection = vdb.get_collection(collection_name)
-            if collection is None:
+        with DatabaseConnection.vector() as vdb:
+            try:
+                collection = vdb.get_collection(collection_name)
+                if collection is None:
+                    return {
+                        "name": collection_name,
+                        "exists": False,
+                        "error": "Collection not found"
+                    }
+                return {
+                    "name": collection_name,
+                    "exists": True,
+                    "document_count": vdb.count(collection_name),
+                    "metadata": collection.get('metadata', {})
+                }
+            except Exception as error:
                 return {
                     "name": collection_name,
                     "exists": False,
-                    "error": "Collection not found"
+                    "error": str(error)
                 }
-            return {
-                "name": collection_name,
-                "exists": True,
-                "document_count": vdb.count(collection_name),
-                "metadata": collection.get('metadata', {})
-            }
-        except Exception as error:
-            return {
-                "name": collection_name,
-                "exists": False,
-                "error": str(error)
-            }
-        finally:
-            vdb.close()
 
     def get_documents(
         self,
@@ -408,20 +609,37 @@ class VectorAPI:
         Get documents from a vector collection.
         """
 
-        vdb = DatabaseConnection.get_vector()
-
-        try:
-            results = vdb.get(
-                collection_name,
-                ids=document_ids,
-                where=metadata_filter,
-                include=["documents", "metadatas"]
-            )
-            return self._paginate(results, limit, offset)
-        except Exception as error:
-            return self._empty_result(error)
-        finally:
-            vdb.close()
+        with DatabaseConnection.vector() as vdb:
+            try:
+                if document_ids is not None:
+                    results = vdb.get(
+                        collection_name,
+                        ids=document_ids,
+                        where=metadata_filter,
+                        include=["documents", "metadatas"]
+                    )
+                    return self._paginate(results, limit, offset)
+
+                # only the requested page is read from the collection
+                results = vdb.get(
+                    collection_name,
+                    where=metadata_filter,
+                    include=["documents", "metadatas"],
+                    limit=limit or None,
+                    offset=offset
+                )
+                total = vdb.count(collection_name, where=metadata_filter)
+                return {
+                    "ids": results["ids"],
+                    "documents": results["documents"],
+                    "metadatas": results["metadatas"],
+                    "total": total,
+                    "limit": limit,
+                    "offset": offset,
+                    "has_more": offset + len(results["ids"]) < total
+                }
+            except Exception as error:
+                return self._empty_result(error)
 
     def search(
         self,
@@ -434,25 +652,22 @@ class VectorAPI:
         Search for similar documents using vector similarity.
         """
 
-        vdb = DatabaseConnection.get_vector()
-
-        try:
-            results = vdb.query(
-                collection_name,
-                query_texts=[query_text],
-                n_results=n_results,
-                where=metadata_filter,
-                include=["documents", "metadatas", "distances"]
-            )
-            return self._format_results(results, query_text, n_results)
-        except Exception as error:
-            return {
-                "results": [],
-                "query": query_text,
-                "error": str(error)
-            }
-        finally:
-            vdb.close()
+        with DatabaseConnection.vector() as vdb:
+            try:
+                results = vdb.query(
+                    collection_name,
+                    query_texts=[query_text],
+                    n_results=n_results,
+                    where=metadata_filter,
+                    include=["documents", "metadatas", "distances"]
+                )
+                return self._format_results(results, query_text, n_results)
+            except Exception as error:
+                return {
+                    "results": [],
+                    "query": query_text,
+                    "error": str(error)
+                }
 
     def _paginate(
         self,
@@ -552,16 +767,18 @@ class StatisticsAPI:
         """
 
         try:
-            db = DatabaseConnection.get_main()
-            table_names = db.get_all_tables_names()
+            with DatabaseConnection.main() as db:
+                statistics = db.get_statistics(max_age=STATISTICS_MAX_AGE)
+            tables = statistics["tables"]
 
-            stats["tables"]["count"] = len(table_names)
+            stats["tables"]["count"] = len(tables)
             stats["tables"]["total_rows"] = sum(
-                len(db.get_all_data(table))
-                for table in table_names
+                table["row_count"]
+                for table in tables.values()
             )
-
-            db.close()
+            stats["tables"]["database_bytes"] = statistics["database_bytes"]
+            stats["tables"]["free_bytes"] = statistics["free_bytes"]
+            stats["tables"]["details"] = tables
         except Exception as error:
             stats["tables"]["error"] = str(error)
 
@@ -573,25 +790,122 @@ class StatisticsAPI:
         Collect collection statistics.
         """
 
-        vdb = None
         try:
-            vdb = DatabaseConnection.get_vector()
-            collections = vdb.list_collections()
-
-            stats["collections"]["count"] = len(collections)
-            stats["collections"]["total_documents"] = sum(
-                vdb.count(coll['name'])
-                for coll in collections
-            )
+            with DatabaseConnection.vector() as vdb:
+                collections = vdb.list_collections()
+
+                stats["collections"]["count"] = len(collections)
+                stats["collections"]["total_documents"] = sum(
+                    vdb.count(coll['name'])
+                    for coll in collections
+                )
         except Exception as error:
             stats["collections"]["error"] = str(error)
-        finally:
-            if vdb is not None:
-                try:
-                    vdb.close()
-                except Exception:
-                    # suppress close errors to avoid masking original exceptions
-                    pass
+
+class LiveAPI:
+    """
+    API for live queries, which push the changes of a result instead of
+    being fetched again on an interval.
+
+    Subscribers of the same query on the same database share one
+    materialized result. Queries are evaluated again when the files of
+    their database change, whichever process committed to it.
+    """
+
+    def __init__(
+        self,
+        tables: "TableAPI",
+        vector: "VectorAPI"
+    ):
+        """
+        Initialize Live API.
+
+        Args:
+            tables: API evaluating table queries
+            vector: API evaluating collection queries
+        """
+
+        self.tables = tables
+        self.vector = vector
+        self.hub = LiveQueryHub()
+
+    def table_search(
+        self,
+        table_name: str,
+        query: Optional[str] = None,
+        limit: int = 100
+    ) -> AsyncContextManager[Any]:
+        """
+        Follow the result of a table search.
+
+        Returns:
+            Async context manager yielding the queue of the events of the query
+        """
+
+        path = DatabaseConnection.main_db_path()
+
+        def evaluate() -> Dict[str, Any]:
+            with DatabaseConnection.paths(main_path=path):
+                return self.tables.search(table_name, query=query, limit=limit)
+
+        # the change log misses writes made with change_log=False, the database
+        # files change with every commit whoever makes it; commits that don't
+        # change the result are evaluated but send nothing
+        return self.hub.subscribe(
+            ("table_search", path, table_name, query, limit),
+            evaluate,
+            lambda: file_fingerprint(path),
+            lambda result: result["data"]
+        )
+
+    def collection_documents(
+        self,
+        collection_name: str,
+        metadata_filter: Optional[Dict] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> AsyncContextManager[Any]:
+        """
+        Follow a page of the documents of a collection.
+
+        Returns:
+            Async context manager yielding the queue of the events of the query
+        """
+
+        path = DatabaseConnection.vector_db_path()
+
+        def evaluate() -> Dict[str, Any]:
+            with DatabaseConnection.paths(vector_path=path):
+                return self.vector.get_documents(
+                    collection_name,
+                    metadata_filter=metadata_filter,
+                    limit=limit,
+                    offset=offset
+                )
+
+        def rows(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return [
+                {"id": document_id, "document": document, "metadata": metadata}
+                for document_id, document, metadata in zip(
+                    result["ids"],
+                    result["documents"],
+                    result["metadatas"]
+                )
+            ]
+
+        return self.hub.subscribe(
+            (
+                "collection_documents",
+                path,
+                collection_name,
+                json.dumps(metadata_filter, sort_keys=True),
+                limit,
+                offset
+            ),
+            evaluate,
+            lambda: file_fingerprint(path),
+            rows
+        )
 
 class DashboardAPI:
     """
@@ -602,6 +916,7 @@ class DashboardAPI:
         tables: Table operations
         vector: Vector collection operations
         statistics: Database-wide statistics
+        live: Live queries pushing the changes of their results
 
     Example:
         api = DashboardAPI()
@@ -634,6 +949,7 @@ class DashboardAPI:
         self.tables = TableAPI()
         self.vector = VectorAPI()
         self.statistics = StatisticsAPI()
+        self.live = LiveAPI(self.tables, self.vector)
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -2,8 +2,12 @@
 Skypydb API Server
 """
 
-import os
+import asyncio
+import json
+from contextlib import asynccontextmanager
 from typing import (
+    AsyncContextManager,
+    AsyncIterator,
     Dict,
     Any,
     Optional
@@ -11,16 +15,55 @@ from typing import (
 from fastapi import (
     FastAPI,
     HTTPException,
-    Header
+    Header,
+    Request
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import uvicorn
-from skypydb.server.dashboard_server import DashboardAPI
+from skypydb.server.dashboard_server import (
+    DashboardAPI,
+    DatabaseConnection
+)
+from skypydb.server.live_queries import format_event
+
+# seconds without events after which a comment is sent to keep live streams open
+KEEPALIVE_INTERVAL = 15.0
+
+# maximum seconds between two sweeps of the idle databases
+IDLE_SWEEP_INTERVAL = 60.0
+
+async def _sweep_idle_databases() -> None:
+    """
+    Close the idle databases of the registry, even when no request comes in.
+    """
+
+    registry = DatabaseConnection.registry
+    while True:
+        await asyncio.sleep(min(registry.idle_timeout, IDLE_SWEEP_INTERVAL))
+        await asyncio.to_thread(registry.close_idle)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Sweep the databases kept open between requests, and close them when the server stops.
+    """
+
+    sweeper = asyncio.create_task(_sweep_idle_databases())
+    yield
+    sweeper.cancel()
+    try:
+        await sweeper
+    except asyncio.CancelledError:
+        pass
+    await dashboard_api.live.hub.close_all()
+    DatabaseConnection.registry.close_all()
 
 app = FastAPI(
     title="SkypyDB Dashboard API",
     description="REST API for monitoring SkypyDB databases",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -32,21 +75,45 @@ app.add_middleware(
 )
 dashboard_api = DashboardAPI()
 
-def update_db_paths(
-    main_path: Optional[str],
-    vector_path: Optional[str]
-):
+async def _stream_events(
+    request: Request,
+    live_query: AsyncContextManager[Any]
+) -> AsyncIterator[str]:
+    """
+    Stream the events of a live query as Server-Sent Events until the client disconnects.
     """
-    Update database paths from request headers.
+
+    async with live_query as events:
+        while True:
+            try:
+                event = await asyncio.wait_for(events.get(), timeout=KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            yield format_event(event)
+
+def _event_stream(
+    request: Request,
+    live_query: AsyncContextManager[Any]
+) -> StreamingResponse:
+    """
+    Build the response streaming a live query.
     """
 
-    if main_path:
-        os.environ['SKYPYDB_PATH'] = main_path
-    if vector_path:
-        os.environ['SKYPYDB_VECTOR_PATH'] = vector_path
+    return StreamingResponse(
+        _stream_events(request, live_query),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# endpoints calling the databases are plain functions, FastAPI runs them in its
+# threadpool so a slow query or embedding call never blocks the event loop and
+# the live streams it serves
 
 @app.get("/api/health")
-async def health_check(
+def health_check(
     x_skypydb_path: Optional[str] = Header(None),
     x_skypydb_vector_path: Optional[str] = Header(None)
 ):
@@ -55,13 +122,13 @@ async def health_check(
     """
 
     try:
-        update_db_paths(x_skypydb_path, x_skypydb_vector_path)
-        return dashboard_api.health.check()
+        with DatabaseConnection.paths(x_skypydb_path, x_skypydb_vector_path):
+            return dashboard_api.health.check()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/summary")
-async def get_summary(
+def get_summary(
     x_skypydb_path: Optional[str] = Header(None),
     x_skypydb_vector_path: Optional[str] = Header(None)
 ):
@@ -70,13 +137,13 @@ async def get_summary(
     """
 
     try:
-        update_db_paths(x_skypydb_path, x_skypydb_vector_path)
-        return dashboard_api.get_summary()
+        with DatabaseConnection.paths(x_skypydb_path, x_skypydb_vector_path):
+            return dashboard_api.get_summary()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/statistics")
-async def get_statistics(
+def get_statistics(
     x_skypydb_path: Optional[str] = Header(None),
     x_skypydb_vector_path: Optional[str] = Header(None)
 ):
@@ -85,13 +152,13 @@ async def get_statistics(
     """
 
     try:
-        update_db_paths(x_skypydb_path, x_skypydb_vector_path)
-        return dashboard_api.statistics.get_all()
+        with DatabaseConnection.paths(x_skypydb_path, x_skypydb_vector_path):
+            return dashboard_api.statistics.get_all()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/tables")
-async def list_tables(
+def list_tables(
     x_skypydb_path: Optional[str] = Header(None)
 ):
     """
@@ -99,14 +166,13 @@ async def list_tables(
     """
 
     try:
-        if x_skypydb_path:
-            os.environ['SKYPYDB_PATH'] = x_skypydb_path
-        return dashboard_api.tables.list_all()
+        with DatabaseConnection.paths(main_path=x_skypydb_path):
+            return dashboard_api.tables.list_all()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/tables/{table_name}/schema")
-async def get_table_schema(
+def get_table_schema(
     table_name: str,
     x_skypydb_path: Optional[str] = Header(None)
 ):
@@ -115,14 +181,13 @@ async def get_table_schema(
     """
 
     try:
-        if x_skypydb_path:
-            os.environ['SKYPYDB_PATH'] = x_skypydb_path
-        return dashboard_api.tables.get_schema(table_name)
+        with DatabaseConnection.paths(main_path=x_skypydb_path):
+            return dashboard_api.tables.get_schema(table_name)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/tables/{table_name}/data")
-async def get_table_data(
+def get_table_data(
     table_name: str,
     limit: int = 100,
     offset: int = 0,
@@ -133,14 +198,13 @@ async def get_table_data(
     """
 
     try:
-        if x_skypydb_path:
-            os.environ['SKYPYDB_PATH'] = x_skypydb_path
-        return dashboard_api.tables.get_data(table_name, limit=limit, offset=offset)
+        with DatabaseConnection.paths(main_path=x_skypydb_path):
+            return dashboard_api.tables.get_data(table_name, limit=limit, offset=offset)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/tables/{table_name}/search")
-async def search_table(
+def search_table(
     table_name: str,
     query: Optional[str] = None,
     limit: int = 100,
@@ -151,14 +215,38 @@ async def search_table(
     """
 
     try:
-        if x_skypydb_path:
-            os.environ['SKYPYDB_PATH'] = x_skypydb_path
-        return dashboard_api.tables.search(table_name, query=query, limit=limit)
+        with DatabaseConnection.paths(main_path=x_skypydb_path):
+            return dashboard_api.tables.search(table_name, query=query, limit=limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/tables/{table_name}/search/live")
+async def search_table_live(
+    request: Request,
+    table_name: str,
+    query: Optional[str] = None,
+    limit: int = 100,
+    path: Optional[str] = None,
+    x_skypydb_path: Optional[str] = Header(None)
+):
+    """
+    Stream the results of a table search as Server-Sent Events.
+
+    A "snapshot" event carries the whole result, then a "diff" event with
+    the added, removed and updated rows is sent whenever it changes. The
+    database path may be passed as the path query parameter, since
+    EventSource can't set headers.
+    """
+
+    try:
+        with DatabaseConnection.paths(main_path=x_skypydb_path or path):
+            live_query = dashboard_api.live.table_search(table_name, query=query, limit=limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return _event_stream(request, live_query)
 
 @app.get("/api/collections")
-async def list_collections(
+def list_collections(
     x_skypydb_vector_path: Optional[str] = Header(None)
 ):
     """
@@ -166,15 +254,14 @@ async def list_collections(
     """
 
     try:
-        if x_skypydb_vector_path:
-            os.environ['SKYPYDB_VECTOR_PATH'] = x_skypydb_vector_path
-        return dashboard_api.vector.list_all()
+        with DatabaseConnection.paths(vector_path=x_skypydb_vector_path):
+            return dashboard_api.vector.list_all()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/collections/{collection_name}")
-async def get_collection_details(
+def get_collection_details(
     collection_name: str,
     x_skypydb_vector_path: Optional[str] = Header(None)
 ):
@@ -183,15 +270,14 @@ async def get_collection_details(
     """
 
     try:
-        if x_skypydb_vector_path:
-            os.environ['SKYPYDB_VECTOR_PATH'] = x_skypydb_vector_path
-        return dashboard_api.vector.get_details(collection_name)
+        with DatabaseConnection.paths(vector_path=x_skypydb_vector_path):
+            return dashboard_api.vector.get_details(collection_name)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/collections/{collection_name}/documents")
-async def get_collection_documents(
+def get_collection_documents(
     collection_name: str,
     body: Dict[str, Any],
     x_skypydb_vector_path: Optional[str] = Header(None)
@@ -201,25 +287,52 @@ async def get_collection_documents(
     """
 
     try:
-        if x_skypydb_vector_path:
-            os.environ['SKYPYDB_VECTOR_PATH'] = x_skypydb_vector_path
-
-        limit = body.get('limit', 100)
-        offset = body.get('offset', 0)
-        document_ids = body.get('document_ids')
-        metadata_filter = body.get('metadata_filter')
-        return dashboard_api.vector.get_documents(
-            collection_name,
-            document_ids=document_ids,
-            metadata_filter=metadata_filter,
-            limit=limit,
-            offset=offset
-        )
+        with DatabaseConnection.paths(vector_path=x_skypydb_vector_path):
+            limit = body.get('limit', 100)
+            offset = body.get('offset', 0)
+            document_ids = body.get('document_ids')
+            metadata_filter = body.get('metadata_filter')
+            return dashboard_api.vector.get_documents(
+                collection_name,
+                document_ids=document_ids,
+                metadata_filter=metadata_filter,
+                limit=limit,
+                offset=offset
+            )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/collections/{collection_name}/documents/live")
+async def get_collection_documents_live(
+    request: Request,
+    collection_name: str,
+    limit: int = 100,
+    offset: int = 0,
+    metadata_filter: Optional[str] = None,
+    vector_path: Optional[str] = None,
+    x_skypydb_vector_path: Optional[str] = Header(None)
+):
+    """
+    Stream a page of the documents of a vector collection as Server-Sent Events.
+
+    The metadata filter is passed as JSON, and the database path as the
+    vector_path query parameter when headers can't be set.
+    """
+
+    try:
+        with DatabaseConnection.paths(vector_path=x_skypydb_vector_path or vector_path):
+            live_query = dashboard_api.live.collection_documents(
+                collection_name,
+                metadata_filter=json.loads(metadata_filter) if metadata_filter else None,
+                limit=limit,
+                offset=offset
+            )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return _event_stream(request, live_query)
 
 @app.post("/api/collections/{collection_name}/search")
-async def search_vectors(
+def search_vectors(
     collection_name: str,
     body: Dict[str, Any],
     x_skypydb_vector_path: Optional[str] = Header(None)
@@ -229,18 +342,16 @@ async def search_vectors(
     """
 
     try:
-        if x_skypydb_vector_path:
-            os.environ['SKYPYDB_VECTOR_PATH'] = x_skypydb_vector_path
-
-        query_text = body.get('query_text', '')
-        n_results = body.get('n_results', 10)
-        metadata_filter = body.get('metadata_filter')
-        return dashboard_api.vector.search(
-            collection_name,
-            query_text,
-            n_results=n_results,
-            metadata_filter=metadata_filter
-        )
+        with DatabaseConnection.paths(vector_path=x_skypydb_vector_path):
+            query_text = body.get('query_text', '')
+            n_results = body.get('n_results', 10)
+            metadata_filter = body.get('metadata_filter')
+            return dashboard_api.vector.search(
+                collection_name,
+                query_text,
+                n_results=n_results,
+                metadata_filter=metadata_filter
+            )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -254,7 +365,9 @@ if __name__ == "__main__":
     print("  - GET  /api/tables")
     print("  - GET  /api/tables/{name}/schema")
     print("  - GET  /api/tables/{name}/data")
+    print("  - GET  /api/tables/{name}/search/live")
     print("  - GET  /api/collections")
+    print("  - GET  /api/collections/{name}/documents/live")
     print("  - POST /api/collections/{name}/search")
     print("\nPress Ctrl+C to stop")
     
@@ -0,0 +1,371 @@
+"""
+Live queries for the dashboard API, which push the changes of query results to their subscribers.
+"""
+
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from dataclasses import (
+    dataclass,
+    field
+)
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple
+)
+
+# seconds between two checks of the data a live query depends on
+LIVE_POLL_INTERVAL = 1.0
+
+# events kept for a subscriber that doesn't read them, it is sent a new snapshot when exceeded
+MAX_PENDING_EVENTS = 100
+
+@dataclass
+class LiveSubscriber:
+    """
+    Connection following a live query.
+    """
+
+    queue: "asyncio.Queue[Dict[str, Any]]" = field(
+        default_factory=lambda: asyncio.Queue(maxsize=MAX_PENDING_EVENTS)
+    )
+    synced: bool = False
+
+def file_fingerprint(
+    path: str
+) -> Tuple[Any, ...]:
+    """
+    Get a value changing with every commit to an SQLite database file.
+
+    In WAL mode commits append to the -wal file and checkpoints rewrite the
+    database file, so the sizes and modification times of both change with
+    every commit, whichever process made it.
+
+    Args:
+        path: Path of the database file
+
+    Returns:
+        Tuple of the sizes and modification times of the database and WAL files
+    """
+
+    fingerprint: List[Any] = []
+    for file_path in (path, f"{path}-wal"):
+        try:
+            stat = os.stat(file_path)
+            fingerprint.extend((stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            fingerprint.extend((None, None))
+    return tuple(fingerprint)
+
+def diff_rows(
+    previous: List[Dict[str, Any]],
+    current: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Compare two results made of rows with an "id".
+
+    Args:
+        previous: Rows of the previous result
+        current: Rows of the current result
+
+    Returns:
+        Dictionary with the added rows, the IDs of the removed rows, the
+        updated rows and the IDs of the current result in order
+    """
+
+    before = {row["id"]: row for row in previous}
+    after = {row["id"]: row for row in current}
+    return {
+        "added": [row for row_id, row in after.items() if row_id not in before],
+        "removed": [row_id for row_id in before if row_id not in after],
+        "updated": [
+            row
+            for row_id, row in after.items()
+            if row_id in before and before[row_id] != row
+        ],
+        "ids": list(after)
+    }
+
+def format_event(
+    event: Dict[str, Any]
+) -> str:
+    """
+    Format an event as a Server-Sent Events message.
+    """
+
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+
+class LiveQuery:
+    """
+    One materialized result shared by every subscriber of the same query.
+
+    The query is evaluated again only when the fingerprint of the data it
+    depends on changes, such as the last sequence number of a table's change
+    log, and the difference with the previous result is sent to every
+    subscriber. N subscribers cost one evaluation per change.
+    """
+
+    def __init__(
+        self,
+        evaluate: Callable[[], Dict[str, Any]],
+        fingerprint: Callable[[], Hashable],
+        rows: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+        poll_interval: float = LIVE_POLL_INTERVAL
+    ):
+        """
+        Initialize live query.
+
+        Args:
+            evaluate: Function computing the result, run on a worker thread
+            fingerprint: Function returning a value changing with the data the
+                         result depends on, run on a worker thread
+            rows: Function extracting the rows of a result, each with an "id"
+            poll_interval: Seconds between two fingerprint checks (default: 1)
+        """
+
+        self.evaluate = evaluate
+        self.fingerprint = fingerprint
+        self.rows = rows
+        self.poll_interval = poll_interval
+        self.subscribers: List[LiveSubscriber] = []
+        self.result: Optional[Dict[str, Any]] = None
+        self.version = 0
+        self._fingerprint: Any = None
+        self._error: Optional[str] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """
+        Start following the data on the running event loop.
+        """
+
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop following the data.
+        """
+
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def add(
+        self,
+        subscriber: LiveSubscriber
+    ) -> None:
+        """
+        Add a subscriber, sent the current result if there is one.
+        """
+
+        self.subscribers.append(subscriber)
+        if self.result is not None:
+            self._send_snapshot(subscriber)
+
+    def remove(
+        self,
+        subscriber: LiveSubscriber
+    ) -> None:
+        """
+        Remove a subscriber.
+        """
+
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+
+    async def _run(self) -> None:
+        """
+        Evaluate the query whenever its data changed.
+        """
+
+        while True:
+            try:
+                # read before evaluating, a change during the evaluation is seen next time
+                fingerprint = await asyncio.to_thread(self.fingerprint)
+                if self.result is None or fingerprint != self._fingerprint:
+                    result = await asyncio.to_thread(self.evaluate)
+                    self._fingerprint = fingerprint
+                    self._error = None
+                    self._publish(result)
+            except Exception as error:
+                # report each error once, the query is retried on the next poll
+                if str(error) != self._error:
+                    self._error = str(error)
+                    self._broadcast({"event": "error", "data": {"error": self._error}})
+            await asyncio.sleep(self.poll_interval)
+
+    def _publish(
+        self,
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Replace the materialized result and send its changes to the subscribers.
+        """
+
+        previous = self.result
+        self.result = result
+        if previous is None:
+            self.version += 1
+            for subscriber in list(self.subscribers):
+                self._send_snapshot(subscriber)
+            return
+
+        diff = diff_rows(self.rows(previous), self.rows(result))
+        fields = self._fields(result)
+        if (
+            not diff["added"] and not diff["removed"] and not diff["updated"]
+            and diff["ids"] == [row["id"] for row in self.rows(previous)]
+            and fields == self._fields(previous)
+        ):
+            return
+
+        self.version += 1
+        diff.update(fields)
+        diff["version"] = self.version
+        event = {"event": "diff", "data": diff}
+        for subscriber in list(self.subscribers):
+            if subscriber.synced:
+                self._send(subscriber, event)
+            else:
+                self._send_snapshot(subscriber)
+
+    def _fields(
+        self,
+        result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Get the values of a result other than its rows, such as its total.
+        """
+
+        return {
+            key: value
+            for key, value in result.items()
+            if not isinstance(value, list)
+        }
+
+    def _broadcast(
+        self,
+        event: Dict[str, Any]
+    ) -> None:
+        """
+        Send an event to every subscriber.
+        """
+
+        for subscriber in list(self.subscribers):
+            self._send(subscriber, event)
+
+    def _send_snapshot(
+        self,
+        subscriber: LiveSubscriber
+    ) -> None:
+        """
+        Send the whole current result to a subscriber.
+        """
+
+        subscriber.synced = True
+        self._send(subscriber, {
+            "event": "snapshot",
+            "data": {"version": self.version, "result": self.result}
+        })
+
+    def _send(
+        self,
+        subscriber: LiveSubscriber,
+        event: Dict[str, Any]
+    ) -> None:
+        """
+        Queue an event for a subscriber, replacing its backlog by a snapshot if it is full.
+        """
+
+        try:
+            subscriber.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            if event["event"] == "snapshot" or self.result is None:
+                # without a result there is no snapshot to resync with, the event is kept
+                subscriber.queue.put_nowait(event)
+            else:
+                self._send_snapshot(subscriber)
+
+class LiveQueryHub:
+    """
+    Live queries of the server, one per distinct query.
+
+    A live query starts with its first subscriber and stops with its last.
+    Every method runs on the event loop, so no lock is needed.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = LIVE_POLL_INTERVAL
+    ):
+        """
+        Initialize the hub.
+
+        Args:
+            poll_interval: Seconds between two checks of the data of a live query (default: 1)
+        """
+
+        self.poll_interval = poll_interval
+        self._queries: Dict[Hashable, LiveQuery] = {}
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        key: Hashable,
+        evaluate: Callable[[], Dict[str, Any]],
+        fingerprint: Callable[[], Hashable],
+        rows: Callable[[Dict[str, Any]], List[Dict[str, Any]]]
+    ) -> AsyncIterator["asyncio.Queue[Dict[str, Any]]"]:
+        """
+        Follow a live query, starting it if nobody follows it yet.
+
+        Args:
+            key: Identity of the query, including the database path and every parameter
+            evaluate: Function computing the result
+            fingerprint: Function returning a value changing with the data the result depends on
+            rows: Function extracting the rows of a result, each with an "id"
+
+        Yields:
+            Queue of the events of the query: a "snapshot" with the whole
+            result, then a "diff" for every change, or an "error"
+        """
+
+        query = self._queries.get(key)
+        if query is None:
+            query = LiveQuery(evaluate, fingerprint, rows, poll_interval=self.poll_interval)
+            self._queries[key] = query
+            query.start()
+
+        subscriber = LiveSubscriber()
+        query.add(subscriber)
+        try:
+            yield subscriber.queue
+        finally:
+            query.remove(subscriber)
+            if not query.subscribers and self._queries.get(key) is query:
+                del self._queries[key]
+                await query.stop()
+
+    async def close_all(self) -> None:
+        """
+        Stop every live query.
+        """
+
+        queries = list(self._queries.values())
+        self._queries.clear()
+        for query in queries:
+            await query.stop()
@@ -3,5 +3,9 @@ Table module.
 """
 
 from skypydb.table.table import Table
+from skypydb.table.subscription import Subscription
 
-__all__ = ["Table"]
+__all__ = [
+    "Table",
+    "Subscription"
+]
@@ -6,10 +6,12 @@ from skypydb.table.mixins.sysadd import SysAdd
 from skypydb.table.mixins.sysdelete import SysDelete
 from skypydb.table.mixins.sysget import SysGet
 from skypydb.table.mixins.syssearch import SysSearch
+from skypydb.table.mixins.syssubscribe import SysSubscribe
 
 __all__ = [
     "SysAdd",
     "SysDelete",
     "SysGet",
-    "SysSearch"
+    "SysSearch",
+    "SysSubscribe"
 ]
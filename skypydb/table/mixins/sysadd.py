@@ -2,7 +2,11 @@
 Module containing the SysAdd class, which is used to add data to a table in the database.
 """
 
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    List
+)
 from skypydb.database.reactive_db import ReactiveDatabase
 
 class SysAdd:
@@ -53,7 +57,7 @@ class SysAdd:
                 max_length = max(max_length, len(value))
 
         # prepare data for each row
-        inserted_ids = []
+        rows = []
         for row_index in range(max_length):
             row_data = {}
             for key, value in kwargs.items():
@@ -61,12 +65,44 @@ class SysAdd:
                     row_data[key] = value[row_index] if row_index < len(value) else value[-1]
                 else:
                     row_data[key] = value
+            rows.append(row_data)
+        return self.add_many(rows)
 
-            # validate data against table config
-            validated_data = self.db.validate_data_with_config(self.table_name, row_data)
+    def add_many(
+        self,
+        rows: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Add many rows to the table in a single transaction.
+
+        The table configuration is read once, columns are added once for all
+        rows and the rows are inserted together, which is much faster than
+        adding them one by one.
+        IDs and timestamps are automatically generated.
+
+        Args:
+            rows: List of dictionaries of column names and values
+
+        Returns:
+            List of IDs for inserted rows
+
+        Example:
+            table.add_many([
+                {"event": "login", "user_id": "user123"},
+                {"event": "logout", "user_id": "user123"}
+            ])
+        """
+
+        prepared_rows = []
+        for row in rows:
+            row = dict(row)
+            # handle "auto" for id field
+            if row.get('id') == 'auto':
+                del row['id']
+            prepared_rows.append(row)
 
-            # insert row with validated data
-            row_id = self.db.add_data(self.table_name, validated_data, generate_id=True)
+        # validate data against table config
+        validated_rows = self.db.validate_rows_with_config(self.table_name, prepared_rows)
 
-            inserted_ids.append(row_id)
-        return inserted_ids
+        # insert rows with validated data
+        return self.db.add_data_batch(self.table_name, validated_rows, generate_id=True)
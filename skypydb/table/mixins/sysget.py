@@ -5,7 +5,9 @@ Module containing the SysGet class, which is used to get all the data from a tab
 from typing import (
     List,
     Dict,
-    Any
+    Any,
+    Iterator,
+    Optional
 )
 from skypydb.database.reactive_db import ReactiveDatabase
 
@@ -19,10 +21,46 @@ class SysGet:
         self.table_name = table_name
 
     def get_all(
-        self
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        after_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get all data from the table.
+        Get all data from the table, or a page of it.
+
+        Args:
+            limit: Optional maximum number of rows
+            offset: Optional number of rows to skip
+            order_by: Optional column to order by, prefixed with "-" for descending order
+            after_id: Optional ID of the last row of the previous page
+        """
+
+        return self.db.get_all_data(
+            self.table_name,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            after_id=after_id
+        )
+
+    def iter(
+        self,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the data of the table in batches, without loading the whole table.
+
+        Args:
+            batch_size: Maximum number of rows per batch (default: 1000)
+
+        Yields:
+            Lists of row dictionaries, in insertion order
+
+        Example:
+            for rows in table.iter(batch_size=500):
+                export(rows)
         """
 
-        return self.db.get_all_data(self.table_name)
+        return self.db.iter_data(self.table_name, batch_size=batch_size)
@@ -22,6 +22,10 @@ class SysSearch:
     def search(
         self,
         index: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        after_id: Optional[str] = None,
         **filters
     ) -> List[Dict[str, Any]]:
         """
@@ -29,6 +33,10 @@ class SysSearch:
 
         Args:
             index: Value to search for in the index column (primary search key)
+            limit: Optional maximum number of rows to return
+            offset: Optional number of matching rows to skip
+            order_by: Optional column to order by, prefixed with "-" for descending order
+            after_id: Optional ID of the last row of the previous page
             **filters: Additional filters as keyword arguments (column name = value or list of values)
 
         Returns:
@@ -53,7 +61,19 @@ class SysSearch:
                 index="user123",
                 title=["doc1", "doc2"]
             )
+
+            # Read the next page of the newest rows
+            page = table.search(status="active", order_by="-created_at", limit=50)
+            page = table.search(status="active", order_by="-created_at", limit=50, after_id=page[-1]["id"])
         """
 
         # pass filters directly; list values are handled explicitly by the database layer
-        return self.db.search(self.table_name, index=index, **filters)
+        return self.db.search(
+            self.table_name,
+            index=index,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            after_id=after_id,
+            **filters
+        )
@@ -0,0 +1,80 @@
+"""
+Module containing the SysSubscribe class, which is used to subscribe to the changes of a table in the database.
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional
+)
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.table.subscription import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_POLL_INTERVAL,
+    Subscription
+)
+
+class SysSubscribe:
+    def __init__(
+        self,
+        db: "ReactiveDatabase",
+        table_name: str
+    ):
+        self.db = db
+        self.table_name = table_name
+
+    def subscribe(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        since: Optional[int] = None,
+        callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Subscription:
+        """
+        Subscribe to the rows inserted into and deleted from the table.
+
+        Only the change log is read, so a subscription costs one indexed
+        query per poll instead of reading the whole table again. The first
+        subscription starts the change log for every writer of the database.
+        A change with the op "resync" means changes were pruned from the log
+        before they were read and the table has to be read again.
+
+        Args:
+            filters: Optional filters on the changed rows (column name = value or list of values)
+            since: Optional sequence number to start after, such as the "seq"
+                   of the last change processed (default: only new changes)
+            callback: Optional function called with each change on a background thread
+            poll_interval: Seconds between two reads of the change log (default: 0.5)
+            batch_size: Maximum number of changes read at once (default: 1000)
+
+        Returns:
+            Subscription, iterable with for or async for, to close when done
+
+        Example:
+            # Iterate the changes
+            with table.subscribe(filters={"status": "active"}) as subscription:
+                for change in subscription:
+                    print(change["op"], change["id"], change["data"])
+
+            # Iterate the changes asynchronously
+            async for change in table.subscribe(since=last_seq):
+                last_seq = change["seq"]
+
+            # Receive the changes on a background thread
+            subscription = table.subscribe(callback=handle_change)
+            subscription.close()
+        """
+
+        subscription = Subscription(
+            self.db,
+            self.table_name,
+            filters=filters,
+            since=since,
+            poll_interval=poll_interval,
+            batch_size=batch_size
+        )
+        if callback is not None:
+            subscription.start(callback)
+        return subscription
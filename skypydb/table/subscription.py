@@ -0,0 +1,193 @@
+"""
+Module containing the Subscription class, which is used to follow the changes of a table.
+"""
+
+import asyncio
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional
+)
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.errors import ChangesPrunedError
+from skypydb.security.validation import InputValidator
+
+# seconds between two reads of the change log when no change was signalled
+DEFAULT_POLL_INTERVAL = 0.5
+
+# maximum number of changes read from the log at once
+DEFAULT_BATCH_SIZE = 1000
+
+class Subscription:
+    """
+    Incremental inserts and deletes of a table, read from the change log.
+
+    Changes are dictionaries with the sequence number "seq", the kind of
+    change "op" ("insert" or "delete"), the row "id" and the row "data".
+    Iterate the subscription, iterate it with async for, or pass a callback
+    to Table.subscribe to receive changes on a background thread. Commits
+    made through the same database wake the subscription immediately,
+    commits from other instances and processes are seen within
+    poll_interval seconds.
+
+    If changes were pruned from the log before they were read, a change
+    with the op "resync" and no row is delivered instead: the table has to
+    be read again, and the following changes continue after it.
+    """
+
+    def __init__(
+        self,
+        db: ReactiveDatabase,
+        table_name: str,
+        filters: Optional[Dict[str, Any]] = None,
+        since: Optional[int] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        """
+        Initialize subscription.
+
+        Args:
+            db: Database instance
+            table_name: Name of the table
+            filters: Optional filters on the changed rows (column name = value or list of values)
+            since: Optional sequence number to start after (default: the last change)
+            poll_interval: Seconds between two reads of the change log (default: 0.5)
+            batch_size: Maximum number of changes read at once (default: 1000)
+        """
+
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be positive")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        self.db = db
+        self.table_name = table_name
+        # the change log is opt-in, following a table starts logging for every writer
+        if not db.changes.active(db.conn):
+            db.enable_change_log()
+        self.filters = InputValidator.validate_filter_dict(filters) if filters else {}
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        # the last change of any table, so changes pruned later are noticed
+        self.sequence = db.get_last_change_sequence() if since is None else since
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def poll(
+        self,
+        timeout: Optional[float] = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the matching changes after the last one returned.
+
+        Args:
+            timeout: Seconds to wait for a matching change, None waits until
+                     one arrives or the subscription is closed (default: 0)
+
+        Returns:
+            List of changes in sequence order, empty on timeout, or a single
+            "resync" change if changes were pruned before they were read
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.closed:
+            # read the version first, a commit after the read wakes the wait below
+            version = self.db.changes.version
+            try:
+                changes = self.db.get_changes(self.table_name, since=self.sequence, limit=self.batch_size)
+            except ChangesPrunedError as e:
+                self.sequence = e.sequence
+                return [{"seq": e.sequence, "op": "resync", "id": None, "data": None, "created_at": None}]
+            if changes:
+                self.sequence = changes[-1]["seq"]
+                matching = [change for change in changes if self._matches(change)]
+                if matching:
+                    return matching
+                continue
+            wait = self.poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                wait = min(wait, remaining)
+            self.db.wait_for_changes(version, wait)
+        return []
+
+    def start(
+        self,
+        callback: Callable[[Dict[str, Any]], Any]
+    ) -> "Subscription":
+        """
+        Deliver the changes to a callback on a background thread until closed.
+
+        Args:
+            callback: Function called with each change, in sequence order
+        """
+
+        if self._thread is not None:
+            raise RuntimeError("Subscription already started")
+
+        def run() -> None:
+            for change in self:
+                callback(change)
+
+        self._thread = threading.Thread(target=run, name=f"skypydb-subscription-{self.table_name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """
+        Stop the subscription, a background thread stops within poll_interval seconds.
+        """
+
+        self._closed.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.poll_interval * 2)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while not self.closed:
+            yield from self.poll(timeout=None)
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        while not self.closed:
+            # wait on a worker thread so the event loop isn't blocked
+            changes = await asyncio.to_thread(self.poll, self.poll_interval)
+            for change in changes:
+                yield change
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _matches(
+        self,
+        change: Dict[str, Any]
+    ) -> bool:
+        """
+        Check if the row of a change matches the filters.
+        """
+
+        if not self.filters:
+            return True
+        data = change.get("data") or {}
+        for column, value in self.filters.items():
+            if isinstance(value, list):
+                if data.get(column) not in value:
+                    return False
+            elif data.get(column) != value:
+                return False
+        return True
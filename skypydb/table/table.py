@@ -8,14 +8,16 @@ from skypydb.table.mixins import (
     SysAdd,
     SysDelete,
     SysGet,
-    SysSearch
+    SysSearch,
+    SysSubscribe
 )
 
 class Table(
     SysAdd,
     SysDelete,
     SysGet,
-    SysSearch
+    SysSearch,
+    SysSubscribe
 ):
     """
     Represents a table in the database.
@@ -0,0 +1,87 @@
+import sqlite3
+from datetime import (
+    datetime,
+    timedelta
+)
+
+import pytest
+
+from skypydb.database.mixins.reactive import rsysadd
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.errors import ValidationError
+from skypydb.schema import (
+    defineTable,
+    v
+)
+
+ENCRYPTION = dict(encryption_key="password", salt=b"0123456789abcdef", encrypted_fields=["email"])
+SHADOW = "_skypy_bidx_email"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = ReactiveDatabase(str(tmp_path / "r.db"), blind_indexed_fields=["email"], **ENCRYPTION)
+    db.create_table("users", defineTable({"email": v.string(), "name": v.string()}))
+    yield db
+    db.close()
+
+
+def test_batch_is_atomic_when_a_row_fails_validation(db):
+    columns = db.get_table_columns_names("users")
+    rows = [{"email": "a@x", "name": "A"}, {"email": "b@x", "bad column;": "B"}]
+
+    with pytest.raises(ValidationError):
+        db.add_data_batch("users", rows)
+
+    assert db.get_all_data("users") == []
+    assert db.get_table_columns_names("users") == columns
+
+
+def test_batch_is_atomic_when_an_insert_fails(db):
+    db.add_data("users", {"id": "taken", "email": "a@x", "name": "A"}, generate_id=False)
+    rows = [
+        {"id": "new", "email": "b@x", "name": "B"},
+        {"id": "taken", "email": "c@x", "name": "C"}
+    ]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        db.add_data_batch("users", rows, generate_id=False)
+
+    assert [row["id"] for row in db.get_all_data("users")] == ["taken"]
+
+
+def test_each_row_gets_its_own_created_at(db, monkeypatch):
+    start = datetime(2026, 1, 1)
+    calls = []
+
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            calls.append(None)
+            return start + timedelta(seconds=len(calls))
+
+    monkeypatch.setattr(rsysadd, "datetime", Clock)
+    rows = [{"email": f"{i}@x", "name": str(i)} for i in range(3)]
+    rows.append({"email": "kept@x", "name": "kept", "created_at": "2020-01-01T00:00:00"})
+
+    ids = db.add_data_batch("users", rows)
+
+    created = {row["id"]: row["created_at"] for row in db.get_all_data("users")}
+    assert [created[row_id] for row_id in ids] == [
+        "2026-01-01T00:00:01", "2026-01-01T00:00:02", "2026-01-01T00:00:03", "2020-01-01T00:00:00"
+    ]
+
+
+def test_batch_writes_encrypted_and_blind_indexed_columns(db):
+    ids = db.add_data_batch("users", [{"email": f"{i}@x", "name": str(i)} for i in range(5)])
+
+    stored = db.conn.execute(f"SELECT id, email, {SHADOW} FROM users").fetchall()
+    assert len(stored) == 5
+    assert all(row[1].startswith("skv1:") and len(row[2]) == 64 for row in stored)
+    # the same values written one at a time get the same blind index
+    db.add_data("users", {"id": "single", "email": "3@x", "name": "3"}, generate_id=False)
+    indexes = dict(db.conn.execute(f"SELECT id, {SHADOW} FROM users").fetchall())
+    assert indexes["single"] == indexes[ids[3]]
+
+    assert sorted(row["name"] for row in db.search("users", email="3@x")) == ["3", "3"]
+    assert [row["email"] for row in db.get_all_data("users")][:5] == [f"{i}@x" for i in range(5)]
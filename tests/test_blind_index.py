@@ -0,0 +1,90 @@
+import pytest
+
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.schema import (
+    defineTable,
+    v
+)
+
+ENCRYPTION = dict(encryption_key="password", salt=b"0123456789abcdef", encrypted_fields=["email", "name"])
+SHADOW = "_skypy_bidx_email"
+
+
+def create_users(db):
+    db.create_table("users", defineTable({"email": v.string(), "name": v.string(), "age": v.int64()}))
+    db.add_data("users", {"email": "a@x", "name": "A", "age": 1})
+    db.add_data_batch("users", [{"email": "b@x", "name": "B", "age": 2}, {"email": "c@x", "name": "C", "age": 3}])
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = ReactiveDatabase(str(tmp_path / "r.db"), blind_indexed_fields=["email"], change_log=True, **ENCRYPTION)
+    create_users(db)
+    yield db
+    db.close()
+
+
+def test_equality_search_uses_the_blind_index(db):
+    assert [row["name"] for row in db.search("users", email="a@x")] == ["A"]
+    assert sorted(row["email"] for row in db.search("users", email=["b@x", "c@x", "z@x"])) == ["b@x", "c@x"]
+    assert db.count("users", email="c@x") == 1
+    assert db.search("users", email="z@x") == []
+
+    plan = db.conn.execute(f"EXPLAIN QUERY PLAN SELECT * FROM users WHERE {SHADOW} = ?", ("x",)).fetchall()
+    assert "USING INDEX" in plan[0][-1]
+
+
+def test_stored_values_stay_encrypted(db):
+    email, blind_index = db.conn.execute(f"SELECT email, {SHADOW} FROM users LIMIT 1").fetchone()
+
+    assert email.startswith("skv1:")
+    assert "a@x" not in blind_index and len(blind_index) == 64
+
+
+def test_blind_indexes_differ_per_table(db):
+    db.create_table("other", defineTable({"email": v.string()}))
+    db.add_data("other", {"email": "a@x"})
+
+    users = db.conn.execute(f"SELECT {SHADOW} FROM users").fetchone()[0]
+    other = db.conn.execute(f"SELECT {SHADOW} FROM other").fetchone()[0]
+    assert users != other
+    assert len(db.search("other", email="a@x")) == 1
+
+
+def test_delete_uses_the_blind_index(db):
+    assert db.delete("users", email="b@x") == 1
+
+    assert sorted(row["email"] for row in db.get_all_data("users")) == ["a@x", "c@x"]
+    assert db.delete("users", email="b@x") == 0
+
+
+def test_shadow_columns_are_hidden(db):
+    assert SHADOW not in db.get_table_columns_names("users")
+    assert SHADOW not in db.get_all_data("users")[0]
+    assert SHADOW not in db.search("users", email="a@x")[0]
+    db.delete("users", email="a@x")
+    assert all(SHADOW not in change["data"] for change in db.get_changes("users"))
+
+    with pytest.raises(ValueError):
+        db.get_all_data("users", order_by=SHADOW)
+
+
+def test_existing_rows_are_indexed_on_build(tmp_path):
+    path = str(tmp_path / "r.db")
+    db = ReactiveDatabase(path, **ENCRYPTION)
+    create_users(db)
+    # without a blind index the encrypted values never compare equal
+    assert db.search("users", email="a@x") == []
+    db.close()
+
+    db = ReactiveDatabase(path, blind_indexed_fields=["email"], **ENCRYPTION)
+    assert db.build_blind_indexes() == {"users": 3}
+    assert [row["name"] for row in db.search("users", email="a@x")] == ["A"]
+    db.add_data("users", {"email": "d@x", "name": "D", "age": 4})
+    assert [row["name"] for row in db.search("users", email="d@x")] == ["D"]
+    db.close()
+
+
+def test_blind_indexed_fields_must_be_encrypted(tmp_path):
+    with pytest.raises(ValueError):
+        ReactiveDatabase(str(tmp_path / "r.db"), blind_indexed_fields=["age"], **ENCRYPTION)
@@ -0,0 +1,109 @@
+import json
+import sqlite3
+
+import pytest
+
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.errors import TableNotFoundError
+from skypydb.schema import (
+    defineTable,
+    v
+)
+
+
+def column_types(conn, table_name):
+    return {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info([{table_name}])")}
+
+
+def test_new_tables_store_typed_values(tmp_path):
+    db = ReactiveDatabase(str(tmp_path / "r.db"))
+    db.create_table("t", defineTable({"n": v.int64(), "f": v.float64(), "b": v.boolean(), "s": v.string()}))
+    for i in range(10):
+        db.add_data("t", {"n": i, "f": i / 2, "b": i % 2 == 0, "s": f"x{i}"})
+
+    assert column_types(db.conn, "t") == {
+        "id": "TEXT", "created_at": "TEXT", "n": "INTEGER", "f": "REAL", "b": "INTEGER", "s": "TEXT"
+    }
+    assert tuple(db.conn.execute("SELECT typeof(n), typeof(f), typeof(b) FROM t LIMIT 1").fetchone()) == (
+        "integer", "real", "integer"
+    )
+    row = db.get_all_data("t")[1]
+    assert (row["n"], row["f"], row["b"], row["s"]) == (1, 0.5, False, "x1")
+    assert len(db.search("t", n=5)) == 1
+    assert db.count("t", b=False) == 5
+    db.close()
+
+
+@pytest.fixture
+def legacy_path(tmp_path):
+    path = str(tmp_path / "r.db")
+    ReactiveDatabase(path).close()
+
+    # tables written by releases that stored every value as text
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE legacy (id TEXT PRIMARY KEY, created_at TEXT NOT NULL, n TEXT, b TEXT, s TEXT)")
+    conn.execute("CREATE INDEX idx_legacy_n ON legacy(n)")
+    conn.executemany(
+        "INSERT INTO legacy VALUES (?, ?, ?, ?, ?)",
+        [("a", "t", "5", "True", "5"), ("b", "t", "None", "False", "x"), ("c", "t", "7", "None", "None")]
+    )
+    conn.execute(
+        "INSERT INTO _skypy_config (table_name, config, created_at) VALUES (?, ?, ?)",
+        ("legacy", json.dumps({"n": "int", "b": "bool", "s": "str"}), "t")
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_legacy_tables_are_read_before_migration(legacy_path):
+    db = ReactiveDatabase(legacy_path)
+
+    assert [(row["n"], row["b"]) for row in db.get_all_data("legacy")] == [(5, True), (None, False), (7, None)]
+    db.close()
+
+
+def test_migrate_column_types_rewrites_text_values(legacy_path):
+    db = ReactiveDatabase(legacy_path)
+
+    assert db.migrate_column_types("legacy") == {"legacy": 4}
+
+    assert column_types(db.conn, "legacy") == {
+        "id": "TEXT", "created_at": "TEXT", "n": "INTEGER", "b": "INTEGER", "s": "TEXT"
+    }
+    assert [tuple(row) for row in db.conn.execute("SELECT n, typeof(n), b, typeof(b), s FROM legacy")] == [
+        (5, "integer", 1, "integer", "5"),
+        (None, "null", 0, "integer", "x"),
+        (7, "integer", None, "null", "None")
+    ]
+    # indexes survive the rebuild
+    assert db.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_legacy_n'").fetchone() is not None
+    assert [row["id"] for row in db.search("legacy", b=True)] == ["a"]
+    assert [row["id"] for row in db.search("legacy", n=7)] == ["c"]
+
+    # a second run has nothing left to rewrite
+    assert db.migrate_column_types("legacy") == {"legacy": 0}
+    db.close()
+
+
+def test_encrypted_columns_are_not_migrated(legacy_path):
+    db = ReactiveDatabase(
+        legacy_path,
+        encryption_key="k" * 32,
+        salt=b"0123456789abcdef",
+        encrypted_fields=["n"]
+    )
+
+    db.migrate_column_types("legacy")
+
+    assert column_types(db.conn, "legacy")["n"] == "TEXT"
+    assert column_types(db.conn, "legacy")["b"] == "INTEGER"
+    db.close()
+
+
+def test_migrate_column_types_of_a_missing_table(tmp_path):
+    db = ReactiveDatabase(str(tmp_path / "r.db"))
+
+    with pytest.raises(TableNotFoundError):
+        db.migrate_column_types("missing")
+    db.close()
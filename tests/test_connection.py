@@ -0,0 +1,185 @@
+import threading
+import time
+
+import pytest
+
+from skypydb.database.connection import (
+    PROFILES,
+    ConnectionManager,
+    resolve_profile
+)
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.schema import (
+    defineTable,
+    v
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ConnectionManager(str(tmp_path / "c.db"))
+    conn = manager.proxy
+    with conn.writing():
+        conn.execute("CREATE TABLE items (n INTEGER, owner TEXT)")
+        conn.execute("INSERT INTO items VALUES (0, 'setup')")
+        conn.commit()
+    yield manager
+    manager.close()
+
+
+def count(conn):
+    return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+def test_readers_see_the_last_commit_during_a_write(manager):
+    conn = manager.proxy
+    written = threading.Event()
+    release = threading.Event()
+
+    def write():
+        with conn.writing():
+            conn.execute("INSERT INTO items VALUES (1, 'writer')")
+            written.set()
+            release.wait(5)
+            conn.commit()
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    assert written.wait(5)
+
+    start = time.monotonic()
+    with conn.reading():
+        assert conn._manager.connection() is not manager.writer
+        assert count(conn) == 1
+    # the reader didn't wait for the open transaction
+    assert time.monotonic() - start < 1
+
+    release.set()
+    thread.join(5)
+    with conn.reading():
+        assert count(conn) == 2
+
+
+def test_writers_read_their_own_transaction(manager):
+    conn = manager.proxy
+
+    with conn.writing():
+        conn.execute("INSERT INTO items VALUES (1, 'writer')")
+        with conn.reading():
+            assert count(conn) == 2
+        conn.rollback()
+
+
+def test_writer_threads_never_share_a_transaction(manager):
+    conn = manager.proxy
+    errors = []
+
+    def write(owner, keep):
+        try:
+            for _ in range(20):
+                with conn.writing():
+                    conn.execute("INSERT INTO items VALUES (1, ?)", (owner,))
+                    # give the other thread a chance to interleave its statements
+                    time.sleep(0.001)
+                    conn.execute("INSERT INTO items VALUES (2, ?)", (owner,))
+                    if keep:
+                        conn.commit()
+                    else:
+                        conn.rollback()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(f"t{i}", i % 2 == 0)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    owners = dict(conn.execute("SELECT owner, COUNT(*) FROM items GROUP BY owner").fetchall())
+    # every committed transaction is whole, no rolled back statement survived
+    assert owners == {"setup": 1, "t0": 40, "t2": 40}
+
+
+def test_a_section_that_raises_is_rolled_back(manager):
+    conn = manager.proxy
+
+    with pytest.raises(RuntimeError):
+        with conn.writing():
+            conn.execute("INSERT INTO items VALUES (1, 'failed')")
+            raise RuntimeError("write failed")
+
+    assert not manager.writer.in_transaction
+    assert count(conn) == 1
+
+
+def test_an_uncommitted_section_is_rolled_back(manager):
+    conn = manager.proxy
+
+    with conn.writing():
+        with conn.writing():
+            conn.execute("INSERT INTO items VALUES (1, 'nested')")
+        # the inner section doesn't end the transaction
+        assert manager.writer.in_transaction
+
+    assert not manager.writer.in_transaction
+    assert count(conn) == 1
+
+
+@pytest.mark.parametrize("profile", [
+    "fast",
+    {"page_size": 4096},
+    {"journal_mode": "WAL; DROP TABLE items"},
+    {"synchronous": "FULL--"},
+    {"cache_size": 1.5},
+])
+def test_invalid_profiles_are_rejected(profile):
+    with pytest.raises(ValueError):
+        resolve_profile(profile)
+
+
+def test_profiles_are_applied(tmp_path):
+    assert resolve_profile(None) == PROFILES["balanced"]
+    assert resolve_profile({"cache_size": -1024})["cache_size"] == -1024
+
+    manager = ConnectionManager(str(tmp_path / "c.db"), profile="compat")
+    assert manager.writer.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert manager.writer.execute("PRAGMA synchronous").fetchone()[0] == 2
+    manager.close()
+
+    with pytest.raises(ValueError):
+        ConnectionManager(str(tmp_path / "c.db"), readers=-1)
+
+
+@pytest.mark.parametrize("path, readers", [(":memory:", 4), (None, 0)])
+def test_reads_fall_back_to_the_writer(tmp_path, path, readers):
+    manager = ConnectionManager(path or str(tmp_path / "c.db"), readers=readers)
+
+    assert manager.max_readers == 0
+    with manager.reading():
+        assert manager.connection() is manager.writer
+    manager.close()
+
+
+def test_databases_read_during_a_write(tmp_path):
+    db = ReactiveDatabase(str(tmp_path / "r.db"))
+    db.create_table("t", defineTable({"name": v.string()}))
+    db.add_data("t", {"name": "a"})
+    written = threading.Event()
+    release = threading.Event()
+
+    def write():
+        with db.conn.writing():
+            db.conn.execute("INSERT INTO t (id, created_at, name) VALUES ('b', 'x', 'b')")
+            written.set()
+            release.wait(5)
+            db.conn.commit()
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    assert written.wait(5)
+    assert [row["name"] for row in db.search("t")] == ["a"]
+    release.set()
+    thread.join(5)
+    assert sorted(row["name"] for row in db.search("t")) == ["a", "b"]
+    db.close()
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from skypydb.server.dashboard_server import (
+    DatabaseConnection,
+    DatabaseRegistry
+)
+from skypydb.database.reactive_db import ReactiveDatabase
+
+
+class FakeDatabase:
+    opened = 0
+
+    def __init__(self, path):
+        FakeDatabase.opened += 1
+        self.path = path
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_requests_share_one_handle():
+    registry = DatabaseRegistry()
+    FakeDatabase.opened = 0
+
+    with registry.acquire("main", "/a", FakeDatabase) as first:
+        with registry.acquire("main", "/a", FakeDatabase) as second:
+            assert second is first
+            assert registry._handles[("main", "/a")].references == 2
+        with registry.acquire("vector", "/a", FakeDatabase) as other:
+            # kinds never share a handle
+            assert other is not first
+
+    assert FakeDatabase.opened == 2
+    assert registry._handles[("main", "/a")].references == 0
+    assert not first.closed
+
+
+def test_idle_databases_are_closed_on_acquire_and_release():
+    registry = DatabaseRegistry(idle_timeout=0.05)
+
+    with registry.acquire("main", "/a", FakeDatabase) as first:
+        pass
+    time.sleep(0.1)
+    with registry.acquire("main", "/b", FakeDatabase) as used:
+        assert first.closed
+        with registry.acquire("main", "/c", FakeDatabase) as second:
+            pass
+        time.sleep(0.1)
+        # the database in use is kept however long the request takes
+        assert not used.closed and not second.closed
+
+    # the release of /b closed /c, idle for longer than the timeout
+    assert second.closed and not used.closed
+    assert set(registry._handles) == {("main", "/b")}
+
+
+def test_close_idle_sweeps_without_requests():
+    registry = DatabaseRegistry(idle_timeout=0.05)
+    with registry.acquire("main", "/a", FakeDatabase) as database:
+        pass
+
+    registry.close_idle()
+    assert not database.closed
+    time.sleep(0.1)
+    registry.close_idle()
+
+    assert database.closed
+    assert registry._handles == {}
+
+
+def test_close_all_closes_databases_in_use():
+    registry = DatabaseRegistry()
+
+    with registry.acquire("main", "/a", FakeDatabase) as database:
+        registry.close_all()
+        assert database.closed
+
+    assert registry._handles == {}
+
+
+def test_failing_close_is_ignored():
+    class BrokenDatabase(FakeDatabase):
+        def close(self):
+            raise RuntimeError("close failed")
+
+    registry = DatabaseRegistry(idle_timeout=0)
+    with registry.acquire("main", "/a", BrokenDatabase):
+        pass
+    with registry.acquire("main", "/b", FakeDatabase):
+        pass
+
+    assert ("main", "/a") not in registry._handles
+
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = []
+    for name in ("a", "b"):
+        path = str(tmp_path / f"{name}.db")
+        ReactiveDatabase(path).close()
+        paths.append(path)
+    return paths
+
+
+def test_request_paths_stay_in_their_thread(paths):
+    barrier = threading.Barrier(len(paths), timeout=5)
+    seen = {}
+
+    def request(path):
+        with DatabaseConnection.paths(main_path=path):
+            # both requests have set their path before either reads it
+            barrier.wait()
+            seen[path] = DatabaseConnection.main_db_path()
+
+    threads = [threading.Thread(target=request, args=(path,)) for path in paths]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {path: path for path in paths}
+
+
+def test_request_paths_stay_in_their_task(paths, monkeypatch, tmp_path):
+    monkeypatch.setenv("SKYPYDB_PATH", paths[0])
+
+    async def request(path):
+        with DatabaseConnection.paths(main_path=path):
+            await asyncio.sleep(0.01)
+            with DatabaseConnection.main() as database:
+                return database.path
+
+    async def run():
+        return await asyncio.gather(*(request(path) for path in reversed(paths)))
+
+    assert asyncio.run(run()) == list(reversed(paths))
+    # the path of a request doesn't leak once it's done
+    assert DatabaseConnection.main_db_path() == paths[0]
+    DatabaseConnection.registry.close_all()
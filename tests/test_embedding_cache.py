@@ -0,0 +1,111 @@
+import os
+import sqlite3
+from array import array
+
+import pytest
+
+from skypydb.api.vector_client import VectorClient
+from skypydb.embeddings.cache import EmbeddingCache
+
+# one embedding of 4 float32 values
+SIZE = 16
+
+
+def embedding(i):
+    return [float(i), 0.5, 0.25, 0.125]
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = EmbeddingCache(memory_budget=2 * SIZE)
+    cache.put_many("m", ["a", "b"], [embedding(1), embedding(2)])
+    # reading "a" makes "b" the least recently used
+    cache.get_many("m", ["a"])
+    cache.put_many("m", ["c"], [embedding(3)])
+
+    assert cache.get_many("m", ["a", "b", "c"]) == [embedding(1), None, embedding(3)]
+    assert cache.nbytes == 2 * SIZE
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"), memory_budget=0, disk_budget=2 * SIZE)
+    cache.put_many("m", ["a"], [embedding(1)])
+    cache.put_many("m", ["b"], [embedding(2)])
+    cache.put_many("m", ["c"], [embedding(3)])
+
+    assert cache.get_many("m", ["a", "b", "c"]) == [None, embedding(2), embedding(3)]
+    assert cache.stats()["disk_bytes"] == 2 * SIZE
+    cache.close()
+
+
+def test_counters_follow_the_tiers(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = EmbeddingCache(path)
+    cache.put_many("m", ["a"], [embedding(1)])
+    cache.close()
+
+    cache = EmbeddingCache(path)
+    cache.get_many("m", ["a", "missing"])
+    cache.get_many("m", ["a"])
+
+    assert cache.stats() == {
+        "memory_hits": 1,
+        "disk_hits": 1,
+        "misses": 1,
+        "memory_bytes": SIZE,
+        "disk_bytes": SIZE
+    }
+    cache.clear()
+    assert cache.stats()["misses"] == 0
+    assert cache.get_many("m", ["a"]) == [None]
+    cache.close()
+
+
+def test_texts_are_matched_after_nfc_normalization():
+    cache = EmbeddingCache()
+    cache.put_many("m", ["caf\u00e9"], [embedding(1)])
+
+    # "e" followed by a combining accent is the same text
+    assert cache.get_many("m", ["cafe\u0301"]) == [embedding(1)]
+    assert cache.get_many("other", ["caf\u00e9"]) == [None]
+
+
+def test_embeddings_are_stored_as_float32(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = EmbeddingCache(path)
+    cache.put_many("m", ["a"], [[0.1, 0.2]])
+
+    data = cache.conn.execute("SELECT embedding FROM embedding_cache").fetchone()[0]
+    assert len(data) == 8
+    assert cache.get_many("m", ["a"])[0] == pytest.approx([0.1, 0.2], abs=1e-7)
+    cache.close()
+
+
+def test_float64_caches_are_emptied(tmp_path):
+    path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE embedding_cache (model TEXT NOT NULL, text_hash TEXT NOT NULL, "
+        "embedding BLOB NOT NULL, last_used REAL NOT NULL, PRIMARY KEY (model, text_hash))"
+    )
+    conn.execute(
+        "INSERT INTO embedding_cache VALUES ('m', ?, ?, 0)",
+        (EmbeddingCache.text_hash("a"), array("d", [1.0, 2.0]).tobytes())
+    )
+    conn.commit()
+    conn.close()
+
+    cache = EmbeddingCache(path)
+
+    assert cache.get_many("m", ["a"]) == [None]
+    assert cache.stats()["disk_bytes"] == 0
+    cache.close()
+
+
+def test_vector_client_has_no_embedding_cache_by_default(tmp_path):
+    path = str(tmp_path / "vector.db")
+
+    VectorClient(path=path).close()
+    assert not os.path.exists(str(tmp_path / "vector_embeddings.db"))
+
+    VectorClient(path=path, embedding_cache=True).close()
+    assert os.path.exists(str(tmp_path / "vector_embeddings.db"))
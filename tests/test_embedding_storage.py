@@ -0,0 +1,113 @@
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from skypydb.database.vector_db import VectorDatabase
+from skypydb.database.mixins.vector.utils import (
+    EMBEDDING_FORMAT_FLOAT32,
+    EMBEDDING_FORMAT_JSON,
+    decode_embedding,
+    embeddings_to_matrix,
+    encode_embedding
+)
+
+
+@pytest.mark.parametrize("embedding", [[0.0], [1.5, -2.25, 3.0], [float(i) / 7 for i in range(384)]])
+def test_float32_round_trip(embedding):
+    blob = encode_embedding(embedding, EMBEDDING_FORMAT_FLOAT32)
+
+    assert isinstance(blob, bytes)
+    assert len(blob) == 4 * len(embedding)
+    assert np.allclose(decode_embedding(blob), embedding, atol=1e-6)
+
+
+def test_blobs_are_little_endian():
+    assert encode_embedding([1.0]) == np.array([1.0], dtype="<f4").tobytes()
+
+
+def test_json_round_trip():
+    text = encode_embedding([0.1, 0.2], EMBEDDING_FORMAT_JSON)
+
+    assert json.loads(text) == [0.1, 0.2]
+    assert decode_embedding(text) == [0.1, 0.2]
+
+
+def test_matrix_accepts_blobs_and_json():
+    rows = [encode_embedding([1.0, 2.0]), json.dumps([3.0, 4.0]), [5.0, 6.0]]
+
+    matrix = embeddings_to_matrix(rows)
+
+    assert matrix.dtype == np.float32
+    assert matrix.tolist() == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+
+
+def test_matrix_rejects_mixed_dimensions():
+    with pytest.raises(ValueError):
+        embeddings_to_matrix([[1.0, 2.0], [1.0]])
+
+
+def test_new_collections_store_blobs(tmp_path):
+    path = str(tmp_path / "v.db")
+    db = VectorDatabase(path)
+    db.create_collection("docs")
+    db.add("docs", ids=["a"], embeddings=[[0.5, 0.25]])
+    db.close()
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT typeof(embedding) FROM vec_docs").fetchone()[0] == "blob"
+    conn.close()
+
+
+def test_legacy_json_collection_reads_and_migrates(tmp_path):
+    path = str(tmp_path / "v.db")
+    db = VectorDatabase(path)
+    db.create_collection("docs")
+    db.close()
+
+    # rewrite the collection the way releases before binary storage did
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE _vector_collections SET embedding_format = 'json' WHERE name = 'docs'")
+    conn.executemany(
+        "INSERT INTO vec_docs (id, embedding, document, metadata, created_at) VALUES (?, ?, ?, NULL, 'x')",
+        [("a", json.dumps([1.0, 0.0]), "first"), ("b", json.dumps([0.0, 1.0]), "second")]
+    )
+    conn.commit()
+    conn.close()
+
+    db = VectorDatabase(path)
+    assert db.get("docs", include=["embeddings"])["embeddings"] == [[1.0, 0.0], [0.0, 1.0]]
+    assert db.query("docs", query_embeddings=[[0.0, 1.0]], n_results=1)["ids"] == [["b"]]
+
+    # writes keep the format of the collection until it is migrated
+    db.add("docs", ids=["c"], embeddings=[[1.0, 1.0]])
+    assert db.migrate_collection("docs") == 3
+    assert db.get("docs", ids=["c"], include=["embeddings"])["embeddings"] == [[1.0, 1.0]]
+    db.close()
+
+    conn = sqlite3.connect(path)
+    assert {row[0] for row in conn.execute("SELECT typeof(embedding) FROM vec_docs")} == {"blob"}
+    conn.close()
+
+
+def test_updates_write_the_format_of_the_collection(tmp_path):
+    path = str(tmp_path / "v.db")
+    db = VectorDatabase(path)
+    db.create_collection("blobs")
+    db.create_collection("legacy")
+    db.conn.execute("UPDATE _vector_collections SET embedding_format = 'json' WHERE name = 'legacy'")
+    db.conn.commit()
+    db.close()
+
+    db = VectorDatabase(path)
+    for name in ("blobs", "legacy"):
+        db.add(name, ids=["a"], embeddings=[[1.0, 0.0]])
+        db.update(name, ids=["a"], embeddings=[[0.25, 0.5]])
+        assert db.get(name, include=["embeddings"])["embeddings"] == [[0.25, 0.5]]
+    db.close()
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT typeof(embedding) FROM vec_blobs").fetchone()[0] == "blob"
+    assert json.loads(conn.execute("SELECT embedding FROM vec_legacy").fetchone()[0]) == [0.25, 0.5]
+    conn.close()
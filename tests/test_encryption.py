@@ -0,0 +1,111 @@
+import base64
+import os
+
+import pytest
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.errors import EncryptionError
+from skypydb.schema import (
+    defineTable,
+    v
+)
+from skypydb.security import EncryptionManager
+from skypydb.security.constants import (
+    ENCRYPTION_CHUNK_SIZE,
+    ENCRYPTION_ENVELOPE_PREFIX
+)
+
+SALT = b"0123456789abcdef"
+
+
+@pytest.fixture(scope="module")
+def manager():
+    return EncryptionManager("password", iterations=1000, salt=SALT)
+
+
+def legacy_ciphertext(manager, plaintext):
+    # values written before the envelope prefix: base64(nonce|ciphertext)
+    nonce = os.urandom(12)
+    ciphertext = AESGCM(manager._key).encrypt(nonce, plaintext.encode("utf-8"), None)
+    return base64.b64encode(nonce + ciphertext).decode("ascii")
+
+
+def test_values_are_written_in_the_envelope(manager):
+    encrypted = manager.encrypt("secret")
+
+    assert encrypted.startswith(ENCRYPTION_ENVELOPE_PREFIX)
+    assert manager.decrypt(encrypted) == "secret"
+    # every value gets its own nonce
+    assert manager.encrypt("secret") != encrypted
+
+
+def test_legacy_ciphertext_is_decrypted(manager):
+    legacy = legacy_ciphertext(manager, "written by 0.1.9")
+
+    assert manager.decrypt(legacy) == "written by 0.1.9"
+    assert manager.decrypt_many([legacy]) == ["written by 0.1.9"]
+    assert manager.decrypt_dict({"f": legacy}) == {"f": "written by 0.1.9"}
+
+
+def test_decrypt_raises_on_tampered_values(manager):
+    encrypted = manager.encrypt("secret")
+    tampered = encrypted[:-4] + ("AAAA" if encrypted[-4:] != "AAAA" else "BBBB")
+
+    with pytest.raises(EncryptionError):
+        manager.decrypt(tampered)
+
+
+def test_plaintext_is_returned_unchanged(manager):
+    # short text, text shaped like base64, a corrupt envelope and non-strings
+    values = ["plain", "a" * 40, ENCRYPTION_ENVELOPE_PREFIX + "bm90IGVuY3J5cHRlZA==", "", None, 5]
+
+    assert manager.decrypt_many(values) == values
+    assert manager.decrypt_dict(dict(enumerate(values))) == dict(enumerate(values))
+
+
+def test_bulk_round_trip_matches_single_values(manager):
+    values = [f"value {i}" for i in range(100)] + [None, 7, 2.5, True]
+
+    encrypted = manager.encrypt_many(values)
+
+    assert encrypted[100] is None
+    assert all(value.startswith(ENCRYPTION_ENVELOPE_PREFIX) for value in encrypted if value is not None)
+    assert manager.decrypt_many(encrypted) == [f"value {i}" for i in range(100)] + [None, "7", "2.5", "True"]
+    assert [manager.decrypt(value) for value in encrypted[:100]] == values[:100]
+
+
+def test_bulk_round_trip_with_workers(manager):
+    values = [f"value {i}" for i in range(3 * ENCRYPTION_CHUNK_SIZE + 1)]
+
+    encrypted = manager.encrypt_many(values, workers=4)
+
+    assert manager.decrypt_many(encrypted, workers=4) == values
+    assert len(set(encrypted)) == len(values)
+    with pytest.raises(ValueError):
+        manager.decrypt_many(encrypted, workers=0)
+
+
+def test_disabled_manager_passes_values_through():
+    manager = EncryptionManager(None)
+
+    assert manager.encrypt_many(["a", None]) == ["a", None]
+    assert manager.decrypt_many(["a", None]) == ["a", None]
+
+
+def test_tables_mixing_legacy_and_enveloped_values(tmp_path):
+    db = ReactiveDatabase(str(tmp_path / "r.db"), encryption_key="k" * 32, salt=SALT, encrypted_fields=["secret"])
+    db.create_table("t", defineTable({"name": v.string(), "secret": v.string()}))
+    db.add_data_batch("t", [{"name": f"n{i}", "secret": f"secret {i}"} for i in range(10)])
+    legacy = legacy_ciphertext(db._encryption_manager, "legacy value")
+    db.conn.execute(
+        "INSERT INTO t (id, created_at, name, secret) VALUES ('legacy', 'x', 'legacy', ?)",
+        (legacy,)
+    )
+    db.conn.commit()
+
+    stored = [row[0] for row in db.conn.execute("SELECT secret FROM t WHERE id != 'legacy'")]
+    assert all(value.startswith(ENCRYPTION_ENVELOPE_PREFIX) for value in stored)
+    rows = db.get_all_data("t")
+    assert [row["secret"] for row in rows] == [f"secret {i}" for i in range(10)] + ["legacy value"]
+    db.close()
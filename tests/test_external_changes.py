@@ -0,0 +1,70 @@
+import json
+import sqlite3
+
+import pytest
+
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.schema import (
+    defineTable,
+    v
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "r.db")
+
+
+@pytest.fixture
+def db(path):
+    db = ReactiveDatabase(path)
+    db.create_table("t", defineTable({"name": v.string(), "n": v.int64()}))
+    db.add_data("t", {"name": "a", "n": 1})
+    yield db
+    db.close()
+
+
+def external(path, *statements):
+    conn = sqlite3.connect(path)
+    for statement, params in statements:
+        conn.execute(statement, params)
+    conn.commit()
+    conn.close()
+
+
+def test_external_alter_table_is_seen(path, db):
+    # fill the caches before the other connection changes the schema
+    assert db.get_table_columns_names("t") == ["id", "created_at", "name", "n"]
+
+    external(
+        path,
+        ("ALTER TABLE t ADD COLUMN extra TEXT", ()),
+        ("UPDATE t SET extra = 'x'", ())
+    )
+
+    assert db.get_table_columns_names("t") == ["id", "created_at", "name", "n", "extra"]
+    assert db.get_all_data("t")[0]["extra"] == "x"
+    db.add_data("t", {"name": "b", "n": 2, "extra": "y"})
+    assert [row["extra"] for row in db.get_all_data("t")] == ["x", "y"]
+
+
+def test_external_config_rewrite_is_seen(path, db):
+    assert db.get_table_config("t") == {"name": "str", "n": "int"}
+    assert db.get_all_data("t")[0]["n"] == 1
+
+    external(path, (
+        "INSERT OR REPLACE INTO _skypy_config (table_name, config, created_at) VALUES (?, ?, ?)",
+        ("t", json.dumps({"name": "str", "n": "bool"}), "x")
+    ))
+
+    assert db.get_table_config("t") == {"name": "str", "n": "bool"}
+    # reads convert with the new configuration
+    assert db.get_all_data("t")[0]["n"] is True
+
+
+def test_external_config_delete_is_seen(path, db):
+    assert db.get_table_config("t") is not None
+
+    external(path, ("DELETE FROM _skypy_config WHERE table_name = ?", ("t",)))
+
+    assert db.get_table_config("t") is None
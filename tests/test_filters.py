@@ -0,0 +1,126 @@
+import json
+import sqlite3
+
+import pytest
+
+from skypydb.database.vector_db import VectorDatabase
+from skypydb.database.mixins.vector.filters import compile_filters
+
+ITEMS = [
+    {"id": "1", "document": "red apple", "metadata": {"n": 1, "s": "a", "b": True, "f": 0.5}},
+    {"id": "2", "document": "green apple", "metadata": {"n": 2, "s": "b", "b": False, "f": 1.5}},
+    {"id": "3", "document": "red pear", "metadata": {"n": 3, "s": "c", "nested": {"s": "a"}}},
+    {"id": "4", "document": None, "metadata": {"n": None, "s": "1", "list": ["a"]}},
+    {"id": "5", "document": "Apple", "metadata": {"s": "a", "n": 1.0}},
+    {"id": "6", "document": "", "metadata": None},
+    {"id": "7", "document": "pear", "metadata": {"n": 10, "s": "10", "b": 1, 'we"ird': "x"}},
+]
+
+WHERE = [
+    {"s": "a"},
+    {"n": 1},
+    {"n": None},
+    {"b": True},
+    {"b": 1},
+    {"f": 1.5},
+    {"nested": {"$eq": "a"}},
+    {"s": "1"},
+    {"s": {"$eq": "a"}, "n": {"$ne": 2}},
+    {"s": {"$ne": "a"}},
+    {"n": {"$ne": None}},
+    {"n": {"$gt": 1}},
+    {"n": {"$gte": 1, "$lt": 10}},
+    {"n": {"$lte": 2}},
+    {"s": {"$gt": "a"}},
+    {"s": {"$in": ["a", "c"]}},
+    {"n": {"$in": [1, None]}},
+    {"s": {"$nin": ["a", "b"]}},
+    {"n": {"$in": []}},
+    {"$and": [{"s": "a"}, {"n": 1}]},
+    {"$or": [{"s": "b"}, {"n": {"$gt": 2}}]},
+    {"$or": [{"$and": [{"s": "a"}, {"b": True}]}, {"n": 10}]},
+    {"$and": []},
+    {"$or": []},
+    {'we"ird': "x"},
+    {"list": ["a"]},
+    {"n": {"$unknown": 1}},
+    {"missing": None},
+    {"missing": "a"},
+]
+
+WHERE_DOCUMENT = [
+    None,
+    {"$contains": "apple"},
+    {"$not_contains": "red"},
+    {"$contains": "Apple"},
+    {"$contains": ""},
+]
+
+
+@pytest.fixture(scope="module")
+def matcher(tmp_path_factory):
+    db = VectorDatabase(str(tmp_path_factory.mktemp("filters") / "v.db"))
+    yield db._matches_filters
+    db.close()
+
+
+@pytest.fixture(scope="module")
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id TEXT PRIMARY KEY, document TEXT, metadata TEXT)")
+    conn.executemany(
+        "INSERT INTO items VALUES (?, ?, ?)",
+        [
+            (item["id"], item["document"], json.dumps(item["metadata"]) if item["metadata"] is not None else None)
+            for item in ITEMS
+        ]
+    )
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize("where_document", WHERE_DOCUMENT)
+@pytest.mark.parametrize("where", WHERE + [None])
+def test_compiled_filters_match_the_python_check(conn, matcher, where, where_document):
+    expected = {item["id"] for item in ITEMS if matcher(item, where, where_document)}
+
+    predicate, params, exact = compile_filters(where, where_document)
+    if predicate is None:
+        selected = {item["id"] for item in ITEMS}
+    else:
+        selected = {row[0] for row in conn.execute(f"SELECT id FROM items WHERE {predicate}", params)}
+
+    if exact:
+        assert selected == expected
+    else:
+        # inexact predicates may only widen the selection, the rows are checked again
+        assert selected >= expected
+        by_id = {item["id"]: item for item in ITEMS}
+        assert {i for i in selected if matcher(by_id[i], where, where_document)} == expected
+
+
+def test_unsupported_keys_are_left_to_python():
+    _, _, exact = compile_filters({'we"ird': "x"})
+
+    assert not exact
+
+
+def test_collection_get_and_delete_follow_the_filters(tmp_path, matcher):
+    db = VectorDatabase(str(tmp_path / "v.db"))
+    db.create_collection("docs")
+    db.add(
+        "docs",
+        ids=[item["id"] for item in ITEMS],
+        embeddings=[[1.0, float(i)] for i in range(len(ITEMS))],
+        documents=[item["document"] for item in ITEMS],
+        metadatas=[item["metadata"] for item in ITEMS]
+    )
+
+    for where in WHERE:
+        expected = [item["id"] for item in ITEMS if matcher(item, where, None)]
+        assert db.get("docs", where=where)["ids"] == expected, where
+        assert db.count("docs", where=where) == len(expected), where
+
+    db.delete("docs", where={"s": {"$in": ["a", "c"]}})
+    assert db.get("docs")["ids"] == ["2", "4", "6", "7"]
+    db.close()
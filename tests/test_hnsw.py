@@ -0,0 +1,130 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("hnswlib")
+
+from skypydb.database.mixins.vector.hnsw import HnswIndex
+from skypydb.database.vector_db import VectorDatabase
+
+HNSW = {"index": "hnsw", "hnsw:ef_search": 64}
+PARAMS = {"M": 16, "ef_construction": 100, "ef_search": 16}
+
+
+def vectors(n, dimension=16, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, dimension)).astype(np.float32)
+
+
+def add_items(db, name, matrix, start=0):
+    db.add(
+        name,
+        ids=[f"id{start + i}" for i in range(len(matrix))],
+        embeddings=matrix.tolist(),
+        metadatas=[{"n": start + i} for i in range(len(matrix))]
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "v.db")
+
+
+@pytest.fixture
+def db(path):
+    db = VectorDatabase(path)
+    db.create_collection("docs", metadata=HNSW)
+    add_items(db, "docs", vectors(500))
+    yield db
+    db.close()
+
+
+def test_recall_against_exact_search(db):
+    queries = vectors(20, seed=1).tolist()
+
+    approximate = db.query("docs", query_embeddings=queries, n_results=10)["ids"]
+    exact = db.query("docs", query_embeddings=queries, n_results=10, exact=True)["ids"]
+
+    recall = np.mean([len(set(a) & set(e)) / len(e) for a, e in zip(approximate, exact)])
+    assert recall >= 0.9
+
+
+def test_deleted_items_are_never_returned(db):
+    db.delete("docs", ids=[f"id{i}" for i in range(495)])
+
+    result = db.query("docs", query_embeddings=vectors(3, seed=1).tolist(), n_results=10)
+
+    assert [sorted(ids) for ids in result["ids"]] == [[f"id{i}" for i in range(495, 500)]] * 3
+
+
+def test_search_is_bounded_by_live_items():
+    index = HnswIndex(None, PARAMS)
+    matrix = vectors(10)
+    index.add(list(range(10)), matrix)
+    index.remove([1, 2, 3])
+
+    assert index.live_count == 7
+    assert [len(labels) for labels, _ in index.search(matrix[:2], 50)] == [7, 7]
+    # the filter leaves fewer items than k, the largest fillable k is used
+    labels, _ = index.search(matrix[:1], 5, allowed=lambda label: label < 6)[0]
+    assert sorted(labels.tolist()) == [0, 4, 5]
+
+    index.add([1], matrix[1:2])
+    assert index.live_count == 8
+
+
+def test_index_is_persisted_with_its_generation(path, db):
+    db.save_indexes()
+    generation = db._get_index("docs").generation
+    assert os.path.exists(f"{path}.docs.hnsw")
+    db.close()
+
+    reopened = VectorDatabase(path)
+    index, rebuilt = reopened._sync_index("docs")
+    assert not rebuilt
+    assert index.generation == generation
+    assert index.live_count == 500
+    reopened.close()
+
+
+def test_deleted_labels_survive_a_reload(path, db):
+    db.delete("docs", ids=[f"id{i}" for i in range(10)])
+    db.save_indexes()
+    db.close()
+
+    reopened = VectorDatabase(path)
+    assert reopened._get_index("docs").live_count == 490
+    reopened.close()
+
+
+def test_writes_from_another_instance_trigger_a_rebuild(path, db):
+    db.save_indexes()
+    other = VectorDatabase(path)
+    add_items(other, "docs", vectors(1, seed=2) * 10, start=500)
+    other.close()
+
+    result = db.query("docs", query_embeddings=(vectors(1, seed=2) * 10).tolist(), n_results=1)
+
+    assert result["ids"] == [["id500"]]
+    index, rebuilt = db._sync_index("docs")
+    assert not rebuilt
+    assert index.live_count == 501
+
+
+def test_rolled_back_writes_invalidate_the_index(db, monkeypatch):
+    index_add = db._index_add
+
+    def fail_after_indexing(*args):
+        index_add(*args)
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(db, "_index_add", fail_after_indexing)
+    with pytest.raises(RuntimeError):
+        add_items(db, "docs", vectors(1, seed=3) * 10, start=500)
+    monkeypatch.undo()
+
+    assert db._indexes["docs"].generation == -1
+    # the item only reached the graph, the next search rebuilds without it
+    result = db.query("docs", query_embeddings=(vectors(1, seed=3) * 10).tolist(), n_results=3)
+    assert "id500" not in result["ids"][0]
+    assert db._get_index("docs").live_count == 500
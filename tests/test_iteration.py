@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from skypydb.api.vector_client import VectorClient
+from skypydb.api.async_vector_client import AsyncVectorClient
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.schema import (
+    defineTable,
+    v
+)
+from skypydb.table.table import Table
+
+IDS = [f"id{i:04d}" for i in range(1003)]
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "v.db")
+    client = VectorClient(path=path, embedding_cache=False)
+    client.create_collection("docs").add(
+        ids=IDS,
+        embeddings=[[float(i), 1.0] for i in range(len(IDS))],
+        documents=IDS,
+        metadatas=[{"k": i % 3} for i in range(len(IDS))]
+    )
+    return path
+
+
+def test_collection_iter_yields_bounded_batches_in_id_order(path):
+    collection = VectorClient(path=path, embedding_cache=False).get_collection("docs")
+
+    batches = list(collection.iter(batch_size=100, include=["documents"]))
+
+    assert [len(batch["ids"]) for batch in batches] == [100] * 10 + [3]
+    assert [i for batch in batches for i in batch["ids"]] == IDS
+    assert [d for batch in batches for d in batch["documents"]] == IDS
+    assert all(batch["embeddings"] is None for batch in batches)
+
+
+def test_collection_iter_applies_filters(path):
+    collection = VectorClient(path=path, embedding_cache=False).get_collection("docs")
+
+    assert [i for batch in collection.iter(batch_size=7, where={"k": 1}) for i in batch["ids"]] == IDS[1::3]
+
+
+def test_collection_iter_continues_after_deletes(path):
+    collection = VectorClient(path=path, embedding_cache=False).get_collection("docs")
+    seen = []
+
+    for batch in collection.iter(batch_size=100):
+        seen += batch["ids"]
+        if len(seen) == 100:
+            # the cursor is the last ID, not an offset
+            collection.delete(ids=IDS[:50] + IDS[500:510])
+
+    assert seen == IDS[:500] + IDS[510:]
+
+
+def test_collection_iter_rejects_empty_batches(path):
+    collection = VectorClient(path=path, embedding_cache=False).get_collection("docs")
+
+    with pytest.raises(ValueError):
+        next(collection.iter(batch_size=0))
+
+
+def test_async_collection_iter(path):
+    async def run():
+        async with AsyncVectorClient(path=path, embedding_cache=False) as client:
+            collection = await client.get_collection("docs")
+            return [i async for batch in collection.iter(batch_size=250) for i in batch["ids"]]
+
+    assert asyncio.run(run()) == IDS
+
+
+def test_table_iter_decrypts_each_batch(tmp_path):
+    db = ReactiveDatabase(
+        str(tmp_path / "r.db"),
+        encryption_key="k" * 32,
+        salt=b"0123456789abcdef",
+        encrypted_fields=["secret"]
+    )
+    db.create_table("t", defineTable({"name": v.string(), "secret": v.string()}))
+    db.add_data_batch("t", [{"name": f"n{i}", "secret": f"s{i}"} for i in range(2501)])
+
+    batches = list(Table(db, "t").iter(batch_size=1000))
+
+    assert [len(batch) for batch in batches] == [1000, 1000, 501]
+    rows = [row for batch in batches for row in batch]
+    assert [row["secret"] for row in rows] == [f"s{i}" for i in range(2501)]
+    assert rows == db.get_all_data("t")
+    with pytest.raises(ValueError):
+        next(db.iter_data("t", batch_size=0))
+    db.close()
@@ -0,0 +1,138 @@
+import threading
+
+import pytest
+
+from skypydb.security import (
+    EncryptionManager,
+    derived_key_cache
+)
+from skypydb.security.keycache import DerivedKeyCache
+
+SALT = b"0123456789abcdef"
+
+
+class CountingDerive:
+    def __init__(self, key=b"k" * 32):
+        self.key = key
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.key
+
+
+def test_hit_skips_the_derivation():
+    cache = DerivedKeyCache()
+    derive = CountingDerive()
+
+    assert cache.get("password", SALT, 1000, derive) == derive.key
+    assert cache.get("password", SALT, 1000, derive) == derive.key
+    assert derive.calls == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("password, salt, iterations", [
+    ("other", SALT, 1000),
+    ("password", b"fedcba9876543210", 1000),
+    ("password", SALT, 2000),
+])
+def test_entries_are_keyed_by_password_salt_and_iterations(password, salt, iterations):
+    cache = DerivedKeyCache()
+    derive = CountingDerive()
+    cache.get("password", SALT, 1000, derive)
+
+    cache.get(password, salt, iterations, derive)
+
+    assert derive.calls == 2
+
+
+def test_password_is_not_kept():
+    cache = DerivedKeyCache()
+    cache.get("hunter2-password", SALT, 1000, CountingDerive())
+
+    assert all(b"hunter2" not in fingerprint for fingerprint, _, _ in cache._keys)
+
+
+def test_least_recently_used_keys_are_evicted_and_wiped():
+    cache = DerivedKeyCache(max_keys=2)
+    cache.get("a", SALT, 1000, CountingDerive(b"a" * 32))
+    held = next(iter(cache._keys.values()))
+    cache.get("b", SALT, 1000, CountingDerive(b"b" * 32))
+    # reading "a" makes "b" the least recently used
+    cache.get("a", SALT, 1000, CountingDerive())
+    cache.get("c", SALT, 1000, CountingDerive(b"c" * 32))
+
+    derive = CountingDerive()
+    assert cache.get("a", SALT, 1000, derive) == b"a" * 32
+    cache.get("b", SALT, 1000, derive)
+    assert derive.calls == 1
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert held == bytearray(32)
+
+
+def test_concurrent_misses_derive_once():
+    cache = DerivedKeyCache()
+    derive = CountingDerive()
+    threads = [threading.Thread(target=cache.get, args=("password", SALT, 1000, derive)) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert derive.calls == 1
+
+
+def test_managers_share_the_derived_key():
+    derived_key_cache.clear()
+    first = EncryptionManager("password", iterations=1000, salt=SALT)
+
+    assert len(derived_key_cache) == 1
+    second = EncryptionManager("password", iterations=1000, salt=SALT)
+    assert second._key == first._key
+    assert second.decrypt(first.encrypt("secret")) == "secret"
+    assert len(derived_key_cache) == 1
+
+    assert EncryptionManager("password", iterations=2000, salt=SALT)._key != first._key
+    derived_key_cache.clear()
+    assert EncryptionManager("password", iterations=1000, salt=SALT)._key == first._key
+
+
+def test_different_keys_derive_concurrently():
+    cache = DerivedKeyCache()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def derive():
+        # both derivations must be running at once to pass the barrier
+        barrier.wait()
+        return b"k" * 32
+
+    threads = [
+        threading.Thread(target=cache.get, args=(password, SALT, 1000, derive))
+        for password in ("first", "second")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not barrier.broken
+    assert len(cache) == 2
+
+
+def test_failed_derivation_is_retried():
+    cache = DerivedKeyCache()
+
+    def fail():
+        raise RuntimeError("derivation failed")
+
+    with pytest.raises(RuntimeError):
+        cache.get("password", SALT, 1000, fail)
+
+    derive = CountingDerive()
+    assert cache.get("password", SALT, 1000, derive) == derive.key
+    assert derive.calls == 1
+    assert not cache._pending
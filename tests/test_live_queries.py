@@ -0,0 +1,192 @@
+import asyncio
+from contextlib import AsyncExitStack
+
+from skypydb.server.live_queries import (
+    MAX_PENDING_EVENTS,
+    LiveQuery,
+    LiveQueryHub,
+    LiveSubscriber
+)
+
+
+class Source:
+    def __init__(self, n=2):
+        self.rows = [{"id": str(i), "n": i} for i in range(n)]
+        self.evaluations = 0
+        self.error = None
+
+    def evaluate(self):
+        self.evaluations += 1
+        if self.error:
+            raise RuntimeError(self.error)
+        return {"rows": [dict(row) for row in self.rows], "total": len(self.rows)}
+
+    def fingerprint(self):
+        return (len(self.rows), tuple(row["n"] for row in self.rows), self.error)
+
+    def add(self, n):
+        self.rows.append({"id": str(n), "n": n})
+
+
+def rows(result):
+    return result["rows"]
+
+
+def subscribe(hub, source, key="q"):
+    return hub.subscribe(key, source.evaluate, source.fingerprint, rows)
+
+
+async def next_event(queue):
+    return await asyncio.wait_for(queue.get(), 2)
+
+
+def drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+def test_snapshot_then_diff():
+    async def run():
+        hub = LiveQueryHub(poll_interval=0.01)
+        source = Source()
+        async with subscribe(hub, source) as queue:
+            snapshot = await next_event(queue)
+            source.add(5)
+            source.rows[0]["n"] = 10
+            diff = await next_event(queue)
+        return snapshot, diff
+
+    snapshot, diff = asyncio.run(run())
+
+    assert snapshot["event"] == "snapshot"
+    assert snapshot["data"]["result"]["total"] == 2
+    assert diff["event"] == "diff"
+    assert diff["data"]["added"] == [{"id": "5", "n": 5}]
+    assert diff["data"]["updated"] == [{"id": "0", "n": 10}]
+    assert diff["data"]["removed"] == []
+    assert (diff["data"]["total"], diff["data"]["version"]) == (3, snapshot["data"]["version"] + 1)
+
+
+def test_subscribers_share_one_evaluation():
+    async def run():
+        hub = LiveQueryHub(poll_interval=0.01)
+        source = Source()
+        async with AsyncExitStack() as stack:
+            queues = [await stack.enter_async_context(subscribe(hub, source)) for _ in range(5)]
+            snapshots = [await next_event(queue) for queue in queues]
+            evaluations = source.evaluations
+            source.add(5)
+            diffs = [await next_event(queue) for queue in queues]
+            return snapshots, evaluations, diffs, source.evaluations
+
+    snapshots, evaluations, diffs, total = asyncio.run(run())
+
+    assert {event["event"] for event in snapshots} == {"snapshot"}
+    assert evaluations == 1
+    assert {event["event"] for event in diffs} == {"diff"}
+    assert total == 2
+
+
+def test_overflow_is_replaced_by_a_snapshot():
+    async def run():
+        source = Source(0)
+        query = LiveQuery(source.evaluate, source.fingerprint, rows)
+        subscriber = LiveSubscriber()
+        query.add(subscriber)
+        query._publish(source.evaluate())
+        for n in range(MAX_PENDING_EVENTS + 10):
+            source.add(n)
+            query._publish(source.evaluate())
+        return drain(subscriber.queue), query
+
+    events, query = asyncio.run(run())
+
+    assert len(events) < MAX_PENDING_EVENTS
+    assert events[0]["event"] == "snapshot"
+    # the diffs following the snapshot continue from its version
+    versions = [event["data"]["version"] for event in events]
+    assert versions == list(range(versions[0], query.version + 1))
+    result = events[0]["data"]["result"]
+    for event in events[1:]:
+        result["rows"] += event["data"]["added"]
+    assert result["rows"] == query.result["rows"]
+
+
+def test_error_overflow_without_a_result():
+    async def run():
+        query = LiveQuery(lambda: {}, lambda: 0, rows)
+        subscriber = LiveSubscriber()
+        query.add(subscriber)
+        for n in range(MAX_PENDING_EVENTS + 1):
+            query._broadcast({"event": "error", "data": {"error": str(n)}})
+        return drain(subscriber.queue)
+
+    events = asyncio.run(run())
+
+    # no snapshot of a missing result, the last error is kept
+    assert events == [{"event": "error", "data": {"error": str(MAX_PENDING_EVENTS)}}]
+
+
+def test_errors_are_reported_once():
+    async def run():
+        hub = LiveQueryHub(poll_interval=0.01)
+        source = Source()
+        source.error = "table missing"
+        async with subscribe(hub, source) as queue:
+            error = await next_event(queue)
+            await asyncio.sleep(0.1)
+            repeated = drain(queue)
+            source.error = None
+            snapshot = await next_event(queue)
+        return error, repeated, snapshot, source.evaluations
+
+    error, repeated, snapshot, evaluations = asyncio.run(run())
+
+    assert error == {"event": "error", "data": {"error": "table missing"}}
+    assert repeated == []
+    assert evaluations > 2
+    assert snapshot["event"] == "snapshot"
+
+
+def test_query_stops_with_its_last_subscriber():
+    async def run():
+        hub = LiveQueryHub(poll_interval=0.01)
+        source = Source()
+        async with subscribe(hub, source) as first:
+            await next_event(first)
+            query = hub._queries["q"]
+            async with subscribe(hub, source) as second:
+                await next_event(second)
+            # a subscriber is left, the query keeps running
+            assert hub._queries["q"] is query
+            task = query._task
+        stopped = task.done() and "q" not in hub._queries
+        evaluations = source.evaluations
+        source.add(5)
+        await asyncio.sleep(0.05)
+        return stopped, evaluations, source.evaluations
+
+    stopped, before, after = asyncio.run(run())
+
+    assert stopped
+    assert after == before
+
+
+def test_close_all_stops_every_query():
+    async def run():
+        hub = LiveQueryHub(poll_interval=0.01)
+        source = Source()
+        async with subscribe(hub, source, "a") as queue:
+            await next_event(queue)
+            async with subscribe(hub, source, "b") as other:
+                await next_event(other)
+                tasks = [query._task for query in hub._queries.values()]
+                await hub.close_all()
+                return hub._queries, [task.done() for task in tasks]
+
+    queries, done = asyncio.run(run())
+
+    assert queries == {}
+    assert done == [True, True]
@@ -0,0 +1,53 @@
+import pytest
+
+from skypydb.database.mixins.vector.filters import compile_filters
+from skypydb.database.vector_db import VectorDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = VectorDatabase(str(tmp_path / "v.db"))
+    db.create_collection("docs", metadata_indexes=["s"])
+    db.add(
+        "docs",
+        ids=[str(i) for i in range(20)],
+        embeddings=[[1.0, float(i)] for i in range(20)],
+        metadatas=[{"s": f"s{i % 4}", "n": i} for i in range(20)]
+    )
+    yield db
+    db.close()
+
+
+def plan(db, where):
+    predicate, params, exact = compile_filters(where)
+    assert exact
+    rows = db.conn.execute(f"EXPLAIN QUERY PLAN SELECT id FROM vec_docs WHERE {predicate}", params).fetchall()
+    return " ".join(row[-1] for row in rows)
+
+
+def test_indexed_filters_use_the_index(db):
+    assert "USING INDEX idx_vec_docs_meta_s" in plan(db, {"s": "s1"})
+    assert "USING INDEX" in plan(db, {"s": {"$in": ["s1", "s2"]}})
+    # unindexed keys scan the collection
+    assert "USING INDEX" not in plan(db, {"n": 3})
+
+    assert db.get("docs", where={"s": "s1"})["ids"] == ["1", "13", "17", "5", "9"]
+
+
+def test_indexes_are_added_to_an_existing_collection(db):
+    db.get_or_create_collection("docs", metadata_indexes=["s", "n"])
+
+    assert db.get_metadata_indexes("docs") == ["s", "n"]
+    assert "USING INDEX idx_vec_docs_meta_n" in plan(db, {"n": {"$gt": 15}})
+    assert db.count("docs", where={"n": {"$gt": 15}}) == 4
+
+
+def test_indexed_keys_are_not_written_again(db):
+    writer = db._connections.writer
+    changes = writer.total_changes
+
+    db.get_or_create_collection("docs", metadata_indexes=["s"])
+    db.create_metadata_indexes("docs", ["s", "s"])
+
+    assert writer.total_changes == changes
+    assert db.get_metadata_indexes("docs") == ["s"]
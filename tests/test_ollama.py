@@ -0,0 +1,167 @@
+import asyncio
+import json
+import threading
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+
+import pytest
+
+from skypydb.embeddings.cache import EmbeddingCache
+from skypydb.embeddings.ollama import OllamaEmbedding
+from skypydb.embeddings.async_ollama import AsyncOllamaEmbedding
+
+
+def vector(text):
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+class StubOllama(BaseHTTPRequestHandler):
+    """
+    Minimal Ollama API answering /api/embed, or only the legacy /api/embeddings.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append((self.path, body))
+
+        if server.mode == "malformed":
+            self.wfile.write(b"garbage\r\n\r\n")
+            self.close_connection = True
+            return
+        if server.mode == "continue":
+            self.wfile.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+
+        if self.path == "/api/embed" and server.mode != "legacy":
+            code, out = 200, {"embeddings": [vector(text) for text in body["input"]]}
+        elif self.path == "/api/embeddings":
+            code, out = 200, {"embedding": vector(body["prompt"])}
+        else:
+            code, out = 404, None
+        data = json.dumps(out).encode() if out is not None else b"404 page not found"
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOllama)
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def url(server):
+    server.mode = "embed"
+    server.requests = []
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+TEXTS = [f"text number {i}" for i in range(50)]
+
+
+def test_texts_are_embedded_in_batches(server, url):
+    embed = OllamaEmbedding(model="m", base_url=url, batch_size=16, max_workers=3)
+
+    assert embed(TEXTS) == [vector(text) for text in TEXTS]
+    assert len(server.requests) == 4
+    assert all(path == "/api/embed" for path, _ in server.requests)
+    assert embed.get_dimension() == 3
+    embed.close()
+
+
+def test_interim_responses_are_skipped(server, url):
+    server.mode = "continue"
+    embed = OllamaEmbedding(model="m", base_url=url)
+
+    assert embed(TEXTS[:3]) == [vector(text) for text in TEXTS[:3]]
+    embed.close()
+
+
+def test_legacy_endpoint_is_used_when_embed_is_missing(server, url):
+    server.mode = "legacy"
+    embed = OllamaEmbedding(model="m", base_url=url)
+
+    assert embed(["a", "bb"]) == [vector("a"), vector("bb")]
+    assert [path for path, _ in server.requests] == ["/api/embed", "/api/embeddings", "/api/embeddings"]
+    embed.close()
+
+
+def test_cached_texts_are_not_sent_again(server, url, tmp_path):
+    embed = OllamaEmbedding(model="m", base_url=url, cache=EmbeddingCache(str(tmp_path / "cache.db")))
+    embed(TEXTS[:10])
+    server.requests.clear()
+
+    assert embed(TEXTS[:12]) == [vector(text) for text in TEXTS[:12]]
+    assert [body["input"] for _, body in server.requests] == [TEXTS[10:12]]
+    embed.close()
+
+
+def test_unreachable_server_raises_connection_error():
+    embed = OllamaEmbedding(model="m", base_url="http://127.0.0.1:9", timeout=2)
+
+    with pytest.raises(ConnectionError):
+        embed(["a"])
+    embed.close()
+
+
+def test_async_client_embeds_in_batches(server, url):
+    async def run():
+        embed = AsyncOllamaEmbedding(model="m", base_url=url, batch_size=8, max_workers=4)
+        try:
+            return await embed(TEXTS)
+        finally:
+            await embed.close()
+
+    assert asyncio.run(run()) == [vector(text) for text in TEXTS]
+    assert len(server.requests) == 7
+
+
+def test_async_client_skips_interim_responses(server, url):
+    server.mode = "continue"
+
+    async def run():
+        embed = AsyncOllamaEmbedding(model="m", base_url=url)
+        try:
+            return await embed(["a", "bb"])
+        finally:
+            await embed.close()
+
+    assert asyncio.run(run()) == [vector("a"), vector("bb")]
+
+
+def test_async_client_survives_a_new_event_loop(server, url):
+    embed = AsyncOllamaEmbedding(model="m", base_url=url, max_workers=2)
+
+    # idle connections and the semaphore belong to the loop that created them
+    for _ in range(3):
+        assert asyncio.run(embed(TEXTS[:4])) == [vector(text) for text in TEXTS[:4]]
+    asyncio.run(embed.close())
+
+
+def test_async_client_rejects_a_malformed_status_line(server, url):
+    server.mode = "malformed"
+
+    async def run():
+        embed = AsyncOllamaEmbedding(model="m", base_url=url)
+        try:
+            await embed(["a"])
+        finally:
+            await embed.close()
+
+    with pytest.raises(ConnectionError, match="Malformed status line"):
+        asyncio.run(run())
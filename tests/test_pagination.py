@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from skypydb.api.vector_client import VectorClient
+
+N = 500
+
+
+@pytest.fixture
+def collection(tmp_path):
+    client = VectorClient(path=str(tmp_path / "v.db"), embedding_cache=False)
+    collection = client.create_collection("docs")
+    ids = [f"id{i:04d}" for i in range(N)]
+    # inserted out of ID order, so rowid order differs from ID order
+    random.Random(3).shuffle(ids)
+    collection.add(
+        ids=ids,
+        embeddings=[[float(i), 1.0] for i in range(N)],
+        documents=[f"document {i}" for i in range(N)],
+        metadatas=[{"k": i % 4} for i in range(N)]
+    )
+    return collection
+
+
+def all_pages(collection, limit, after_id=None, **kwargs):
+    ids = []
+    page = collection.get(limit=limit, after_id=after_id, **kwargs)
+    while page["ids"]:
+        ids += page["ids"]
+        page = collection.get(limit=limit, after_id=page["ids"][-1], **kwargs)
+    return ids
+
+
+def test_get_returns_id_order_with_or_without_pagination(collection):
+    full = collection.get()
+
+    assert full["ids"] == sorted(full["ids"])
+    assert collection.get(limit=N)["ids"] == full["ids"]
+    assert collection.get(where={"k": 1})["ids"] == collection.get(where={"k": 1}, limit=N)["ids"]
+
+
+@pytest.mark.parametrize("offset, limit", [(0, 10), (5, 100), (N - 3, 10), (7, None), (N, 5)])
+def test_offset_pages_slice_the_full_result(collection, offset, limit):
+    full = collection.get()
+    end = offset + limit if limit is not None else None
+
+    page = collection.get(limit=limit, offset=offset)
+
+    assert page["ids"] == full["ids"][offset:end]
+    assert page["embeddings"] == full["embeddings"][offset:end]
+    assert page["metadatas"] == full["metadatas"][offset:end]
+
+
+@pytest.mark.parametrize("filters", [{}, {"where": {"k": 2}}, {"where_document": {"$contains": "document 1"}}])
+def test_after_id_pages_cover_every_item_once(collection, filters):
+    expected = collection.get(**filters)["ids"]
+
+    assert all_pages(collection, 37, **filters) == expected
+
+
+def test_after_id_is_stable_while_items_change(collection):
+    first = collection.get(limit=50)["ids"]
+    # deleting items of the read page shifts offsets but not the cursor
+    collection.delete(ids=first[:10])
+    collection.add(ids=["id0000a"], embeddings=[[0.0, 0.0]])
+
+    rest = all_pages(collection, 50, after_id=first[-1])
+
+    assert rest == [i for i in collection.get()["ids"] if i > first[-1]]
+    assert len(rest) == N - 50
+
+
+def test_after_id_needs_no_existing_item(collection):
+    assert collection.get(limit=3, after_id="id0099z")["ids"] == ["id0100", "id0101", "id0102"]
+
+
+def test_pages_skip_unrequested_fields(collection):
+    page = collection.get(limit=5, include=["documents"])
+
+    assert page["embeddings"] is None and page["metadatas"] is None
+    assert len(page["documents"]) == 5
+
+
+def test_empty_and_invalid_pages(collection):
+    assert collection.get(limit=0)["ids"] == []
+    with pytest.raises(ValueError):
+        collection.get(limit=-1)
+    with pytest.raises(ValueError):
+        collection.get(offset=-1)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from skypydb.database.vector_db import VectorDatabase
+from skypydb.database.mixins.vector.sysplanner import (
+    STRATEGY_POSTFILTER,
+    STRATEGY_PREFILTER,
+    STRATEGY_SCAN
+)
+
+N = 2000
+
+# "rare" matches 1% of the rows, "common" 90%
+RARE = {"group": 0}
+COMMON = {"common": True}
+
+
+@pytest.fixture(scope="module")
+def embeddings():
+    return np.random.default_rng(7).standard_normal((N, 16)).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory, embeddings):
+    db = VectorDatabase(str(tmp_path_factory.mktemp("planner") / "v.db"), cache_memory_budget=1 << 26)
+    db.create_collection("docs")
+    db.add(
+        "docs",
+        ids=[f"id{i:05d}" for i in range(N)],
+        embeddings=embeddings.tolist(),
+        documents=[f"document {i}" for i in range(N)],
+        metadatas=[{"group": i % 100, "common": i % 10 != 0} for i in range(N)]
+    )
+    yield db
+    db.close()
+
+
+def test_unfiltered_queries_scan(db):
+    assert db._plan_query("docs") == STRATEGY_SCAN
+
+
+def test_rows_read_from_sqlite_are_pre_filtered(db):
+    assert db._plan_query("docs", COMMON) == STRATEGY_PREFILTER
+
+
+def test_snapshot_selective_filter_is_pre_filtered(db):
+    snapshot = db._get_snapshot("docs")
+
+    assert db._plan_query("docs", RARE, snapshot=snapshot) == STRATEGY_PREFILTER
+    assert db._plan_query("docs", where_document={"$contains": "document 7"}, snapshot=snapshot) == STRATEGY_PREFILTER
+
+
+def test_snapshot_broad_filter_is_post_filtered(db):
+    snapshot = db._get_snapshot("docs")
+
+    assert db._plan_query("docs", COMMON, snapshot=snapshot) == STRATEGY_POSTFILTER
+    assert db._plan_query("docs", where_document={"$contains": "document"}, snapshot=snapshot) == STRATEGY_POSTFILTER
+
+
+def test_indexed_collections_estimate_from_sqlite(db):
+    assert db._plan_query("docs", RARE, indexed=True) == STRATEGY_PREFILTER
+    assert db._plan_query("docs", COMMON, indexed=True) == STRATEGY_POSTFILTER
+
+
+@pytest.mark.parametrize("where", [RARE, COMMON, {"group": {"$in": [1, 2, 3]}}, {"group": -1}])
+def test_strategies_return_the_same_results(embeddings, db, where):
+    queries = embeddings[:5].tolist()
+
+    # the uncached database reads the rows from SQLite and always pre-filters
+    uncached = VectorDatabase(db.path)
+    expected = uncached.query("docs", query_embeddings=queries, n_results=10, where=where)
+    got = db.query("docs", query_embeddings=queries, n_results=10, where=where)
+    uncached.close()
+
+    assert got["ids"] == expected["ids"]
+    assert np.allclose(got["distances"], expected["distances"], atol=1e-5)
+    for ids in got["ids"]:
+        assert len(ids) == min(10, sum(1 for i in range(N) if matches(i, where)))
+
+
+def matches(i, where):
+    metadata = {"group": i % 100, "common": i % 10 != 0}
+    for key, value in where.items():
+        if isinstance(value, dict):
+            if metadata[key] not in value["$in"]:
+                return False
+        elif metadata[key] != value:
+            return False
+    return True
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from skypydb.database.mixins.vector.utils import (
+    cosine_similarity,
+    normalize_rows,
+    top_k
+)
+from skypydb.database.vector_db import VectorDatabase
+
+
+def reference_ranking(items, query, k):
+    # the per-pair loop the vectorised path replaced
+    scored = [(cosine_similarity(query, item), position) for position, item in enumerate(items)]
+    scored.sort(key=lambda pair: (-pair[0], pair[1]))
+    return scored[:k]
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    items = rng.normal(size=(300, 24))
+    items[7] = 0.0
+    queries = rng.normal(size=(5, 24))
+    return items, queries
+
+
+@pytest.mark.parametrize("k", [1, 10, 300, 500])
+def test_vectorised_ranking_matches_the_reference(data, k):
+    items, queries = data
+
+    scores = normalize_rows(queries) @ normalize_rows(items).T
+    ranked = top_k(scores, k)
+
+    assert ranked.shape == (len(queries), min(k, len(items)))
+    for query, rows, row_scores in zip(queries, ranked, scores):
+        expected = reference_ranking(items.tolist(), query.tolist(), k)
+        assert rows.tolist() == [position for _, position in expected]
+        assert row_scores[rows] == pytest.approx([score for score, _ in expected], abs=1e-5)
+
+
+def test_zero_rows_score_zero(data):
+    items, queries = data
+
+    scores = normalize_rows(queries) @ normalize_rows(items).T
+
+    assert np.all(scores[:, 7] == 0.0)
+    assert top_k(scores, 0).shape == (len(queries), 0)
+
+
+def test_exact_query_matches_the_reference(tmp_path, data):
+    items, queries = data
+    db = VectorDatabase(str(tmp_path / "v.db"))
+    db.create_collection("docs")
+    db.add("docs", ids=[f"id{i:03d}" for i in range(len(items))], embeddings=items.tolist())
+
+    result = db.query("docs", query_embeddings=queries.tolist(), n_results=10, exact=True)
+
+    # stored embeddings are float32, the reference scores the same values
+    stored = items.astype(np.float32).tolist()
+    for query, ids, distances in zip(queries.tolist(), result["ids"], result["distances"]):
+        expected = reference_ranking(stored, query, 10)
+        assert ids == [f"id{position:03d}" for _, position in expected]
+        assert distances == pytest.approx([1.0 - score for score, _ in expected], abs=1e-5)
+    db.close()
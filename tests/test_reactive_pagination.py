@@ -0,0 +1,86 @@
+import pytest
+
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.errors import ValidationError
+from skypydb.schema import (
+    defineTable,
+    v
+)
+
+N = 300
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = ReactiveDatabase(
+        str(tmp_path / "r.db"),
+        encryption_key="k" * 32,
+        salt=b"0123456789abcdef",
+        encrypted_fields=["secret"]
+    )
+    db.create_table("t", defineTable({"name": v.string(), "grp": v.string(), "secret": v.string()}))
+    db.add_data_batch(
+        "t",
+        [{"name": ["b", "a", "c", "a"][i % 4], "grp": str(i % 3), "secret": f"s{i}"} for i in range(N)]
+    )
+    yield db
+    db.close()
+
+
+def expected_order(rows, order_by):
+    if order_by is None:
+        return rows
+    column = order_by.lstrip("-")
+    # sorted() is stable, so ties keep insertion order
+    return sorted(rows, key=lambda row: row[column], reverse=order_by.startswith("-"))
+
+
+def all_pages(read, limit, **kwargs):
+    rows = []
+    page = read(limit=limit, **kwargs)
+    while page:
+        rows += page
+        page = read(limit=limit, after_id=page[-1]["id"], **kwargs)
+    return rows
+
+
+@pytest.mark.parametrize("order_by", [None, "name", "-name", "grp", "-created_at"])
+def test_after_id_pages_follow_the_order(db, order_by):
+    full = db.get_all_data("t")
+    expected = expected_order(full, order_by)
+
+    rows = all_pages(lambda **kw: db.get_all_data("t", order_by=order_by, **kw), 37)
+
+    assert [row["id"] for row in rows] == [row["id"] for row in expected]
+    assert [row["secret"] for row in rows] == [row["secret"] for row in expected]
+
+
+@pytest.mark.parametrize("order_by", [None, "name", "-name"])
+def test_filtered_pages_follow_the_order(db, order_by):
+    expected = expected_order(db.search("t", grp="1"), order_by)
+
+    rows = all_pages(lambda **kw: db.search("t", grp="1", order_by=order_by, **kw), 11)
+
+    assert [row["id"] for row in rows] == [row["id"] for row in expected]
+
+
+def test_offset_pages_slice_the_full_result(db):
+    full = db.get_all_data("t")
+
+    assert db.get_all_data("t", limit=10, offset=20) == full[20:30]
+    assert db.get_all_data("t", offset=N - 5) == full[N - 5:]
+    assert db.search("t", grp="0", limit=5, offset=3) == db.search("t", grp="0")[3:8]
+
+
+def test_encrypted_columns_cannot_order_pages(db):
+    for order_by in ("secret", "-secret"):
+        with pytest.raises(ValueError):
+            db.get_all_data("t", limit=10, order_by=order_by)
+        with pytest.raises(ValueError):
+            db.search("t", grp="1", order_by=order_by)
+
+
+@pytest.mark.parametrize("arguments", [{"limit": -1}, {"offset": -1}, {"order_by": "nope"}, {"after_id": "missing"}])
+def test_invalid_pages(db, arguments):
+    with pytest.raises(ValidationError):
+        db.get_all_data("t", **arguments)
@@ -0,0 +1,82 @@
+import sqlite3
+
+import pytest
+
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.database.statistics import DatabaseStatistics
+from skypydb.schema import (
+    defineTable,
+    v
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = ReactiveDatabase(str(tmp_path / "r.db"))
+    db.create_table("t", defineTable({"name": v.string(), "n": v.int64()}))
+    db.create_table("empty", defineTable({"name": v.string()}))
+    db.add_data_batch("t", [{"name": f"r{i}", "n": i % 3} for i in range(30)])
+    db.conn.execute("CREATE INDEX idx_t_n ON t (n)")
+    db.conn.commit()
+    yield db
+    db.close()
+
+
+class WithoutDbstat:
+    """
+    Connection of an SQLite build without the dbstat table.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.dbstat_queries = 0
+
+    def execute(self, sql, *args):
+        if "dbstat" in sql:
+            self.dbstat_queries += 1
+            raise sqlite3.OperationalError("no such table: dbstat")
+        return self.conn.execute(sql, *args)
+
+
+def test_row_counts(db):
+    assert db.count("t") == 30
+    assert db.count("t", n=1) == 10
+    assert db.count("empty") == 0
+
+    tables = db.get_statistics()["tables"]
+    assert (tables["t"]["row_count"], tables["empty"]["row_count"]) == (30, 0)
+
+
+def test_indexes_and_sizes(db):
+    statistics = db.get_statistics()
+    table = statistics["tables"]["t"]
+
+    index = next(index for index in table["indexes"] if index["name"] == "idx_t_n")
+    assert (index["columns"], index["unique"]) == (["n"], False)
+    # the primary key is listed as a unique index
+    assert any(index["unique"] for index in table["indexes"] if index["name"] != "idx_t_n")
+    assert table["bytes"] > 0 and index["bytes"] > 0
+    assert table["index_bytes"] == sum(index["bytes"] for index in table["indexes"])
+    assert statistics["database_bytes"] == statistics["page_size"] * statistics["page_count"]
+
+
+def test_sizes_are_none_without_dbstat(db):
+    statistics = DatabaseStatistics()
+    conn = WithoutDbstat(db.conn)
+
+    table = statistics.collect(conn, ["t"])["tables"]["t"]
+    statistics.collect(conn, ["t"])
+
+    assert table["row_count"] == 30
+    assert (table["bytes"], table["index_bytes"]) == (None, None)
+    assert all(index["bytes"] is None for index in table["indexes"])
+    # the missing table is remembered, it is not queried again
+    assert conn.dbstat_queries == 2
+
+
+def test_recent_statistics_are_reused(db):
+    first = db.get_statistics(max_age=60)
+    db.add_data("t", {"name": "new", "n": 0})
+
+    assert db.get_statistics(max_age=60) is first
+    assert db.get_statistics()["tables"]["t"]["row_count"] == 31
@@ -0,0 +1,229 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from skypydb.database.changes import CHANGES_TABLE
+from skypydb.database.reactive_db import ReactiveDatabase
+from skypydb.errors import ChangesPrunedError
+from skypydb.schema import (
+    defineTable,
+    v
+)
+from skypydb.table.table import Table
+
+ENCRYPTION = dict(encryption_key="k" * 32, salt=b"0123456789abcdef", encrypted_fields=["secret"])
+
+
+def open_db(path, **kwargs):
+    return ReactiveDatabase(str(path), **ENCRYPTION, **kwargs)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = open_db(tmp_path / "r.db")
+    db.create_table("t", defineTable({"name": v.string(), "n": v.int64(), "secret": v.string()}))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def table(db):
+    return Table(db, "t")
+
+
+def ops(changes):
+    return [(change["op"], change["data"]["name"]) for change in changes]
+
+
+def test_log_is_off_until_enabled(db):
+    assert not db.audit.table_exists(CHANGES_TABLE)
+    db.add_data("t", {"name": "a", "n": 1, "secret": "s"})
+
+    assert db.get_changes("t") == []
+    assert db.get_last_change_sequence() == 0
+
+
+def test_inserts_and_deletes_in_sequence_order(db, table):
+    with table.subscribe() as subscription:
+        db.add_data("t", {"name": "a", "n": 1, "secret": "s1"})
+        db.add_data_batch("t", [{"name": "b", "n": 2, "secret": "s2"}, {"name": "c", "n": 3, "secret": "s3"}])
+        db.delete("t", name="a")
+
+        changes = subscription.poll(timeout=1)
+
+    assert ops(changes) == [("insert", "a"), ("insert", "b"), ("insert", "c"), ("delete", "a")]
+    assert [change["seq"] for change in changes] == sorted(change["seq"] for change in changes)
+    # rows are decrypted and typed like reads of the table
+    assert (changes[1]["data"]["secret"], changes[1]["data"]["n"]) == ("s2", 2)
+    assert changes[3]["id"] == changes[0]["id"]
+
+
+def test_filters_select_the_changed_rows(db, table):
+    with table.subscribe(filters={"n": [2, 3]}) as subscription:
+        db.add_data_batch("t", [{"name": f"r{i}", "n": i, "secret": "s"} for i in range(5)])
+        db.delete("t", n=3)
+
+        changes = subscription.poll(timeout=1)
+
+    assert ops(changes) == [("insert", "r2"), ("insert", "r3"), ("delete", "r3")]
+
+
+def test_resume_from_since(db, table):
+    table.subscribe().close()
+    db.add_data("t", {"name": "a", "n": 1, "secret": "s"})
+    seen = db.get_last_change_sequence("t")
+    db.add_data("t", {"name": "b", "n": 2, "secret": "s"})
+    db.add_data("t", {"name": "c", "n": 3, "secret": "s"})
+
+    with table.subscribe(since=seen) as subscription:
+        assert ops(subscription.poll(timeout=1)) == [("insert", "b"), ("insert", "c")]
+    with table.subscribe(since=0) as subscription:
+        assert ops(subscription.poll(timeout=1)) == [("insert", "a"), ("insert", "b"), ("insert", "c")]
+    # new subscriptions only see new changes
+    with table.subscribe() as subscription:
+        assert subscription.poll(timeout=0) == []
+
+
+def test_writes_from_another_instance_are_logged(tmp_path, db, table):
+    # the writer didn't ask for the log, the subscription of the reader enables it
+    writer = open_db(tmp_path / "r.db")
+    with table.subscribe(poll_interval=0.05) as subscription:
+        writer.add_data("t", {"name": "other", "n": 1, "secret": "s"})
+        writer.delete("t", name="other")
+
+        assert ops(subscription.poll(timeout=2)) == [("insert", "other"), ("delete", "other")]
+    writer.close()
+
+    # the setting is stored in the file
+    reopened = open_db(tmp_path / "r.db")
+    reopened.add_data("t", {"name": "later", "n": 2, "secret": "s"})
+    assert ops(db.get_changes("t"))[-1] == ("insert", "later")
+    reopened.close()
+
+
+def test_disable_change_log_stops_every_writer(db, table):
+    table.subscribe().close()
+    db.disable_change_log()
+
+    db.add_data("t", {"name": "a", "n": 1, "secret": "s"})
+
+    assert db.get_changes("t") == []
+
+
+def test_retention_prunes_and_reports_the_boundary(tmp_path):
+    db = open_db(tmp_path / "r.db", change_log=True, change_log_retention=5)
+    db.create_table("t", defineTable({"name": v.string(), "n": v.int64(), "secret": v.string()}))
+    db.add_data_batch("t", [{"name": f"r{i}", "n": i, "secret": "s"} for i in range(8)])
+
+    changes = db.get_changes("t")
+    assert [change["seq"] for change in changes] == [4, 5, 6, 7, 8]
+
+    # resuming at the boundary loses nothing, before it changes are missing
+    assert [change["seq"] for change in db.get_changes("t", since=3)] == [4, 5, 6, 7, 8]
+    with pytest.raises(ChangesPrunedError) as error:
+        db.get_changes("t", since=2)
+    assert error.value.sequence == 3
+    db.close()
+
+
+def test_subscription_resyncs_after_pruning(db, table):
+    subscription = table.subscribe()
+    db.add_data_batch("t", [{"name": f"r{i}", "n": i, "secret": "s"} for i in range(4)])
+    db.prune_changes(db.get_last_change_sequence() - 1, table_name="t")
+
+    changes = subscription.poll(timeout=1)
+
+    assert [change["op"] for change in changes] == ["resync"]
+    assert changes[0]["data"] is None
+    # the changes after the pruned ones follow
+    assert ops(subscription.poll(timeout=1)) == [("insert", "r3")]
+    db.add_data("t", {"name": "next", "n": 9, "secret": "s"})
+    assert ops(subscription.poll(timeout=1)) == [("insert", "next")]
+    subscription.close()
+
+
+def test_pruning_other_tables_keeps_the_table_readable(db, table):
+    db.create_table("other", defineTable({"name": v.string()}))
+    table.subscribe().close()
+    db.add_data("t", {"name": "a", "n": 1, "secret": "s"})
+    db.add_data("other", {"name": "b"})
+
+    db.prune_changes(db.get_last_change_sequence(), table_name="other")
+
+    assert ops(db.get_changes("t", since=0)) == [("insert", "a")]
+    assert db.get_changes("t", since=1) == []
+
+
+def test_callback_delivery_on_a_background_thread(db, table):
+    received = []
+    delivered = threading.Event()
+
+    def callback(change):
+        received.append(change)
+        if len(received) == 3:
+            delivered.set()
+
+    subscription = table.subscribe(callback=callback, poll_interval=0.05)
+    db.add_data_batch("t", [{"name": f"r{i}", "n": i, "secret": "s"} for i in range(3)])
+
+    assert delivered.wait(2)
+    subscription.close()
+    assert ops(received) == [("insert", "r0"), ("insert", "r1"), ("insert", "r2")]
+    assert not subscription._thread.is_alive()
+    with pytest.raises(RuntimeError):
+        subscription.start(callback)
+
+
+def test_iterator_stops_when_closed(db, table):
+    subscription = table.subscribe(poll_interval=0.05)
+    received = []
+
+    def consume():
+        for change in subscription:
+            received.append(change)
+            if len(received) == 2:
+                subscription.close()
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    db.add_data("t", {"name": "a", "n": 1, "secret": "s"})
+    db.add_data("t", {"name": "b", "n": 2, "secret": "s"})
+    thread.join(2)
+
+    assert not thread.is_alive()
+    assert ops(received) == [("insert", "a"), ("insert", "b")]
+
+
+def test_async_iteration(db, table):
+    async def run():
+        subscription = table.subscribe(poll_interval=0.05)
+        received = []
+
+        async def consume():
+            async for change in subscription:
+                received.append(change)
+                if len(received) == 2:
+                    subscription.close()
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        await asyncio.to_thread(db.add_data_batch, "t", [{"name": "a", "n": 1, "secret": "s"}, {"name": "b", "n": 2, "secret": "s"}])
+        await asyncio.wait_for(task, 2)
+        return received
+
+    assert ops(asyncio.run(run())) == [("insert", "a"), ("insert", "b")]
+
+
+def test_wait_for_changes_wakes_on_commit(db, table):
+    table.subscribe().close()
+    version = db.changes.version
+
+    timer = threading.Timer(0.1, db.add_data, args=("t", {"name": "a", "n": 1, "secret": "s"}))
+    start = time.monotonic()
+    timer.start()
+
+    assert db.wait_for_changes(version, 5)
+    assert time.monotonic() - start < 2
+    assert not db.wait_for_changes(db.changes.version, 0.05)
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from skypydb.database.vector_db import VectorDatabase
+from skypydb.database.mixins.vector.cache import (
+    CollectionSnapshot,
+    VectorCache
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = VectorDatabase(str(tmp_path / "v.db"), cache_memory_budget=1 << 24)
+    db.create_collection("docs")
+    db.add(
+        "docs",
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+        documents=["alpha", "beta", "gamma"],
+        metadatas=[{"k": 1}, {"k": 2}, {"k": 3}]
+    )
+    yield db
+    db.close()
+
+
+def nearest(db, embedding, n_results=3, **filters):
+    return db.query("docs", query_embeddings=[embedding], n_results=n_results, **filters)["ids"][0]
+
+
+def test_queries_load_the_snapshot_once(db):
+    nearest(db, [1.0, 0.0])
+    snapshot = db._cache.get("docs")
+
+    assert snapshot is not None and len(snapshot) == 3
+    nearest(db, [0.0, 1.0])
+    assert db._cache.get("docs") is snapshot
+
+
+def test_add_is_visible_to_cached_queries(db):
+    nearest(db, [1.0, 0.0])
+
+    db.add("docs", ids=["d"], embeddings=[[-1.0, 0.0]], metadatas=[{"k": 4}])
+
+    assert nearest(db, [-1.0, 0.0], n_results=1) == ["d"]
+    assert nearest(db, [-1.0, 0.0], n_results=1, where={"k": 4}) == ["d"]
+    assert len(db._cache.get("docs")) == 4
+
+
+def test_update_is_visible_to_cached_queries(db):
+    nearest(db, [1.0, 0.0])
+
+    db.update("docs", ids=["b"], embeddings=[[1.0, 0.01]], metadatas=[{"k": 9}])
+
+    assert nearest(db, [0.0, 1.0], n_results=1) == ["c"]
+    assert nearest(db, [1.0, 0.0], n_results=2) == ["a", "b"]
+    assert nearest(db, [1.0, 0.0], where={"k": 9}) == ["b"]
+    assert nearest(db, [1.0, 0.0], where={"k": 2}) == []
+
+
+def test_delete_is_visible_to_cached_queries(db):
+    nearest(db, [1.0, 0.0])
+
+    db.delete("docs", ids=["a"])
+
+    assert "a" not in nearest(db, [1.0, 0.0])
+    assert len(db._cache.get("docs")) == 2
+    db.delete("docs", where={"k": 3})
+    assert nearest(db, [1.0, 0.0]) == ["b"]
+
+
+def test_clear_cache_reloads_writes_made_elsewhere(db, tmp_path):
+    nearest(db, [1.0, 0.0])
+
+    other = VectorDatabase(str(tmp_path / "v.db"))
+    other.add("docs", ids=["d"], embeddings=[[-1.0, 0.0]])
+    other.close()
+
+    db.clear_cache("docs")
+    assert db._cache.get("docs") is None
+    assert nearest(db, [-1.0, 0.0], n_results=1) == ["d"]
+
+
+def test_stale_snapshot_is_not_stored():
+    cache = VectorCache(memory_budget=1 << 20)
+    version = cache.version("docs")
+    snapshot = CollectionSnapshot.from_items([
+        {"id": "a", "embedding": [1.0, 0.0], "document": None, "metadata": None}
+    ])
+
+    # a write happened while the snapshot was being read
+    cache.invalidate("docs")
+    cache.put("docs", snapshot, version=version)
+
+    assert cache.get("docs") is None
+    cache.put("docs", snapshot, version=cache.version("docs"))
+    assert cache.get("docs") is snapshot
+
+
+def test_snapshots_are_evicted_to_fit_the_budget():
+    snapshots = {
+        name: CollectionSnapshot.from_items([
+            {"id": str(i), "embedding": np.ones(64).tolist(), "document": None, "metadata": None}
+            for i in range(10)
+        ])
+        for name in ("a", "b", "c")
+    }
+    cache = VectorCache(memory_budget=2 * snapshots["a"].nbytes)
+
+    for name, snapshot in snapshots.items():
+        cache.put(name, snapshot)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None and cache.get("c") is not None
+    assert cache.nbytes <= cache.memory_budget
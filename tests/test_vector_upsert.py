@@ -0,0 +1,85 @@
+import pytest
+
+from skypydb.database.vector_db import VectorDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = VectorDatabase(str(tmp_path / "v.db"))
+    db.create_collection("docs")
+    yield db
+    db.close()
+
+
+def stored(db):
+    result = db.get("docs", include=["embeddings", "documents", "metadatas"])
+    return {
+        item_id: (document, metadata, [round(value, 3) for value in embedding])
+        for item_id, document, metadata, embedding in zip(
+            result["ids"], result["documents"], result["metadatas"], result["embeddings"]
+        )
+    }
+
+
+def test_id_repeated_within_a_batch_keeps_the_last_item(db):
+    db.add(
+        "docs",
+        ids=["a", "b", "a"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]],
+        documents=["first", "b", "last"],
+        metadatas=[{"n": 1}, {"n": 2}, {"n": 3}]
+    )
+
+    assert stored(db) == {"a": ("last", {"n": 3}, [0.5, 0.5]), "b": ("b", {"n": 2}, [0.0, 1.0])}
+    assert db.count("docs") == 2
+
+
+def test_id_repeated_across_batches_keeps_the_last_item(db):
+    db.add(
+        "docs",
+        ids=["a", "b", "c", "a", "d"],
+        embeddings=[[float(i), 1.0] for i in range(5)],
+        documents=[f"doc {i}" for i in range(5)],
+        batch_size=2
+    )
+
+    items = stored(db)
+    assert sorted(items) == ["a", "b", "c", "d"]
+    assert items["a"] == ("doc 3", None, [3.0, 1.0])
+    result = db.query("docs", query_embeddings=[[3.0, 1.0]], n_results=1)
+    assert result["ids"] == [["a"]]
+
+
+def test_existing_items_are_updated(db):
+    db.add("docs", ids=["a"], embeddings=[[1.0, 0.0]], documents=["old"], metadatas=[{"v": 1}])
+    rowid = db.conn.execute("SELECT rowid FROM vec_docs WHERE id = 'a'").fetchone()[0]
+
+    db.add("docs", ids=["a", "b"], embeddings=[[0.0, 1.0], [1.0, 1.0]], documents=["new", "b"], batch_size=1)
+
+    assert stored(db)["a"] == ("new", None, [0.0, 1.0])
+    # the replaced row keeps its rowid, which labels it in the HNSW index
+    assert db.conn.execute("SELECT rowid FROM vec_docs WHERE id = 'a'").fetchone()[0] == rowid
+
+
+def test_failing_batch_rolls_back_the_whole_call(db):
+    db.add("docs", ids=["a"], embeddings=[[1.0, 0.0]], documents=["kept"])
+    before = stored(db)
+
+    with pytest.raises(TypeError):
+        db.add(
+            "docs",
+            ids=["a", "b", "c", "d"],
+            embeddings=[[0.0, 1.0]] * 4,
+            documents=["replaced", "b", "c", "d"],
+            # the set in the second batch can't be serialized
+            metadatas=[{"n": 1}, {"n": 2}, {"n": {3}}, {"n": 4}],
+            batch_size=2
+        )
+
+    assert stored(db) == before
+    assert db.count("docs") == 1
+
+
+def test_batch_size_must_be_positive(db):
+    with pytest.raises(ValueError):
+        db.add("docs", ids=["a"], embeddings=[[1.0]], batch_size=0)